@@ -0,0 +1,34 @@
+"""add_row_version_counters
+
+Revision ID: 3f7a91c2d4e8
+Revises: 1d4fed343685
+Create Date: 2026-10-16 09:12:04.318552
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f7a91c2d4e8'
+down_revision: Union[str, None] = '1d4fed343685'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+VERSIONED_TABLES = ('entities', 'npc_extensions', 'items', 'character_needs')
+
+
+def upgrade() -> None:
+    for table in VERSIONED_TABLES:
+        op.add_column(
+            table,
+            sa.Column('row_version', sa.Integer(), server_default='1', nullable=False),
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(VERSIONED_TABLES):
+        op.drop_column(table, 'row_version')
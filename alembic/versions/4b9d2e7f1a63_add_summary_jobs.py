@@ -0,0 +1,70 @@
+"""add_summary_jobs
+
+Revision ID: 4b9d2e7f1a63
+Revises: 8c2e5d71b9a4
+Create Date: 2026-10-17 09:41:12.318205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b9d2e7f1a63'
+down_revision: Union[str, None] = '8c2e5d71b9a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('turn_chunk_summaries',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('session_id', sa.Integer(), nullable=False),
+    sa.Column('from_turn', sa.Integer(), nullable=False, comment='First turn number in this chunk'),
+    sa.Column('to_turn', sa.Integer(), nullable=False, comment='Last turn number in this chunk'),
+    sa.Column('from_day', sa.Integer(), nullable=True, comment='In-game day of the first turn'),
+    sa.Column('to_day', sa.Integer(), nullable=True, comment='In-game day of the last turn'),
+    sa.Column('summary_text', sa.Text(), nullable=False, comment='The generated summary text'),
+    sa.Column('token_count', sa.Integer(), nullable=False, comment='Approximate token count of summary'),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['session_id'], ['game_sessions.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('session_id', 'from_turn', name='uq_turn_chunk_summary_session_from_turn')
+    )
+    op.create_index(op.f('ix_turn_chunk_summaries_id'), 'turn_chunk_summaries', ['id'], unique=False)
+    op.create_index(op.f('ix_turn_chunk_summaries_session_id'), 'turn_chunk_summaries', ['session_id'], unique=False)
+    op.create_table('summary_jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('session_id', sa.Integer(), nullable=False),
+    sa.Column('job_type', sa.Enum('chunk', 'story', 'recent', name='summaryjobtype'), nullable=False),
+    sa.Column('status', sa.Enum('pending', 'running', 'done', 'failed', name='summaryjobstatus'), nullable=False),
+    sa.Column('from_turn', sa.Integer(), nullable=True, comment='First turn to summarize (chunk jobs)'),
+    sa.Column('to_turn', sa.Integer(), nullable=False, comment='Last turn the summary should cover'),
+    sa.Column('target_day', sa.Integer(), nullable=True, comment='Current day the recent summary is generated for (recent jobs)'),
+    sa.Column('milestone_id', sa.Integer(), nullable=True, comment='Milestone the story summary should reach (story jobs)'),
+    sa.Column('attempts', sa.Integer(), nullable=False, comment='Number of times the job was started'),
+    sa.Column('last_error', sa.Text(), nullable=True, comment='Error from the last failed attempt'),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['milestone_id'], ['milestones.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['session_id'], ['game_sessions.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_summary_jobs_id'), 'summary_jobs', ['id'], unique=False)
+    op.create_index(op.f('ix_summary_jobs_session_id'), 'summary_jobs', ['session_id'], unique=False)
+    op.create_index(op.f('ix_summary_jobs_status'), 'summary_jobs', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_summary_jobs_status'), table_name='summary_jobs')
+    op.drop_index(op.f('ix_summary_jobs_session_id'), table_name='summary_jobs')
+    op.drop_index(op.f('ix_summary_jobs_id'), table_name='summary_jobs')
+    op.drop_table('summary_jobs')
+    sa.Enum(name='summaryjobstatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='summaryjobtype').drop(op.get_bind(), checkfirst=True)
+    op.drop_index(op.f('ix_turn_chunk_summaries_session_id'), table_name='turn_chunk_summaries')
+    op.drop_index(op.f('ix_turn_chunk_summaries_id'), table_name='turn_chunk_summaries')
+    op.drop_table('turn_chunk_summaries')
@@ -0,0 +1,62 @@
+"""add_delta_snapshots
+
+Revision ID: 8c2e5d71b9a4
+Revises: 3f7a91c2d4e8
+Create Date: 2026-10-16 11:02:47.905113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c2e5d71b9a4'
+down_revision: Union[str, None] = '3f7a91c2d4e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'session_snapshots',
+        sa.Column(
+            'base_turn_number',
+            sa.Integer(),
+            nullable=True,
+            comment='Turn of the snapshot this delta applies to (NULL = keyframe)',
+        ),
+    )
+    op.add_column(
+        'session_snapshots',
+        sa.Column(
+            'compressed_data',
+            sa.LargeBinary(),
+            nullable=True,
+            comment='zlib-compressed JSON keyframe or delta',
+        ),
+    )
+    op.alter_column(
+        'session_snapshots',
+        'snapshot_data',
+        existing_type=sa.JSON(),
+        nullable=True,
+        comment='Complete session state as JSON (legacy uncompressed keyframes)',
+        existing_comment='Complete session state as JSON',
+    )
+
+
+def downgrade() -> None:
+    # Delta snapshots cannot be restored without their chain; drop them
+    op.execute('DELETE FROM session_snapshots WHERE snapshot_data IS NULL')
+    op.alter_column(
+        'session_snapshots',
+        'snapshot_data',
+        existing_type=sa.JSON(),
+        nullable=False,
+        comment='Complete session state as JSON',
+        existing_comment='Complete session state as JSON (legacy uncompressed keyframes)',
+    )
+    op.drop_column('session_snapshots', 'compressed_data')
+    op.drop_column('session_snapshots', 'base_turn_number')
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Quantum Pipeline Turn Benchmark.
+
+Replays scripted player inputs through QuantumPipeline.process_turn on a
+freshly seeded Millbrook world with a scripted LLM, and reports per-phase
+p50/p95/p99 latency, throughput and cache hit rate. No model or network
+is needed.
+
+Usage:
+    python scripts/benchmark_quantum_pipeline.py                          # Quick run
+    python scripts/benchmark_quantum_pipeline.py --repeat 20 --latency-ms 300
+    python scripts/benchmark_quantum_pipeline.py --output baseline.json   # Save baseline
+    python scripts/benchmark_quantum_pipeline.py --baseline baseline.json # Fail on regressions
+    python scripts/benchmark_quantum_pipeline.py --trace traces.jsonl     # Export span traces
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, ".")
+
+from src.observability import JSONLTraceExporter
+from src.world_server.quantum.benchmark import (
+    DEFAULT_WORLD_DIR,
+    BenchmarkConfig,
+    BenchmarkReport,
+    compare_to_baseline,
+    run_benchmark,
+)
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="Quantum pipeline turn benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="Times to replay the inputs")
+    parser.add_argument(
+        "--inputs",
+        type=Path,
+        help="File with one player input per line (default: built-in Millbrook script)",
+    )
+    parser.add_argument("--world-dir", type=Path, default=DEFAULT_WORLD_DIR)
+    parser.add_argument("--world-name", default="millbrook")
+    parser.add_argument("--start-location", default="market_square")
+    parser.add_argument("--start-time", default="10:00", help="In-game time (HH:MM)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated LLM latency per call")
+    parser.add_argument(
+        "--ms-per-token", type=float, default=0.0, help="Simulated LLM time per output token"
+    )
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random +/- latency fraction")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write the report as a JSON baseline")
+    parser.add_argument("--baseline", type=Path, help="Compare against a JSON baseline")
+    parser.add_argument("--trace", type=Path, help="Write per-phase tracing spans as JSONL")
+    parser.add_argument(
+        "--latency-tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed relative p95 growth per phase",
+    )
+    parser.add_argument(
+        "--hit-rate-tolerance",
+        type=float,
+        default=0.05,
+        help="Allowed absolute cache hit rate drop",
+    )
+    parser.add_argument("--verbose", "-v", action="store_true", help="Show pipeline logs")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.ERROR)
+
+    config = BenchmarkConfig(
+        repeat=args.repeat,
+        start_location=args.start_location,
+        start_time=args.start_time,
+        world_dir=args.world_dir,
+        world_name=args.world_name,
+        latency_ms=args.latency_ms,
+        ms_per_output_token=args.ms_per_token,
+        jitter=args.jitter,
+        seed=args.seed,
+    )
+    if args.inputs:
+        lines = args.inputs.read_text(encoding="utf-8").splitlines()
+        config.inputs = tuple(line.strip() for line in lines if line.strip())
+
+    trace_exporter = JSONLTraceExporter(args.trace) if args.trace else None
+    try:
+        report = await run_benchmark(config, observability_hook=trace_exporter)
+    finally:
+        if trace_exporter is not None:
+            trace_exporter.close()
+    print(report.format_table())
+    if args.trace:
+        print(f"\nTraces written to {args.trace}")
+
+    if args.output:
+        args.output.write_text(json.dumps(report.to_dict(), indent=2) + "\n", encoding="utf-8")
+        print(f"\nBaseline written to {args.output}")
+
+    if args.baseline:
+        baseline = BenchmarkReport.from_dict(json.loads(args.baseline.read_text(encoding="utf-8")))
+        regressions = compare_to_baseline(
+            report,
+            baseline,
+            latency_tolerance=args.latency_tolerance,
+            hit_rate_tolerance=args.hit_rate_tolerance,
+        )
+        if regressions:
+            print(f"\nRegressions against {args.baseline}:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print(f"\nNo regressions against {args.baseline}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
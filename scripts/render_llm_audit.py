@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Render compressed LLM audit segments as Markdown.
+
+Reads the segment files written with LLM_LOG_FORMAT=jsonl and prints
+each call in the same Markdown layout as LLM_LOG_FORMAT=markdown, or
+writes them out as the usual one-file-per-call tree.
+
+Usage:
+    python scripts/render_llm_audit.py logs/llm/session_42                # Print every call
+    python scripts/render_llm_audit.py logs/llm --session 42 --turn 7     # One turn
+    python scripts/render_llm_audit.py logs/llm --call-type game_master
+    python scripts/render_llm_audit.py logs/llm --output-dir logs/llm_md  # Markdown files
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, ".")
+
+from src.llm.audit_logger import LLMAuditLogger
+from src.llm.audit_segments import read_audit_records, record_to_entry, render_markdown
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Render LLM audit segments as Markdown")
+    parser.add_argument("path", type=Path, help="Segment file, session directory or log root")
+    parser.add_argument("--session", type=int, help="Only calls from this game session")
+    parser.add_argument("--turn", type=int, help="Only calls from this turn")
+    parser.add_argument("--call-type", help="Only calls of this type (e.g. game_master)")
+    parser.add_argument("--output-dir", type=Path, help="Write one .md file per call here")
+    args = parser.parse_args()
+
+    if not args.path.exists():
+        print(f"No such file or directory: {args.path}", file=sys.stderr)
+        return 1
+
+    writer = LLMAuditLogger(log_dir=args.output_dir) if args.output_dir else None
+    count = 0
+    for record in read_audit_records(args.path):
+        if args.session is not None and record.get("session_id") != args.session:
+            continue
+        if args.turn is not None and record.get("turn_number") != args.turn:
+            continue
+        if args.call_type and record.get("call_type") != args.call_type:
+            continue
+
+        count += 1
+        if writer is None:
+            if count > 1:
+                print("\n---\n")
+            print(render_markdown(record))
+        else:
+            path = writer._get_file_path(record_to_entry(record))
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(render_markdown(record), encoding="utf-8")
+
+    if writer is not None:
+        print(f"Wrote {count} calls to {args.output_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
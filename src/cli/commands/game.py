@@ -10,6 +10,7 @@ import typer
 from rich.console import Console
 
 from src.cli.display import (
+    StreamingNarrativePanel,
     display_error,
     display_game_wizard_welcome,
     display_info,
@@ -1152,6 +1153,7 @@ async def _game_loop(
 
     # Initialize Quantum Pipeline
     from src.world_server.quantum import QuantumPipeline, AnticipationConfig
+    from src.world_server.quantum.speculation import SpeculationPolicy
     from src.config import get_settings
     settings = get_settings()
 
@@ -1162,11 +1164,47 @@ async def _game_loop(
         max_gm_decisions_per_action=settings.quantum_max_gm_decisions,
         cycle_delay_seconds=settings.quantum_cycle_delay,
     )
+    branch_store = None
+    if settings.quantum_branch_store_path:
+        from src.world_server.quantum.branch_store import SQLiteBranchStore
+
+        branch_store = SQLiteBranchStore(
+            settings.quantum_branch_store_path,
+            max_entries=settings.quantum_branch_store_max_entries,
+        )
+    anticipation_sessions = None
+    if use_anticipation and settings.db_async_enabled and settings.async_database_url:
+        from src.database.connection import get_async_session_factory
+
+        # Anticipation reads on its own pooled async sessions
+        anticipation_sessions = get_async_session_factory()
+    observability_hook = None
+    trace_exporter = None
+    if settings.quantum_trace_file:
+        from src.observability import CompositeHook, JSONLTraceExporter, LatencyHistogramHook
+
+        latency_histograms = LatencyHistogramHook()
+        trace_exporter = JSONLTraceExporter(settings.quantum_trace_file)
+        observability_hook = CompositeHook([latency_histograms, trace_exporter])
     quantum_pipeline = QuantumPipeline(
         db=db,
         game_session=game_session,
         anticipation_config=anticipation_config,
+        branch_store=branch_store,
+        anticipation_sessions=anticipation_sessions,
+        speculation_policy=SpeculationPolicy.from_setting(
+            settings.quantum_speculative_narration
+        ),
+        observability_hook=observability_hook,
     )
+    summary_worker = None
+    if settings.summary_worker_enabled:
+        from src.database.connection import SessionLocal
+        from src.managers.summary_worker import SummaryWorker
+
+        # Summaries are generated off the turn path, on their own sessions
+        summary_worker = SummaryWorker(SessionLocal, game_session.id)
+        await summary_worker.start()
 
     # Enable ref-based architecture if requested
     if ref_based_enabled:
@@ -1240,16 +1278,19 @@ async def _game_loop(
 
         # Generate initial scene with quantum pipeline
         with progress_spinner("Setting the scene...") as (progress, task):
+            stream_panel = StreamingNarrativePanel(progress)
             try:
                 progress.update(task, description="Generating narrative...")
                 turn_result = await quantum_pipeline.process_turn(
                     player_input=first_turn_input,
                     location_key=player_location,
                     turn_number=game_session.total_turns,
+                    on_text=stream_panel.write,
                 )
-                if turn_result.narrative:
+                if not stream_panel.finish(turn_result.narrative) and turn_result.narrative:
                     display_narrative(turn_result.narrative)
             except Exception as e:
+                stream_panel.finish()
                 display_error(f"Error generating scene: {e}")
         # Start anticipation after first turn
         if quantum_pipeline.anticipation_config.enabled:
@@ -1272,6 +1313,21 @@ async def _game_loop(
                 db.commit()
                 # Shutdown quantum pipeline
                 await quantum_pipeline.stop_anticipation()
+                if summary_worker is not None:
+                    await summary_worker.stop()
+                if anticipation_sessions is not None:
+                    from src.database.connection import dispose_async_engine
+
+                    await dispose_async_engine()
+                if trace_exporter is not None:
+                    trace_exporter.close()
+                    turn_latency = latency_histograms.summary().get("turn")
+                    if turn_latency:
+                        display_info(
+                            f"Turn latency over {turn_latency['count']} turns: "
+                            f"p50 {turn_latency['p50']:.0f}ms, p95 {turn_latency['p95']:.0f}ms, "
+                            f"p99 {turn_latency['p99']:.0f}ms (traces in {trace_exporter.path})"
+                        )
                 break
             elif cmd == "help":
                 _show_help()
@@ -1352,7 +1408,13 @@ async def _game_loop(
         game_session.total_turns += 1
 
         # Quantum pipeline: use process_turn
+        # Cache misses stream the narrative into a live panel as it is written
         with progress_spinner("Processing...") as (progress, task):
+            stream_panel = StreamingNarrativePanel(progress)
+            shown_rolls = []
+            # Slow-path rolls are shown while the narrative is generated
+            show_roll = _roll_display(progress, shown_rolls)
+
             try:
                 # Show cache check phase
                 progress.update(task, description="Checking prepared outcomes...")
@@ -1361,6 +1423,8 @@ async def _game_loop(
                     player_input=enhanced_input,
                     location_key=player_location,
                     turn_number=game_session.total_turns,
+                    on_text=stream_panel.write,
+                    on_roll=show_roll,
                 )
 
                 # Update progress based on cache hit
@@ -1370,17 +1434,21 @@ async def _game_loop(
                     progress.update(task, description="Generating narrative...")
 
             except Exception as e:
+                stream_panel.finish()
                 display_error(f"Error: {e}")
                 game_session.total_turns -= 1
                 continue
 
-        # Display skill check if present
-        if turn_result.skill_check_result:
+        streamed = stream_panel.finish(turn_result.narrative)
+
+        # Display skill check if present (and not already shown mid-turn)
+        if turn_result.skill_check_result and not shown_rolls:
             _display_quantum_skill_check(turn_result.skill_check_result)
 
-        # Display the response
+        # Display the response (unless it was already streamed)
         if turn_result.narrative:
-            display_narrative(turn_result.narrative)
+            if not streamed:
+                display_narrative(turn_result.narrative)
 
             # Show cache/latency info
             if turn_result.was_cache_hit:
@@ -1409,9 +1477,30 @@ async def _game_loop(
                 gm_response=turn_result.narrative,
                 player_location=player_location,
                 is_ooc=False,
+                summary_worker=summary_worker,
             )
 
 
+def _roll_display(progress, shown_rolls: list):
+    """Build the on_roll callback that shows a roll mid-turn.
+
+    Args:
+        progress: Spinner to pause while the roll is shown.
+        shown_rolls: List the shown results are appended to.
+
+    Returns:
+        Async callback taking a SkillCheckResult.
+    """
+
+    async def show_roll(skill_check_result) -> None:
+        progress.stop()
+        await asyncio.to_thread(_display_quantum_skill_check, skill_check_result)
+        shown_rolls.append(skill_check_result)
+        progress.start()
+
+    return show_roll
+
+
 def _display_quantum_skill_check(skill_check_result) -> None:
     """Display skill check result from quantum pipeline.
 
@@ -1481,6 +1570,7 @@ def _save_turn_immediately(
     gm_response: str,
     player_location: str,
     is_ooc: bool = False,
+    summary_worker=None,
 ) -> None:
     """Save turn record immediately to prevent data loss on quit.
 
@@ -1490,6 +1580,9 @@ def _save_turn_immediately(
     If the turn was already created by persistence_node (during graph execution),
     this updates it instead of creating a duplicate.
 
+    When a summary worker is running, summaries the turn makes due are
+    queued in the same commit and left to it.
+
     Args:
         db: Database session.
         game_session: Current game session.
@@ -1498,9 +1591,11 @@ def _save_turn_immediately(
         gm_response: The GM's narrative response.
         player_location: Current location key.
         is_ooc: Whether this is an OOC response.
+        summary_worker: SummaryWorker to wake for queued summaries (optional).
     """
     from src.database.models.session import Turn
     from src.database.models.world import TimeState
+    from src.managers.summary_manager import SummaryManager
 
     # Get current game time for turn snapshot
     time_state = (
@@ -1543,7 +1638,12 @@ def _save_turn_immediately(
         )
         db.add(turn)
 
+    db.flush()
+    if summary_worker is not None:
+        SummaryManager(db, game_session).enqueue_due_jobs()
     db.commit()
+    if summary_worker is not None:
+        summary_worker.notify()
 
 
 def _show_help() -> None:
@@ -4,6 +4,7 @@ from contextlib import contextmanager
 
 from rich import box
 from rich.console import Console
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.progress import (
@@ -36,6 +37,62 @@ def display_narrative(text: str) -> None:
     console.print(panel)
 
 
+class StreamingNarrativePanel:
+    """Narrative panel that fills in as streamed text arrives.
+
+    Pass write() as the pipeline's on_text callback. The first chunk stops
+    the given spinner and opens a live panel; finish() settles the panel
+    on the final narrative, replacing the streamed text if it differs.
+    """
+
+    def __init__(self, progress: Progress | None = None) -> None:
+        """Initialize the panel.
+
+        Args:
+            progress: Spinner to stop when the first chunk arrives.
+        """
+        self.progress = progress
+        self.text = ""
+        self._live: Live | None = None
+
+    @property
+    def started(self) -> bool:
+        """Whether any streamed text has been displayed."""
+        return self._live is not None
+
+    def _render(self) -> Panel:
+        return Panel(self.text, border_style="dim", padding=(1, 2))
+
+    def write(self, chunk: str) -> None:
+        """Append a chunk of streamed narrative."""
+        self.text += chunk
+        if self._live is None:
+            if self.progress is not None:
+                self.progress.stop()
+            self._live = Live(self._render(), console=console, refresh_per_second=12)
+            self._live.start()
+        else:
+            self._live.update(self._render())
+
+    def finish(self, final_text: str | None = None) -> bool:
+        """Stop streaming, showing final_text in place of the streamed text.
+
+        Args:
+            final_text: The authoritative narrative (None keeps the streamed text).
+
+        Returns:
+            True if the panel was displayed, False if nothing was streamed.
+        """
+        if self._live is None:
+            return False
+        if final_text and final_text != self.text:
+            self.text = final_text
+        self._live.update(self._render(), refresh=True)
+        self._live.stop()
+        self._live = None
+        return True
+
+
 def display_ooc_response(text: str) -> None:
     """Display an out-of-character GM response.
 
@@ -67,6 +67,13 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "postgresql://localhost/rpg_game"
 
+    # Async engine pool (used by background anticipation)
+    db_async_enabled: bool = True
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 10.0
+    db_pool_recycle_seconds: int = 1800
+
     # API Keys
     anthropic_api_key: str = ""
     openai_api_key: str = ""
@@ -110,11 +117,26 @@ class Settings(BaseSettings):
     default_setting: str = "fantasy"
     checkpoint_interval: int = 15  # Turns between checkpoints
     pipeline: Literal["legacy", "system-authority", "scene-first"] = "system-authority"
+    # Generate story/recent context summaries in the background
+    # (see src/managers/summary_worker.py)
+    summary_worker_enabled: bool = True
 
     # Debug
     debug: bool = False
     log_llm_calls: bool = False
     llm_log_dir: str = "logs/llm"
+    # markdown = one file per call, jsonl = buffered compressed segments
+    # (see src/llm/audit_segments.py; zstd needs the zstandard package)
+    llm_log_format: Literal["markdown", "jsonl"] = "markdown"
+    llm_log_compression: Literal["gzip", "zstd"] = "gzip"
+    llm_log_buffer_mb: int = 16
+
+    # LLM response cache (see src/llm/caching_provider.py)
+    # off = no caching, readwrite = reuse deterministic responses,
+    # record = store every response, replay = serve only from cache (no network)
+    llm_cache_mode: Literal["off", "readwrite", "record", "replay"] = "off"
+    llm_cache_dir: str = "cache/llm"
+    llm_cache_max_mb: int = 256
 
     # ==========================================================================
     # World Server / Anticipation Settings
@@ -147,10 +169,35 @@ class Settings(BaseSettings):
     # Minimum confidence score to use a cached branch (0.0 - 1.0)
     quantum_min_match_confidence: float = 0.7
 
+    # SQLite file for the persistent branch store (None = in-memory cache only).
+    # Processes playing the same world can share one file.
+    quantum_branch_store_path: str | None = None
+    quantum_branch_store_max_entries: int = 5000
+
+    # Narrate every plausible outcome while the skill check resolves, for
+    # narrators in these cost classes: "off", "local" (Ollama, qwen-agent),
+    # "metered" (Anthropic, OpenAI), "all", or a comma-separated list
+    quantum_speculative_narration: str = "off"
+
+    # JSONL file receiving nested tracing spans for every turn phase,
+    # collapse, anticipation cycle and LLM call (None = tracing off)
+    quantum_trace_file: str | None = None
+
     # ==========================================================================
     # Parsed Configuration Properties
     # ==========================================================================
 
+    @property
+    def async_database_url(self) -> str | None:
+        """Get database_url with an async driver, or None if unsupported."""
+        url = self.database_url
+        for prefix in ("postgresql+psycopg2://", "postgresql+psycopg://", "postgresql://"):
+            if url.startswith(prefix):
+                return "postgresql+asyncpg://" + url[len(prefix):]
+        if url.startswith("postgresql+asyncpg://"):
+            return url
+        return None
+
     @property
     def narrator_config(self) -> ProviderConfig:
         """Get parsed narrator provider config."""
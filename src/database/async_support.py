@@ -0,0 +1,63 @@
+"""Bridge between sync manager code and AsyncSession.
+
+Managers are written against a sync Session. When that Session is the
+sync_session of an AsyncSession, ORM calls must run inside
+AsyncSession.run_sync(), where database I/O is awaited on the event loop
+instead of blocking it. run_sync_read() does that for async-backed
+sessions and calls the function directly for plain sessions, so the
+same manager works in both worlds:
+
+    player = await run_sync_read(manager.db, manager.get_player)
+
+An AsyncSession is not safe for concurrent use, so calls on the same
+session are serialized with a per-session lock. Work that should overlap
+(e.g. background anticipation next to the foreground turn) must use its
+own session from get_async_session_factory().
+"""
+
+import asyncio
+from typing import Any, Callable, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_session
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+_LOCK_KEY = "async_session_lock"
+
+
+def get_async_session(db: Any) -> AsyncSession | None:
+    """Get the AsyncSession proxying a sync Session, if any.
+
+    Args:
+        db: Sync Session (or test double)
+
+    Returns:
+        The owning AsyncSession, or None for plain sessions
+    """
+    if not isinstance(db, Session):
+        return None
+    return async_session(db)
+
+
+async def run_sync_read(db: Any, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run sync ORM code without blocking the event loop.
+
+    Args:
+        db: Session the function queries through
+        fn: Sync function to run
+        *args: Positional arguments for fn
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        fn's return value
+    """
+    proxy = get_async_session(db)
+    if proxy is None:
+        return fn(*args, **kwargs)
+
+    lock = db.info.get(_LOCK_KEY)
+    if lock is None:
+        lock = db.info[_LOCK_KEY] = asyncio.Lock()
+    async with lock:
+        return await proxy.run_sync(lambda _session: fn(*args, **kwargs))
@@ -1,9 +1,15 @@
 """Database connection and session management."""
 
-from contextlib import contextmanager
-from typing import Generator
+from collections.abc import AsyncGenerator, Generator
+from contextlib import asynccontextmanager, contextmanager
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.config import settings
@@ -27,6 +33,68 @@ SessionLocal = sessionmaker(
     bind=engine,
 )
 
+# Async engine and session factory, created on first use
+_async_engine: AsyncEngine | None = None
+_async_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """Get the pooled asyncpg engine, creating it on first use.
+
+    Returns:
+        Async engine for settings.database_url.
+
+    Raises:
+        RuntimeError: If the database URL has no async driver.
+    """
+    global _async_engine
+    if _async_engine is None:
+        url = settings.async_database_url
+        if url is None:
+            raise RuntimeError(f"No async driver for database URL: {settings.database_url}")
+        _async_engine = create_async_engine(
+            url,
+            echo=settings.debug,
+            pool_pre_ping=True,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout_seconds,
+            pool_recycle=settings.db_pool_recycle_seconds,
+            connect_args={
+                "timeout": 10,  # Connection timeout in seconds
+                "server_settings": {"statement_timeout": "30000"},  # Query timeout 30s
+            },
+        )
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get the AsyncSession factory bound to the async engine.
+
+    Sessions don't expire objects on commit, so results stay readable
+    after the session that loaded them is closed.
+
+    Returns:
+        Async session factory.
+    """
+    global _async_session_factory
+    if _async_session_factory is None:
+        _async_session_factory = async_sessionmaker(
+            get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_session_factory
+
+
+async def dispose_async_engine() -> None:
+    """Close all pooled async connections."""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_session_factory = None
+
 
 def init_db() -> None:
     """Initialize database tables.
@@ -73,3 +141,22 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+@asynccontextmanager
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get a pooled async database session with automatic cleanup.
+
+    Usage:
+        async with get_async_db_session() as db:
+            result = await db.execute(select(Entity))
+    """
+    session = get_async_session_factory()()
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
@@ -1,6 +1,6 @@
 """Database models package."""
 
-from src.database.models.base import Base, SoftDeleteMixin, TimestampMixin
+from src.database.models.base import Base, SoftDeleteMixin, TimestampMixin, VersionedMixin
 from src.database.models.enums import (
     AlcoholTolerance,
     AppointmentStatus,
@@ -183,7 +183,11 @@ from src.database.models.context_summary import (
     Milestone,
     MilestoneType,
     NarrativeMentionLog,
+    SummaryJob,
+    SummaryJobStatus,
+    SummaryJobType,
     SummaryType,
+    TurnChunkSummary,
 )
 
 # Session snapshots for state restoration
@@ -194,6 +198,7 @@ __all__ = [
     "Base",
     "TimestampMixin",
     "SoftDeleteMixin",
+    "VersionedMixin",
     # Enums
     "EntityType",
     "ItemType",
@@ -358,10 +363,14 @@ __all__ = [
     # Context summary enums
     "MilestoneType",
     "SummaryType",
+    "SummaryJobType",
+    "SummaryJobStatus",
     # Context summary models
     "Milestone",
     "ContextSummary",
     "NarrativeMentionLog",
+    "TurnChunkSummary",
+    "SummaryJob",
     # Session snapshots
     "SessionSnapshot",
 ]
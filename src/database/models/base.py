@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import DateTime
+from sqlalchemy import DateTime, Integer, literal_column
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -33,3 +33,23 @@ class SoftDeleteMixin:
 
     is_active: Mapped[bool] = mapped_column(default=True, nullable=False)
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+
+class VersionedMixin:
+    """Mixin for a per-row version counter.
+
+    Every UPDATE of the row that does not set row_version itself bumps
+    it (the same way TimestampMixin refreshes updated_at), so a cached
+    result can record the versions it was computed from and later check
+    freshness with an integer comparison. It is a plain counter, not an
+    optimistic lock: writes never fail because another session or a bulk
+    statement bumped the row first.
+    """
+
+    row_version: Mapped[int] = mapped_column(
+        Integer,
+        default=1,
+        server_default="1",
+        onupdate=literal_column("row_version + 1"),
+        nullable=False,
+    )
@@ -12,14 +12,14 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.database.models.base import Base, TimestampMixin
+from src.database.models.base import Base, TimestampMixin, VersionedMixin
 
 if TYPE_CHECKING:
     from src.database.models.entities import Entity
     from src.database.models.session import GameSession
 
 
-class CharacterNeeds(Base, TimestampMixin):
+class CharacterNeeds(Base, TimestampMixin, VersionedMixin):
     """Tracks character physiological and psychological needs."""
 
     __tablename__ = "character_needs"
@@ -4,6 +4,8 @@ This module provides models for:
 - Milestone: Significant story events that trigger summary regeneration
 - ContextSummary: LLM-generated summaries at different time scales
 - NarrativeMentionLog: Tracks what was mentioned to prevent repetition
+- TurnChunkSummary: Rolling summaries of fixed runs of turns
+- SummaryJob: Queue of summaries for the background worker to generate
 """
 
 from datetime import datetime
@@ -280,3 +282,159 @@ class NarrativeMentionLog(Base, TimestampMixin):
             f"<NarrativeMentionLog {self.mention_type}:{self.subject_key}="
             f"'{self.mention_value}' turn={self.mentioned_turn}>"
         )
+
+
+class TurnChunkSummary(Base, TimestampMixin):
+    """LLM-generated summary of a fixed run of consecutive turns.
+
+    Chunks are summarized in the background as turns are saved, so the
+    story and recent summaries can be built from a few chunk summaries
+    instead of every raw turn.
+    """
+
+    __tablename__ = "turn_chunk_summaries"
+    __table_args__ = (
+        UniqueConstraint(
+            "session_id", "from_turn",
+            name="uq_turn_chunk_summary_session_from_turn"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    session_id: Mapped[int] = mapped_column(
+        ForeignKey("game_sessions.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    # Coverage
+    from_turn: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="First turn number in this chunk",
+    )
+    to_turn: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Last turn number in this chunk",
+    )
+    from_day: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="In-game day of the first turn",
+    )
+    to_day: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="In-game day of the last turn",
+    )
+
+    # Content
+    summary_text: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        comment="The generated summary text",
+    )
+    token_count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False,
+        comment="Approximate token count of summary",
+    )
+
+    # Relationships
+    session: Mapped["GameSession"] = relationship()
+
+    def __repr__(self) -> str:
+        return f"<TurnChunkSummary turns={self.from_turn}-{self.to_turn}>"
+
+
+class SummaryJobType(str, PyEnum):
+    """Kinds of summary the background worker generates."""
+
+    CHUNK = "chunk"  # A TurnChunkSummary
+    STORY = "story"  # The STORY ContextSummary
+    RECENT = "recent"  # The RECENT ContextSummary
+
+
+class SummaryJobStatus(str, PyEnum):
+    """Lifecycle of a summary job."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class SummaryJob(Base, TimestampMixin):
+    """A summary waiting to be generated (or already generated).
+
+    Jobs are enqueued on the turn that makes a summary due and run by
+    SummaryWorker off the turn's critical path. Finished jobs are kept
+    so the same target is never enqueued twice.
+    """
+
+    __tablename__ = "summary_jobs"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    session_id: Mapped[int] = mapped_column(
+        ForeignKey("game_sessions.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    job_type: Mapped[SummaryJobType] = mapped_column(
+        Enum(SummaryJobType, values_callable=lambda obj: [e.value for e in obj]),
+        nullable=False,
+    )
+    status: Mapped[SummaryJobStatus] = mapped_column(
+        Enum(SummaryJobStatus, values_callable=lambda obj: [e.value for e in obj]),
+        default=SummaryJobStatus.PENDING,
+        nullable=False,
+        index=True,
+    )
+
+    # Target
+    from_turn: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="First turn to summarize (chunk jobs)",
+    )
+    to_turn: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Last turn the summary should cover",
+    )
+    target_day: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Current day the recent summary is generated for (recent jobs)",
+    )
+    milestone_id: Mapped[int | None] = mapped_column(
+        ForeignKey("milestones.id", ondelete="SET NULL"),
+        nullable=True,
+        comment="Milestone the story summary should reach (story jobs)",
+    )
+
+    # Execution
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False,
+        comment="Number of times the job was started",
+    )
+    last_error: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+        comment="Error from the last failed attempt",
+    )
+
+    # Relationships
+    session: Mapped["GameSession"] = relationship()
+    milestone: Mapped["Milestone | None"] = relationship()
+
+    def __repr__(self) -> str:
+        return (
+            f"<SummaryJob {self.job_type.value} {self.status.value} "
+            f"to_turn={self.to_turn}>"
+        )
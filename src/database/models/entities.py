@@ -17,7 +17,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.database.models.base import Base, TimestampMixin
+from src.database.models.base import Base, TimestampMixin, VersionedMixin
 from src.database.models.enums import EntityType
 
 if TYPE_CHECKING:
@@ -25,7 +25,7 @@ if TYPE_CHECKING:
     from src.database.models.session import GameSession
 
 
-class Entity(Base, TimestampMixin):
+class Entity(Base, TimestampMixin, VersionedMixin):
     """Base entity for all characters, creatures, and monsters."""
 
     __tablename__ = "entities"
@@ -447,7 +447,7 @@ class EntitySkill(Base):
         return f"<EntitySkill {self.skill_key} L{self.proficiency_level}>"
 
 
-class NPCExtension(Base, TimestampMixin):
+class NPCExtension(Base, TimestampMixin, VersionedMixin):
     """NPC-specific data (schedules, jobs, hobbies)."""
 
     __tablename__ = "npc_extensions"
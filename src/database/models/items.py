@@ -17,7 +17,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.database.models.base import Base, TimestampMixin
+from src.database.models.base import Base, TimestampMixin, VersionedMixin
 from src.database.models.enums import ItemCondition, ItemType, StorageLocationType
 
 if TYPE_CHECKING:
@@ -161,7 +161,7 @@ class StorageLocation(Base, TimestampMixin):
         return f"<StorageLocation {self.location_key} ({self.location_type.value})>"
 
 
-class Item(Base, TimestampMixin):
+class Item(Base, TimestampMixin, VersionedMixin):
     """An item in the game world."""
 
     __tablename__ = "items"
@@ -2,23 +2,27 @@
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, JSON
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, JSON, LargeBinary
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database.models.base import Base
 
 
 class SessionSnapshot(Base):
-    """Complete state snapshot for a game session at a specific turn.
+    """State snapshot for a game session at a specific turn.
 
-    Captures the full state of all session-scoped tables at the start of a turn,
-    enabling exact restoration for debugging or rollback.
+    Captures the state of all session-scoped tables at the start of a turn,
+    enabling exact restoration for debugging or rollback. Snapshots are
+    either keyframes (every row) or deltas (rows changed since their base
+    snapshot); both are stored as compressed JSON.
 
     Attributes:
         id: Primary key.
         session_id: Foreign key to the game session.
         turn_number: Turn number this snapshot was captured at.
-        snapshot_data: JSON containing complete session state.
+        base_turn_number: Snapshot this delta applies to (None for keyframes).
+        snapshot_data: Uncompressed full state (snapshots from before deltas).
+        compressed_data: zlib-compressed JSON keyframe or delta.
         created_at: When the snapshot was captured.
     """
 
@@ -35,10 +39,20 @@ class SessionSnapshot(Base):
         nullable=False,
         index=True,
     )
-    snapshot_data: Mapped[dict] = mapped_column(
+    base_turn_number: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Turn of the snapshot this delta applies to (NULL = keyframe)",
+    )
+    snapshot_data: Mapped[dict | None] = mapped_column(
         JSON,
-        nullable=False,
-        comment="Complete session state as JSON",
+        nullable=True,
+        comment="Complete session state as JSON (legacy uncompressed keyframes)",
+    )
+    compressed_data: Mapped[bytes | None] = mapped_column(
+        LargeBinary,
+        nullable=True,
+        comment="zlib-compressed JSON keyframe or delta",
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
@@ -53,6 +67,11 @@ class SessionSnapshot(Base):
         Index("ix_session_snapshots_session_turn", "session_id", "turn_number", unique=True),
     )
 
+    @property
+    def is_keyframe(self) -> bool:
+        """Whether this snapshot holds every row rather than a delta."""
+        return self.base_turn_number is None
+
     def __repr__(self) -> str:
         """Return string representation."""
         return f"<SessionSnapshot session={self.session_id} turn={self.turn_number}>"
@@ -43,6 +43,15 @@ from src.dice.checks import (
     DC_LEGENDARY,
 )
 
+# Outcome Probabilities
+from src.dice.probability import (
+    CheckOutcome,
+    check_outcome_distribution,
+    outcome_probability_table,
+    outcome_tier_probabilities,
+    success_probability,
+)
+
 # Combat
 from src.dice.combat import (
     make_attack_roll,
@@ -94,6 +103,12 @@ __all__ = [
     "DC_HARD",
     "DC_VERY_HARD",
     "DC_LEGENDARY",
+    # Probabilities
+    "CheckOutcome",
+    "check_outcome_distribution",
+    "outcome_probability_table",
+    "outcome_tier_probabilities",
+    "success_probability",
     # Combat
     "make_attack_roll",
     "roll_damage",
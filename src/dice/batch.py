@@ -0,0 +1,285 @@
+"""Vectorized dice resolution with NumPy.
+
+Resolves many skill checks, d20 rolls or contests in one call using
+arrays instead of one RollResult per roll. Used for mass NPC contests
+and simulations where per-roll objects are too slow.
+
+Tiers are returned as int8 codes indexing TIER_ORDER, worst first, so
+they can be compared (higher code = better outcome) and counted with
+np.bincount.
+
+Usage:
+    >>> checks = make_skill_checks(dcs=[12, 15, 20], modifiers=[2, 3, 5])
+    >>> checks.success.shape
+    (3,)
+    >>> checks.tier_counts()[OutcomeTier.EXCEPTIONAL]
+    0
+"""
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from src.dice.types import AdvantageType, DiceExpression, OutcomeTier
+
+# Tier codes, worst to best
+TIER_ORDER: tuple[OutcomeTier, ...] = (
+    OutcomeTier.CATASTROPHIC,
+    OutcomeTier.CLEAR_FAILURE,
+    OutcomeTier.PARTIAL_FAILURE,
+    OutcomeTier.BARE_SUCCESS,
+    OutcomeTier.NARROW_SUCCESS,
+    OutcomeTier.CLEAR_SUCCESS,
+    OutcomeTier.EXCEPTIONAL,
+)
+
+# Lowest margin of each tier after CATASTROPHIC (see get_outcome_tier)
+_TIER_MARGIN_BOUNDS = np.array([-9, -4, 0, 1, 5, 10])
+
+_ADVANTAGE_CODES = {
+    AdvantageType.DISADVANTAGE: -1,
+    AdvantageType.NORMAL: 0,
+    AdvantageType.ADVANTAGE: 1,
+}
+
+AdvantageInput = AdvantageType | Sequence[AdvantageType] | np.ndarray
+
+
+@dataclass(frozen=True)
+class BatchCheckResult:
+    """Results of a batch of skill checks, one array element per check.
+
+    Attributes:
+        dc: Difficulty Class of each check.
+        modifier: Total modifier of each check.
+        total: Roll total (virtual total 11 + modifier for auto-successes).
+        success: Whether each check succeeded.
+        margin: Total minus DC.
+        tier: OutcomeTier codes indexing TIER_ORDER.
+        is_auto_success: Checks resolved without rolling.
+        is_critical_success: Kept dice are double-10.
+        is_critical_failure: Kept dice are double-1.
+    """
+
+    dc: np.ndarray
+    modifier: np.ndarray
+    total: np.ndarray
+    success: np.ndarray
+    margin: np.ndarray
+    tier: np.ndarray
+    is_auto_success: np.ndarray
+    is_critical_success: np.ndarray
+    is_critical_failure: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.success)
+
+    @property
+    def success_rate(self) -> float:
+        """Fraction of checks that succeeded."""
+        return float(self.success.mean()) if len(self) else 0.0
+
+    def outcome_tiers(self) -> list[OutcomeTier]:
+        """Get each check's tier as an OutcomeTier."""
+        return [TIER_ORDER[code] for code in self.tier]
+
+    def tier_counts(self) -> dict[OutcomeTier, int]:
+        """Count checks per OutcomeTier (every tier present)."""
+        counts = np.bincount(self.tier, minlength=len(TIER_ORDER))
+        return {tier: int(count) for tier, count in zip(TIER_ORDER, counts, strict=True)}
+
+
+def classify_margins(margins: np.ndarray | Sequence[int]) -> np.ndarray:
+    """Get OutcomeTier codes for an array of margins.
+
+    Vectorized get_outcome_tier(); codes index TIER_ORDER.
+
+    Args:
+        margins: Roll totals minus DCs.
+
+    Returns:
+        int8 array of tier codes.
+
+    Examples:
+        >>> classify_margins([12, 0, -3])
+        array([6, 3, 2], dtype=int8)
+    """
+    return np.digitize(margins, _TIER_MARGIN_BOUNDS).astype(np.int8)
+
+
+def advantage_codes(advantage: AdvantageInput, size: int) -> np.ndarray:
+    """Normalize advantage input to an array of -1/0/1 codes.
+
+    Args:
+        advantage: One AdvantageType for every roll, a sequence of them,
+            or an array already holding -1 (disadvantage), 0 or 1 (advantage).
+        size: Number of rolls.
+
+    Returns:
+        int8 array of length size.
+    """
+    if isinstance(advantage, AdvantageType):
+        return np.full(size, _ADVANTAGE_CODES[advantage], dtype=np.int8)
+    if isinstance(advantage, np.ndarray) and advantage.dtype.kind in "iub":
+        codes = advantage.astype(np.int8)
+    else:
+        codes = np.array(
+            [_ADVANTAGE_CODES[AdvantageType(value)] for value in advantage], dtype=np.int8
+        )
+    return np.broadcast_to(codes, (size,))
+
+
+def roll_2d10_batch(
+    modifiers: np.ndarray | Sequence[int],
+    advantage: AdvantageInput = AdvantageType.NORMAL,
+    rng: np.random.Generator | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Roll 2d10 (3d10 keep 2 with advantage/disadvantage) for each modifier.
+
+    Vectorized roll_2d10(): advantage keeps the best two of three dice,
+    disadvantage the worst two.
+
+    Args:
+        modifiers: Total modifier for each roll.
+        advantage: Advantage for all rolls or per roll.
+        rng: Random generator (default: a fresh unseeded one).
+
+    Returns:
+        Tuple of (totals, double-10 flags, double-1 flags).
+    """
+    rng = rng or np.random.default_rng()
+    modifiers = np.asarray(modifiers, dtype=np.int64)
+    codes = advantage_codes(advantage, modifiers.size)
+
+    rolled = rng.integers(1, 11, size=(modifiers.size, 3))
+    # Normal rolls keep the first two dice as rolled, ordered so low <= high
+    normal_low = np.minimum(rolled[:, 0], rolled[:, 1])
+    normal_high = np.maximum(rolled[:, 0], rolled[:, 1])
+    dice = np.sort(rolled, axis=1)
+    low = np.select([codes > 0, codes < 0], [dice[:, 1], dice[:, 0]], normal_low)
+    high = np.select([codes > 0, codes < 0], [dice[:, 2], dice[:, 1]], normal_high)
+
+    totals = low + high + modifiers.reshape(-1)
+    return totals, low == 10, high == 1
+
+
+def make_skill_checks(
+    dcs: np.ndarray | Sequence[int] | int,
+    modifiers: np.ndarray | Sequence[int] | int = 0,
+    advantage: AdvantageInput = AdvantageType.NORMAL,
+    rng: np.random.Generator | None = None,
+) -> BatchCheckResult:
+    """Make many skill checks at once.
+
+    Vectorized make_skill_check(): auto-success when DC <= 10 + modifier,
+    otherwise 2d10 + modifier against the DC, with margins classified
+    into OutcomeTier codes. DCs and modifiers broadcast against each other.
+
+    Args:
+        dcs: Difficulty Class of each check.
+        modifiers: Total modifier (attribute + skill) of each check.
+        advantage: Advantage for all checks or per check.
+        rng: Random generator (default: a fresh unseeded one).
+
+    Returns:
+        BatchCheckResult with one element per check.
+
+    Examples:
+        >>> result = make_skill_checks(dcs=15, modifiers=np.arange(6))
+        >>> len(result)
+        6
+    """
+    dc_array, modifier_array = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(dcs, dtype=np.int64)),
+        np.atleast_1d(np.asarray(modifiers, dtype=np.int64)),
+    )
+    totals, double_ten, double_one = roll_2d10_batch(modifier_array, advantage, rng)
+
+    is_auto = dc_array <= 10 + modifier_array
+    totals = np.where(is_auto, 11 + modifier_array, totals)
+    margins = totals - dc_array
+    success = is_auto | (margins >= 0)
+
+    return BatchCheckResult(
+        dc=dc_array.copy(),
+        modifier=modifier_array.copy(),
+        total=totals,
+        success=success,
+        margin=margins,
+        tier=classify_margins(margins),
+        is_auto_success=is_auto,
+        is_critical_success=double_ten & ~is_auto,
+        is_critical_failure=double_one & ~is_auto,
+    )
+
+
+def roll_dice_batch(
+    expression: DiceExpression,
+    count: int,
+    advantage: AdvantageInput = AdvantageType.NORMAL,
+    rng: np.random.Generator | None = None,
+) -> np.ndarray:
+    """Roll a dice expression many times.
+
+    Vectorized roll_with_advantage(): advantage/disadvantage only applies
+    to single-die expressions such as 1d20.
+
+    Args:
+        expression: The dice expression to roll.
+        count: Number of rolls.
+        advantage: Advantage for all rolls or per roll.
+        rng: Random generator (default: a fresh unseeded one).
+
+    Returns:
+        Array of totals (including the expression's modifier).
+    """
+    rng = rng or np.random.default_rng()
+
+    if expression.num_dice != 1:
+        rolls = rng.integers(1, expression.die_size + 1, size=(count, expression.num_dice))
+        return rolls.sum(axis=1) + expression.modifier
+
+    codes = advantage_codes(advantage, count)
+    pairs = rng.integers(1, expression.die_size + 1, size=(count, 2))
+    kept = np.select(
+        [codes > 0, codes < 0],
+        [pairs.max(axis=1), pairs.min(axis=1)],
+        pairs[:, 0],
+    )
+    return kept + expression.modifier
+
+
+def contested_rolls_batch(
+    attacker_modifiers: np.ndarray | Sequence[int],
+    defender_modifiers: np.ndarray | Sequence[int],
+    attacker_advantage: AdvantageInput = AdvantageType.NORMAL,
+    defender_advantage: AdvantageInput = AdvantageType.NORMAL,
+    rng: np.random.Generator | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Resolve many d20 contests at once.
+
+    Vectorized contested_roll(): both sides roll 1d20 + modifier and ties
+    go to the defender.
+
+    Args:
+        attacker_modifiers: Attacker modifier for each contest.
+        defender_modifiers: Defender modifier for each contest.
+        attacker_advantage: Attacker advantage for all contests or per contest.
+        defender_advantage: Defender advantage for all contests or per contest.
+        rng: Random generator (default: a fresh unseeded one).
+
+    Returns:
+        Tuple of (attacker wins, margins); positive margin favors the attacker.
+    """
+    rng = rng or np.random.default_rng()
+    attacker_mods, defender_mods = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(attacker_modifiers, dtype=np.int64)),
+        np.atleast_1d(np.asarray(defender_modifiers, dtype=np.int64)),
+    )
+    d20 = DiceExpression(num_dice=1, die_size=20)
+    attacker_rolls = roll_dice_batch(d20, attacker_mods.size, attacker_advantage, rng)
+    defender_rolls = roll_dice_batch(d20, defender_mods.size, defender_advantage, rng)
+
+    margins = (attacker_rolls + attacker_mods) - (defender_rolls + defender_mods)
+    return margins > 0, margins
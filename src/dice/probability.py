@@ -0,0 +1,198 @@
+"""Exact outcome probabilities for 2d10 skill checks.
+
+Enumerates every kept-dice combination (100 for 2d10, 1000 for 3d10
+keep 2) once per advantage type, then derives success, critical and
+OutcomeTier odds for any DC and modifier without rolling.
+
+Usage:
+    >>> success_probability(dc=15, modifier=3)
+    0.45
+    >>> outcome_tier_probabilities(dc=15, modifier=3)[OutcomeTier.NARROW_SUCCESS]
+    0.26
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import product
+from typing import Iterable
+
+from src.dice.checks import can_auto_succeed, get_outcome_tier
+from src.dice.types import AdvantageType, OutcomeTier
+
+
+@dataclass(frozen=True)
+class CheckOutcome:
+    """One distinct outcome of a skill check and its probability.
+
+    Attributes:
+        total: Roll total including modifier (virtual total if auto-success).
+        margin: Total minus DC.
+        success: Whether the check succeeds.
+        outcome_tier: Degree of success/failure.
+        is_critical_success: Kept dice are double-10.
+        is_critical_failure: Kept dice are double-1.
+        is_auto_success: No roll needed (DC <= 10 + modifier).
+        probability: Chance of this outcome (0.0 to 1.0).
+    """
+
+    total: int
+    margin: int
+    success: bool
+    outcome_tier: OutcomeTier
+    is_critical_success: bool
+    is_critical_failure: bool
+    is_auto_success: bool
+    probability: float
+
+
+@lru_cache(maxsize=None)
+def _kept_sum_distribution(
+    advantage_type: AdvantageType,
+) -> tuple[tuple[int, bool, bool, float], ...]:
+    """Get (kept sum, double-10, double-1, probability) for a 2d10 roll."""
+    num_dice = 2 if advantage_type == AdvantageType.NORMAL else 3
+    weight = 1 / 10**num_dice
+
+    counts: dict[tuple[int, bool, bool], int] = {}
+    for dice in product(range(1, 11), repeat=num_dice):
+        ordered = sorted(dice)
+        if advantage_type == AdvantageType.ADVANTAGE:
+            kept = ordered[1:]
+        elif advantage_type == AdvantageType.DISADVANTAGE:
+            kept = ordered[:2]
+        else:
+            kept = ordered
+        key = (sum(kept), kept[0] == 10, kept[1] == 1)
+        counts[key] = counts.get(key, 0) + 1
+
+    return tuple(
+        (kept_sum, double_ten, double_one, count * weight)
+        for (kept_sum, double_ten, double_one), count in sorted(counts.items())
+    )
+
+
+@lru_cache(maxsize=4096)
+def check_outcome_distribution(
+    dc: int,
+    modifier: int = 0,
+    advantage_type: AdvantageType = AdvantageType.NORMAL,
+) -> tuple[CheckOutcome, ...]:
+    """Get every distinct outcome of a skill check with its probability.
+
+    Follows make_skill_check() exactly, including auto-success.
+
+    Args:
+        dc: Difficulty Class to beat.
+        modifier: Total modifier (attribute + skill).
+        advantage_type: Whether the check has advantage/disadvantage.
+
+    Returns:
+        Outcomes whose probabilities sum to 1.0.
+    """
+    if can_auto_succeed(dc, modifier):
+        margin = 11 + modifier - dc
+        return (
+            CheckOutcome(
+                total=11 + modifier,
+                margin=margin,
+                success=True,
+                outcome_tier=get_outcome_tier(margin, success=True),
+                is_critical_success=False,
+                is_critical_failure=False,
+                is_auto_success=True,
+                probability=1.0,
+            ),
+        )
+
+    outcomes = []
+    for kept_sum, double_ten, double_one, probability in _kept_sum_distribution(advantage_type):
+        total = kept_sum + modifier
+        success = total >= dc
+        outcomes.append(
+            CheckOutcome(
+                total=total,
+                margin=total - dc,
+                success=success,
+                outcome_tier=get_outcome_tier(total - dc, success),
+                is_critical_success=double_ten,
+                is_critical_failure=double_one,
+                is_auto_success=False,
+                probability=probability,
+            )
+        )
+    return tuple(outcomes)
+
+
+def success_probability(
+    dc: int,
+    modifier: int = 0,
+    advantage_type: AdvantageType = AdvantageType.NORMAL,
+) -> float:
+    """Get the chance a skill check succeeds.
+
+    Args:
+        dc: Difficulty Class to beat.
+        modifier: Total modifier (attribute + skill).
+        advantage_type: Whether the check has advantage/disadvantage.
+
+    Returns:
+        Probability of success (0.0 to 1.0).
+
+    Examples:
+        >>> success_probability(dc=20, modifier=0)  # Double-10 only
+        0.01
+        >>> success_probability(dc=10, modifier=0)  # Auto-success
+        1.0
+    """
+    return round(
+        sum(
+            outcome.probability
+            for outcome in check_outcome_distribution(dc, modifier, advantage_type)
+            if outcome.success
+        ),
+        12,
+    )
+
+
+def outcome_tier_probabilities(
+    dc: int,
+    modifier: int = 0,
+    advantage_type: AdvantageType = AdvantageType.NORMAL,
+) -> dict[OutcomeTier, float]:
+    """Get the chance of each OutcomeTier for a skill check.
+
+    Args:
+        dc: Difficulty Class to beat.
+        modifier: Total modifier (attribute + skill).
+        advantage_type: Whether the check has advantage/disadvantage.
+
+    Returns:
+        Probability per tier; every tier is present, impossible ones are 0.0.
+    """
+    tiers = dict.fromkeys(OutcomeTier, 0.0)
+    for outcome in check_outcome_distribution(dc, modifier, advantage_type):
+        tiers[outcome.outcome_tier] += outcome.probability
+    return {tier: round(probability, 12) for tier, probability in tiers.items()}
+
+
+def outcome_probability_table(
+    dcs: Iterable[int],
+    modifier: int = 0,
+    advantage_type: AdvantageType = AdvantageType.NORMAL,
+) -> dict[int, dict[OutcomeTier, float]]:
+    """Get OutcomeTier probabilities for several DCs at once.
+
+    Args:
+        dcs: Difficulty Classes to tabulate.
+        modifier: Total modifier (attribute + skill).
+        advantage_type: Whether the check has advantage/disadvantage.
+
+    Returns:
+        Mapping of DC to its tier probabilities.
+
+    Examples:
+        >>> table = outcome_probability_table(range(10, 31, 5), modifier=3)
+        >>> sorted(table)
+        [10, 15, 20, 25, 30]
+    """
+    return {dc: outcome_tier_probabilities(dc, modifier, advantage_type) for dc in dcs}
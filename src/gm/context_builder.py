@@ -5,9 +5,11 @@ for the new GM prompt template.
 """
 
 import re
+from typing import Callable, Hashable, TypeVar
 
 from sqlalchemy.orm import Session
 
+from src.database.async_support import run_sync_read
 from src.database.models.entities import Entity, EntityAttribute, EntitySkill
 from src.database.models.enums import EntityType
 from src.database.models.items import Item
@@ -22,9 +24,22 @@ from src.managers.relationship_manager import RelationshipManager
 from src.managers.storage_observation_manager import StorageObservationManager
 from src.managers.summary_manager import SummaryManager
 from src.gm.grounding import GroundedEntity, GroundingManifest
+from src.gm.manifest_cache import (
+    EQUIPPED,
+    EXITS,
+    INVENTORY,
+    ITEMS_AT_LOCATION,
+    LOCATION,
+    NPCS,
+    PLAYER,
+    STORAGES,
+    ManifestCache,
+)
 from src.gm.prompts import GM_USER_TEMPLATE, GM_SYSTEM_PROMPT
 from src.llm.message_types import Message, MessageRole
 
+T = TypeVar("T")
+
 
 class GMContextBuilder(BaseManager):
     """Builds rich context for the GM LLM.
@@ -82,8 +97,14 @@ class GMContextBuilder(BaseManager):
         r"\bno specific (?:question|task)\b",
     )
 
-    def __init__(self, db: Session, game_session: GameSession) -> None:
+    def __init__(
+        self,
+        db: Session,
+        game_session: GameSession,
+        manifest_cache: ManifestCache | None = None,
+    ) -> None:
         super().__init__(db, game_session)
+        self.manifest_cache = manifest_cache
         self._context_compiler: ContextCompiler | None = None
         self._item_manager: ItemManager | None = None
         self._location_manager: LocationManager | None = None
@@ -732,6 +753,10 @@ class GMContextBuilder(BaseManager):
         2. Validating [key:text] references in GM output
         3. Detecting unkeyed entity mentions (hallucinations)
 
+        With a manifest_cache attached, each section is reused until a
+        change to its inputs is reported, and the session key set is
+        patched instead of rescanned.
+
         Args:
             player_id: Player entity ID.
             location_key: Current location key.
@@ -742,14 +767,117 @@ class GMContextBuilder(BaseManager):
         Returns:
             GroundingManifest with all valid entity keys.
         """
-        from src.managers.entity_manager import EntityManager
+        player_key, player_display = self._manifest_section(
+            PLAYER, player_id, lambda: self._build_player_section(player_id)
+        )
+        location_id, location_display = self._manifest_section(
+            LOCATION, location_key, lambda: self._build_location_section(location_key)
+        )
+        npcs = self._manifest_section(
+            NPCS, location_key, lambda: self._build_npcs_section(location_key)
+        )
+        items_at_location = self._manifest_section(
+            ITEMS_AT_LOCATION,
+            location_key,
+            lambda: self._build_items_at_location_section(location_key),
+        )
+        inventory = self._manifest_section(
+            INVENTORY, player_id, lambda: self._build_inventory_section(player_id)
+        )
+        equipped = self._manifest_section(
+            EQUIPPED, player_id, lambda: self._build_equipped_section(player_id)
+        )
+        storages = self._manifest_section(
+            STORAGES,
+            (player_id, location_key),
+            lambda: self._build_storages_section(player_id, location_id),
+        )
+        exits = self._manifest_section(
+            EXITS, location_key, lambda: self._build_exits_section(location_key)
+        )
 
-        # Get player entity
+        # Build candidate locations (non-exit locations matching destination hint)
+        candidate_locations: dict[str, GroundedEntity] = {}
+        if destination_hint:
+            candidate_locations = self._get_candidate_locations(
+                destination_hint=destination_hint,
+                current_location_key=location_key,
+                exclude_keys=set(exits.keys()),
+            )
+
+        # Query ALL entity and item keys from this session
+        # This prevents branch generator from creating duplicates of existing entities
+        if self.manifest_cache is not None:
+            session_entity_keys = set(
+                self.manifest_cache.get_session_keys(self._get_all_session_keys)
+            )
+        else:
+            session_entity_keys = self._get_all_session_keys()
+
+        manifest = GroundingManifest(
+            location_key=location_key,
+            location_display=location_display,
+            player_key=player_key,
+            player_display=player_display,
+            npcs=dict(npcs),
+            items_at_location=dict(items_at_location),
+            inventory=dict(inventory),
+            equipped=dict(equipped),
+            storages=dict(storages),
+            exits=dict(exits),
+            candidate_locations=candidate_locations,
+            additional_valid_keys=session_entity_keys,
+            session_id=self.session_id,
+        )
+        if self.manifest_cache is not None:
+            # Fuzzy key repair searches the cached session index instead of re-indexing
+            manifest.use_session_key_index(
+                self.manifest_cache.get_session_key_index(self._get_all_session_keys)
+            )
+        return manifest
+
+    async def build_grounding_manifest_async(
+        self,
+        player_id: int,
+        location_key: str,
+        destination_hint: str | None = None,
+    ) -> GroundingManifest:
+        """Async version of build_grounding_manifest().
+
+        On an AsyncSession-backed session the section queries are awaited
+        instead of blocking the event loop.
+
+        Args:
+            player_id: Player entity ID.
+            location_key: Current location key.
+            destination_hint: Optional destination text for MOVE actions.
+
+        Returns:
+            GroundingManifest with all valid entity keys.
+        """
+        return await run_sync_read(
+            self.db,
+            self.build_grounding_manifest,
+            player_id,
+            location_key,
+            destination_hint,
+        )
+
+    def _manifest_section(self, name: str, scope: Hashable, build: Callable[[], T]) -> T:
+        """Build a manifest section, reusing the cached copy if unchanged."""
+        if self.manifest_cache is None:
+            return build()
+        return self.manifest_cache.get_section(name, scope, build)
+
+    def _build_player_section(self, player_id: int) -> tuple[str, str]:
+        """Get the player's key and display name."""
         player = self.db.query(Entity).filter(Entity.id == player_id).first()
-        player_key = player.entity_key if player else "player"
-        player_display = player.display_name if player else "You"
+        if player is None:
+            return "player", "You"
+        return player.entity_key, player.display_name
 
-        # Get location
+    def _build_location_section(self, location_key: str) -> tuple[int | None, str]:
+        """Get the location's ID and display name."""
         location = (
             self.db.query(Location)
             .filter(
@@ -758,9 +886,14 @@ class GMContextBuilder(BaseManager):
             )
             .first()
         )
-        location_display = location.display_name if location else location_key
+        if location is None:
+            return None, location_key
+        return location.id, location.display_name
+
+    def _build_npcs_section(self, location_key: str) -> dict[str, GroundedEntity]:
+        """Get NPCs present at the location."""
+        from src.managers.entity_manager import EntityManager
 
-        # Build NPC dict
         npcs: dict[str, GroundedEntity] = {}
         entity_manager = EntityManager(self.db, self.game_session)
         npc_entities = entity_manager.get_npcs_in_scene(location_key)
@@ -772,8 +905,10 @@ class GMContextBuilder(BaseManager):
                 entity_type="npc",
                 short_description=occupation,
             )
+        return npcs
 
-        # Build items at location dict
+    def _build_items_at_location_section(self, location_key: str) -> dict[str, GroundedEntity]:
+        """Get items lying at the location."""
         items_at_location: dict[str, GroundedEntity] = {}
         for item in self.item_manager.get_items_at_location(location_key)[:15]:
             items_at_location[item.item_key] = GroundedEntity(
@@ -781,8 +916,10 @@ class GMContextBuilder(BaseManager):
                 display_name=item.display_name,
                 entity_type="item",
             )
+        return items_at_location
 
-        # Build inventory dict
+    def _build_inventory_section(self, player_id: int) -> dict[str, GroundedEntity]:
+        """Get items the player is carrying."""
         inventory: dict[str, GroundedEntity] = {}
         for item in self.item_manager.get_inventory(player_id)[:20]:
             inventory[item.item_key] = GroundedEntity(
@@ -790,8 +927,10 @@ class GMContextBuilder(BaseManager):
                 display_name=item.display_name,
                 entity_type="item",
             )
+        return inventory
 
-        # Build equipped dict
+    def _build_equipped_section(self, player_id: int) -> dict[str, GroundedEntity]:
+        """Get items the player is wearing or holding."""
         equipped: dict[str, GroundedEntity] = {}
         for item in self.item_manager.get_equipped_items(player_id):
             slot = item.body_slot or "equipped"
@@ -801,29 +940,37 @@ class GMContextBuilder(BaseManager):
                 entity_type="item",
                 short_description=f"worn on {slot}",
             )
+        return equipped
 
-        # Build storage dict
+    def _build_storages_section(
+        self, player_id: int, location_id: int | None
+    ) -> dict[str, GroundedEntity]:
+        """Get storage containers at the location with first-visit status."""
         storages: dict[str, GroundedEntity] = {}
-        if location:
-            storages_with_status = (
-                self.storage_observation_manager.get_storages_at_location_with_status(
-                    observer_id=player_id,
-                    location_id=location.id,
-                )
+        if location_id is None:
+            return storages
+
+        storages_with_status = (
+            self.storage_observation_manager.get_storages_at_location_with_status(
+                observer_id=player_id,
+                location_id=location_id,
             )
-            for storage_info in storages_with_status:
-                storage_key = storage_info["storage_key"]
-                storage_name = storage_info.get("storage_name", storage_key)
-                first_time = storage_info["first_time"]
-                status = "[FIRST TIME]" if first_time else "[REVISIT]"
-                storages[storage_key] = GroundedEntity(
-                    key=storage_key,
-                    display_name=storage_name,
-                    entity_type="storage",
-                    short_description=status,
-                )
+        )
+        for storage_info in storages_with_status:
+            storage_key = storage_info["storage_key"]
+            storage_name = storage_info.get("storage_name", storage_key)
+            first_time = storage_info["first_time"]
+            status = "[FIRST TIME]" if first_time else "[REVISIT]"
+            storages[storage_key] = GroundedEntity(
+                key=storage_key,
+                display_name=storage_name,
+                entity_type="storage",
+                short_description=status,
+            )
+        return storages
 
-        # Build exits dict
+    def _build_exits_section(self, location_key: str) -> dict[str, GroundedEntity]:
+        """Get locations reachable from the location."""
         exits: dict[str, GroundedEntity] = {}
         try:
             accessible = self.location_manager.get_accessible_locations(location_key)
@@ -835,35 +982,7 @@ class GMContextBuilder(BaseManager):
                 )
         except Exception:
             pass  # Skip if location lookup fails
-
-        # Build candidate locations (non-exit locations matching destination hint)
-        candidate_locations: dict[str, GroundedEntity] = {}
-        if destination_hint:
-            candidate_locations = self._get_candidate_locations(
-                destination_hint=destination_hint,
-                current_location_key=location_key,
-                exclude_keys=set(exits.keys()),
-            )
-
-        # Query ALL entity and item keys from this session
-        # This prevents branch generator from creating duplicates of existing entities
-        session_entity_keys = self._get_all_session_keys()
-
-        return GroundingManifest(
-            location_key=location_key,
-            location_display=location_display,
-            player_key=player_key,
-            player_display=player_display,
-            npcs=npcs,
-            items_at_location=items_at_location,
-            inventory=inventory,
-            equipped=equipped,
-            storages=storages,
-            exits=exits,
-            candidate_locations=candidate_locations,
-            additional_valid_keys=session_entity_keys,
-            session_id=self.session_id,
-        )
+        return exits
 
     def _get_all_session_keys(self) -> set[str]:
         """Get all entity and item keys from the current session.
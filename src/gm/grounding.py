@@ -11,7 +11,9 @@ the narrator's format for consistency across the system.
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from src.gm.key_index import KeyIndex
 
 
 class GroundedEntity(BaseModel):
@@ -78,6 +80,12 @@ class GroundingManifest(BaseModel):
         description="Session ID for tracking which session this manifest belongs to",
     )
 
+    # Fuzzy key lookup: this manifest's own keys, plus the session-wide index
+    # kept by ManifestCache (see use_session_key_index)
+    _key_index: KeyIndex | None = PrivateAttr(default=None)
+    _key_index_signature: tuple | None = PrivateAttr(default=None)
+    _session_key_index: KeyIndex | None = PrivateAttr(default=None)
+
     def contains_key(self, key: str) -> bool:
         """Check if a key exists in the manifest.
 
@@ -161,6 +169,90 @@ class GroundingManifest(BaseModel):
                 return category[key]
         return None
 
+    def add_valid_key(self, key: str) -> None:
+        """Mark a key created mid-turn as valid.
+
+        Prefer this over mutating additional_valid_keys directly: it also
+        updates the fuzzy key index instead of forcing a rebuild.
+
+        Args:
+            key: Entity key to accept.
+        """
+        self.additional_valid_keys.add(key)
+        if self._key_index is not None:
+            shared = self._session_key_index
+            if shared is None or key not in shared:
+                self._key_index.add(key)
+            self._key_index_signature = self._key_signature()
+
+    def use_session_key_index(self, index: KeyIndex) -> None:
+        """Search a shared index for additional_valid_keys.
+
+        ManifestCache keeps one index of every session key, patched as
+        rows are created and deleted, so manifests built from it do not
+        re-index the whole session.
+
+        Args:
+            index: Index of the session's entity and item keys.
+        """
+        self._session_key_index = index
+        self._key_index = None
+
+    def _key_signature(self) -> tuple:
+        """Cheap fingerprint of the key containers, to notice direct edits."""
+        return (
+            self.location_key,
+            self.player_key,
+            len(self.npcs),
+            len(self.items_at_location),
+            len(self.inventory),
+            len(self.equipped),
+            len(self.storages),
+            len(self.exits),
+            len(self.candidate_locations),
+            len(self.additional_valid_keys),
+        )
+
+    def _key_indexes(self) -> list[KeyIndex]:
+        """Indexes covering all_keys(), building the local one if stale."""
+        shared = self._session_key_index
+        signature = self._key_signature()
+        if self._key_index is None or signature != self._key_index_signature:
+            index = KeyIndex(self.all_entities())
+            index.update((self.location_key, self.player_key))
+            index.update(
+                key
+                for key in self.additional_valid_keys
+                if shared is None or key not in shared
+            )
+            self._key_index = index
+            self._key_index_signature = signature
+        if shared is None:
+            return [self._key_index]
+        return [self._key_index, shared]
+
+    def find_similar_keys(
+        self, invalid_key: str, threshold: float = 0.6, limit: int | None = None
+    ) -> list[tuple[str, float]]:
+        """Find valid keys similar to an invalid one.
+
+        Args:
+            invalid_key: The hallucinated/invalid key to match.
+            threshold: Minimum similarity score (0.0-1.0).
+            limit: Maximum number of matches (all if None).
+
+        Returns:
+            (key, score) pairs, best first.
+        """
+        scores: dict[str, float] = {}
+        for index in self._key_indexes():
+            # The shared index follows the live session, not this snapshot
+            for key, score in index.similar(invalid_key, threshold):
+                if key not in scores and self.contains_key(key):
+                    scores[key] = score
+        matches = sorted(scores.items(), key=lambda match: (-match[1], match[0]))
+        return matches[:limit] if limit is not None else matches
+
     def find_similar_key(
         self, invalid_key: str, threshold: float = 0.6
     ) -> str | None:
@@ -178,18 +270,10 @@ class GroundingManifest(BaseModel):
         Returns:
             The most similar valid key if above threshold, None otherwise.
         """
-        from difflib import SequenceMatcher
-
-        best_match: str | None = None
-        best_score = threshold
-
-        for valid_key in self.all_keys():
-            score = SequenceMatcher(None, invalid_key.lower(), valid_key.lower()).ratio()
-            if score > best_score:
-                best_match = valid_key
-                best_score = score
-
-        return best_match
+        for key, score in self.find_similar_keys(invalid_key, threshold, limit=1):
+            if score > threshold:
+                return key
+        return None
 
     def format_for_prompt(self) -> str:
         """Format manifest for inclusion in GM system prompt.
@@ -6,7 +6,9 @@ This module validates GM output to ensure:
 - Output is grounded in known entities
 
 The validator is deterministic (no LLM) and fast, enabling
-validation passes during the GM tool loop.
+validation passes during the GM tool loop. Entity names are found with
+one PhraseIndex pass over the text rather than a regex per entity, and
+GroundingScan validates a streamed narrative incrementally.
 """
 
 from __future__ import annotations
@@ -15,11 +17,13 @@ import logging
 import re
 
 from src.gm.grounding import (
+    GroundedEntity,
     GroundingManifest,
     GroundingValidationResult,
     InvalidKeyReference,
     UnkeyedMention,
 )
+from src.gm.narrative_scanner import PhraseIndex
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +36,9 @@ KEY_PATTERN = re.compile(r"\[([a-z0-9_]+):([^\]]+)\]")
 # Negative lookahead (?!:) ensures we don't match the start of [key:text]
 KEY_ONLY_PATTERN = re.compile(r"\[([a-z0-9_]+)\](?!:)")
 
+# Name words too common to count as an entity mention on their own
+NAME_PART_STOPWORDS = frozenset({"the", "and", "for", "with", "from", "into", "onto", "some"})
+
 
 class GroundingValidator:
     """Validates GM output against a grounding manifest.
@@ -99,6 +106,20 @@ class GroundingValidator:
                     if word not in self._name_to_key:
                         self._name_to_key[word] = key
 
+        # (key, entity, lowercase display name, significant name words)
+        self._entity_names: list[tuple[str, GroundedEntity, str, list[str]]] = []
+        for key, entity in self.manifest.all_entities().items():
+            display_lower = entity.display_name.lower()
+            parts = [
+                part
+                for part in display_lower.split()
+                if len(part) > 3 and part not in NAME_PART_STOPWORDS
+            ]
+            self._entity_names.append((key, entity, display_lower, parts))
+        self._phrases = PhraseIndex(
+            phrase for _, _, name, parts in self._entity_names for phrase in (name, *parts)
+        )
+
     def validate(self, text: str) -> GroundingValidationResult:
         """Validate GM output for grounding issues.
 
@@ -108,11 +129,25 @@ class GroundingValidator:
         Returns:
             GroundingValidationResult with validation status and any errors.
         """
-        invalid_keys: list[InvalidKeyReference] = []
-        unkeyed_mentions: list[UnkeyedMention] = []
-
-        # Extract and validate [key:text] references
         key_refs = self._extract_key_references(text)
+        return self._build_result(text, key_refs, self._phrases.first_positions(text.lower()))
+
+    def scan(self) -> GroundingScan:
+        """Start validating a narrative that is still being streamed.
+
+        Returns:
+            A GroundingScan for this validator.
+        """
+        return GroundingScan(self)
+
+    def _build_result(
+        self,
+        text: str,
+        key_refs: list[tuple[str, str, int]],
+        name_positions: dict[str, int],
+    ) -> GroundingValidationResult:
+        """Turn the references and name positions found in text into a result."""
+        invalid_keys: list[InvalidKeyReference] = []
 
         for key, display_text, position in key_refs:
             if not self.manifest.contains_key(key):
@@ -128,8 +163,7 @@ class GroundingValidator:
                 )
 
         # Check for unkeyed entity mentions
-        unkeyed = self._detect_unkeyed_mentions(text, key_refs)
-        unkeyed_mentions.extend(unkeyed)
+        unkeyed_mentions = self._detect_unkeyed_mentions(text, key_refs, name_positions)
 
         return GroundingValidationResult(
             valid=len(invalid_keys) == 0 and len(unkeyed_mentions) == 0,
@@ -177,24 +211,28 @@ class GroundingValidator:
         self,
         text: str,
         keyed_refs: list[tuple[str, str, int]],
+        name_positions: dict[str, int] | None = None,
     ) -> list[UnkeyedMention]:
         """Detect entity mentions without [key:text] format.
 
         Args:
             text: The text to check.
             keyed_refs: Already extracted keyed references.
+            name_positions: First position of each entity name and name
+                word in the lowercased text (found here if None).
 
         Returns:
             List of UnkeyedMention errors.
         """
+        if name_positions is None:
+            name_positions = self._phrases.first_positions(text.lower())
         errors = []
-        text_lower = text.lower()
 
         # Get the keys that were properly used
         used_keys = {key for key, _, _ in keyed_refs}
 
         # Check each entity's names
-        for key, entity in self.manifest.all_entities().items():
+        for key, entity, display_lower, name_parts in self._entity_names:
             # If this key was used properly, skip checking its name
             if key in used_keys:
                 continue
@@ -204,14 +242,12 @@ class GroundingValidator:
             if self.skip_player_items and key in self._player_item_keys:
                 continue
 
-            display_lower = entity.display_name.lower()
-
-            # Use word boundary to find standalone mentions
-            pattern = rf"\b{re.escape(display_lower)}\b"
-            match = re.search(pattern, text_lower)
-
-            if match:
-                pos = match.start()
+            # Whole-word mentions of the full name, then of significant
+            # name parts for NPCs (first name, last name - not just articles)
+            for phrase in (display_lower, *name_parts):
+                pos = name_positions.get(phrase)
+                if pos is None:
+                    continue
                 # Check if there's a [key: pattern within 50 chars before
                 before_text = text[max(0, pos - 50) : pos]
                 if f"[{key}:" not in before_text.lower():
@@ -224,42 +260,80 @@ class GroundingValidator:
                             context=context,
                         )
                     )
-                    continue
-
-            # Check for significant name parts for NPCs
-            # (first name, last name - not just articles)
-            name_parts = display_lower.split()
-            for part in name_parts:
-                if len(part) > 3 and part not in {
-                    "the",
-                    "and",
-                    "for",
-                    "with",
-                    "from",
-                    "into",
-                    "onto",
-                    "some",
-                }:
-                    pattern = rf"\b{re.escape(part)}\b"
-                    match = re.search(pattern, text_lower)
-                    if match:
-                        pos = match.start()
-                        before_text = text[max(0, pos - 50) : pos]
-                        if f"[{key}:" not in before_text.lower():
-                            context = self._get_context(text, pos)
-                            errors.append(
-                                UnkeyedMention(
-                                    expected_key=key,
-                                    display_name=entity.display_name,
-                                    position=pos,
-                                    context=context,
-                                )
-                            )
-                            break  # Only report once per entity
+                    break  # Only report once per entity
 
         return errors
 
 
+class GroundingScan:
+    """Grounding validation of a narrative as it streams in.
+
+    GroundingValidator.validate() looks at the whole text each time;
+    validating every sentence of a streamed narrative that way costs
+    the square of its length. A scan remembers the key references and
+    name positions that more text can no longer change, so each call
+    only looks at the newly arrived text plus a short tail.
+
+    Usage:
+        scan = GroundingValidator(manifest).scan()
+        for prefix in growing_prefixes:
+            result = scan.validate(prefix)  # Same as validator.validate(prefix)
+    """
+
+    def __init__(self, validator: GroundingValidator) -> None:
+        """Initialize the scan.
+
+        Args:
+            validator: Validator whose manifest and names to use.
+        """
+        self.validator = validator
+        self._reset("")
+
+    def _reset(self, text: str) -> None:
+        """Forget everything scanned so far."""
+        self._text = text
+        self._key_refs: list[tuple[str, str, int]] = []
+        self._key_scanned = 0  # KEY_PATTERN matches before this are final
+        self._name_positions: dict[str, int] = {}
+        self._names_scanned = 0  # Name positions before this are final
+
+    def validate(self, text: str) -> GroundingValidationResult:
+        """Validate text, normally the previous text plus what streamed in since.
+
+        Text that does not extend the previous call's is scanned afresh.
+
+        Args:
+            text: The narrative so far.
+
+        Returns:
+            The same result GroundingValidator.validate(text) gives.
+        """
+        if not text.startswith(self._text):
+            self._reset("")
+        self._text = text
+
+        last_end = self._key_scanned
+        for match in KEY_PATTERN.finditer(text, self._key_scanned):
+            self._key_refs.append((match.group(1), match.group(2), match.start()))
+            last_end = match.end()
+        # Only a "[" with no "]" after it can still start a reference
+        pending = text.find("[", max(last_end, text.rfind("]") + 1))
+        self._key_scanned = pending if pending != -1 else len(text)
+
+        lowered = text.lower()
+        phrases = self.validator._phrases
+        settled = max(self._names_scanned, phrases.settled(len(lowered)))
+        found = phrases.first_positions(lowered, self._names_scanned, settled)
+        for phrase, position in found.items():
+            self._name_positions.setdefault(phrase, position)
+        self._names_scanned = settled
+
+        # The unsettled tail counts as the end of the text for this call only
+        name_positions = phrases.first_positions(lowered, settled)
+        name_positions.update(self._name_positions)
+        return self.validator._build_result(text, list(self._key_refs), name_positions)
+
+
 def fix_key_only_format(text: str, manifest: GroundingManifest) -> str:
     """Replace [key] with [key:display_name] using manifest lookup.
 
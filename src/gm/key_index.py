@@ -0,0 +1,192 @@
+"""Trigram index for fuzzy entity key lookup.
+
+When the LLM invents a key ("farmer_001" for "farmer_marcus"), key
+repair looks for the closest valid key by difflib's SequenceMatcher
+ratio. Grounding manifests carry every entity and item key in the
+session, so comparing against all of them costs one SequenceMatcher per
+key per hallucination, which grows with the world.
+
+KeyIndex keeps postings from padded character trigrams to keys and the
+keys grouped by length. A lookup:
+
+1. Skips lengths that cannot reach the threshold (the ratio is
+   2 * matches / (len(a) + len(b)), and matches <= the shorter length).
+2. Counts shared trigrams from the postings of the query's trigrams,
+   skipping grams so common they would select most of the index.
+3. Scores the keys sharing the most trigrams with the exact
+   SequenceMatcher ratio, after the cheap upper bounds
+   (real_quick_ratio, quick_ratio) rule them in.
+
+Scores are therefore the same numbers the linear scan produced. What
+changes is which keys are scored: a key sharing no trigram with the
+query, or outside the max_candidates best trigram overlaps, is not
+considered. Padding makes the first and last characters grams of their
+own, so a key that is a close typo of the query always shares some.
+
+Matching is case-insensitive; keys are returned as added.
+"""
+
+from collections import Counter
+from collections.abc import Iterable
+from difflib import SequenceMatcher
+
+# Postings longer than this are skipped when counting (e.g. "npc" in "npc_0001")
+DEFAULT_MAX_POSTINGS = 256
+
+# Keys scored with SequenceMatcher per lookup
+DEFAULT_MAX_CANDIDATES = 64
+
+_PAD = "\x00"
+
+
+def _trigrams(text: str) -> set[str]:
+    """Distinct padded character trigrams of lowercased text."""
+    padded = f"{_PAD}{_PAD}{text.lower()}{_PAD}{_PAD}"
+    return {padded[start:start + 3] for start in range(len(padded) - 2)}
+
+
+class KeyIndex:
+    """Entity keys indexed by trigram and length for fuzzy lookup.
+
+    Usage:
+        index = KeyIndex(manifest.all_keys())
+        for key, score in index.similar("farmer_001", threshold=0.6, limit=2):
+            ...
+
+    Args:
+        keys: Keys to index.
+        max_postings: Skip trigrams shared by more keys than this.
+        max_candidates: Keys scored with SequenceMatcher per lookup.
+    """
+
+    def __init__(
+        self,
+        keys: Iterable[str] = (),
+        max_postings: int = DEFAULT_MAX_POSTINGS,
+        max_candidates: int = DEFAULT_MAX_CANDIDATES,
+    ) -> None:
+        """Build the index.
+
+        Args:
+            keys: Keys to index.
+            max_postings: Skip trigrams shared by more keys than this.
+            max_candidates: Keys scored with SequenceMatcher per lookup.
+        """
+        self.max_postings = max_postings
+        self.max_candidates = max_candidates
+        self._keys: set[str] = set()
+        self._postings: dict[str, set[str]] = {}
+        self._by_length: dict[int, set[str]] = {}
+        self.update(keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def add(self, key: str) -> None:
+        """Index a key (no-op if present).
+
+        Args:
+            key: Key to add.
+        """
+        if key in self._keys:
+            return
+        self._keys.add(key)
+        for gram in _trigrams(key):
+            self._postings.setdefault(gram, set()).add(key)
+        self._by_length.setdefault(len(key), set()).add(key)
+
+    def update(self, keys: Iterable[str]) -> None:
+        """Index several keys.
+
+        Args:
+            keys: Keys to add.
+        """
+        for key in keys:
+            self.add(key)
+
+    def discard(self, key: str) -> None:
+        """Drop a key (no-op if absent).
+
+        Args:
+            key: Key to remove.
+        """
+        if key not in self._keys:
+            return
+        self._keys.discard(key)
+        for gram in _trigrams(key):
+            postings = self._postings[gram]
+            postings.discard(key)
+            if not postings:
+                del self._postings[gram]
+        same_length = self._by_length[len(key)]
+        same_length.discard(key)
+        if not same_length:
+            del self._by_length[len(key)]
+
+    def _candidates(self, query: str, threshold: float) -> list[str]:
+        """Keys worth scoring, most shared trigrams first."""
+        size = len(query)
+        lengths = {
+            length
+            for length in self._by_length
+            if length + size and 2 * min(length, size) / (length + size) >= threshold
+        }
+        if not lengths:
+            return []
+
+        postings = [self._postings[gram] for gram in _trigrams(query) if gram in self._postings]
+        if not postings:
+            return []
+        selective = [keys for keys in postings if len(keys) <= self.max_postings]
+        if not selective:
+            # Every gram is common: fall back to the rarest one
+            selective = [min(postings, key=len)]
+
+        shared: Counter[str] = Counter()
+        for keys in selective:
+            shared.update(key for key in keys if len(key) in lengths)
+        return [key for key, _ in shared.most_common(self.max_candidates)]
+
+    def similar(
+        self, query: str, threshold: float = 0.6, limit: int | None = None
+    ) -> list[tuple[str, float]]:
+        """Indexed keys whose similarity to query is at least threshold.
+
+        Args:
+            query: The (possibly hallucinated) key.
+            threshold: Minimum SequenceMatcher ratio.
+            limit: Maximum number of results (all if None).
+
+        Returns:
+            (key, score) pairs, best first, ties by key.
+        """
+        lowered = query.lower()
+        matcher = SequenceMatcher(None, lowered)
+        matches = []
+        for key in self._candidates(query, threshold):
+            matcher.set_seq2(key.lower())
+            if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+                continue
+            score = matcher.ratio()
+            if score >= threshold:
+                matches.append((key, score))
+        matches.sort(key=lambda match: (-match[1], match[0]))
+        return matches[:limit] if limit is not None else matches
+
+    def most_similar(self, query: str, threshold: float = 0.6) -> str | None:
+        """The best key scoring strictly above threshold.
+
+        Args:
+            query: The (possibly hallucinated) key.
+            threshold: Score the match must exceed.
+
+        Returns:
+            The key, or None.
+        """
+        for key, score in self.similar(query, threshold, limit=1):
+            if score > threshold:
+                return key
+        return None
@@ -0,0 +1,243 @@
+"""Incremental cache for GroundingManifest sections.
+
+build_grounding_manifest() runs on every turn and every anticipation
+cycle. Most of what it queries (NPCs present, items, inventory, exits,
+and the full list of session keys) is unchanged from one call to the
+next. ManifestCache keeps each section keyed by the player/location it
+was built for and only drops the sections whose inputs changed:
+
+- Deltas applied by BranchCollapseManager are reported via apply_delta(),
+  which dirties only the sections that delta type can affect.
+- Writes made outside delta application are caught by a session
+  after_flush listener, which dirties sections by model type.
+- The session-wide key set, and the trigram KeyIndex over it used for
+  fuzzy key repair, are patched in place from created and deleted
+  Entity/Item rows instead of being rescanned.
+"""
+
+import logging
+from contextlib import contextmanager
+from typing import Any, Callable, Hashable, Iterator, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.database.models.entities import Entity, NPCExtension
+from src.database.models.items import Item, StorageLocation
+from src.database.models.world import Location, StorageObservation
+from src.gm.key_index import KeyIndex
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Section names
+PLAYER = "player"
+LOCATION = "location"
+NPCS = "npcs"
+ITEMS_AT_LOCATION = "items_at_location"
+INVENTORY = "inventory"
+EQUIPPED = "equipped"
+STORAGES = "storages"
+EXITS = "exits"
+
+ALL_SECTIONS = (PLAYER, LOCATION, NPCS, ITEMS_AT_LOCATION, INVENTORY, EQUIPPED, STORAGES, EXITS)
+ITEM_SECTIONS = (ITEMS_AT_LOCATION, INVENTORY, EQUIPPED)
+
+# Sections each delta type can change (keyed by DeltaType value)
+DELTA_SECTIONS: dict[str, tuple[str, ...]] = {
+    "create_entity": (NPCS, *ITEM_SECTIONS, LOCATION, EXITS),
+    "delete_entity": (NPCS, *ITEM_SECTIONS),
+    "update_entity": (PLAYER, NPCS),
+    "update_location": (NPCS,),
+    "transfer_item": ITEM_SECTIONS,
+    "update_need": (),
+    "update_relationship": (),
+    "record_fact": (),
+    "advance_time": (),
+}
+
+# Sections that depend on each model, for writes outside delta application
+MODEL_SECTIONS: dict[type, tuple[str, ...]] = {
+    Entity: (PLAYER, NPCS),
+    NPCExtension: (NPCS,),
+    Item: ITEM_SECTIONS,
+    StorageLocation: (STORAGES,),
+    StorageObservation: (STORAGES,),
+    Location: (LOCATION, EXITS),
+}
+
+
+class ManifestCache:
+    """Session-scoped cache of grounding manifest sections.
+
+    Usage:
+        cache = ManifestCache(db)
+        builder = GMContextBuilder(db, game_session, manifest_cache=cache)
+
+        # Around delta application
+        with cache.applying_deltas():
+            for delta in deltas:
+                apply(delta)
+                cache.apply_delta(delta.delta_type, delta.target_key, delta.changes)
+    """
+
+    def __init__(self, db: Session | None = None):
+        """Initialize the cache.
+
+        Args:
+            db: Database session to watch for out-of-band writes
+        """
+        self._sections: dict[str, dict[Hashable, Any]] = {name: {} for name in ALL_SECTIONS}
+        self._session_keys: set[str] | None = None
+        self._session_key_index: KeyIndex | None = None
+        self._applying = False
+        self.hits = 0
+        self.misses = 0
+
+        if isinstance(db, Session):
+            event.listen(db, "after_flush", self._on_flush)
+            event.listen(db, "after_rollback", self._on_rollback)
+
+    def get_section(self, name: str, scope: Hashable, build: Callable[[], T]) -> T:
+        """Get a cached section, building it on a miss.
+
+        Args:
+            name: Section name
+            scope: What the section was built for (player id, location key, ...)
+            build: Builds the section from the database
+
+        Returns:
+            The section value
+        """
+        entries = self._sections[name]
+        if scope in entries:
+            self.hits += 1
+            return entries[scope]
+
+        self.misses += 1
+        value = build()
+        entries[scope] = value
+        return value
+
+    def get_session_keys(self, load: Callable[[], set[str]]) -> set[str]:
+        """Get every entity and item key in the session.
+
+        Loaded once, then patched as rows are created and deleted.
+
+        Args:
+            load: Full scan used the first time
+
+        Returns:
+            The live key set (callers must copy before mutating)
+        """
+        if self._session_keys is None:
+            self._session_keys = set(load())
+            self._session_key_index = None
+        return self._session_keys
+
+    def get_session_key_index(self, load: Callable[[], set[str]]) -> KeyIndex:
+        """Get a fuzzy lookup index over every entity and item key in the session.
+
+        Built once from the session keys, then patched alongside them.
+
+        Args:
+            load: Full scan used if the session keys are not loaded yet
+
+        Returns:
+            The live index (shared by every manifest built from this cache)
+        """
+        keys = self.get_session_keys(load)
+        if self._session_key_index is None:
+            self._session_key_index = KeyIndex(keys)
+        return self._session_key_index
+
+    def apply_delta(self, delta_type: str, target_key: str, changes: dict[str, Any]) -> None:
+        """Update the cache for a state delta that was just applied.
+
+        Args:
+            delta_type: DeltaType value of the applied delta
+            target_key: Delta target key
+            changes: Delta changes
+        """
+        delta_type = getattr(delta_type, "value", delta_type)
+        if delta_type not in DELTA_SECTIONS:
+            logger.debug(f"Unknown delta type {delta_type}, rebuilding whole manifest")
+            self.invalidate()
+            return
+
+        # Created/deleted keys are patched by the flush listener
+        self.invalidate(DELTA_SECTIONS[delta_type])
+
+    @contextmanager
+    def applying_deltas(self) -> Iterator[None]:
+        """Suspend flush-based invalidation while apply_delta() reports changes."""
+        previous = self._applying
+        self._applying = True
+        try:
+            yield
+        finally:
+            self._applying = previous
+
+    def invalidate(self, sections: tuple[str, ...] | list[str] | None = None) -> None:
+        """Drop cached sections so they are rebuilt on next use.
+
+        Args:
+            sections: Section names to drop (all sections and session keys if None)
+        """
+        if sections is None:
+            for entries in self._sections.values():
+                entries.clear()
+            self._session_keys = None
+            self._session_key_index = None
+            return
+        for name in sections:
+            self._sections[name].clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "cached_sections": sum(len(entries) for entries in self._sections.values()),
+            "session_keys": len(self._session_keys) if self._session_keys is not None else None,
+        }
+
+    def _on_flush(self, session: Session, flush_context: object) -> None:
+        """Patch session keys and dirty sections for flushed rows."""
+        dirty: set[str] = set()
+        for obj in (*session.new, *session.dirty, *session.deleted):
+            sections = MODEL_SECTIONS.get(type(obj))
+            if sections:
+                dirty.update(sections)
+
+        if self._session_keys is not None:
+            index = self._session_key_index
+            for obj in session.new:
+                key = self._row_key(obj)
+                if key is not None:
+                    self._session_keys.add(key)
+                    if index is not None:
+                        index.add(key)
+            for obj in session.deleted:
+                key = self._row_key(obj)
+                if key is not None:
+                    self._session_keys.discard(key)
+                    if index is not None:
+                        index.discard(key)
+
+        if dirty and not self._applying:
+            self.invalidate(list(dirty))
+
+    @staticmethod
+    def _row_key(obj: object) -> str | None:
+        """Session key of an Entity or Item row (None for other models)."""
+        if isinstance(obj, Entity):
+            return obj.entity_key
+        if isinstance(obj, Item):
+            return obj.item_key
+        return None
+
+    def _on_rollback(self, session: Session) -> None:
+        """Forget everything; cached sections may include rolled-back rows."""
+        self.invalidate()
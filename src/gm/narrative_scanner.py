@@ -0,0 +1,296 @@
+"""Single-pass matching for narrative validation.
+
+Narrative validators look for two kinds of things in LLM output:
+
+- Entity names (display names and their significant words) that should
+  have been written as [key:text]. There is one or two per entity in
+  the scene, and each used to be its own \\b-anchored regex search.
+- Fixed rule patterns (AI identity leaks, third-person references,
+  placeholders, tool-call commentary, ...), one regex search each.
+
+PhraseIndex covers the first kind. Every phrase must appear as a whole
+word, so a match can only start where a word starts: the text is split
+into words once, and each word is looked up in a dict of phrases by
+their first word, then checked in place. The result is the same first
+position a \\b{phrase}\\b search gives, at the cost of one pass over the
+words however many phrases there are.
+
+RuleSet covers the second. Every pattern is parsed once for literal
+factors, strings at least one of which any match must contain
+("tool" for r"\\buse\\s+\\w+\\s+tool\\b", "${" for r"\\$\\{.*\\}"). A
+search checks which factors occur in the case-folded text, a C-speed
+substring test each, and only runs the patterns whose factors are
+there; each of those still reports its own first match. Valid
+narratives (the common case) contain few or no factors, so most
+patterns never run, and a new rule adds one or two substring tests
+rather than a regex scan. (A pure-Python Aho-Corasick automaton over
+the factors measured slower than these substring tests at this size.)
+
+PhraseIndex can also scan a growing text: settled() says which
+positions more text can no longer change, so a streaming validator
+only ever scans each position once (see GroundingScan).
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Mapping, Sequence
+
+try:
+    # Private CPython modules; without them every rule pattern always runs
+    from re import _constants as sre_constants
+    from re import _parser as sre_parser
+except ImportError:  # pragma: no cover - other interpreters
+    sre_constants = None  # type: ignore[assignment]
+    sre_parser = None  # type: ignore[assignment]
+
+WORD_PATTERN = re.compile(r"\w+")
+
+# Rule name -> first match of each of its patterns (None if no match)
+RuleMatches = dict[str, list[re.Match[str] | None]]
+
+
+# Non-ASCII characters re.IGNORECASE equates with an ASCII letter
+_IGNORECASE_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+_REPEATS = (
+    ()
+    if sre_constants is None
+    else tuple(
+        getattr(sre_constants, name, None)
+        for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    )
+)
+
+
+def fold_case(text: str) -> str:
+    """Lowercase text so every case-insensitive match of an ASCII literal survives."""
+    return text.translate(_IGNORECASE_FOLD).lower()
+
+
+def _best(candidates: list[frozenset[str]]) -> frozenset[str] | None:
+    """The factor set whose shortest member is longest (longest on average on ties)."""
+    if not candidates:
+        return None
+    return max(
+        candidates,
+        key=lambda factors: (min(map(len, factors)), sum(map(len, factors)) / len(factors)),
+    )
+
+
+def _factors(parsed: sre_parser.SubPattern | list) -> frozenset[str] | None:
+    """Lowercase literals one of which every match of a parsed pattern contains.
+
+    None means no such set was found (the pattern must always be searched).
+    """
+    candidates: list[frozenset[str]] = []
+    run = ""
+    for op, value in parsed:
+        if op is sre_constants.LITERAL and value < 128:
+            run += chr(value).lower()
+            continue
+        if op is sre_constants.AT:
+            continue  # Zero-width: the literals around it stay adjacent
+        if run:
+            candidates.append(frozenset({run}))
+            run = ""
+        if op is sre_constants.SUBPATTERN:
+            factors = _factors(value[-1])
+        elif op is sre_constants.BRANCH:
+            branches = [_factors(branch) for branch in value[1]]
+            factors = (
+                None if None in branches else frozenset().union(*branches)  # type: ignore[arg-type]
+            )
+        elif op in _REPEATS and value[0] >= 1:
+            factors = _factors(value[2])
+        else:
+            factors = None
+        if factors:
+            candidates.append(factors)
+    if run:
+        candidates.append(frozenset({run}))
+    return _best(candidates)
+
+
+def literal_factors(pattern: str, flags: int = 0) -> frozenset[str] | None:
+    """Literal strings one of which every match of a pattern contains.
+
+    Factors are lowercase; look for them in fold_case(text).
+
+    Args:
+        pattern: Regular expression.
+        flags: re flags it is compiled with.
+
+    Returns:
+        The factors, or None if the pattern has no usable literals or
+        could not be parsed.
+    """
+    if sre_parser is None:
+        return None
+    try:
+        return _factors(sre_parser.parse(pattern, flags))
+    except Exception:
+        # An unexpected parser version: searching the pattern is always safe
+        return None
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether re's \\w matches a character."""
+    return char.isalnum() or char == "_"
+
+
+def _at_boundary(text: str, position: int) -> bool:
+    """Whether re's \\b matches at a position in text."""
+    before = position > 0 and _is_word_char(text[position - 1])
+    after = position < len(text) and _is_word_char(text[position])
+    return before != after
+
+
+class PhraseIndex:
+    """Phrases matched as whole words in one pass over a text.
+
+    Matching is case-sensitive; callers lowercase phrases and text alike.
+
+    Usage:
+        index = PhraseIndex(["old tom", "tom", "tankard"])
+        index.first_positions("you greet old tom.")
+        # {"old tom": 10, "tom": 14}
+    """
+
+    def __init__(self, phrases: Iterable[str] = ()) -> None:
+        """Build the index.
+
+        Args:
+            phrases: Phrases to look for.
+        """
+        self._by_first_word: dict[str, list[str]] = {}
+        # Phrases not starting with a word character are searched by regex
+        self._irregular: dict[str, re.Pattern[str]] = {}
+        self._longest = 0
+        for phrase in phrases:
+            self.add(phrase)
+
+    def __len__(self) -> int:
+        return sum(len(phrases) for phrases in self._by_first_word.values()) + len(
+            self._irregular
+        )
+
+    def add(self, phrase: str) -> None:
+        """Add a phrase (no-op if present).
+
+        Args:
+            phrase: Phrase to look for.
+        """
+        first_word = WORD_PATTERN.match(phrase)
+        if first_word is None:
+            self._irregular.setdefault(phrase, re.compile(rf"\b{re.escape(phrase)}\b"))
+        else:
+            phrases = self._by_first_word.setdefault(first_word.group(0), [])
+            if phrase not in phrases:
+                phrases.append(phrase)
+        self._longest = max(self._longest, len(phrase))
+
+    def first_positions(
+        self, text: str, start: int = 0, stop: int | None = None
+    ) -> dict[str, int]:
+        """Find where each phrase first occurs as a whole word.
+
+        Args:
+            text: Text to search.
+            start: First position a match may start at.
+            stop: Matches must start before this (default: anywhere).
+
+        Returns:
+            Phrase -> start position, for the phrases found.
+        """
+        stop = len(text) if stop is None else stop
+        found: dict[str, int] = {}
+        for word in WORD_PATTERN.finditer(text, start):
+            position = word.start()
+            if position >= stop:
+                break
+            phrases = self._by_first_word.get(word.group(0))
+            if phrases is None or (position and _is_word_char(text[position - 1])):
+                continue
+            for phrase in phrases:
+                if (
+                    phrase not in found
+                    and text.startswith(phrase, position)
+                    and _at_boundary(text, position + len(phrase))
+                ):
+                    found[phrase] = position
+
+        for phrase, pattern in self._irregular.items():
+            match = pattern.search(text, start)
+            if match is not None and match.start() < stop:
+                found[phrase] = match.start()
+        return found
+
+    def settled(self, length: int) -> int:
+        """Where matches in a text that is still growing stop being final.
+
+        A match starting before the returned position, or its absence,
+        cannot change when more text is appended.
+
+        Args:
+            length: Current length of the text.
+
+        Returns:
+            Position (0 if nothing is settled yet).
+        """
+        # The phrase plus the character deciding its closing \b must be present
+        return max(0, length - self._longest - 1)
+
+
+class RuleSet:
+    """Named groups of regex rules, prefiltered by their literal factors.
+
+    Usage:
+        rules = RuleSet({"perspective": [r"\\bthe player\\b"]}, re.IGNORECASE)
+        matches = rules.search(text)
+        if matches["perspective"][0]:
+            ...
+    """
+
+    def __init__(self, rules: Mapping[str, Sequence[str]], flags: int = 0) -> None:
+        """Compile the rules.
+
+        Args:
+            rules: Rule name -> patterns.
+            flags: re flags for every pattern.
+        """
+        self.patterns: dict[str, list[re.Pattern[str]]] = {
+            name: [re.compile(pattern, flags) for pattern in patterns]
+            for name, patterns in rules.items()
+        }
+        # Factor -> patterns it can trigger; patterns without factors always run
+        self._triggers: dict[str, list[re.Pattern[str]]] = {}
+        self._always: list[re.Pattern[str]] = []
+        for patterns in self.patterns.values():
+            for compiled in patterns:
+                factors = literal_factors(compiled.pattern, flags)
+                if factors is None:
+                    self._always.append(compiled)
+                    continue
+                for factor in factors:
+                    self._triggers.setdefault(factor, []).append(compiled)
+
+    def search(self, text: str) -> RuleMatches:
+        """First match of every pattern.
+
+        Args:
+            text: Text to search.
+
+        Returns:
+            Rule name -> the first match of each of its patterns (None if
+            a pattern does not match), in pattern order.
+        """
+        folded = fold_case(text)
+        candidates = set(self._always)
+        for factor, patterns in self._triggers.items():
+            if factor in folded:
+                candidates.update(patterns)
+        return {
+            name: [pattern.search(text) if pattern in candidates else None for pattern in patterns]
+            for name, patterns in self.patterns.items()
+        }
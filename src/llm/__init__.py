@@ -50,6 +50,9 @@ from src.llm.factory import (
     get_creative_provider,
 )
 
+# Token counting
+from src.llm.token_counter import TokenCounter, get_token_counter
+
 # Retry utilities
 from src.llm.retry import RetryConfig, with_retry
 
@@ -62,8 +65,19 @@ from src.llm.audit_logger import (
     LLMAuditEntry,
     LLMAuditLogger,
 )
+from src.llm.audit_segments import SegmentAuditLogger, read_audit_records, render_markdown
 from src.llm.logging_provider import LoggingProvider
 
+# Response caching
+from src.llm.response_cache import LLMResponseCache, get_response_cache
+from src.llm.caching_provider import CachingProvider
+
+# Tracing
+from src.llm.tracing_provider import TracingProvider
+
+# Scripted provider (benchmarks, offline runs)
+from src.llm.scripted_provider import ScriptedProvider, ScriptedRequest
+
 # Exceptions
 from src.llm.exceptions import (
     LLMError,
@@ -74,6 +88,7 @@ from src.llm.exceptions import (
     ContextLengthError,
     UnsupportedProviderError,
     StructuredOutputError,
+    ResponseCacheMissError,
 )
 
 __all__ = [
@@ -103,6 +118,9 @@ __all__ = [
     "get_narrator_provider",
     "get_reasoning_provider",
     "get_creative_provider",
+    # Token counting
+    "TokenCounter",
+    "get_token_counter",
     # Retry
     "RetryConfig",
     "with_retry",
@@ -113,7 +131,19 @@ __all__ = [
     "LLMAuditContext",
     "LLMAuditEntry",
     "LLMAuditLogger",
+    "SegmentAuditLogger",
+    "read_audit_records",
+    "render_markdown",
     "LoggingProvider",
+    # Response caching
+    "LLMResponseCache",
+    "get_response_cache",
+    "CachingProvider",
+    # Tracing
+    "TracingProvider",
+    # Scripted provider
+    "ScriptedProvider",
+    "ScriptedRequest",
     # Exceptions
     "LLMError",
     "ProviderError",
@@ -123,4 +153,5 @@ __all__ = [
     "ContextLengthError",
     "UnsupportedProviderError",
     "StructuredOutputError",
+    "ResponseCacheMissError",
 ]
@@ -14,6 +14,7 @@ from anthropic import (
 from src.llm.base import LLMProvider
 from src.llm.message_types import Message, MessageRole, MessageContent
 from src.llm.response_types import LLMResponse, ToolCall, UsageStats
+from src.llm.token_counter import get_token_counter, prompt_text
 from src.llm.tool_types import ToolDefinition
 from src.llm.exceptions import (
     AuthenticationError,
@@ -35,8 +36,6 @@ class AnthropicProvider:
     - Vision (image inputs)
     """
 
-    CHARS_PER_TOKEN = 4  # Rough estimate for token counting
-
     def __init__(
         self,
         api_key: str | None = None,
@@ -240,10 +239,11 @@ class AnthropicProvider:
         """Generate a completion from messages."""
         extracted_system, api_messages = self._convert_messages(messages)
         final_system = system_prompt or extracted_system
+        model_name = model or self._default_model
 
         try:
             kwargs: dict[str, Any] = {
-                "model": model or self._default_model,
+                "model": model_name,
                 "max_tokens": max_tokens,
                 "temperature": temperature,
                 "messages": api_messages,
@@ -254,11 +254,16 @@ class AnthropicProvider:
                 kwargs["stop_sequences"] = list(stop_sequences)
 
             response = await self._get_client().messages.create(**kwargs)
-            return self._parse_response(response)
+            result = self._parse_response(response)
         except Exception as e:
             await self._handle_api_error(e)
             raise  # Should not reach here
 
+        get_token_counter().observe_usage(
+            model_name, prompt_text(messages, final_system), result.usage
+        )
+        return result
+
     async def complete_with_tools(
         self,
         messages: Sequence[Message],
@@ -274,12 +279,14 @@ class AnthropicProvider:
         extracted_system, api_messages = self._convert_messages(messages)
         final_system = system_prompt or extracted_system
 
+        model_name = model or self._default_model
+
         # Convert tools to Anthropic format
         api_tools = [tool.to_anthropic_format() for tool in tools]
 
         try:
             kwargs: dict[str, Any] = {
-                "model": model or self._default_model,
+                "model": model_name,
                 "max_tokens": max_tokens,
                 "temperature": temperature,
                 "messages": api_messages,
@@ -308,11 +315,16 @@ class AnthropicProvider:
                 kwargs["tool_choice"] = tool_choice
 
             response = await self._get_client().messages.create(**kwargs)
-            return self._parse_response(response)
+            result = self._parse_response(response)
         except Exception as e:
             await self._handle_api_error(e)
             raise
 
+        get_token_counter().observe_usage(
+            model_name, prompt_text(messages, final_system, kwargs.get("tools")), result.usage
+        )
+        return result
+
     async def complete_with_tools_streaming(
         self,
         messages: Sequence[Message],
@@ -344,12 +356,14 @@ class AnthropicProvider:
         extracted_system, api_messages = self._convert_messages(messages)
         final_system = system_prompt or extracted_system
 
+        model_name = model or self._default_model
+
         # Convert tools to Anthropic format
         api_tools = [tool.to_anthropic_format() for tool in tools]
 
         try:
             kwargs: dict[str, Any] = {
-                "model": model or self._default_model,
+                "model": model_name,
                 "max_tokens": max_tokens,
                 "temperature": temperature,
                 "messages": api_messages,
@@ -386,12 +400,17 @@ class AnthropicProvider:
 
                 # Get final message with full response
                 final_message = await stream.get_final_message()
-                return self._parse_response(final_message)
+                result = self._parse_response(final_message)
 
         except Exception as e:
             await self._handle_api_error(e)
             raise
 
+        get_token_counter().observe_usage(
+            model_name, prompt_text(messages, final_system, kwargs.get("tools")), result.usage
+        )
+        return result
+
     async def complete_structured(
         self,
         messages: Sequence[Message],
@@ -412,10 +431,11 @@ class AnthropicProvider:
         # Create tool definition with proper JSON schema
         tool_dict = self._schema_to_anthropic_tool(response_schema)
         tool_name = tool_dict["name"]
+        model_name = model or self._default_model
 
         try:
             kwargs: dict[str, Any] = {
-                "model": model or self._default_model,
+                "model": model_name,
                 "max_tokens": max_tokens,
                 "temperature": temperature,
                 "messages": api_messages,
@@ -427,6 +447,9 @@ class AnthropicProvider:
 
             response = await self._get_client().messages.create(**kwargs)
             parsed_response = self._parse_response(response)
+            get_token_counter().observe_usage(
+                model_name, prompt_text(messages, final_system, [tool_dict]), parsed_response.usage
+            )
 
             # Extract structured content from tool call
             if parsed_response.has_tool_calls:
@@ -584,10 +607,9 @@ class AnthropicProvider:
         text: str,
         model: str | None = None,
     ) -> int:
-        """Count tokens in text (rough estimate).
+        """Count tokens in text (approximate).
 
-        Anthropic doesn't provide a public tokenizer, so we use a heuristic.
+        Anthropic doesn't provide a public tokenizer, so this uses the shared
+        token counter's proxy tokenizer, calibrated from reported usage.
         """
-        if not text:
-            return 0
-        return len(text) // self.CHARS_PER_TOKEN
+        return get_token_counter().count(text, model or self._default_model)
@@ -2,10 +2,12 @@
 
 Provides filesystem-based logging of all LLM calls for debugging
 and prompt improvement. Logs are written as markdown files organized
-by session and turn number.
+by session and turn number, or as compressed JSONL segments (see
+audit_segments.py).
 """
 
 import asyncio
+import atexit
 import contextvars
 import json
 from dataclasses import dataclass, field
@@ -298,6 +300,9 @@ _audit_logger: LLMAuditLogger | None = None
 def get_audit_logger() -> LLMAuditLogger:
     """Get or create global audit logger.
 
+    With LLM_LOG_FORMAT=jsonl this is a SegmentAuditLogger, closed (and
+    so flushed) at interpreter exit.
+
     Returns:
         LLMAuditLogger instance.
     """
@@ -305,8 +310,19 @@ def get_audit_logger() -> LLMAuditLogger:
     if _audit_logger is None:
         from src.config import settings
 
-        _audit_logger = LLMAuditLogger(
-            log_dir=settings.llm_log_dir,
-            enabled=settings.log_llm_calls,
-        )
+        if settings.log_llm_calls and settings.llm_log_format == "jsonl":
+            from src.llm.audit_segments import SegmentAuditLogger
+
+            segment_logger = SegmentAuditLogger(
+                log_dir=settings.llm_log_dir,
+                compression=settings.llm_log_compression,
+                max_buffer_bytes=settings.llm_log_buffer_mb * 1024 * 1024,
+            )
+            atexit.register(segment_logger.close)
+            _audit_logger = segment_logger
+        else:
+            _audit_logger = LLMAuditLogger(
+                log_dir=settings.llm_log_dir,
+                enabled=settings.log_llm_calls,
+            )
     return _audit_logger
@@ -0,0 +1,388 @@
+"""Buffered, compressed JSONL sink for LLM audit logs.
+
+LLMAuditLogger writes one Markdown file per call through its own
+asyncio.to_thread hop, which under anticipation means thousands of tiny
+files. SegmentAuditLogger instead turns each entry into a JSON line,
+queues it in memory and lets one background thread append compressed
+batches to rotating per-session segment files:
+
+    logs/llm/session_42/segment_000001.jsonl.gz
+    logs/llm/orphan/segment_000001.jsonl.zst
+
+A segment is a sequence of frames, each a 4-byte big-endian length
+followed by one gzip member or zstd frame holding one or more JSON
+lines. A segment cut short by a crash reads up to its last whole frame.
+
+The queue has a byte budget. When the writer falls behind, new entries
+are dropped and counted (dropped_count) rather than stalling the turn.
+
+read_audit_records() and render_markdown() turn segments back into the
+Markdown view on demand (see scripts/render_llm_audit.py).
+"""
+
+import gzip
+import json
+import logging
+import re
+import struct
+import threading
+from collections import deque
+from collections.abc import Callable, Iterator
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Literal
+
+from src.llm.audit_logger import LLMAuditContext, LLMAuditEntry, LLMAuditLogger
+from src.llm.response_types import LLMResponse, ToolCall, UsageStats
+
+logger = logging.getLogger(__name__)
+
+Compression = Literal["gzip", "zstd"]
+
+_SUFFIXES: dict[str, str] = {"gzip": ".jsonl.gz", "zstd": ".jsonl.zst"}
+_SEGMENT_PATTERN = re.compile(r"^segment_(\d+)\.jsonl\.(gz|zst)$")
+_FRAME_HEADER = struct.Struct(">I")
+
+DEFAULT_BUFFER_BYTES = 16 * 1024 * 1024
+DEFAULT_SEGMENT_BYTES = 8 * 1024 * 1024
+
+
+def _compressor(compression: Compression) -> Callable[[bytes], bytes]:
+    """Get the frame compression function for a codec.
+
+    Raises:
+        ImportError: If zstd is requested without the zstandard package.
+        ValueError: If the codec is unknown.
+    """
+    if compression == "gzip":
+        return lambda data: gzip.compress(data, compresslevel=6, mtime=0)
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("zstd audit logs require the zstandard package") from e
+        return zstandard.ZstdCompressor(level=3).compress
+    raise ValueError(f"Unknown audit log compression: {compression}")
+
+
+def _decompressor(path: Path) -> Callable[[bytes], bytes]:
+    """Get the frame decompression function for a segment file."""
+    if path.name.endswith(_SUFFIXES["zstd"]):
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError(f"Reading {path.name} requires the zstandard package") from e
+        return zstandard.ZstdDecompressor().decompress
+    return gzip.decompress
+
+
+def entry_to_record(entry: LLMAuditEntry) -> dict[str, Any]:
+    """Convert an audit entry to a JSON-serializable record.
+
+    Args:
+        entry: The audit entry.
+
+    Returns:
+        Record dict (parsed_content and raw_response are not kept).
+    """
+    response = None
+    if entry.response is not None:
+        response = {
+            "content": entry.response.content,
+            "tool_calls": [
+                {"id": call.id, "name": call.name, "arguments": call.arguments}
+                for call in entry.response.tool_calls
+            ],
+            "finish_reason": entry.response.finish_reason,
+            "model": entry.response.model,
+            "usage": asdict(entry.response.usage) if entry.response.usage else None,
+        }
+    return {
+        "timestamp": entry.timestamp.isoformat(),
+        "session_id": entry.context.session_id,
+        "turn_number": entry.context.turn_number,
+        "call_type": entry.context.call_type,
+        "provider": entry.provider,
+        "model": entry.model,
+        "method": entry.method,
+        "system_prompt": entry.system_prompt,
+        "messages": entry.messages,
+        "tools": entry.tools,
+        "parameters": entry.parameters,
+        "response": response,
+        "error": entry.error,
+        "duration_seconds": entry.duration_seconds,
+        "tool_rounds": entry.tool_rounds,
+    }
+
+
+def record_to_entry(record: dict[str, Any]) -> LLMAuditEntry:
+    """Rebuild an audit entry from a record.
+
+    Args:
+        record: Record produced by entry_to_record.
+
+    Returns:
+        The audit entry.
+    """
+    response = None
+    if record.get("response") is not None:
+        data = record["response"]
+        response = LLMResponse(
+            content=data["content"],
+            tool_calls=tuple(
+                ToolCall(id=call["id"], name=call["name"], arguments=call["arguments"])
+                for call in data.get("tool_calls", [])
+            ),
+            finish_reason=data.get("finish_reason", "stop"),
+            model=data.get("model", ""),
+            usage=UsageStats(**data["usage"]) if data.get("usage") else None,
+        )
+    return LLMAuditEntry(
+        timestamp=datetime.fromisoformat(record["timestamp"]),
+        context=LLMAuditContext(
+            session_id=record.get("session_id"),
+            turn_number=record.get("turn_number"),
+            call_type=record.get("call_type", "unknown"),
+        ),
+        provider=record["provider"],
+        model=record["model"],
+        method=record["method"],
+        system_prompt=record.get("system_prompt"),
+        messages=record.get("messages", []),
+        tools=record.get("tools"),
+        parameters=record.get("parameters", {}),
+        response=response,
+        error=record.get("error"),
+        duration_seconds=record.get("duration_seconds", 0.0),
+        tool_rounds=record.get("tool_rounds", []),
+    )
+
+
+_MARKDOWN = LLMAuditLogger(enabled=False)
+
+
+def render_markdown(record: dict[str, Any]) -> str:
+    """Render a record exactly as LLMAuditLogger would have written it.
+
+    Args:
+        record: Record from read_audit_records.
+
+    Returns:
+        Markdown document.
+    """
+    return _MARKDOWN._format_entry(record_to_entry(record))
+
+
+def read_audit_records(path: Path | str) -> Iterator[dict[str, Any]]:
+    """Read records from a segment file, or every segment under a directory.
+
+    Args:
+        path: Segment file, session directory or log root.
+
+    Yields:
+        Records in write order within each segment.
+    """
+    path = Path(path)
+    if path.is_dir():
+        files = sorted(
+            (file for file in path.rglob("segment_*") if _SEGMENT_PATTERN.match(file.name)),
+            key=lambda file: (str(file.parent), file.name),
+        )
+    else:
+        files = [path]
+
+    for file in files:
+        decompress = _decompressor(file)
+        with file.open("rb") as f:
+            while True:
+                header = f.read(_FRAME_HEADER.size)
+                if len(header) < _FRAME_HEADER.size:
+                    break
+                (length,) = _FRAME_HEADER.unpack(header)
+                frame = f.read(length)
+                if len(frame) < length:
+                    logger.warning(f"Ignoring truncated frame at end of {file}")
+                    break
+                for line in decompress(frame).splitlines():
+                    if line:
+                        yield json.loads(line)
+
+
+class _Segment:
+    """An open segment file (writer thread only)."""
+
+    def __init__(self, directory: Path, suffix: str) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        numbers = [
+            int(match.group(1))
+            for match in (_SEGMENT_PATTERN.match(file.name) for file in directory.iterdir())
+            if match
+        ]
+        # Always start a new segment; an old one may end in a torn frame
+        self.path = directory / f"segment_{max(numbers, default=0) + 1:06d}{suffix}"
+        self.file: IO[bytes] = self.path.open("ab")
+        self.size = 0
+
+    def write(self, frame: bytes) -> None:
+        self.file.write(_FRAME_HEADER.pack(len(frame)) + frame)
+        self.file.flush()
+        self.size += _FRAME_HEADER.size + len(frame)
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class SegmentAuditLogger(LLMAuditLogger):
+    """Audit logger appending compressed JSONL to rotating segment files.
+
+    log() only serializes the entry and queues it; a single background
+    thread compresses and writes whatever has queued up. Entries that
+    would push the queue past max_buffer_bytes are dropped and counted.
+
+    Args:
+        log_dir: Directory to write segment files to.
+        enabled: Whether logging is enabled.
+        compression: Frame codec ("zstd" needs the zstandard package).
+        max_buffer_bytes: Memory budget for queued, unwritten entries.
+        segment_bytes: Size after which a session's segment rotates.
+    """
+
+    def __init__(
+        self,
+        log_dir: Path | str = "logs/llm",
+        enabled: bool = True,
+        compression: Compression = "gzip",
+        max_buffer_bytes: int = DEFAULT_BUFFER_BYTES,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+    ) -> None:
+        """Initialize the segment logger; the writer thread starts on first use.
+
+        Args:
+            log_dir: Directory to write segment files to.
+            enabled: Whether logging is enabled.
+            compression: Frame codec.
+            max_buffer_bytes: Memory budget for queued entries.
+            segment_bytes: Segment rotation size.
+        """
+        super().__init__(log_dir=log_dir, enabled=enabled)
+        self.compression = compression
+        self.max_buffer_bytes = max_buffer_bytes
+        self.segment_bytes = segment_bytes
+        self.written_count = 0
+        self.dropped_count = 0
+        self._compress = _compressor(compression)
+        self._suffix = _SUFFIXES[compression]
+        self._pending: deque[tuple[str, bytes]] = deque()
+        self._pending_bytes = 0
+        self._writing = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._segments: dict[str, _Segment] = {}
+
+    async def log(self, entry: LLMAuditEntry) -> None:
+        """Queue an audit entry without waiting for it to be written.
+
+        Args:
+            entry: The audit entry to log.
+        """
+        if self.enabled:
+            self.submit(entry)
+
+    def submit(self, entry: LLMAuditEntry) -> bool:
+        """Queue an audit entry for the writer thread.
+
+        Args:
+            entry: The audit entry to log.
+
+        Returns:
+            False if the entry was dropped (budget exceeded or closed).
+        """
+        line = json.dumps(entry_to_record(entry), ensure_ascii=False, default=str) + "\n"
+        data = line.encode("utf-8")
+        directory = self._get_file_path(entry).parent.name
+        with self._condition:
+            if self._closed or self._pending_bytes + len(data) > self.max_buffer_bytes:
+                self.dropped_count += 1
+                return False
+            self._pending.append((directory, data))
+            self._pending_bytes += len(data)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="llm-audit-writer", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued entry has been written.
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely).
+
+        Returns:
+            True if the queue drained in time.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and not self._writing, timeout=timeout
+            )
+
+    def close(self) -> None:
+        """Write what is queued, stop the writer and close segment files."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def _run(self) -> None:
+        """Writer thread: drain the queue in batches until closed."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    break
+                batch = list(self._pending)
+                self._pending.clear()
+                self._writing = True
+            try:
+                self._write_batch(batch)
+            except Exception:
+                # A failed batch is dropped; the writer keeps serving the queue
+                logger.exception("Failed to write LLM audit segment")
+                with self._condition:
+                    self.dropped_count += len(batch)
+            else:
+                with self._condition:
+                    self.written_count += len(batch)
+            finally:
+                with self._condition:
+                    self._pending_bytes -= sum(len(data) for _, data in batch)
+                    self._writing = False
+                    self._condition.notify_all()
+
+        for segment in self._segments.values():
+            segment.close()
+        self._segments.clear()
+
+    def _write_batch(self, batch: list[tuple[str, bytes]]) -> None:
+        """Compress a batch into one frame per session and append it."""
+        by_directory: dict[str, list[bytes]] = {}
+        for directory, data in batch:
+            by_directory.setdefault(directory, []).append(data)
+
+        for directory, lines in by_directory.items():
+            frame = self._compress(b"".join(lines))
+            segment = self._segments.get(directory)
+            if segment is not None and segment.size + len(frame) > self.segment_bytes:
+                segment.close()
+                segment = None
+            if segment is None:
+                segment = _Segment(self.log_dir / directory, self._suffix)
+                self._segments[directory] = segment
+            segment.write(frame)
@@ -0,0 +1,333 @@
+"""Caching wrapper for LLM providers.
+
+Wraps any LLM provider to serve repeated requests from a
+content-addressed response cache, and to record and replay whole
+sessions without network access.
+
+Modes:
+    readwrite: Serve deterministic (temperature 0) requests from the
+        cache, storing misses. Sampled requests go to the provider.
+    record: Always call the provider and store every response.
+    replay: Serve every request from the cache; a miss raises
+        ResponseCacheMissError instead of calling the provider.
+
+Streaming (complete_with_tools_streaming) is passed through uncached,
+and only offered in readwrite mode when the wrapped provider supports
+it: recordings must hold every response, so record and replay leave
+callers on the cached complete_with_tools.
+"""
+
+import logging
+from typing import Any, Awaitable, Callable, Sequence
+
+from src.llm.base import LLMProvider
+from src.llm.exceptions import ResponseCacheMissError
+from src.llm.message_types import Message
+from src.llm.response_cache import LLMResponseCache, request_key
+from src.llm.response_types import LLMResponse
+from src.llm.tool_types import ToolDefinition
+
+logger = logging.getLogger(__name__)
+
+CACHE_MODES = ("readwrite", "record", "replay")
+
+
+class CachingProvider:
+    """Wrapper that caches responses of any LLM provider.
+
+    Args:
+        provider: The LLM provider to wrap.
+        cache: Response store (optional, uses global if not provided).
+        mode: "readwrite", "record" or "replay" (see module docstring).
+        cache_sampled: In readwrite mode, also cache requests with
+            temperature > 0 (repeats one sample for identical prompts).
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        cache: LLMResponseCache | None = None,
+        mode: str = "readwrite",
+        cache_sampled: bool = False,
+    ) -> None:
+        """Initialize the caching provider.
+
+        Args:
+            provider: The LLM provider to wrap.
+            cache: Response store.
+            mode: Cache mode.
+            cache_sampled: Cache sampled requests in readwrite mode.
+
+        Raises:
+            ValueError: If mode is not one of CACHE_MODES.
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode '{mode}'; expected one of {list(CACHE_MODES)}")
+        self._provider = provider
+        self._cache = cache
+        self.mode = mode
+        self.cache_sampled = cache_sampled
+        if mode == "readwrite" and callable(
+            getattr(provider, "complete_with_tools_streaming", None)
+        ):
+            self.complete_with_tools_streaming = self._complete_with_tools_streaming
+
+    @property
+    def provider_name(self) -> str:
+        """Return provider identifier."""
+        return self._provider.provider_name
+
+    @property
+    def default_model(self) -> str:
+        """Return default model for this provider."""
+        return self._provider.default_model
+
+    def _get_cache(self) -> LLMResponseCache:
+        """Get the response cache.
+
+        Returns:
+            LLMResponseCache instance.
+        """
+        if self._cache is not None:
+            return self._cache
+        from src.llm.response_cache import get_response_cache
+        return get_response_cache()
+
+    def _uses_cache(self, temperature: float) -> bool:
+        """Whether a request at this temperature is read from/written to the cache."""
+        if self.mode != "readwrite":
+            return True
+        return temperature <= 0 or self.cache_sampled
+
+    async def _cached(
+        self,
+        method: str,
+        call: Callable[[], Awaitable[LLMResponse]],
+        messages: Sequence[Message],
+        model: str | None,
+        temperature: float,
+        **request: Any,
+    ) -> LLMResponse:
+        """Serve a request from the cache or the wrapped provider.
+
+        Args:
+            method: Provider method name (part of the key).
+            call: Calls the wrapped provider.
+            messages: Conversation history.
+            model: Requested model (None = provider default).
+            temperature: Sampling temperature.
+            **request: Remaining request parameters (part of the key).
+
+        Returns:
+            The cached or freshly generated response.
+
+        Raises:
+            ResponseCacheMissError: On a miss in replay mode.
+        """
+        if not self._uses_cache(temperature):
+            return await call()
+
+        model_name = model or self._provider.default_model
+        key = request_key(
+            method,
+            self._provider.provider_name,
+            model_name,
+            messages,
+            temperature,
+            **request,
+        )
+        cache = self._get_cache()
+
+        if self.mode != "record":
+            cached = await cache.get_async(key)
+            if cached is not None:
+                logger.debug(f"LLM cache hit for {method} ({key[:12]})")
+                return cached
+            if self.mode == "replay":
+                raise ResponseCacheMissError(
+                    f"No cached response for {method} on {model_name} (key {key[:12]})",
+                    key=key,
+                )
+
+        response = await call()
+        await cache.put_async(
+            key,
+            response,
+            request={
+                "method": method,
+                "provider": self._provider.provider_name,
+                "model": model_name,
+            },
+        )
+        return response
+
+    async def complete(
+        self,
+        messages: Sequence[Message],
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        stop_sequences: Sequence[str] | None = None,
+        system_prompt: str | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Generate a completion from messages, using the cache.
+
+        Args:
+            messages: Conversation history.
+            model: Model to use.
+            max_tokens: Maximum tokens to generate.
+            temperature: Sampling temperature.
+            stop_sequences: Sequences that stop generation.
+            system_prompt: System-level instructions.
+            **kwargs: Provider-specific options (e.g., think for Ollama).
+
+        Returns:
+            LLMResponse with text and metadata.
+        """
+        return await self._cached(
+            "complete",
+            lambda: self._provider.complete(
+                messages=messages,
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stop_sequences=stop_sequences,
+                system_prompt=system_prompt,
+                **kwargs,
+            ),
+            messages,
+            model,
+            temperature,
+            max_tokens=max_tokens,
+            system_prompt=system_prompt,
+            stop_sequences=list(stop_sequences) if stop_sequences else None,
+            **kwargs,
+        )
+
+    async def complete_with_tools(
+        self,
+        messages: Sequence[Message],
+        tools: Sequence[ToolDefinition],
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        tool_choice: str | dict[str, Any] = "auto",
+        system_prompt: str | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Generate a completion that may include tool calls, using the cache.
+
+        Args:
+            messages: Conversation history.
+            tools: Available tools/functions.
+            model: Model to use.
+            max_tokens: Maximum tokens to generate.
+            temperature: Sampling temperature.
+            tool_choice: Tool selection mode.
+            system_prompt: System-level instructions.
+            **kwargs: Provider-specific options (e.g., think for Ollama).
+
+        Returns:
+            LLMResponse with text and/or tool_calls.
+        """
+        return await self._cached(
+            "complete_with_tools",
+            lambda: self._provider.complete_with_tools(
+                messages=messages,
+                tools=tools,
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                tool_choice=tool_choice,
+                system_prompt=system_prompt,
+                **kwargs,
+            ),
+            messages,
+            model,
+            temperature,
+            max_tokens=max_tokens,
+            system_prompt=system_prompt,
+            tools=tools,
+            tool_choice=tool_choice,
+            **kwargs,
+        )
+
+    async def _complete_with_tools_streaming(
+        self,
+        messages: Sequence[Message],
+        tools: Sequence[ToolDefinition],
+        model: str | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Stream a completion that may include tool calls, bypassing the cache.
+
+        Args:
+            messages: Conversation history.
+            tools: Available tools/functions.
+            model: Model to use.
+            **kwargs: Other arguments of the wrapped provider's method
+                (max_tokens, temperature, tool_choice, system_prompt, on_token).
+
+        Returns:
+            LLMResponse with text and/or tool_calls.
+        """
+        return await self._provider.complete_with_tools_streaming(
+            messages=messages, tools=tools, model=model, **kwargs
+        )
+
+    async def complete_structured(
+        self,
+        messages: Sequence[Message],
+        response_schema: type,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        """Generate a structured response matching a schema, using the cache.
+
+        Args:
+            messages: Conversation history.
+            response_schema: Pydantic model or dataclass for output.
+            model: Model to use.
+            max_tokens: Maximum tokens to generate.
+            temperature: Sampling temperature.
+            system_prompt: System-level instructions.
+
+        Returns:
+            LLMResponse with parsed_content containing the structured data.
+        """
+        return await self._cached(
+            "complete_structured",
+            lambda: self._provider.complete_structured(
+                messages=messages,
+                response_schema=response_schema,
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                system_prompt=system_prompt,
+            ),
+            messages,
+            model,
+            temperature,
+            max_tokens=max_tokens,
+            system_prompt=system_prompt,
+            response_schema=response_schema,
+        )
+
+    def count_tokens(
+        self,
+        text: str,
+        model: str | None = None,
+    ) -> int:
+        """Count tokens in text for context window management.
+
+        Args:
+            text: Text to count tokens for.
+            model: Model to use for tokenization.
+
+        Returns:
+            Token count.
+        """
+        return self._provider.count_tokens(text, model)
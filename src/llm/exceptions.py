@@ -87,3 +87,15 @@ class StructuredOutputError(LLMError):
     def __init__(self, message: str, raw_output: str | None = None) -> None:
         super().__init__(message)
         self.raw_output = raw_output
+
+
+class ResponseCacheMissError(LLMError):
+    """Request not found in the response cache during strict replay.
+
+    Attributes:
+        key: Content hash of the request that missed.
+    """
+
+    def __init__(self, message: str, key: str) -> None:
+        super().__init__(message)
+        self.key = key
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 
 from src.config import settings, ProviderConfig, ProviderType
 from src.llm.base import LLMProvider
+from src.llm.caching_provider import CACHE_MODES, CachingProvider
 from src.llm.anthropic_provider import AnthropicProvider
 from src.llm.openai_provider import OpenAIProvider
 from src.llm.exceptions import UnsupportedProviderError
@@ -60,6 +61,26 @@ def _create_provider(config: ProviderConfig, base_url_override: str | None = Non
     else:
         raise UnsupportedProviderError(f"Provider '{config.provider}' is not supported")
 
+    return _wrap_provider(provider)
+
+
+def _wrap_provider(provider: LLMProvider) -> LLMProvider:
+    """Apply the response cache and audit logging wrappers from settings.
+
+    The cache wraps the provider directly so the audit log still shows
+    every request, including those served from the cache.
+
+    Args:
+        provider: The provider to wrap.
+
+    Returns:
+        The wrapped provider (or the provider itself if both are disabled).
+    """
+    if settings.llm_cache_mode in CACHE_MODES:
+        from src.llm.response_cache import get_response_cache
+
+        provider = CachingProvider(provider, get_response_cache(), mode=settings.llm_cache_mode)
+
     # Wrap with logging if enabled
     if settings.log_llm_calls:
         from src.llm.logging_provider import LoggingProvider
@@ -200,13 +221,7 @@ def get_provider(
     else:
         raise UnsupportedProviderError(f"Provider '{provider_type}' is not supported")
 
-    if settings.log_llm_calls:
-        from src.llm.logging_provider import LoggingProvider
-        from src.llm.audit_logger import get_audit_logger
-
-        llm_provider = LoggingProvider(llm_provider, get_audit_logger())
-
-    return llm_provider
+    return _wrap_provider(llm_provider)
 
 
 def get_gm_provider() -> LLMProvider:
@@ -5,7 +5,7 @@ Wraps any LLM provider to add audit logging of all calls.
 
 import time
 from datetime import datetime
-from typing import Any, Sequence
+from typing import Any, Callable, Sequence
 
 from src.llm.base import LLMProvider
 from src.llm.message_types import Message
@@ -22,7 +22,9 @@ class LoggingProvider:
     """Wrapper that adds audit logging to any LLM provider.
 
     Delegates all calls to the wrapped provider while logging
-    the full request and response for debugging.
+    the full request and response for debugging. Streaming
+    (complete_with_tools_streaming) is only offered if the wrapped
+    provider supports it.
 
     Args:
         provider: The LLM provider to wrap.
@@ -42,6 +44,8 @@ class LoggingProvider:
         """
         self._provider = provider
         self._logger = logger
+        if callable(getattr(provider, "complete_with_tools_streaming", None)):
+            self.complete_with_tools_streaming = self._complete_with_tools_streaming
 
     @property
     def provider_name(self) -> str:
@@ -236,6 +240,76 @@ class LoggingProvider:
             )
             await self._get_logger().log(entry)
 
+    async def _complete_with_tools_streaming(
+        self,
+        messages: Sequence[Message],
+        tools: Sequence[ToolDefinition],
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        tool_choice: str | dict[str, Any] = "auto",
+        system_prompt: str | None = None,
+        on_token: Callable[[str], None] | None = None,
+    ) -> LLMResponse:
+        """Stream a completion that may include tool calls with logging.
+
+        Args:
+            messages: Conversation history.
+            tools: Available tools/functions.
+            model: Model to use.
+            max_tokens: Maximum tokens to generate.
+            temperature: Sampling temperature.
+            tool_choice: Tool selection mode.
+            system_prompt: System-level instructions.
+            on_token: Callback for each streamed text token.
+
+        Returns:
+            LLMResponse with text and/or tool_calls.
+        """
+        start_time = time.perf_counter()
+        timestamp = datetime.now()
+        context = get_audit_context()
+
+        response = None
+        error = None
+
+        try:
+            response = await self._provider.complete_with_tools_streaming(
+                messages=messages,
+                tools=tools,
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                tool_choice=tool_choice,
+                system_prompt=system_prompt,
+                on_token=on_token,
+            )
+            return response
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            duration = time.perf_counter() - start_time
+            entry = LLMAuditEntry(
+                timestamp=timestamp,
+                context=context,
+                provider=self._provider.provider_name,
+                model=model or self._provider.default_model,
+                method="complete_with_tools_streaming",
+                system_prompt=system_prompt,
+                messages=self._messages_to_dicts(messages),
+                tools=self._tools_to_dicts(tools),
+                parameters={
+                    "max_tokens": max_tokens,
+                    "temperature": temperature,
+                    "tool_choice": tool_choice,
+                },
+                response=response,
+                error=error,
+                duration_seconds=duration,
+            )
+            await self._get_logger().log(entry)
+
     async def complete_structured(
         self,
         messages: Sequence[Message],
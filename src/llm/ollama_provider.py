@@ -18,6 +18,7 @@ from langchain_core.messages import (
 from src.llm.base import LLMProvider
 from src.llm.message_types import Message, MessageRole
 from src.llm.response_types import LLMResponse, ToolCall, UsageStats
+from src.llm.token_counter import get_token_counter, prompt_text
 from src.llm.tool_types import ToolDefinition
 from src.llm.exceptions import (
     ProviderError,
@@ -41,11 +42,10 @@ class OllamaProvider:
     - Qwen3-style: Uses `/nothink` system prefix and `<think>` tags
 
     Note:
-    - Token counting is approximate (Ollama doesn't expose tokenizers)
-    - Usage stats are available in response_metadata
+    - Token counting is approximate (Ollama doesn't expose tokenizers) and
+      calibrated from the usage Ollama reports
     """
 
-    CHARS_PER_TOKEN = 4  # Rough estimate for token counting
     # Match complete thinking blocks (Qwen3 style)
     THINKING_PATTERN = re.compile(r"<think>.*?</think>\s*", re.DOTALL)
     # Match incomplete thinking blocks (cut off before closing tag)
@@ -139,13 +139,21 @@ class OllamaProvider:
                     )
                 )
 
-        # Ollama doesn't provide token usage via langchain-ollama
+        usage = None
+        usage_metadata = getattr(response, "usage_metadata", None)
+        if isinstance(usage_metadata, dict) and usage_metadata.get("input_tokens"):
+            usage = UsageStats(
+                prompt_tokens=usage_metadata["input_tokens"],
+                completion_tokens=usage_metadata.get("output_tokens", 0),
+                total_tokens=usage_metadata.get("total_tokens", 0),
+            )
+
         return LLMResponse(
             content=content,
             tool_calls=tuple(tool_calls),
             finish_reason="stop",
             model=model,
-            usage=None,
+            usage=usage,
             raw_response=response,
         )
 
@@ -194,10 +202,15 @@ class OllamaProvider:
 
         try:
             response = await client.ainvoke(lc_messages)
-            return self._parse_response(response, model_name)
+            result = self._parse_response(response, model_name)
         except Exception as e:
             raise ProviderError(str(e), is_retryable=True)
 
+        get_token_counter().observe_usage(
+            model_name, prompt_text(messages, effective_system), result.usage
+        )
+        return result
+
     async def complete_with_tools(
         self,
         messages: Sequence[Message],
@@ -250,10 +263,15 @@ class OllamaProvider:
 
         try:
             response = await client_with_tools.ainvoke(lc_messages)
-            return self._parse_response(response, model_name)
+            result = self._parse_response(response, model_name)
         except Exception as e:
             raise ProviderError(str(e), is_retryable=True)
 
+        get_token_counter().observe_usage(
+            model_name, prompt_text(messages, effective_system, lc_tools), result.usage
+        )
+        return result
+
     async def complete_structured(
         self,
         messages: Sequence[Message],
@@ -302,11 +320,9 @@ class OllamaProvider:
         text: str,
         model: str | None = None,
     ) -> int:
-        """Count tokens in text (rough estimate).
+        """Count tokens in text (approximate).
 
-        Ollama doesn't provide a public tokenizer, so we use a heuristic
-        of approximately 4 characters per token (similar to Anthropic).
+        Ollama doesn't provide a public tokenizer, so this uses the shared
+        token counter's proxy tokenizer, calibrated from reported usage.
         """
-        if not text:
-            return 0
-        return len(text) // self.CHARS_PER_TOKEN
+        return get_token_counter().count(text, model or self._default_model)
@@ -18,6 +18,7 @@ from openai import (
 from src.llm.base import LLMProvider
 from src.llm.message_types import Message, MessageRole, MessageContent
 from src.llm.response_types import LLMResponse, ToolCall, UsageStats
+from src.llm.token_counter import get_token_counter, prompt_text
 from src.llm.tool_types import ToolDefinition
 from src.llm.exceptions import (
     AuthenticationError,
@@ -246,10 +247,11 @@ class OpenAIProvider:
             effective_system = "/nothink\n" + effective_system if effective_system else "/nothink"
 
         api_messages = self._convert_messages(messages, effective_system)
+        model_name = model or self._default_model
 
         try:
             kwargs: dict[str, Any] = {
-                "model": model or self._default_model,
+                "model": model_name,
                 "max_tokens": max_tokens,
                 "temperature": temperature,
                 "messages": api_messages,
@@ -258,11 +260,16 @@ class OpenAIProvider:
                 kwargs["stop"] = list(stop_sequences)
 
             response = await self._get_client().chat.completions.create(**kwargs)
-            return self._parse_response(response)
+            result = self._parse_response(response)
         except Exception as e:
             await self._handle_api_error(e)
             raise
 
+        get_token_counter().observe_usage(
+            model_name, prompt_text(messages, effective_system), result.usage
+        )
+        return result
+
     async def complete_with_tools(
         self,
         messages: Sequence[Message],
@@ -296,10 +303,11 @@ class OpenAIProvider:
 
         # Convert tools to OpenAI format
         api_tools = [tool.to_openai_format() for tool in tools]
+        model_name = model or self._default_model
 
         try:
             kwargs: dict[str, Any] = {
-                "model": model or self._default_model,
+                "model": model_name,
                 "max_tokens": max_tokens,
                 "temperature": temperature,
                 "messages": api_messages,
@@ -317,11 +325,16 @@ class OpenAIProvider:
                 kwargs["tool_choice"] = tool_choice
 
             response = await self._get_client().chat.completions.create(**kwargs)
-            return self._parse_response(response)
+            result = self._parse_response(response)
         except Exception as e:
             await self._handle_api_error(e)
             raise
 
+        get_token_counter().observe_usage(
+            model_name, prompt_text(messages, effective_system, kwargs.get("tools")), result.usage
+        )
+        return result
+
     async def complete_structured(
         self,
         messages: Sequence[Message],
@@ -341,10 +354,11 @@ class OpenAIProvider:
         # Create tool definition with proper JSON schema
         tool_dict = self._schema_to_openai_tool(response_schema)
         tool_name = tool_dict["function"]["name"]
+        model_name = model or self._default_model
 
         try:
             kwargs: dict[str, Any] = {
-                "model": model or self._default_model,
+                "model": model_name,
                 "max_tokens": max_tokens,
                 "temperature": temperature,
                 "messages": api_messages,
@@ -354,6 +368,9 @@ class OpenAIProvider:
 
             response = await self._get_client().chat.completions.create(**kwargs)
             parsed_response = self._parse_response(response)
+            get_token_counter().observe_usage(
+                model_name, prompt_text(messages, system_prompt, [tool_dict]), parsed_response.usage
+            )
 
             # Extract structured content from tool call
             if parsed_response.has_tool_calls:
@@ -516,19 +533,9 @@ class OpenAIProvider:
         text: str,
         model: str | None = None,
     ) -> int:
-        """Count tokens in text using tiktoken."""
-        if not text:
-            return 0
+        """Count tokens in text using tiktoken.
 
-        try:
-            import tiktoken
-            model_name = model or self._default_model
-            try:
-                encoding = tiktoken.encoding_for_model(model_name)
-            except KeyError:
-                # Fall back to cl100k_base for unknown models
-                encoding = tiktoken.get_encoding("cl100k_base")
-            return len(encoding.encode(text))
-        except ImportError:
-            # Fallback if tiktoken not available
-            return len(text) // 4
+        OpenAI models use their own encoding; OpenAI-compatible models
+        (DeepSeek, vLLM, ...) use a proxy encoding calibrated from usage.
+        """
+        return get_token_counter().count(text, model or self._default_model)
@@ -12,6 +12,7 @@ from qwen_agent.llm import get_chat_model
 
 from src.llm.message_types import Message, MessageRole
 from src.llm.response_types import LLMResponse, ToolCall, UsageStats
+from src.llm.token_counter import get_token_counter, prompt_text
 from src.llm.tool_types import ToolDefinition
 from src.llm.exceptions import ProviderError, StructuredOutputError
 
@@ -34,7 +35,6 @@ class QwenAgentProvider:
     - Usage stats not available from qwen-agent
     """
 
-    CHARS_PER_TOKEN = 4  # Rough estimate for token counting
     # Match complete thinking blocks
     THINKING_PATTERN = re.compile(r"<think>.*?</think>\s*", re.DOTALL)
     # Match incomplete thinking blocks (cut off before closing tag)
@@ -270,10 +270,15 @@ class QwenAgentProvider:
                     else:
                         response_messages.append({"role": "assistant", "content": str(response)})
 
-            return self._parse_response(response_messages, model_name)
+            result = self._parse_response(response_messages, model_name)
         except Exception as e:
             raise ProviderError(str(e), is_retryable=True)
 
+        get_token_counter().observe_usage(
+            model_name, prompt_text(messages, system_prompt), result.usage
+        )
+        return result
+
     async def complete_with_tools(
         self,
         messages: Sequence[Message],
@@ -330,10 +335,15 @@ class QwenAgentProvider:
                     else:
                         response_messages.append({"role": "assistant", "content": str(response)})
 
-            return self._parse_response(response_messages, model_name)
+            result = self._parse_response(response_messages, model_name)
         except Exception as e:
             raise ProviderError(str(e), is_retryable=True)
 
+        get_token_counter().observe_usage(
+            model_name, prompt_text(messages, system_prompt, functions), result.usage
+        )
+        return result
+
     async def complete_structured(
         self,
         messages: Sequence[Message],
@@ -412,6 +422,9 @@ class QwenAgentProvider:
                         response_messages.append({"role": "assistant", "content": str(response)})
 
             llm_response = self._parse_response(response_messages, model_name)
+            get_token_counter().observe_usage(
+                model_name, prompt_text(messages, system_prompt, functions), llm_response.usage
+            )
 
             # Extract structured content from tool call
             if llm_response.has_tool_calls:
@@ -431,7 +444,7 @@ class QwenAgentProvider:
                 parsed_content=parsed_content,
                 finish_reason=llm_response.finish_reason,
                 model=model_name,
-                usage=None,
+                usage=llm_response.usage,
             )
         except StructuredOutputError:
             raise
@@ -443,11 +456,9 @@ class QwenAgentProvider:
         text: str,
         model: str | None = None,
     ) -> int:
-        """Count tokens in text (rough estimate).
+        """Count tokens in text (approximate).
 
-        qwen-agent doesn't provide a public tokenizer, so we use a heuristic
-        of approximately 4 characters per token.
+        qwen-agent doesn't provide a public tokenizer, so this uses the shared
+        token counter's proxy tokenizer.
         """
-        if not text:
-            return 0
-        return len(text) // self.CHARS_PER_TOKEN
+        return get_token_counter().count(text, model or self._default_model)
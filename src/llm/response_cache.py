@@ -0,0 +1,295 @@
+"""Content-addressed on-disk cache for LLM responses.
+
+Responses are stored as JSON files named by the SHA-256 of the request
+(provider, model, method, messages, schema/tools, sampling parameters),
+so byte-identical requests share one entry. The cache is bounded by
+total size and evicts least recently used entries first.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Sequence
+
+from src.llm.message_types import Message
+from src.llm.response_types import LLMResponse, ToolCall, UsageStats
+from src.llm.tool_types import ToolDefinition
+
+logger = logging.getLogger(__name__)
+
+# Bump when the key payload or entry format changes
+CACHE_FORMAT_VERSION = 1
+
+
+def _schema_fingerprint(response_schema: type | None) -> Any:
+    """Describe a response schema by content rather than identity."""
+    if response_schema is None:
+        return None
+    if hasattr(response_schema, "model_json_schema"):
+        return response_schema.model_json_schema()
+    return getattr(response_schema, "__qualname__", str(response_schema))
+
+
+def request_key(
+    method: str,
+    provider: str,
+    model: str,
+    messages: Sequence[Message],
+    temperature: float,
+    max_tokens: int | None = None,
+    system_prompt: str | None = None,
+    response_schema: type | None = None,
+    tools: Sequence[ToolDefinition] | None = None,
+    **options: Any,
+) -> str:
+    """Compute the content hash identifying an LLM request.
+
+    Args:
+        method: Provider method ("complete", "complete_structured", ...).
+        provider: Provider name.
+        model: Resolved model name.
+        messages: Conversation history.
+        temperature: Sampling temperature.
+        max_tokens: Maximum tokens to generate.
+        system_prompt: System-level instructions.
+        response_schema: Schema for structured output.
+        tools: Available tools.
+        **options: Any other request parameters (tool_choice, think, ...).
+
+    Returns:
+        Hex SHA-256 digest of the canonical request.
+    """
+    payload = {
+        "version": CACHE_FORMAT_VERSION,
+        "method": method,
+        "provider": provider,
+        "model": model,
+        "messages": [asdict(message) for message in messages],
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "system_prompt": system_prompt,
+        "schema": _schema_fingerprint(response_schema),
+        "tools": [tool.to_anthropic_format() for tool in tools] if tools else None,
+        "options": options,
+    }
+    canonical = json.dumps(payload, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def response_to_dict(response: LLMResponse) -> dict[str, Any]:
+    """Serialize a response for the cache (raw_response is dropped).
+
+    Args:
+        response: The response to serialize.
+
+    Returns:
+        JSON-compatible dict.
+    """
+    return {
+        "content": response.content,
+        "tool_calls": [asdict(call) for call in response.tool_calls],
+        "parsed_content": response.parsed_content,
+        "finish_reason": response.finish_reason,
+        "model": response.model,
+        "usage": asdict(response.usage) if response.usage else None,
+    }
+
+
+def response_from_dict(data: dict[str, Any]) -> LLMResponse:
+    """Rebuild a response serialized with response_to_dict().
+
+    Args:
+        data: Serialized response.
+
+    Returns:
+        LLMResponse equal to the original apart from raw_response.
+    """
+    return LLMResponse(
+        content=data["content"],
+        tool_calls=tuple(ToolCall(**call) for call in data["tool_calls"]),
+        parsed_content=data["parsed_content"],
+        finish_reason=data["finish_reason"],
+        model=data["model"],
+        usage=UsageStats(**data["usage"]) if data["usage"] else None,
+    )
+
+
+class LLMResponseCache:
+    """Size-bounded, content-addressed store of LLM responses.
+
+    Entries live at <cache_dir>/<key[:2]>/<key>.json. An in-memory LRU
+    index (seeded from file modification times) tracks entry sizes;
+    when the total exceeds max_bytes the least recently used entries
+    are deleted.
+
+    Args:
+        cache_dir: Directory to store entries in.
+        max_bytes: Maximum total size of all entries.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | str = "cache/llm",
+        max_bytes: int = 256 * 1024 * 1024,
+    ) -> None:
+        """Initialize the cache, indexing any existing entries.
+
+        Args:
+            cache_dir: Directory to store entries in.
+            max_bytes: Maximum total size of all entries.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._index: OrderedDict[str, int] = OrderedDict()  # key -> size, oldest first
+        self._total_bytes = 0
+        self._load_index()
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of all cached entries."""
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _load_index(self) -> None:
+        """Index existing entries, least recently used first."""
+        if not self.cache_dir.exists():
+            return
+        entries = []
+        for path in self.cache_dir.glob("*/*.json"):
+            stat = path.stat()
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._total_bytes += size
+
+    def get(self, key: str) -> LLMResponse | None:
+        """Look up a cached response.
+
+        Args:
+            key: Request key from request_key().
+
+        Returns:
+            The cached response, or None on a miss.
+        """
+        with self._lock:
+            if key not in self._index:
+                self.misses += 1
+                return None
+            self._index.move_to_end(key)
+
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)  # Keep LRU order across restarts
+        except (OSError, ValueError) as e:
+            logger.warning(f"Dropping unreadable cache entry {key}: {e}")
+            self._forget(key)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return response_from_dict(data["response"])
+
+    def put(self, key: str, response: LLMResponse, request: dict[str, Any] | None = None) -> None:
+        """Store a response, evicting old entries if over the size bound.
+
+        Args:
+            key: Request key from request_key().
+            response: The response to store.
+            request: Optional request summary saved alongside (for debugging).
+        """
+        content = json.dumps(
+            {"key": key, "request": request or {}, "response": response_to_dict(response)},
+            default=str,
+            ensure_ascii=False,
+        )
+        size = len(content.encode("utf-8"))
+        if size > self.max_bytes:
+            logger.debug(f"Not caching {key}: {size} bytes exceeds the cache size")
+            return
+
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        tmp_path.replace(path)
+
+        with self._lock:
+            self._total_bytes += size - self._index.pop(key, 0)
+            self._index[key] = size
+            evicted = []
+            while self._total_bytes > self.max_bytes and len(self._index) > 1:
+                old_key, old_size = self._index.popitem(last=False)
+                self._total_bytes -= old_size
+                evicted.append(old_key)
+            self.evictions += len(evicted)
+
+        for old_key in evicted:
+            self._path(old_key).unlink(missing_ok=True)
+
+    def _forget(self, key: str) -> None:
+        """Remove an entry from the index and disk."""
+        with self._lock:
+            self._total_bytes -= self._index.pop(key, 0)
+        self._path(key).unlink(missing_ok=True)
+
+    async def get_async(self, key: str) -> LLMResponse | None:
+        """Look up a cached response without blocking the event loop."""
+        return await asyncio.to_thread(self.get, key)
+
+    async def put_async(
+        self, key: str, response: LLMResponse, request: dict[str, Any] | None = None
+    ) -> None:
+        """Store a response without blocking the event loop."""
+        await asyncio.to_thread(self.put, key, response, request)
+
+    def clear(self) -> None:
+        """Delete every cached entry."""
+        with self._lock:
+            keys = list(self._index)
+            self._index.clear()
+            self._total_bytes = 0
+        for key in keys:
+            self._path(key).unlink(missing_ok=True)
+
+
+# Global cache instance
+_response_cache: LLMResponseCache | None = None
+
+
+def get_response_cache() -> LLMResponseCache:
+    """Get or create the global response cache.
+
+    Returns:
+        LLMResponseCache configured from settings.
+    """
+    global _response_cache
+    if _response_cache is None:
+        from src.config import settings
+
+        _response_cache = LLMResponseCache(
+            cache_dir=settings.llm_cache_dir,
+            max_bytes=settings.llm_cache_max_mb * 1024 * 1024,
+        )
+    return _response_cache
@@ -0,0 +1,193 @@
+"""Scripted LLM provider for benchmarks and offline runs.
+
+Answers every call from deterministic responder functions instead of a
+model, after a configurable simulated latency. Responders are looked up
+by response schema name for complete_structured() and by method name
+otherwise; requests without a responder get an empty response
+(parsed_content=None), which callers already treat as a failed call.
+"""
+
+import asyncio
+import random
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
+
+from src.llm.message_types import Message
+from src.llm.response_types import LLMResponse, UsageStats
+from src.llm.tool_types import ToolDefinition
+
+
+@dataclass(frozen=True)
+class ScriptedRequest:
+    """A request seen by a scripted responder.
+
+    Attributes:
+        method: Provider method ("complete", "complete_with_tools", "complete_structured").
+        messages: Conversation history.
+        system_prompt: System-level instructions.
+        response_schema: Schema for structured output (complete_structured only).
+        tools: Available tools (complete_with_tools only).
+    """
+
+    method: str
+    messages: tuple[Message, ...]
+    system_prompt: str | None = None
+    response_schema: type | None = None
+    tools: tuple[ToolDefinition, ...] = ()
+
+    @property
+    def prompt(self) -> str:
+        """Text of the last message."""
+        if not self.messages:
+            return ""
+        content = self.messages[-1].content
+        return content if isinstance(content, str) else str(content)
+
+
+# Returns parsed content (dict) for structured calls, text otherwise,
+# or a complete LLMResponse
+Responder = Callable[[ScriptedRequest], Any]
+
+
+class ScriptedProvider:
+    """LLM provider answering from responder functions with simulated latency.
+
+    Args:
+        responders: Schema or method name -> responder.
+        latency_ms: Fixed delay per call.
+        ms_per_output_token: Extra delay per (estimated) output token.
+        jitter: Random +/- fraction applied to each delay.
+        seed: Seed for the jitter.
+        provider_name: Name reported to callers (e.g. to look like "ollama").
+        default_model: Model name reported in responses.
+    """
+
+    def __init__(
+        self,
+        responders: dict[str, Responder] | None = None,
+        latency_ms: float = 0.0,
+        ms_per_output_token: float = 0.0,
+        jitter: float = 0.0,
+        seed: int | None = None,
+        provider_name: str = "scripted",
+        default_model: str = "scripted",
+    ) -> None:
+        """Initialize the scripted provider.
+
+        Args:
+            responders: Schema or method name -> responder.
+            latency_ms: Fixed delay per call.
+            ms_per_output_token: Extra delay per (estimated) output token.
+            jitter: Random +/- fraction applied to each delay.
+            seed: Seed for the jitter.
+            provider_name: Name reported to callers.
+            default_model: Model name reported in responses.
+        """
+        self.responders = dict(responders or {})
+        self.latency_ms = latency_ms
+        self.ms_per_output_token = ms_per_output_token
+        self.jitter = jitter
+        self._random = random.Random(seed)
+        self._provider_name = provider_name
+        self._default_model = default_model
+        self.calls: list[ScriptedRequest] = []
+
+    @property
+    def provider_name(self) -> str:
+        """Return provider identifier."""
+        return self._provider_name
+
+    @property
+    def default_model(self) -> str:
+        """Return default model for this provider."""
+        return self._default_model
+
+    async def _respond(self, request: ScriptedRequest, model: str | None) -> LLMResponse:
+        """Run the responder for a request and simulate its latency."""
+        self.calls.append(request)
+        key = request.response_schema.__name__ if request.response_schema else request.method
+        responder = self.responders.get(key)
+        result = responder(request) if responder else None
+
+        if isinstance(result, LLMResponse):
+            response = result
+        elif request.method == "complete_structured":
+            response = LLMResponse(content="", parsed_content=result)
+        else:
+            response = LLMResponse(content=result or "")
+
+        prompt_tokens = self.count_tokens(request.prompt + (request.system_prompt or ""))
+        completion_tokens = self.count_tokens(
+            response.content or str(response.parsed_content or "")
+        )
+        delay_ms = self.latency_ms + self.ms_per_output_token * completion_tokens
+        if self.jitter:
+            delay_ms *= 1 + self._random.uniform(-self.jitter, self.jitter)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000)
+
+        if response.usage is not None and response.model:
+            return response
+        return LLMResponse(
+            content=response.content,
+            tool_calls=response.tool_calls,
+            parsed_content=response.parsed_content,
+            finish_reason=response.finish_reason,
+            model=response.model or model or self._default_model,
+            usage=response.usage
+            or UsageStats(prompt_tokens, completion_tokens, prompt_tokens + completion_tokens),
+        )
+
+    async def complete(
+        self,
+        messages: Sequence[Message],
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        stop_sequences: Sequence[str] | None = None,
+        system_prompt: str | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Generate a scripted completion."""
+        request = ScriptedRequest("complete", tuple(messages), system_prompt)
+        return await self._respond(request, model)
+
+    async def complete_with_tools(
+        self,
+        messages: Sequence[Message],
+        tools: Sequence[ToolDefinition],
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        tool_choice: str | dict[str, Any] = "auto",
+        system_prompt: str | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Generate a scripted completion that may include tool calls."""
+        request = ScriptedRequest(
+            "complete_with_tools", tuple(messages), system_prompt, tools=tuple(tools)
+        )
+        return await self._respond(request, model)
+
+    async def complete_structured(
+        self,
+        messages: Sequence[Message],
+        response_schema: type,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        """Generate a scripted structured response."""
+        request = ScriptedRequest(
+            "complete_structured", tuple(messages), system_prompt, response_schema=response_schema
+        )
+        return await self._respond(request, model)
+
+    def count_tokens(
+        self,
+        text: str,
+        model: str | None = None,
+    ) -> int:
+        """Estimate tokens as one per four characters."""
+        return max(1, len(text) // 4) if text else 0
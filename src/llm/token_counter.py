@@ -0,0 +1,241 @@
+"""Tokenizer-backed token counting with per-model calibration.
+
+Counts come from a real tokenizer where one is available:
+
+- OpenAI models use their own tiktoken encoding (exact)
+- Other models (Claude, Llama, Qwen, ...) use cl100k_base as a proxy
+  tokenizer, or a characters-per-token heuristic when tiktoken or its
+  encoding files are unavailable (e.g. offline)
+
+Approximate counts are scaled by a per-model factor learned from the
+prompt token usage that providers report in LLMResponse.usage, so they
+converge on what the model actually bills.
+
+Raw counts are cached in an LRU keyed by a hash of the model and text,
+so context sections that repeat every turn are tokenized once.
+
+Usage:
+    counter = get_token_counter()
+    tokens = counter.count(system_prompt, "claude-sonnet-4-20250514")
+"""
+
+import hashlib
+import json
+import logging
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Sequence
+
+from src.llm.message_types import Message
+from src.llm.response_types import UsageStats
+
+logger = logging.getLogger(__name__)
+
+PROXY_ENCODING = "cl100k_base"
+
+
+class TokenCounter:
+    """Counts tokens per model behind a content-hash LRU cache.
+
+    Usage:
+        counter = TokenCounter()
+        counter.count("Hello, world!", "gpt-4o")
+        counter.observe_usage("llama3", prompt_text, response.usage)
+    """
+
+    DEFAULT_CHARS_PER_TOKEN = 4.0
+    # Weight of each new observation in the calibration moving average
+    CALIBRATION_WEIGHT = 0.2
+    # Shorter prompts are dominated by per-message template overhead
+    MIN_CALIBRATION_CHARS = 200
+
+    def __init__(self, max_entries: int = 4096, use_tokenizers: bool = True) -> None:
+        """Initialize the counter.
+
+        Args:
+            max_entries: Maximum cached (model, text) counts.
+            use_tokenizers: Whether to try tiktoken (False = heuristic only).
+        """
+        self.max_entries = max_entries
+        self.use_tokenizers = use_tokenizers
+        self.hits = 0
+        self.misses = 0
+        self._cache: OrderedDict[tuple[str, bytes], int] = OrderedDict()
+        self._encodings: dict[str, Any] = {}  # encoding name -> Encoding | None
+        self._model_encodings: dict[str, tuple[Any, bool]] = {}  # model -> (Encoding, exact)
+        self._scales: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def count(self, text: str | None, model: str | None = None) -> int:
+        """Count tokens in text for a model.
+
+        Args:
+            text: Text to count.
+            model: Model name (None = generic estimate).
+
+        Returns:
+            Token count (0 for empty text).
+        """
+        if not text:
+            return 0
+        model_key = model or ""
+        raw = self._raw_count(text, model_key)
+        scale = self._scales.get(model_key)
+        if scale is None:
+            return raw
+        return max(1, round(raw * scale))
+
+    def is_exact(self, model: str | None) -> bool:
+        """Check whether counts for a model come from its own tokenizer."""
+        return self._resolve_encoding(model or "")[1]
+
+    def observe_usage(
+        self,
+        model: str | None,
+        prompt_text: str,
+        usage: UsageStats | None,
+    ) -> None:
+        """Calibrate a model's estimates from a response's reported usage.
+
+        Args:
+            model: Model that served the request.
+            prompt_text: Text that was sent as the prompt.
+            usage: Usage reported by the provider (ignored if None).
+        """
+        if usage is None or not usage.prompt_tokens or len(prompt_text) < self.MIN_CALIBRATION_CHARS:
+            return
+        model_key = model or ""
+        if self.is_exact(model_key):
+            return
+
+        actual = usage.prompt_tokens + usage.cache_read_tokens + usage.cache_creation_tokens
+        ratio = actual / self._raw_count(prompt_text, model_key)
+        with self._lock:
+            previous = self._scales.get(model_key)
+            if previous is None:
+                self._scales[model_key] = ratio
+            else:
+                self._scales[model_key] = previous + self.CALIBRATION_WEIGHT * (ratio - previous)
+        logger.debug(f"Token scale for {model_key or 'default'}: {self._scales[model_key]:.3f}")
+
+    def scale_for(self, model: str | None) -> float | None:
+        """Get a model's learned calibration factor, if any."""
+        return self._scales.get(model or "")
+
+    def clear(self) -> None:
+        """Drop cached counts (calibration is kept)."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _raw_count(self, text: str, model_key: str) -> int:
+        """Count with the model's tokenizer or heuristic, cached."""
+        digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        key = (model_key, digest)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+
+        encoding, _ = self._resolve_encoding(model_key)
+        if encoding is not None:
+            raw = max(1, len(encoding.encode(text, disallowed_special=())))
+        else:
+            raw = math.ceil(len(text) / self.DEFAULT_CHARS_PER_TOKEN)
+
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = raw
+            if len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return raw
+
+    def _resolve_encoding(self, model_key: str) -> tuple[Any, bool]:
+        """Get (encoding or None, is exact) for a model."""
+        resolved = self._model_encodings.get(model_key)
+        if resolved is not None:
+            return resolved
+
+        encoding, exact = None, False
+        if self.use_tokenizers:
+            name = _openai_encoding_name(model_key)
+            if name is not None:
+                encoding = self._load_encoding(name)
+                exact = encoding is not None
+            if encoding is None:
+                encoding = self._load_encoding(PROXY_ENCODING)
+
+        self._model_encodings[model_key] = (encoding, exact)
+        return encoding, exact
+
+    def _load_encoding(self, name: str) -> Any:
+        """Load a tiktoken encoding once; None if it can't be loaded."""
+        if name in self._encodings:
+            return self._encodings[name]
+        try:
+            import tiktoken
+
+            encoding = tiktoken.get_encoding(name)
+        except Exception as e:
+            # ImportError, or the encoding file can't be fetched (offline)
+            logger.warning(f"Tokenizer {name} unavailable, using heuristic counts: {e}")
+            encoding = None
+        self._encodings[name] = encoding
+        return encoding
+
+
+def _openai_encoding_name(model: str) -> str | None:
+    """Get the tiktoken encoding name for an OpenAI model, if it is one."""
+    if not model:
+        return None
+    try:
+        from tiktoken.model import encoding_name_for_model
+    except ImportError:
+        return None
+    try:
+        return encoding_name_for_model(model)
+    except KeyError:
+        return None
+
+
+def prompt_text(
+    messages: Sequence[Message],
+    system_prompt: str | None = None,
+    tools: Sequence[dict[str, Any]] | None = None,
+) -> str:
+    """Join the text a request sends, for calibrating against usage.
+
+    Args:
+        messages: Request messages.
+        system_prompt: System prompt sent alongside them.
+        tools: Tool definitions as sent to the API, which providers bill
+            as prompt tokens.
+
+    Returns:
+        Newline-joined text of the system prompt, tools and messages.
+    """
+    parts = [system_prompt] if system_prompt else []
+    parts.extend(json.dumps(tool) for tool in tools or ())
+    for message in messages:
+        if isinstance(message.content, str):
+            parts.append(message.content)
+        else:
+            parts.extend(
+                block.text or block.tool_result or "" for block in message.content
+            )
+    return "\n".join(part for part in parts if part)
+
+
+_token_counter: TokenCounter | None = None
+
+
+def get_token_counter() -> TokenCounter:
+    """Get the process-wide token counter."""
+    global _token_counter
+    if _token_counter is None:
+        _token_counter = TokenCounter()
+    return _token_counter
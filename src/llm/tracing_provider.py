@@ -0,0 +1,235 @@
+"""Tracing wrapper for LLM providers.
+
+Wraps any LLM provider so each call runs in an "llm.<method>" tracing
+span, nested under whatever pipeline phase made the call and carrying
+provider, model and token usage.
+"""
+
+from typing import Any, Awaitable, Callable, Sequence
+
+from src.llm.base import LLMProvider
+from src.llm.message_types import Message
+from src.llm.response_types import LLMResponse
+from src.llm.tool_types import ToolDefinition
+from src.observability.tracing import Tracer
+
+
+class TracingProvider:
+    """Wrapper that emits a tracing span for every LLM call.
+
+    Streaming (complete_with_tools_streaming) is only offered if the
+    wrapped provider supports it, so callers' streaming checks see
+    through the wrapper.
+
+    Args:
+        provider: The LLM provider to wrap.
+        tracer: Tracer receiving the spans.
+    """
+
+    def __init__(self, provider: LLMProvider, tracer: Tracer) -> None:
+        """Initialize the tracing provider.
+
+        Args:
+            provider: The LLM provider to wrap.
+            tracer: Tracer receiving the spans.
+        """
+        self._provider = provider
+        self._tracer = tracer
+        if callable(getattr(provider, "complete_with_tools_streaming", None)):
+            self.complete_with_tools_streaming = self._complete_with_tools_streaming
+
+    @property
+    def provider_name(self) -> str:
+        """Return provider identifier."""
+        return self._provider.provider_name
+
+    @property
+    def default_model(self) -> str:
+        """Return default model for this provider."""
+        return self._provider.default_model
+
+    async def _traced(
+        self,
+        method: str,
+        call: Callable[[], Awaitable[LLMResponse]],
+        model: str | None,
+    ) -> LLMResponse:
+        """Run a provider call inside a span and record its usage.
+
+        Args:
+            method: Provider method name.
+            call: Zero-argument coroutine factory making the call.
+            model: Requested model (None for the provider default).
+
+        Returns:
+            The provider's response.
+        """
+        with self._tracer.span(
+            f"llm.{method}",
+            provider=self._provider.provider_name,
+            model=model or self._provider.default_model,
+        ) as span:
+            response = await call()
+            if response.usage is not None:
+                span.set(
+                    prompt_tokens=response.usage.prompt_tokens,
+                    completion_tokens=response.usage.completion_tokens,
+                )
+            return response
+
+    async def complete(
+        self,
+        messages: Sequence[Message],
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        stop_sequences: Sequence[str] | None = None,
+        system_prompt: str | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Generate a completion from messages in a span.
+
+        Args:
+            messages: Conversation history.
+            model: Model to use.
+            max_tokens: Maximum tokens to generate.
+            temperature: Sampling temperature.
+            stop_sequences: Sequences that stop generation.
+            system_prompt: System-level instructions.
+            **kwargs: Provider-specific options (e.g., think for Ollama).
+
+        Returns:
+            LLMResponse with text and metadata.
+        """
+        return await self._traced(
+            "complete",
+            lambda: self._provider.complete(
+                messages=messages,
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stop_sequences=stop_sequences,
+                system_prompt=system_prompt,
+                **kwargs,
+            ),
+            model,
+        )
+
+    async def complete_with_tools(
+        self,
+        messages: Sequence[Message],
+        tools: Sequence[ToolDefinition],
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        tool_choice: str | dict[str, Any] = "auto",
+        system_prompt: str | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Generate a completion that may include tool calls in a span.
+
+        Args:
+            messages: Conversation history.
+            tools: Available tools/functions.
+            model: Model to use.
+            max_tokens: Maximum tokens to generate.
+            temperature: Sampling temperature.
+            tool_choice: Tool selection mode.
+            system_prompt: System-level instructions.
+            **kwargs: Provider-specific options (e.g., think for Ollama).
+
+        Returns:
+            LLMResponse with text and/or tool_calls.
+        """
+        return await self._traced(
+            "complete_with_tools",
+            lambda: self._provider.complete_with_tools(
+                messages=messages,
+                tools=tools,
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                tool_choice=tool_choice,
+                system_prompt=system_prompt,
+                **kwargs,
+            ),
+            model,
+        )
+
+    async def _complete_with_tools_streaming(
+        self,
+        messages: Sequence[Message],
+        tools: Sequence[ToolDefinition],
+        model: str | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Stream a completion that may include tool calls in a span.
+
+        Args:
+            messages: Conversation history.
+            tools: Available tools/functions.
+            model: Model to use.
+            **kwargs: Other arguments of the wrapped provider's method
+                (max_tokens, temperature, tool_choice, system_prompt, on_token).
+
+        Returns:
+            LLMResponse with text and/or tool_calls.
+        """
+        return await self._traced(
+            "complete_with_tools_streaming",
+            lambda: self._provider.complete_with_tools_streaming(
+                messages=messages, tools=tools, model=model, **kwargs
+            ),
+            model,
+        )
+
+    async def complete_structured(
+        self,
+        messages: Sequence[Message],
+        response_schema: type,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        system_prompt: str | None = None,
+    ) -> LLMResponse:
+        """Generate a structured response matching a schema in a span.
+
+        Args:
+            messages: Conversation history.
+            response_schema: Pydantic model or dataclass for output.
+            model: Model to use.
+            max_tokens: Maximum tokens to generate.
+            temperature: Sampling temperature.
+            system_prompt: System-level instructions.
+
+        Returns:
+            LLMResponse with parsed_content containing the structured data.
+        """
+        return await self._traced(
+            "complete_structured",
+            lambda: self._provider.complete_structured(
+                messages=messages,
+                response_schema=response_schema,
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                system_prompt=system_prompt,
+            ),
+            model,
+        )
+
+    def count_tokens(
+        self,
+        text: str,
+        model: str | None = None,
+    ) -> int:
+        """Count tokens in text for context window management.
+
+        Args:
+            text: Text to count tokens for.
+            model: Model to use for tokenization.
+
+        Returns:
+            Token count.
+        """
+        return self._provider.count_tokens(text, model)
@@ -10,6 +10,7 @@ from src.managers.cliffhanger_manager import (
 from src.managers.conflict_manager import ConflictManager, ConflictStatus
 from src.managers.consistency import ConsistencyIssue, ConsistencyValidator, TemporalEffects
 from src.managers.context_compiler import ContextCompiler, SceneContext
+from src.managers.scene_section_cache import SceneSectionCache
 from src.managers.death import DeathManager, DeathSaveResult, RevivalResult
 from src.managers.destiny_manager import DestinyManager, ProphesyProgress
 from src.managers.economy_manager import (
@@ -73,6 +74,7 @@ from src.managers.combat_condition_manager import (
     ConditionInfo,
 )
 from src.managers.rumor_manager import (
+    RumorDiffusionResult,
     RumorInfo,
     RumorManager,
     RumorSpreadResult,
@@ -90,6 +92,7 @@ from src.managers.task_manager import TaskManager
 from src.managers.time_manager import TimeManager
 from src.managers.milestone_manager import MilestoneManager
 from src.managers.summary_manager import SummaryManager
+from src.managers.summary_worker import SummaryWorker
 from src.managers.narrative_mention_manager import NarrativeMentionManager
 from src.managers.discourse_manager import DiscourseManager, EntityMention
 
@@ -139,6 +142,7 @@ __all__ = [
     # Context
     "ContextCompiler",
     "SceneContext",
+    "SceneSectionCache",
     # Consistency
     "ConsistencyValidator",
     "ConsistencyIssue",
@@ -179,6 +183,7 @@ __all__ = [
     "ConditionEffect",
     "ConditionInfo",
     # Rumors
+    "RumorDiffusionResult",
     "RumorManager",
     "RumorInfo",
     "RumorSpreadResult",
@@ -207,6 +212,7 @@ __all__ = [
     # Context Summaries
     "MilestoneManager",
     "SummaryManager",
+    "SummaryWorker",
     "NarrativeMentionManager",
     # Discourse
     "DiscourseManager",
@@ -8,6 +8,8 @@ from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import Callable
 
+from src.llm.token_counter import get_token_counter
+
 
 class ContextPriority(IntEnum):
     """Priority levels for context sections.
@@ -66,23 +68,21 @@ DEFAULT_PRIORITIES: dict[str, ContextPriority] = {
 }
 
 
-def estimate_tokens(text: str) -> int:
+def estimate_tokens(text: str, model: str | None = None) -> int:
     """Estimate token count from text.
 
-    Uses a simple heuristic: ~4 characters per token on average.
-    This is a rough estimate for English text; actual counts vary by model.
+    Uses the shared token counter: a real tokenizer where available,
+    calibrated per model from reported usage, and cached by content hash
+    so sections repeated every turn are only tokenized once.
 
     Args:
         text: Text to estimate tokens for.
+        model: Model the text is for (None = generic estimate).
 
     Returns:
         Estimated token count.
     """
-    if not text:
-        return 0
-    # Average of ~4 chars per token for English text
-    # This is conservative; Claude tends to be ~3.5-4 chars/token
-    return len(text) // 4 + 1
+    return get_token_counter().count(text, model)
 
 
 class ContextBudget:
@@ -98,15 +98,18 @@ class ContextBudget:
         self,
         max_tokens: int = 8000,
         priorities: dict[str, ContextPriority] | None = None,
+        model: str | None = None,
     ) -> None:
         """Initialize budget manager.
 
         Args:
             max_tokens: Maximum tokens allowed for context.
             priorities: Optional custom priority mapping.
+            model: Model the context is for (used for token counting).
         """
         self.max_tokens = max_tokens
         self.priorities = priorities or DEFAULT_PRIORITIES
+        self.model = model
         self._sections: list[ContextSection] = []
 
     def add_section(
@@ -130,6 +133,7 @@ class ContextBudget:
             name=name,
             content=content,
             priority=section_priority,
+            token_count=estimate_tokens(content, self.model),
         )
         self._sections.append(section)
 
@@ -166,7 +170,7 @@ class ContextBudget:
         included: list[ContextSection] = []
         excluded: list[str] = []
         total_tokens = 0
-        separator_tokens = estimate_tokens(separator)
+        separator_tokens = estimate_tokens(separator, self.model)
 
         for section in sorted_sections:
             section_tokens = section.token_count
@@ -190,6 +194,7 @@ class ContextBudget:
                         name=section.name,
                         content=truncated_content,
                         priority=section.priority,
+                        token_count=estimate_tokens(truncated_content, self.model),
                     )
                     included.append(truncated_section)
                     total_tokens += truncated_section.token_count + separator_tokens
@@ -222,11 +227,12 @@ class ContextBudget:
         Returns:
             Truncated text with ellipsis.
         """
-        if estimate_tokens(text) <= max_tokens:
+        text_tokens = estimate_tokens(text, self.model)
+        if text_tokens <= max_tokens:
             return text
 
-        # Estimate character limit (4 chars per token)
-        char_limit = max_tokens * 4 - 3  # Leave room for "..."
+        # Estimate character limit from this text's own chars-per-token ratio
+        char_limit = len(text) * max_tokens // text_tokens - 3  # Leave room for "..."
 
         if char_limit <= 0:
             return ""
@@ -288,7 +294,7 @@ class ContextBudget:
         for model_key, limit in model_limits.items():
             if model_key in model_name.lower():
                 # Use 60% of limit for context (leaving room for response)
-                return ContextBudget(max_tokens=int(limit * 0.6))
+                return ContextBudget(max_tokens=int(limit * 0.6), model=model_name)
 
         # Default to conservative limit
-        return ContextBudget(max_tokens=8000)
+        return ContextBudget(max_tokens=8000, model=model_name)
@@ -27,6 +27,7 @@ from src.managers.narrative_mention_manager import NarrativeMentionManager
 from src.managers.needs import NeedsManager
 from src.managers.needs_communication_manager import NeedsCommunicationManager
 from src.managers.relationship_manager import RelationshipManager
+from src.managers.scene_section_cache import SceneSectionCache, get_scene_section_cache
 from src.managers.summary_manager import SummaryManager
 from src.managers.zone_manager import ZoneManager
 
@@ -123,12 +124,16 @@ class ContextCompiler(BaseManager):
         zone_manager: ZoneManager | None = None,
         discovery_manager: DiscoveryManager | None = None,
         goal_manager: GoalManager | None = None,
+        section_cache: SceneSectionCache | None = None,
     ) -> None:
         """Initialize with optional manager references.
 
         If managers aren't provided, they'll be created on demand.
+        compile_scene() reuses sections through section_cache (the game
+        session's shared cache for db if not provided).
         """
         super().__init__(db, game_session)
+        self.section_cache = section_cache or get_scene_section_cache(db, self.session_id)
         self._needs_manager = needs_manager
         self._injury_manager = injury_manager
         self._relationship_manager = relationship_manager
@@ -214,6 +219,9 @@ class ContextCompiler(BaseManager):
     ) -> SceneContext:
         """Compile full scene context for GM.
 
+        Each section is reused from section_cache until its arguments,
+        the game clock it reads, or a table it reads changes.
+
         Args:
             player_id: Player entity ID
             location_key: Current location key
@@ -224,35 +232,79 @@ class ContextCompiler(BaseManager):
         Returns:
             SceneContext with all compiled sections
         """
-        # Get layered summaries
-        story_summary = self.summary_manager.get_story_summary()
-        recent_summary = self.summary_manager.get_recent_summary()
-        turns_since_night = self.summary_manager.get_turns_since_night()
+        cache = self.section_cache
+        cache.check_pending_writes()
+        section = cache.get_section
 
-        # Get stable conditions
+        # Sections that read the game clock are scoped by it (or by its day)
         game_time = self._get_game_datetime()
-        stable_conditions = self.narrative_mention_manager.format_stable_conditions(
-            turn_number, game_time
-        )
+        day = game_time.day
 
         return SceneContext(
-            turn_context=self._get_turn_context(turn_number),
-            time_context=self._get_time_context(),
-            location_context=self._get_location_context(location_key),
-            player_context=self._get_player_context(player_id),
-            npcs_context=self._get_npcs_context(location_key, player_id),
-            tasks_context=self._get_tasks_context(player_id),
-            recent_events_context=self._get_recent_events(limit=5),
-            secrets_context=self._get_secrets_context(location_key) if include_secrets else "",
-            navigation_context=self._get_navigation_context(current_zone_key),
-            entity_registry_context=self._get_entity_registry_context(location_key, player_id),
-            world_facts_context=self._get_world_facts_context(location_key),
-            location_inventory_context=self._get_location_inventory_context(location_key),
-            needs_alerts_context=self._get_needs_alerts(player_id, turn_number),
-            story_summary=story_summary,
-            recent_summary=recent_summary,
-            turns_since_night=turns_since_night,
-            stable_conditions=stable_conditions,
+            turn_context=section(
+                "turn_context", turn_number, lambda: self._get_turn_context(turn_number)
+            ),
+            time_context=section("time_context", None, self._get_time_context),
+            location_context=section(
+                "location_context", location_key, lambda: self._get_location_context(location_key)
+            ),
+            player_context=section(
+                "player_context", player_id, lambda: self._get_player_context(player_id)
+            ),
+            npcs_context=section(
+                "npcs_context",
+                (location_key, player_id),
+                lambda: self._get_npcs_context(location_key, player_id),
+            ),
+            tasks_context=section(
+                "tasks_context", (player_id, game_time), lambda: self._get_tasks_context(player_id)
+            ),
+            recent_events_context=section(
+                "recent_events_context", None, lambda: self._get_recent_events(limit=5)
+            ),
+            secrets_context=section(
+                "secrets_context", location_key, lambda: self._get_secrets_context(location_key)
+            )
+            if include_secrets
+            else "",
+            navigation_context=section(
+                "navigation_context",
+                current_zone_key,
+                lambda: self._get_navigation_context(current_zone_key),
+            ),
+            entity_registry_context=section(
+                "entity_registry_context",
+                (location_key, player_id),
+                lambda: self._get_entity_registry_context(location_key, player_id),
+            ),
+            world_facts_context=section(
+                "world_facts_context",
+                location_key,
+                lambda: self._get_world_facts_context(location_key),
+            ),
+            location_inventory_context=section(
+                "location_inventory_context",
+                location_key,
+                lambda: self._get_location_inventory_context(location_key),
+            ),
+            needs_alerts_context=section(
+                "needs_alerts_context",
+                (player_id, turn_number, game_time),
+                lambda: self._get_needs_alerts(player_id, turn_number),
+            ),
+            # Not cached: SummaryWorker commits new summaries from its own session
+            story_summary=self.summary_manager.get_story_summary(),
+            recent_summary=self.summary_manager.get_recent_summary(),
+            turns_since_night=section(
+                "turns_since_night", day, self.summary_manager.get_turns_since_night
+            ),
+            stable_conditions=section(
+                "stable_conditions",
+                (turn_number, game_time),
+                lambda: self.narrative_mention_manager.format_stable_conditions(
+                    turn_number, game_time
+                ),
+            ),
         )
 
     def _get_turn_context(self, turn_number: int, history_limit: int = 3) -> str:
@@ -3,6 +3,7 @@
 from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
+from src.database.async_support import run_sync_read
 from src.database.models.enums import EntityType
 from src.database.models.entities import (
     Entity,
@@ -1064,3 +1065,21 @@ class EntityManager(BaseManager):
             )
             .all()
         )
+
+    # =========================================================================
+    # Async Reads (hot path, async-backed sessions)
+    # =========================================================================
+
+    async def get_entity_async(self, entity_key: str) -> Entity | None:
+        """Async version of get_entity() that doesn't block the event loop."""
+        return await run_sync_read(self.db, self.get_entity, entity_key)
+
+    async def get_player_async(self) -> Entity | None:
+        """Async version of get_player() that doesn't block the event loop."""
+        return await run_sync_read(self.db, self.get_player)
+
+    async def get_npcs_in_scene_async(
+        self, location_key: str, alive_only: bool = True
+    ) -> list[Entity]:
+        """Async version of get_npcs_in_scene() that doesn't block the event loop."""
+        return await run_sync_read(self.db, self.get_npcs_in_scene, location_key, alive_only)
@@ -4,6 +4,7 @@ from collections import defaultdict
 
 from sqlalchemy.orm import Session
 
+from src.database.async_support import run_sync_read
 from src.database.models.enums import ItemType, ItemCondition, StorageLocationType
 from src.database.models.items import Item, StorageLocation
 from src.database.models.session import GameSession
@@ -1773,3 +1774,19 @@ class ItemManager(BaseManager):
 
         self.db.flush()
         return transferred_item
+
+    # =========================================================================
+    # Async Reads (hot path, async-backed sessions)
+    # =========================================================================
+
+    async def get_item_async(self, item_key: str) -> Item | None:
+        """Async version of get_item() that doesn't block the event loop."""
+        return await run_sync_read(self.db, self.get_item, item_key)
+
+    async def get_inventory_async(self, entity_id: int) -> list[Item]:
+        """Async version of get_inventory() that doesn't block the event loop."""
+        return await run_sync_read(self.db, self.get_inventory, entity_id)
+
+    async def get_equipped_items_async(self, entity_id: int) -> list[Item]:
+        """Async version of get_equipped_items() that doesn't block the event loop."""
+        return await run_sync_read(self.db, self.get_equipped_items, entity_id)
@@ -2,6 +2,7 @@
 
 from sqlalchemy.orm import Session
 
+from src.database.async_support import run_sync_read
 from src.database.models.items import StorageLocation
 from src.database.models.session import GameSession
 from src.database.models.world import Location
@@ -642,3 +643,19 @@ class LocationManager(BaseManager):
             return "The " + name[4:].title()
 
         return name.title()
+
+    # =========================================================================
+    # Async Reads (hot path, async-backed sessions)
+    # =========================================================================
+
+    async def get_location_async(self, location_key: str) -> Location | None:
+        """Async version of get_location() that doesn't block the event loop."""
+        return await run_sync_read(self.db, self.get_location, location_key)
+
+    async def get_accessible_locations_async(self, from_location_key: str) -> list[Location]:
+        """Async version of get_accessible_locations() that doesn't block the event loop."""
+        return await run_sync_read(self.db, self.get_accessible_locations, from_location_key)
+
+    async def get_items_at_location_async(self, location_key: str) -> list:
+        """Async version of get_items_at_location() that doesn't block the event loop."""
+        return await run_sync_read(self.db, self.get_items_at_location, location_key)
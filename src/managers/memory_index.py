@@ -0,0 +1,292 @@
+"""Inverted index over character memory keywords and subjects.
+
+MemoryManager.find_matching_memories used to load every memory of an
+entity and run CharacterMemory.matches_keywords on each one per call.
+The index keeps, per entity, postings from the first word of each
+keyword and subject to the memories containing it, so a lookup only
+walks the postings of words that appear in the text and then loads the
+few memories that matched.
+
+Matching is on words rather than raw substrings: a phrase matches when
+its words appear in order in the text, the last one as a prefix (so
+"hat" matches "hats" and "wide-brimmed" matches "wide brimmed", but
+"hat" no longer matches "that").
+
+Scores are BM25 term weights normalized by the memory's own maximum.
+Each keyword or subject counts once per memory, so BM25's term
+frequency and length factors cancel and a memory's score is the IDF
+mass of its matched phrases over its total IDF mass. A memory whose
+phrases all match scores 1.0, and phrases shared by many of the
+entity's memories count for less than rare ones.
+
+Indexes live in the SQLAlchemy session's info dict, one per entity, and
+are built on first use. Flushed inserts, updates and deletes of
+memories are applied to them incrementally; bulk deletes that bypass
+the unit of work must call discard_memory. A rollback drops them all.
+"""
+
+import math
+import re
+from collections.abc import Iterable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.database.models.character_memory import CharacterMemory
+from src.database.models.entities import Entity
+
+_INDEXES_KEY = "memory_indexes"
+_LISTENING_KEY = "memory_index_listening"
+
+# BM25 IDF smoothing; k1 and b drop out of the normalized score
+_IDF_OFFSET = 0.5
+
+_WORD = re.compile(r"[^\W_]+")
+
+Phrase = tuple[str, ...]
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase words.
+
+    Args:
+        text: Text to split.
+
+    Returns:
+        Words in order, punctuation dropped.
+    """
+    return _WORD.findall(text.lower())
+
+
+def _phrases(subject: str, keywords: Iterable[str]) -> tuple[Phrase, ...]:
+    """Distinct non-empty phrases of a memory, keywords first."""
+    phrases = dict.fromkeys(tuple(tokenize(keyword)) for keyword in keywords)
+    phrases[tuple(tokenize(subject))] = None
+    return tuple(phrase for phrase in phrases if phrase)
+
+
+def _matches_at(phrase: Phrase, words: list[str], position: int) -> bool:
+    """Whether a phrase starts at a word position (last word as a prefix)."""
+    end = position + len(phrase)
+    if end > len(words):
+        return False
+    *head, last = phrase
+    return (
+        all(words[position + offset] == word for offset, word in enumerate(head))
+        and words[end - 1].startswith(last)
+    )
+
+
+class MemoryIndex:
+    """Keyword and subject postings for one entity's memories.
+
+    Usage:
+        index = get_memory_index(db, session_id, entity_id)
+        for memory_id, relevance in index.search("a wide-brimmed straw hat"):
+            ...
+    """
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self._phrases: dict[int, tuple[Phrase, ...]] = {}
+        self._keywords: dict[int, frozenset[str]] = {}
+        # First word -> phrase -> memory IDs
+        self._postings: dict[str, dict[Phrase, set[int]]] = {}
+        self._document_frequency: dict[Phrase, int] = {}
+        self._by_keyword: dict[str, set[int]] = {}
+        self._longest_word = 0
+
+    @classmethod
+    def load(cls, db: Session, session_id: int, entity_id: int) -> "MemoryIndex":
+        """Load an entity's memories into a new index.
+
+        Args:
+            db: Database session
+            session_id: Game session ID
+            entity_id: Entity ID
+
+        Returns:
+            The index
+        """
+        index = cls()
+        rows = db.query(
+            CharacterMemory.id, CharacterMemory.subject, CharacterMemory.keywords
+        ).filter(
+            CharacterMemory.entity_id == entity_id,
+            CharacterMemory.session_id == session_id,
+        )
+        for memory_id, subject, keywords in rows:
+            index.add(memory_id, subject, keywords)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._phrases)
+
+    def __contains__(self, memory_id: object) -> bool:
+        return memory_id in self._phrases
+
+    def add(self, memory_id: int, subject: str, keywords: Iterable[str]) -> None:
+        """Index a memory, replacing any earlier version of it.
+
+        Args:
+            memory_id: Memory ID.
+            subject: What is remembered.
+            keywords: Keywords for matching.
+        """
+        self.remove(memory_id)
+        keywords = list(keywords or [])
+        phrases = _phrases(subject or "", keywords)
+        self._phrases[memory_id] = phrases
+        self._keywords[memory_id] = frozenset(keyword.lower() for keyword in keywords)
+        for phrase in phrases:
+            self._postings.setdefault(phrase[0], {}).setdefault(phrase, set()).add(memory_id)
+            self._document_frequency[phrase] = self._document_frequency.get(phrase, 0) + 1
+            self._longest_word = max(self._longest_word, len(phrase[0]))
+        for keyword in self._keywords[memory_id]:
+            self._by_keyword.setdefault(keyword, set()).add(memory_id)
+
+    def remove(self, memory_id: int) -> None:
+        """Drop a memory from the index (no-op if absent).
+
+        Args:
+            memory_id: Memory ID.
+        """
+        phrases = self._phrases.pop(memory_id, None)
+        if phrases is None:
+            return
+        for phrase in phrases:
+            by_phrase = self._postings[phrase[0]]
+            by_phrase[phrase].discard(memory_id)
+            if not by_phrase[phrase]:
+                del by_phrase[phrase]
+                if not by_phrase:
+                    del self._postings[phrase[0]]
+            self._document_frequency[phrase] -= 1
+            if not self._document_frequency[phrase]:
+                del self._document_frequency[phrase]
+        for keyword in self._keywords.pop(memory_id):
+            self._by_keyword[keyword].discard(memory_id)
+            if not self._by_keyword[keyword]:
+                del self._by_keyword[keyword]
+
+    def _idf(self, phrase: Phrase) -> float:
+        """BM25 inverse document frequency of a phrase among this entity's memories."""
+        frequency = self._document_frequency[phrase]
+        return math.log(
+            1 + (len(self._phrases) - frequency + _IDF_OFFSET) / (frequency + _IDF_OFFSET)
+        )
+
+    def search(self, text: str) -> list[tuple[int, float]]:
+        """Score the memories whose keywords or subject appear in text.
+
+        Args:
+            text: Text to match against (e.g., item description).
+
+        Returns:
+            (memory ID, relevance 0.0-1.0) for every memory with a match.
+        """
+        words = tokenize(text)
+        hits: dict[int, set[Phrase]] = {}
+        for position, word in enumerate(words):
+            # Any prefix of the word may start a phrase (single-word prefix matches)
+            for length in range(1, min(len(word), self._longest_word) + 1):
+                by_phrase = self._postings.get(word[:length])
+                if by_phrase is None:
+                    continue
+                for phrase, memory_ids in by_phrase.items():
+                    if _matches_at(phrase, words, position):
+                        for memory_id in memory_ids:
+                            hits.setdefault(memory_id, set()).add(phrase)
+
+        scores = []
+        for memory_id, matched in hits.items():
+            weights = [(phrase in matched, self._idf(phrase)) for phrase in self._phrases[memory_id]]
+            total = sum(weight for _, weight in weights)
+            score = sum(weight for hit, weight in weights if hit)
+            scores.append((memory_id, min(1.0, score / total)))
+        return scores
+
+    def with_keyword(self, keyword: str) -> set[int]:
+        """Memories with a keyword equal to the given one (case-insensitive).
+
+        Args:
+            keyword: Keyword to look up.
+
+        Returns:
+            Memory IDs.
+        """
+        return set(self._by_keyword.get(keyword.lower(), ()))
+
+
+def get_memory_index(db: Session, session_id: int, entity_id: int) -> MemoryIndex:
+    """Get the cached memory index for an entity, building it if needed.
+
+    Pending changes are flushed first (as a query would autoflush them),
+    so memories added through the ORM are never missed.
+
+    Args:
+        db: Database session
+        session_id: Game session ID
+        entity_id: Entity ID
+
+    Returns:
+        The entity's memory index
+    """
+    if not isinstance(db, Session):
+        return MemoryIndex.load(db, session_id, entity_id)
+
+    if db.autoflush:
+        db.flush()  # No-op when nothing is pending
+
+    if not db.info.get(_LISTENING_KEY):
+        event.listen(db, "after_flush", _on_flush)
+        event.listen(db, "after_rollback", _on_rollback)
+        db.info[_LISTENING_KEY] = True
+
+    indexes: dict[tuple[int, int], MemoryIndex] = db.info.setdefault(_INDEXES_KEY, {})
+    index = indexes.get((session_id, entity_id))
+    if index is None:
+        index = MemoryIndex.load(db, session_id, entity_id)
+        indexes[(session_id, entity_id)] = index
+    return index
+
+
+def discard_memory(db: Session, memory_id: int) -> None:
+    """Drop a memory deleted outside the unit of work from cached indexes.
+
+    Args:
+        db: Database session
+        memory_id: Deleted memory ID
+    """
+    if not isinstance(db, Session):
+        return
+    for index in db.info.get(_INDEXES_KEY, {}).values():
+        index.remove(memory_id)
+
+
+def _on_flush(session: Session, flush_context: object) -> None:
+    """Apply flushed memory changes to the cached indexes."""
+    indexes: dict[tuple[int, int], MemoryIndex] = session.info.get(_INDEXES_KEY, {})
+    if not indexes:
+        return
+    for obj in session.deleted:
+        if isinstance(obj, CharacterMemory):
+            discard_memory(session, obj.id)
+        elif isinstance(obj, Entity):
+            # Memories go with the entity through ON DELETE CASCADE
+            indexes.pop((obj.session_id, obj.id), None)
+    dirty = [obj for obj in session.dirty if isinstance(obj, CharacterMemory)]
+    for obj in dirty:
+        # The memory may have moved to another entity
+        discard_memory(session, obj.id)
+    for obj in (*session.new, *dirty):
+        if not isinstance(obj, CharacterMemory):
+            continue
+        index = indexes.get((obj.session_id, obj.entity_id))
+        if index is not None:
+            index.add(obj.id, obj.subject, obj.keywords)
+
+
+def _on_rollback(session: Session) -> None:
+    """Drop all indexes; they may contain rolled-back memories."""
+    session.info.get(_INDEXES_KEY, {}).clear()
@@ -1,5 +1,6 @@
 """Character memory management for emotional reactions."""
 
+from collections.abc import Iterable
 from typing import Any
 
 from sqlalchemy.orm import Session
@@ -8,6 +9,7 @@ from src.database.models.character_memory import CharacterMemory
 from src.database.models.enums import EmotionalValence, MemoryType
 from src.database.models.session import GameSession
 from src.managers.base import BaseManager
+from src.managers.memory_index import MemoryIndex, discard_memory, get_memory_index
 
 
 class MemoryManager(BaseManager):
@@ -17,8 +19,22 @@ class MemoryManager(BaseManager):
     - CRUD operations for CharacterMemory
     - Memory matching and retrieval
     - Trigger tracking and statistics
+
+    Matching goes through a per-entity MemoryIndex that is kept up to
+    date as memories are flushed (see src/managers/memory_index.py).
     """
 
+    def memory_index(self, entity_id: int) -> MemoryIndex:
+        """Get the keyword index of an entity's memories.
+
+        Args:
+            entity_id: The entity ID.
+
+        Returns:
+            The entity's MemoryIndex.
+        """
+        return get_memory_index(self.db, self.session_id, entity_id)
+
     # =========================================================================
     # Memory CRUD
     # =========================================================================
@@ -170,6 +186,8 @@ class MemoryManager(BaseManager):
             .delete()
         )
         self.db.flush()
+        # Bulk deletes bypass the flush hook that maintains the index
+        discard_memory(self.db, memory_id)
         return result > 0
 
     # =========================================================================
@@ -182,9 +200,11 @@ class MemoryManager(BaseManager):
         text: str,
         min_relevance: float = 0.3,
     ) -> list[tuple[CharacterMemory, float]]:
-        """Find memories that match the given text using keyword matching.
+        """Find memories whose keywords or subject appear in the given text.
 
         This is a quick filter - semantic matching should use LLM.
+        Relevance is the IDF-weighted share of a memory's keywords and
+        subject found in the text, so 1.0 means all of them matched.
 
         Args:
             entity_id: The entity ID.
@@ -194,16 +214,19 @@ class MemoryManager(BaseManager):
         Returns:
             List of (CharacterMemory, relevance_score) tuples, sorted by score.
         """
-        memories = self.get_memories_for_entity(entity_id)
-        matches: list[tuple[CharacterMemory, float]] = []
+        scores = {
+            memory_id: relevance
+            for memory_id, relevance in self.memory_index(entity_id).search(text)
+            if relevance >= min_relevance
+        }
+        if not scores:
+            return []
 
-        for memory in memories:
-            relevance = memory.matches_keywords(text)
-            if relevance >= min_relevance:
-                matches.append((memory, relevance))
+        memories = self._load_memories(scores)
+        matches = [(memory, scores[memory.id]) for memory in memories]
 
-        # Sort by relevance (highest first)
-        matches.sort(key=lambda x: x[1], reverse=True)
+        # Sort by relevance (highest first), then as get_memories_for_entity
+        matches.sort(key=lambda x: (-x[1], -x[0].intensity, x[0].id))
         return matches
 
     def find_memories_by_keyword(
@@ -218,14 +241,31 @@ class MemoryManager(BaseManager):
             keyword: Keyword to search for.
 
         Returns:
-            List of memories containing the keyword.
+            List of memories containing the keyword, strongest first.
         """
-        keyword_lower = keyword.lower()
-        memories = self.get_memories_for_entity(entity_id)
-        return [
-            m for m in memories
-            if any(kw.lower() == keyword_lower for kw in m.keywords)
-        ]
+        memory_ids = self.memory_index(entity_id).with_keyword(keyword)
+        if not memory_ids:
+            return []
+        memories = self._load_memories(memory_ids)
+        return sorted(memories, key=lambda m: (-m.intensity, m.id))
+
+    def _load_memories(self, memory_ids: Iterable[int]) -> list[CharacterMemory]:
+        """Load memories by ID in one query.
+
+        Args:
+            memory_ids: Memory IDs from the index.
+
+        Returns:
+            The memories that still exist in this session.
+        """
+        return (
+            self.db.query(CharacterMemory)
+            .filter(
+                CharacterMemory.id.in_(list(memory_ids)),
+                CharacterMemory.session_id == self.session_id,
+            )
+            .all()
+        )
 
     # =========================================================================
     # Trigger Tracking
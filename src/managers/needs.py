@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Literal
+from typing import TYPE_CHECKING, Iterable, Literal
 
 from sqlalchemy.orm import Session
 
@@ -17,6 +17,9 @@ from src.database.models.enums import DriveLevel, IntimacyStyle, ModifierSource,
 from src.database.models.session import GameSession
 from src.managers.base import BaseManager
 
+if TYPE_CHECKING:
+    from src.managers.needs_batch import BatchDecayResult
+
 
 class ActivityType(str, Enum):
     """Activity types affecting need decay rates."""
@@ -91,6 +94,26 @@ INTIMACY_DAILY_DECAY: dict[DriveLevel, float] = {
     DriveLevel.VERY_HIGH: 10,
 }
 
+# Morale penalties from other needs: (need, worse when high, bands).
+# Bands run most to least severe; the first band whose threshold the
+# value is past (below, or above when worse when high) applies.
+MORALE_NEED_PENALTIES: tuple[tuple[str, bool, tuple[tuple[int, int], ...]], ...] = (
+    ("hunger", False, ((15, -20), (30, -10))),
+    # Thirst is vital - affects morale significantly
+    ("thirst", False, ((5, -25), (15, -15), (30, -5))),
+    # Low stamina = physically exhausted
+    ("stamina", False, ((20, -10), (40, -5))),
+    # High pressure = desperately tired
+    ("sleep_pressure", True, ((80, -15), (60, -8))),
+    # Low wellness = pain
+    ("wellness", False, ((40, -25), (60, -15))),
+    ("social_connection", False, ((20, -25), (40, -10))),
+    ("comfort", False, ((20, -10),)),
+)
+MORALE_BASELINE = 50
+# Morale drifts toward baseline + penalties by this much per update
+MORALE_DRIFT = 5
+
 # Action catalog with midpoint satisfaction values for each need
 # These represent typical satisfaction amounts before quality/preference modifiers
 # All needs: higher value = better, so satisfaction increases the need value
@@ -436,61 +459,57 @@ class NeedsManager(BaseManager):
         self.db.flush()
         return needs
 
-    def _update_morale(self, needs: CharacterNeeds) -> None:
-        """Update morale based on other need states."""
-        morale_modifier = 0
-
-        # Hunger effects on morale
-        if needs.hunger < 15:
-            morale_modifier -= 20
-        elif needs.hunger < 30:
-            morale_modifier -= 10
-
-        # Thirst effects on morale (vital - affects morale significantly)
-        if needs.thirst < 5:
-            morale_modifier -= 25
-        elif needs.thirst < 15:
-            morale_modifier -= 15
-        elif needs.thirst < 30:
-            morale_modifier -= 5
-
-        # Stamina effects on morale (low stamina = physically exhausted)
-        if needs.stamina < 20:
-            morale_modifier -= 10
-        elif needs.stamina < 40:
-            morale_modifier -= 5
+    def apply_batch_time_decay(
+        self,
+        hours: float,
+        activity: ActivityType = ActivityType.ACTIVE,
+        is_alone: bool = True,
+        entity_ids: Iterable[int] | None = None,
+    ) -> "BatchDecayResult":
+        """Apply time-based decay to many entities' needs at once.
 
-        # Sleep pressure effects on morale (high pressure = desperately tired)
-        if needs.sleep_pressure > 80:
-            morale_modifier -= 15
-        elif needs.sleep_pressure > 60:
-            morale_modifier -= 8
+        Same rules as apply_time_decay, computed column-wise over all
+        entities with a fixed number of queries. Entities without a needs
+        record are skipped.
 
-        # Wellness effects on morale (low wellness = pain)
-        if needs.wellness < 40:
-            morale_modifier -= 25
-        elif needs.wellness < 60:
-            morale_modifier -= 15
+        Args:
+            hours: In-game hours that passed
+            activity: Type of activity during this time
+            is_alone: Whether the entities were alone (affects social need)
+            entity_ids: Entities to update (all with needs if None)
 
-        # Social isolation effects
-        if needs.social_connection < 20:
-            morale_modifier -= 25
-        elif needs.social_connection < 40:
-            morale_modifier -= 10
+        Returns:
+            BatchDecayResult with the new need values
+        """
+        from src.managers.needs_batch import apply_batch_time_decay
+
+        return apply_batch_time_decay(
+            self.db,
+            self.session_id,
+            hours,
+            activity=activity,
+            is_alone=is_alone,
+            entity_ids=entity_ids,
+        )
 
-        # Comfort effects
-        if needs.comfort < 20:
-            morale_modifier -= 10
+    def _update_morale(self, needs: CharacterNeeds) -> None:
+        """Update morale based on other need states."""
+        morale_modifier = 0
+        for need_name, worse_when_high, bands in MORALE_NEED_PENALTIES:
+            value = getattr(needs, need_name)
+            for threshold, penalty in bands:
+                if (value > threshold) if worse_when_high else (value < threshold):
+                    morale_modifier += penalty
+                    break
 
         # Apply gradual morale adjustment toward baseline + modifiers
-        baseline = 50 + morale_modifier
+        baseline = MORALE_BASELINE + morale_modifier
         current = needs.morale
 
-        # Morale drifts toward baseline at 5 points per update
         if current < baseline:
-            needs.morale = min(current + 5, baseline)
+            needs.morale = min(current + MORALE_DRIFT, baseline)
         elif current > baseline:
-            needs.morale = max(current - 5, baseline)
+            needs.morale = max(current - MORALE_DRIFT, baseline)
 
         needs.morale = self._clamp(needs.morale)
 
@@ -1412,20 +1431,25 @@ class NeedsManager(BaseManager):
         entity_manager = EntityManager(self.db, self.game_session)
         companions = entity_manager.get_companions()
 
-        results: dict[str, CharacterNeeds | None] = {}
-
-        for companion in companions:
-            # Check if companion has needs record
-            needs = self.get_needs(companion.id)
-            if needs:
-                updated = self.apply_time_decay(
-                    entity_id=companion.id,
-                    hours=hours,
-                    activity=activity,
-                    is_alone=False,  # Companions are with player
-                )
-                results[companion.entity_key] = updated
-            else:
-                results[companion.entity_key] = None
+        if not companions:
+            return {}
+
+        companion_ids = [companion.id for companion in companions]
+        self.apply_batch_time_decay(
+            hours=hours,
+            activity=activity,
+            is_alone=False,  # Companions are with player
+            entity_ids=companion_ids,
+        )
 
-        return results
+        needs_by_entity = {
+            needs.entity_id: needs
+            for needs in self.db.query(CharacterNeeds).filter(
+                CharacterNeeds.entity_id.in_(companion_ids),
+                CharacterNeeds.session_id == self.session_id,
+            )
+        }
+        return {
+            companion.entity_key: needs_by_entity.get(companion.id)
+            for companion in companions
+        }
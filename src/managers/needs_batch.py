@@ -0,0 +1,246 @@
+"""Columnar need decay for many entities at once.
+
+NeedsManager.apply_time_decay updates one entity per call and queries
+its modifiers twice per need, so simulating a few hours across a town
+costs thousands of queries. apply_batch_time_decay loads the needs,
+active modifiers and preferences of a whole set of entities in three
+queries, applies DECAY_RATES, intensity caps, drive-based intimacy decay
+and morale drift as NumPy array operations, and writes the changed rows
+back in one executemany UPDATE.
+
+The result matches calling apply_time_decay on each entity in turn,
+except that entities without a CharacterNeeds row are skipped rather
+than given one.
+
+Usage:
+    >>> result = apply_batch_time_decay(db, session_id, hours=3.0)
+    >>> result.needs_for(npc.id)["hunger"]
+    62
+"""
+
+from dataclasses import dataclass
+from typing import Iterable
+
+import numpy as np
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.orm import Session
+
+from src.database.models.character_preferences import CharacterPreferences, NeedModifier
+from src.database.models.character_state import CharacterNeeds
+from src.managers.needs import (
+    DECAY_RATES,
+    INTIMACY_DAILY_DECAY,
+    MORALE_BASELINE,
+    MORALE_DRIFT,
+    MORALE_NEED_PENALTIES,
+    ActivityType,
+)
+
+# Need columns decayed per hour, in DECAY_RATES order
+NEED_COLUMNS: tuple[str, ...] = tuple(name for name in DECAY_RATES if hasattr(CharacterNeeds, name))
+_COLUMN_INDEX = {name: index for index, name in enumerate(NEED_COLUMNS)}
+
+# Rate for social connection when not alone or socializing
+SOCIAL_GAIN_RATE = 5
+
+# Default daily intimacy decay for an unknown drive level
+_DEFAULT_INTIMACY_DECAY = 5
+
+
+@dataclass(frozen=True)
+class BatchDecayResult:
+    """Need values after a batch decay, one row per entity.
+
+    Attributes:
+        entity_ids: Entity of each row, ascending.
+        values: New need values, one column per NEED_COLUMNS entry.
+        changed: Rows whose values changed (and were written back).
+    """
+
+    entity_ids: np.ndarray
+    values: np.ndarray
+    changed: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.entity_ids)
+
+    def needs_for(self, entity_id: int) -> dict[str, int] | None:
+        """New need values for one entity.
+
+        Args:
+            entity_id: Entity to look up.
+
+        Returns:
+            Need name -> value, or None if the entity was not in the batch.
+        """
+        row = int(np.searchsorted(self.entity_ids, entity_id))
+        if row == len(self.entity_ids) or self.entity_ids[row] != entity_id:
+            return None
+        return {name: int(value) for name, value in zip(NEED_COLUMNS, self.values[row], strict=True)}
+
+
+def _clamp(values: np.ndarray, max_values: np.ndarray | int = 100) -> np.ndarray:
+    """Vectorized BaseManager._clamp: clip to [0, max] and round half to even."""
+    return np.round(np.maximum(0, np.minimum(max_values, values)))
+
+
+def _morale_modifier(values: np.ndarray) -> np.ndarray:
+    """Sum of MORALE_NEED_PENALTIES for each row."""
+    modifier = np.zeros(len(values))
+    for need_name, worse_when_high, bands in MORALE_NEED_PENALTIES:
+        column = values[:, _COLUMN_INDEX[need_name]]
+        conditions = [
+            column > threshold if worse_when_high else column < threshold
+            for threshold, _ in bands
+        ]
+        modifier += np.select(conditions, [penalty for _, penalty in bands], default=0)
+    return modifier
+
+
+def apply_batch_time_decay(
+    db: Session,
+    session_id: int,
+    hours: float,
+    activity: ActivityType = ActivityType.ACTIVE,
+    is_alone: bool = True,
+    entity_ids: Iterable[int] | None = None,
+) -> BatchDecayResult:
+    """Apply time-based decay to the needs of many entities at once.
+
+    Args:
+        db: Database session.
+        session_id: Game session ID.
+        hours: In-game hours that passed.
+        activity: Type of activity during this time (same for everyone).
+        is_alone: Whether the entities were alone (affects social need).
+        entity_ids: Entities to update (all with needs in the session if None).
+
+    Returns:
+        New need values of every entity with a needs record.
+    """
+    db.flush()
+
+    table = CharacterNeeds.__table__
+    query = select(table.c.id, table.c.entity_id, *(table.c[name] for name in NEED_COLUMNS)).where(
+        table.c.session_id == session_id
+    )
+    if entity_ids is not None:
+        query = query.where(table.c.entity_id.in_(list(entity_ids)))
+    rows = db.execute(query.order_by(table.c.entity_id)).all()
+
+    if not rows:
+        return BatchDecayResult(
+            entity_ids=np.empty(0, dtype=np.int64),
+            values=np.empty((0, len(NEED_COLUMNS))),
+            changed=np.empty(0, dtype=bool),
+        )
+
+    row_ids = np.array([row[0] for row in rows], dtype=np.int64)
+    entities = np.array([row[1] for row in rows], dtype=np.int64)
+    original = np.array([row[2:] for row in rows], dtype=np.float64)
+    row_of = {int(entity_id): row for row, entity_id in enumerate(entities)}
+    loaded_ids = list(row_of)
+
+    # Active modifiers: multipliers multiply, caps take the lowest
+    multipliers = np.ones_like(original)
+    caps = np.full_like(original, 100)
+    modifiers = db.execute(
+        select(
+            NeedModifier.entity_id,
+            NeedModifier.need_name,
+            NeedModifier.decay_rate_multiplier,
+            NeedModifier.max_intensity_cap,
+        ).where(
+            NeedModifier.session_id == session_id,
+            NeedModifier.is_active == True,  # noqa: E712
+            NeedModifier.entity_id.in_(loaded_ids),
+        )
+    ).all()
+    modifiers = [mod for mod in modifiers if mod.need_name in _COLUMN_INDEX]
+    if modifiers:
+        index = (
+            np.array([row_of[mod.entity_id] for mod in modifiers]),
+            np.array([_COLUMN_INDEX[mod.need_name] for mod in modifiers]),
+        )
+        np.multiply.at(multipliers, index, [mod.decay_rate_multiplier for mod in modifiers])
+        capped = np.array([mod.max_intensity_cap is not None for mod in modifiers])
+        np.minimum.at(
+            caps,
+            (index[0][capped], index[1][capped]),
+            [mod.max_intensity_cap for mod in modifiers if mod.max_intensity_cap is not None],
+        )
+
+    # Per-hour decay for every need
+    rates = np.array(
+        [
+            getattr(DECAY_RATES[name], activity.value, DECAY_RATES[name].active)
+            for name in NEED_COLUMNS
+        ],
+        dtype=np.float64,
+    )
+    if not is_alone or activity == ActivityType.SOCIALIZING:
+        rates[_COLUMN_INDEX["social_connection"]] = SOCIAL_GAIN_RATE
+    values = _clamp(original + rates * multipliers * hours, caps)
+
+    # Intimacy decays daily by drive level, for entities with preferences
+    intimacy = _COLUMN_INDEX["intimacy"]
+    preferences = db.execute(
+        select(CharacterPreferences.entity_id, CharacterPreferences.drive_level).where(
+            CharacterPreferences.session_id == session_id,
+            CharacterPreferences.entity_id.in_(loaded_ids),
+        )
+    ).all()
+    if preferences:
+        pref_rows = np.array([row_of[pref.entity_id] for pref in preferences])
+        daily_rates = np.array(
+            [
+                INTIMACY_DAILY_DECAY.get(pref.drive_level, _DEFAULT_INTIMACY_DECAY)
+                for pref in preferences
+            ],
+            dtype=np.float64,
+        )
+        hourly_rates = (daily_rates / 24) * multipliers[pref_rows, intimacy]
+        values[pref_rows, intimacy] = _clamp(values[pref_rows, intimacy] - hourly_rates * hours)
+
+    # Morale drifts toward its baseline, as in NeedsManager._update_morale
+    morale = _COLUMN_INDEX["morale"]
+    baseline = MORALE_BASELINE + _morale_modifier(values)
+    current = values[:, morale]
+    drifted = np.where(
+        current < baseline,
+        np.minimum(current + MORALE_DRIFT, baseline),
+        np.maximum(current - MORALE_DRIFT, baseline),
+    )
+    values[:, morale] = _clamp(drifted)
+
+    changed = np.any(values != original, axis=1)
+    if changed.any():
+        _write_back(db, row_ids[changed], values[changed])
+
+    return BatchDecayResult(entity_ids=entities, values=values, changed=changed)
+
+
+def _write_back(db: Session, row_ids: np.ndarray, values: np.ndarray) -> None:
+    """Update needs rows in one executemany statement.
+
+    row_version is bumped as an ORM update would, and loaded
+    CharacterNeeds objects are expired so they reload the new values.
+    """
+    table = CharacterNeeds.__table__
+    statement = (
+        update(table)
+        .where(table.c.id == bindparam("row_id"))
+        .values(
+            row_version=table.c.row_version + 1,
+            **{name: bindparam(f"new_{name}") for name in NEED_COLUMNS},
+        )
+    )
+    params = []
+    for row_id, row in zip(row_ids, values, strict=True):
+        row_params = {f"new_{name}": int(value) for name, value in zip(NEED_COLUMNS, row, strict=True)}
+        params.append({"row_id": int(row_id), **row_params})
+    db.execute(statement, params)
+    for row_id in row_ids:
+        needs = db.identity_map.get(db.identity_key(CharacterNeeds, int(row_id)))
+        if needs is not None:
+            db.expire(needs)
@@ -1,27 +1,17 @@
 """PathfindingManager for A* pathfinding and route planning."""
 
 import heapq
-from dataclasses import dataclass, field
-from typing import Any
 
 from sqlalchemy.orm import Session
 
 from src.database.models.enums import TerrainType
-from src.database.models.navigation import TerrainZone, TransportMode, ZoneConnection
+from src.database.models.navigation import TerrainZone, TransportMode
 from src.database.models.session import GameSession
 from src.managers.base import BaseManager
+from src.managers.zone_graph import ZoneGraph, get_zone_graph
 from src.managers.zone_manager import ZoneManager
 
 
-@dataclass(order=True)
-class PriorityItem:
-    """Priority queue item for A* algorithm."""
-
-    priority: float
-    zone_id: int = field(compare=False)
-    zone: Any = field(compare=False)
-
-
 class PathfindingManager(BaseManager):
     """Manager for pathfinding operations using A* algorithm.
 
@@ -258,7 +248,7 @@ class PathfindingManager(BaseManager):
         avoid_terrain: list[TerrainType],
         prefer_roads: bool,
     ) -> tuple[list[TerrainZone] | None, int]:
-        """A* pathfinding algorithm.
+        """A* pathfinding algorithm over the in-memory zone graph.
 
         Args:
             start: Starting zone.
@@ -271,163 +261,76 @@ class PathfindingManager(BaseManager):
         Returns:
             Tuple of (path, total_cost) or (None, 0) if no path found.
         """
-        # Priority queue: (f_score, zone_id, zone)
-        open_set: list[PriorityItem] = []
-        heapq.heappush(open_set, PriorityItem(0, start.id, start))
+        graph = get_zone_graph(self.db, self.session_id)
+        start_index = graph.index_of(start.zone_key)
+        goal_index = graph.index_of(goal.zone_key)
+        if start_index is None or goal_index is None:
+            return None, 0
 
-        # Track where each zone was reached from
-        came_from: dict[int, tuple[TerrainZone, int]] = {}  # zone_id -> (from_zone, edge_cost)
+        def zone_cost(zone: TerrainZone) -> int | None:
+            return self._get_zone_cost(zone, transport_mode_key, transport_mode)
 
-        # Best known cost to reach each zone
-        g_score: dict[int, int] = {start.id: 0}
+        costs = graph.zone_costs(transport_mode_key, zone_cost)
+
+        # Road discounts make landmark bounds inadmissible
+        heuristic = None if prefer_roads else graph.landmark_heuristic(
+            transport_mode_key, zone_cost
+        )
+        avoided = set(avoid_terrain)
 
-        # Set of zones in open_set for quick lookup
-        open_set_ids: set[int] = {start.id}
+        # Heap of (f_score, tie-breaker, zone index); stale entries are skipped
+        counter = 0
+        open_set: list[tuple[float, int, int]] = [(0, counter, start_index)]
+
+        # zone index -> previous zone index
+        came_from: dict[int, int] = {}
+
+        # Best known cost to reach each zone
+        g_score: dict[int, int] = {start_index: 0}
 
         # Set of zones we've fully processed
         closed_set: set[int] = set()
 
         while open_set:
-            current_item = heapq.heappop(open_set)
-            current = current_item.zone
-            open_set_ids.discard(current.id)
+            _, _, current = heapq.heappop(open_set)
+            if current in closed_set:
+                continue
 
-            if current.id == goal.id:
-                # Reconstruct path
-                return self._reconstruct_path(came_from, current, g_score[current.id])
+            if current == goal_index:
+                return self._reconstruct_path(graph, came_from, current, g_score[current])
 
-            closed_set.add(current.id)
+            closed_set.add(current)
 
-            # Get neighbors
-            neighbors = self._get_neighbors(current, transport_mode_key, transport_mode)
-
-            for neighbor, edge_cost in neighbors:
-                if neighbor.id in closed_set:
+            for neighbor, crossing_minutes in graph.neighbors(current):
+                if neighbor in closed_set:
                     continue
 
-                # Check if terrain should be avoided
-                if neighbor.terrain_type in avoid_terrain:
+                # Check if terrain should be avoided or is impassable
+                if graph.terrain[neighbor] in avoided or costs[neighbor] is None:
                     continue
 
                 # Calculate tentative g_score
-                tentative_g = g_score[current.id] + edge_cost
+                tentative_g = g_score[current] + costs[neighbor] + crossing_minutes
 
                 # Apply road preference bonus
-                if prefer_roads and neighbor.terrain_type == TerrainType.ROAD:
+                if prefer_roads and graph.terrain[neighbor] == TerrainType.ROAD:
                     tentative_g = int(tentative_g * 0.7)  # 30% bonus for roads
 
-                if neighbor.id not in g_score or tentative_g < g_score[neighbor.id]:
+                if neighbor not in g_score or tentative_g < g_score[neighbor]:
                     # This is a better path
-                    came_from[neighbor.id] = (current, edge_cost)
-                    g_score[neighbor.id] = tentative_g
+                    came_from[neighbor] = current
+                    g_score[neighbor] = tentative_g
 
-                    # f_score = g_score + heuristic (we use 0 heuristic for simplicity)
                     f_score = tentative_g
+                    if heuristic is not None:
+                        f_score += heuristic(neighbor, goal_index)
 
-                    if neighbor.id not in open_set_ids:
-                        heapq.heappush(open_set, PriorityItem(f_score, neighbor.id, neighbor))
-                        open_set_ids.add(neighbor.id)
+                    counter += 1
+                    heapq.heappush(open_set, (f_score, counter, neighbor))
 
         # No path found
         return None, 0
 
-    def _get_neighbors(
-        self,
-        zone: TerrainZone,
-        transport_mode_key: str,
-        transport_mode: TransportMode | None,
-    ) -> list[tuple[TerrainZone, int]]:
-        """Get neighboring zones with travel costs.
-
-        Args:
-            zone: Current zone.
-            transport_mode_key: Transport mode key.
-            transport_mode: Transport mode object.
-
-        Returns:
-            List of (neighbor_zone, edge_cost) tuples.
-        """
-        neighbors = []
-
-        # Get outgoing connections
-        outgoing = (
-            self.db.query(ZoneConnection)
-            .filter(
-                ZoneConnection.session_id == self.session_id,
-                ZoneConnection.from_zone_id == zone.id,
-                ZoneConnection.is_passable == True,
-            )
-            .all()
-        )
-
-        for conn in outgoing:
-            neighbor = (
-                self.db.query(TerrainZone)
-                .filter(TerrainZone.id == conn.to_zone_id)
-                .first()
-            )
-            if neighbor:
-                cost = self._calculate_edge_cost(
-                    neighbor, conn, transport_mode_key, transport_mode
-                )
-                if cost is not None:
-                    neighbors.append((neighbor, cost))
-
-        # Get incoming bidirectional connections
-        incoming = (
-            self.db.query(ZoneConnection)
-            .filter(
-                ZoneConnection.session_id == self.session_id,
-                ZoneConnection.to_zone_id == zone.id,
-                ZoneConnection.is_passable == True,
-                ZoneConnection.is_bidirectional == True,
-            )
-            .all()
-        )
-
-        for conn in incoming:
-            neighbor = (
-                self.db.query(TerrainZone)
-                .filter(TerrainZone.id == conn.from_zone_id)
-                .first()
-            )
-            if neighbor:
-                cost = self._calculate_edge_cost(
-                    neighbor, conn, transport_mode_key, transport_mode
-                )
-                if cost is not None:
-                    neighbors.append((neighbor, cost))
-
-        return neighbors
-
-    def _calculate_edge_cost(
-        self,
-        to_zone: TerrainZone,
-        connection: ZoneConnection,
-        transport_mode_key: str,
-        transport_mode: TransportMode | None,
-    ) -> int | None:
-        """Calculate the cost to traverse to a zone.
-
-        Args:
-            to_zone: Destination zone.
-            connection: The connection being used.
-            transport_mode_key: Transport mode key.
-            transport_mode: Transport mode object.
-
-        Returns:
-            Cost in minutes, or None if impassable.
-        """
-        # Get zone traversal cost
-        zone_cost = self._get_zone_cost(to_zone, transport_mode_key, transport_mode)
-        if zone_cost is None:
-            return None
-
-        # Add connection crossing cost
-        total_cost = zone_cost + connection.crossing_minutes
-
-        return total_cost
-
     def _get_zone_cost(
         self,
         zone: TerrainZone,
@@ -467,25 +370,27 @@ class PathfindingManager(BaseManager):
 
     def _reconstruct_path(
         self,
-        came_from: dict[int, tuple[TerrainZone, int]],
-        current: TerrainZone,
+        graph: ZoneGraph,
+        came_from: dict[int, int],
+        current: int,
         total_cost: int,
     ) -> tuple[list[TerrainZone], int]:
         """Reconstruct the path from came_from data.
 
         Args:
-            came_from: Dict mapping zone_id to (previous_zone, edge_cost).
-            current: The goal zone.
+            graph: Zone graph the search ran on.
+            came_from: Dict mapping zone index to previous zone index.
+            current: Index of the goal zone.
             total_cost: Total path cost.
 
         Returns:
             Tuple of (path, total_cost).
         """
-        path = [current]
+        path = [graph.zones[current]]
 
-        while current.id in came_from:
-            current, _ = came_from[current.id]
-            path.append(current)
+        while current in came_from:
+            current = came_from[current]
+            path.append(graph.zones[current])
 
         path.reverse()
         return path, total_cost
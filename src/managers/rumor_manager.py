@@ -4,11 +4,14 @@ Manages the creation, spreading, and decay of rumors through the game world.
 Rumors propagate through social networks and can become distorted over time.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from sqlalchemy import select
+import numpy as np
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 
+from src.database.models.entities import Entity, NPCExtension
+from src.database.models.relationships import Relationship
 from src.database.models.rumors import Rumor, RumorKnowledge, RumorSentiment
 from src.database.models.session import GameSession
 from src.managers.base import BaseManager
@@ -43,6 +46,26 @@ class RumorSpreadResult:
     distortion_applied: bool = False
 
 
+@dataclass
+class RumorDiffusionResult:
+    """Result of advancing all active rumors by one time step."""
+
+    spread: list[RumorSpreadResult] = field(default_factory=list)
+    deactivated: list[Rumor] = field(default_factory=list)
+
+
+# Rumors below this intensity stop spreading
+MIN_ACTIVE_INTENSITY = 0.1
+
+# Truth lost each time a retelling is distorted
+DISTORTION_TRUTH_LOSS = 0.1
+
+# Daily chance of telling a contact, relative to spread_rate * intensity:
+# people with a relationship talk more than people who just share a place
+RELATIONSHIP_CONTACT_WEIGHT = 1.0
+CO_LOCATED_CONTACT_WEIGHT = 0.5
+
+
 class RumorManager(BaseManager):
     """Manages rumors in the game world.
 
@@ -261,17 +284,27 @@ class RumorManager(BaseManager):
         Returns:
             List of rumors that became inactive.
         """
-        deactivated = []
-        active_rumors = self.get_active_rumors()
+        deactivated = self._decay(self.get_active_rumors(), days)
+        self.db.commit()
+        return deactivated
 
-        for rumor in active_rumors:
+    def _decay(self, rumors: list[Rumor], days: float) -> list[Rumor]:
+        """Reduce intensity of rumors, deactivating weak ones (no commit).
+
+        Args:
+            rumors: Active rumors to decay.
+            days: Number of days to decay.
+
+        Returns:
+            List of rumors that became inactive.
+        """
+        deactivated = []
+        for rumor in rumors:
             rumor.intensity -= rumor.decay_rate * days
-            if rumor.intensity < 0.1:
+            if rumor.intensity < MIN_ACTIVE_INTENSITY:
                 rumor.intensity = max(0.0, rumor.intensity)
                 rumor.is_active = False
                 deactivated.append(rumor)
-
-        self.db.commit()
         return deactivated
 
     def spread_rumor_to_entity(
@@ -321,17 +354,15 @@ class RumorManager(BaseManager):
         if random.random() < distortion_chance:
             distortion_applied = True
             # Reduce truth value slightly when distortion occurs
-            rumor.truth_value = max(0.0, rumor.truth_value - 0.1)
+            rumor.truth_value = max(0.0, rumor.truth_value - DISTORTION_TRUTH_LOSS)
 
-        # Add knowledge to target
+        # Add knowledge to target (commits the distortion too)
         self.add_knowledge(
             rumor_key=rumor_key,
             entity_key=to_entity_key,
             learned_turn=current_turn,
         )
 
-        self.db.commit()
-
         return RumorSpreadResult(
             spread_successful=True,
             rumor_key=rumor_key,
@@ -340,6 +371,148 @@ class RumorManager(BaseManager):
             distortion_applied=distortion_applied,
         )
 
+    def diffuse_rumors(
+        self,
+        current_turn: int,
+        days: float = 1,
+        distortion_chance: float = 0.0,
+        rng: np.random.Generator | None = None,
+    ) -> RumorDiffusionResult:
+        """Advance every active rumor by one time step, then decay them.
+
+        Everyone who knows a rumor and will spread it may tell each of
+        their contacts: entities they have a relationship with, and NPCs
+        at the same current location. Each contact hears it with daily
+        chance spread_rate * intensity * contact weight, compounded over
+        the step. Rumors travel at most one hop per call, so call this
+        once per day (or per world tick).
+
+        Social and location data is loaded once for all rumors, new
+        RumorKnowledge rows are inserted in bulk, and everything is
+        committed in a single transaction.
+
+        Args:
+            current_turn: Current game turn (recorded as learned_turn).
+            days: Length of the time step in days.
+            distortion_chance: Chance each retelling is distorted (0.0-1.0).
+            rng: Random generator (default: a fresh unseeded one).
+
+        Returns:
+            RumorDiffusionResult with every successful spread and the
+            rumors that decayed into inactivity.
+        """
+        rng = rng or np.random.default_rng()
+        result = RumorDiffusionResult()
+        rumors = self.get_active_rumors()
+        if not rumors:
+            return result
+
+        # Entities and where the NPCs among them are
+        entity_rows = self.db.execute(
+            select(Entity.id, Entity.entity_key, NPCExtension.current_location)
+            .outerjoin(NPCExtension, NPCExtension.entity_id == Entity.id)
+            .where(Entity.session_id == self.session_id)
+            .order_by(Entity.id)
+        ).all()
+        entity_keys = [row.entity_key for row in entity_rows]
+        index_of_key = {key: index for index, key in enumerate(entity_keys)}
+        index_of_id = {row.id: index for index, row in enumerate(entity_rows)}
+
+        # Contact edges (speaker -> listener) shared by every rumor
+        sources: list[int] = []
+        targets: list[int] = []
+        weights: list[float] = []
+        relationships = self.db.execute(
+            select(Relationship.from_entity_id, Relationship.to_entity_id).where(
+                Relationship.session_id == self.session_id,
+                Relationship.knows == True,  # noqa: E712
+            )
+        ).all()
+        for from_id, to_id in relationships:
+            if from_id in index_of_id and to_id in index_of_id:
+                sources.append(index_of_id[from_id])
+                targets.append(index_of_id[to_id])
+                weights.append(RELATIONSHIP_CONTACT_WEIGHT)
+        by_location: dict[str, list[int]] = {}
+        for index, row in enumerate(entity_rows):
+            if row.current_location:
+                by_location.setdefault(row.current_location, []).append(index)
+        for present in by_location.values():
+            for speaker in present:
+                for listener in present:
+                    if speaker != listener:
+                        sources.append(speaker)
+                        targets.append(listener)
+                        weights.append(CO_LOCATED_CONTACT_WEIGHT)
+        if not sources:
+            result.deactivated = self._decay(rumors, days)
+            self.db.commit()
+            return result
+        source_array = np.array(sources)
+        target_array = np.array(targets)
+        weight_array = np.array(weights)
+
+        # Who already knows (and will retell) each rumor
+        rumor_row = {rumor.id: row for row, rumor in enumerate(rumors)}
+        knows = np.zeros((len(rumors), len(entity_keys)), dtype=bool)
+        tells = np.zeros_like(knows)
+        knowledge = self.db.execute(
+            select(
+                RumorKnowledge.rumor_id, RumorKnowledge.entity_key, RumorKnowledge.will_spread
+            ).where(
+                RumorKnowledge.session_id == self.session_id,
+                RumorKnowledge.rumor_id.in_(list(rumor_row)),
+            )
+        ).all()
+        for rumor_id, entity_key, will_spread in knowledge:
+            if entity_key in index_of_key:
+                knows[rumor_row[rumor_id], index_of_key[entity_key]] = True
+                tells[rumor_row[rumor_id], index_of_key[entity_key]] = will_spread
+
+        new_knowledge = []
+        for row, rumor in enumerate(rumors):
+            open_edges = tells[row, source_array] & ~knows[row, target_array]
+            if not open_edges.any():
+                continue
+            daily_chance = np.clip(rumor.spread_rate * rumor.intensity * weight_array, 0.0, 1.0)
+            step_chance = 1.0 - (1.0 - daily_chance) ** days
+            told = open_edges & (rng.random(len(source_array)) < step_chance)
+            # A listener told by several contacts learns it once, from the first
+            listeners, first = np.unique(target_array[told], return_index=True)
+            speakers = source_array[told][first]
+            distorted = rng.random(len(listeners)) < distortion_chance
+            rumor.truth_value = max(
+                0.0, rumor.truth_value - DISTORTION_TRUTH_LOSS * int(distorted.sum())
+            )
+            for speaker, listener, was_distorted in zip(
+                speakers, listeners, distorted, strict=True
+            ):
+                new_knowledge.append(
+                    {
+                        "session_id": self.session_id,
+                        "rumor_id": rumor.id,
+                        "entity_key": entity_keys[listener],
+                        "learned_turn": current_turn,
+                        "believed": True,
+                        "will_spread": True,
+                    }
+                )
+                result.spread.append(
+                    RumorSpreadResult(
+                        spread_successful=True,
+                        rumor_key=rumor.rumor_key,
+                        from_entity_key=entity_keys[speaker],
+                        to_entity_key=entity_keys[listener],
+                        distortion_applied=bool(was_distorted),
+                    )
+                )
+
+        if new_knowledge:
+            self.db.execute(insert(RumorKnowledge), new_knowledge)
+        result.deactivated = self._decay(rumors, days)
+        self.db.commit()
+        return result
+
     def get_rumor_info(self, rumor_key: str) -> RumorInfo | None:
         """Get detailed information about a rumor.
 
@@ -0,0 +1,237 @@
+"""Dependency-tracked cache for compiled scene sections.
+
+ContextCompiler.compile_scene() assembles ~17 sections, each with its
+own queries, and most of them are unchanged from one turn to the next.
+SceneSectionCache keeps the last value of each section together with
+what it was built from:
+
+- its scope: the arguments it was built for (player id, location key,
+  turn number, game day or clock), and
+- the write counters of the tables it reads (SECTION_MODELS).
+
+A section is rebuilt only when its scope differs or one of its tables
+was written since. Table counters are bumped by a session after_flush
+listener, by bulk UPDATE/DELETE statements run through the session, and
+for unflushed changes when check_pending_writes() is called; a rollback
+drops every section. Writes made through other sessions are not seen.
+
+get_scene_section_cache() keeps one cache per game session in
+Session.info, so compilers created per call share it and the listeners
+are registered once per database session.
+"""
+
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from typing import Any
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from src.database.models.character_state import CharacterNeeds, NeedsCommunicationLog
+from src.database.models.context_summary import NarrativeMentionLog
+from src.database.models.entities import Entity, EntityAttribute, EntitySkill, NPCExtension
+from src.database.models.goals import NPCGoal
+from src.database.models.injuries import BodyInjury
+from src.database.models.items import Item, StorageLocation
+from src.database.models.navigation import (
+    LocationDiscovery,
+    LocationZonePlacement,
+    MapItem,
+    TerrainZone,
+    ZoneConnection,
+    ZoneDiscovery,
+)
+from src.database.models.relationships import Relationship
+from src.database.models.session import Turn
+from src.database.models.tasks import Appointment, Quest, QuestStage, Task
+from src.database.models.world import Fact, Location, TimeState, WorldEvent
+
+# Key in Session.info holding game session ID -> SceneSectionCache
+_CACHES_KEY = "scene_section_caches"
+
+# Models each section reads, keyed by SceneContext field. Game time is
+# part of a section's scope instead (day or clock), so sections that
+# only need the day are not rebuilt whenever the clock moves. The story
+# and recent summaries are written by SummaryWorker through its own
+# session, which the cache cannot watch, so they are always read.
+SECTION_MODELS: dict[str, tuple[type, ...]] = {
+    "turn_context": (Turn,),
+    "time_context": (TimeState,),
+    "location_context": (Location,),
+    "player_context": (
+        Entity,
+        EntityAttribute,
+        EntitySkill,
+        Item,
+        CharacterNeeds,
+        BodyInjury,
+    ),
+    "npcs_context": (
+        Entity,
+        NPCExtension,
+        NPCGoal,
+        CharacterNeeds,
+        BodyInjury,
+        Relationship,
+    ),
+    "tasks_context": (Task, Appointment, Quest, QuestStage),
+    "recent_events_context": (WorldEvent,),
+    "secrets_context": (Fact,),
+    "navigation_context": (
+        TerrainZone,
+        ZoneConnection,
+        ZoneDiscovery,
+        Location,
+        LocationDiscovery,
+        LocationZonePlacement,
+        Entity,
+        Item,
+        MapItem,
+    ),
+    "entity_registry_context": (Entity, NPCGoal, Item, Location, StorageLocation),
+    "world_facts_context": (Fact,),
+    "location_inventory_context": (Location, StorageLocation, Item),
+    "needs_alerts_context": (CharacterNeeds, NeedsCommunicationLog, Entity),
+    "turns_since_night": (Turn,),
+    "stable_conditions": (NarrativeMentionLog,),
+}
+
+
+class SceneSectionCache:
+    """Last value of each scene section, reused until its inputs change.
+
+    Usage:
+        cache = SceneSectionCache(db)
+        cache.check_pending_writes()
+        text = cache.get_section("location_context", location_key, build)
+        cache.get_stats()["sections"]["location_context"]  # {"hits": ..., "misses": ...}
+    """
+
+    def __init__(
+        self,
+        db: Session | None = None,
+        section_models: Mapping[str, Iterable[type]] = SECTION_MODELS,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            db: Database session to watch for writes
+            section_models: Section name -> models it reads
+        """
+        self._db = db if isinstance(db, Session) else None
+        self._tables: dict[str, tuple[str, ...]] = {
+            name: tuple(sorted({table.name for model in models for table in inspect(model).tables}))
+            for name, models in section_models.items()
+        }
+        self._writes: dict[str, int] = {}  # Table name -> writes seen
+        self._entries: dict[str, tuple[Hashable, Any]] = {}  # Section -> (key, value)
+        self._model_tables: dict[type, tuple[str, ...]] = {}
+        self.hits: dict[str, int] = dict.fromkeys(self._tables, 0)
+        self.misses: dict[str, int] = dict.fromkeys(self._tables, 0)
+
+        if self._db is not None:
+            event.listen(self._db, "after_flush", self._on_flush)
+            event.listen(self._db, "after_rollback", self._on_rollback)
+            event.listen(self._db, "do_orm_execute", self._on_execute)
+
+    def get_section(self, name: str, scope: Hashable, build: Callable[[], Any]) -> Any:
+        """Get a section, rebuilding it if its scope or tables changed.
+
+        Args:
+            name: Section name (a key of SECTION_MODELS)
+            scope: What the section is built for
+            build: Builds the section
+
+        Returns:
+            The section value
+        """
+        key = (scope, tuple(self._writes.get(table, 0) for table in self._tables[name]))
+        entry = self._entries.get(name)
+        if entry is not None and entry[0] == key:
+            self.hits[name] += 1
+            return entry[1]
+
+        # Writes made by build itself change the key, so the next call rebuilds
+        self.misses[name] += 1
+        value = build()
+        self._entries[name] = (key, value)
+        return value
+
+    def check_pending_writes(self) -> None:
+        """Treat objects added, changed or deleted but not yet flushed as writes.
+
+        Uncached queries would see them (autoflush) and cached sections
+        would not, so sections reading their tables are rebuilt.
+        """
+        if self._db is not None:
+            self._record_writes((*self._db.new, *self._db.dirty, *self._db.deleted))
+
+    def invalidate(self, sections: Iterable[str] | None = None) -> None:
+        """Drop cached sections so they are rebuilt on next use.
+
+        Args:
+            sections: Section names to drop (all if None)
+        """
+        if sections is None:
+            self._entries.clear()
+            return
+        for name in sections:
+            self._entries.pop(name, None)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hit/miss counts, overall and per section."""
+        return {
+            "hits": sum(self.hits.values()),
+            "misses": sum(self.misses.values()),
+            "sections": {
+                name: {"hits": self.hits[name], "misses": self.misses[name]}
+                for name in self._tables
+            },
+        }
+
+    def _record_writes(self, objects: Iterable[object]) -> None:
+        """Bump the write counters of the tables behind some ORM objects."""
+        for obj in objects:
+            model = type(obj)
+            tables = self._model_tables.get(model)
+            if tables is None:
+                tables = tuple(table.name for table in inspect(model).tables)
+                self._model_tables[model] = tables
+            for table in tables:
+                self._writes[table] = self._writes.get(table, 0) + 1
+
+    def _on_flush(self, session: Session, flush_context: object) -> None:
+        """Count flushed rows as writes to their tables."""
+        self._record_writes((*session.new, *session.dirty, *session.deleted))
+
+    def _on_execute(self, state: ORMExecuteState) -> None:
+        """Count bulk UPDATE/DELETE statements as writes to their table."""
+        if state.is_update or state.is_delete:
+            table = getattr(state.statement, "table", None)
+            name = getattr(table, "name", None)
+            if name is not None:
+                self._writes[name] = self._writes.get(name, 0) + 1
+
+    def _on_rollback(self, session: Session) -> None:
+        """Forget everything; cached sections may include rolled-back rows."""
+        self.invalidate()
+
+
+def get_scene_section_cache(db: Session, session_id: int) -> SceneSectionCache:
+    """Get the shared section cache for a game session, creating it if needed.
+
+    Args:
+        db: Database session
+        session_id: Game session ID
+
+    Returns:
+        The game session's section cache (an unshared one if db is not a Session)
+    """
+    if not isinstance(db, Session):
+        return SceneSectionCache()
+
+    caches: dict[int, SceneSectionCache] = db.info.setdefault(_CACHES_KEY, {})
+    cache = caches.get(session_id)
+    if cache is None:
+        cache = SceneSectionCache(db)
+        caches[session_id] = cache
+    return cache
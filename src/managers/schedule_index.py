@@ -0,0 +1,338 @@
+"""In-memory index of NPC schedules by minute of the week.
+
+Presence queries used to load every Schedule row for a location and
+parse its HH:MM strings per call. The index loads a game session's
+schedules once, expands each day pattern to concrete days and stores the
+resulting intervals in hourly buckets over the week, so "who is where at
+time T" is answered for one or all locations in a single pass over one
+bucket.
+
+Time ranges keep ScheduleManager.is_time_in_range semantics: the end is
+exclusive, and a range crossing midnight (22:00-06:00) covers both ends
+of each matching day. When an NPC has several matching entries, the
+highest priority wins (lowest ID on ties), as in get_schedule_entry.
+
+Indexes live in the SQLAlchemy session's info dict, so every manager
+sharing a session shares one index. Any flush that writes a schedule,
+deletes an entity or changes an entity key drops it; ScheduleManager
+also drops it on its own writes (including bulk clear_schedule). It is
+rebuilt on next use.
+"""
+
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from src.database.models.entities import Entity
+from src.database.models.enums import DayOfWeek
+from src.database.models.world import Schedule
+
+logger = logging.getLogger(__name__)
+
+_INDEXES_KEY = "schedule_indexes"
+_LISTENING_KEY = "schedule_index_listening"
+
+MINUTES_PER_DAY = 24 * 60
+BUCKET_MINUTES = 60
+
+# Monday = 0, matching minute-of-week offsets
+WEEK_DAYS = (
+    DayOfWeek.MONDAY,
+    DayOfWeek.TUESDAY,
+    DayOfWeek.WEDNESDAY,
+    DayOfWeek.THURSDAY,
+    DayOfWeek.FRIDAY,
+    DayOfWeek.SATURDAY,
+    DayOfWeek.SUNDAY,
+)
+_DAY_INDEX = {day: index for index, day in enumerate(WEEK_DAYS)}
+
+# Day pattern -> day indexes it covers
+_PATTERN_DAYS: dict[DayOfWeek, tuple[int, ...]] = {
+    **{day: (index,) for day, index in _DAY_INDEX.items()},
+    DayOfWeek.WEEKDAY: (0, 1, 2, 3, 4),
+    DayOfWeek.WEEKEND: (5, 6),
+    DayOfWeek.DAILY: tuple(range(7)),
+}
+
+
+def parse_minutes(time: str) -> int:
+    """Convert HH:MM to minutes after midnight.
+
+    Args:
+        time: Time in HH:MM format.
+
+    Returns:
+        Minutes after midnight.
+
+    Raises:
+        ValueError: If the time is not HH:MM.
+    """
+    hours, minutes = map(int, time.split(":"))
+    return hours * 60 + minutes
+
+
+def minute_of_week(day: DayOfWeek, time: str) -> int:
+    """Minutes since Monday 00:00 for a day and HH:MM time.
+
+    Args:
+        day: Concrete day of the week.
+        time: Time in HH:MM format.
+
+    Returns:
+        Minute of the week (0-10079).
+    """
+    return _DAY_INDEX[day] * MINUTES_PER_DAY + parse_minutes(time) % MINUTES_PER_DAY
+
+
+@dataclass(frozen=True)
+class ScheduledPresence:
+    """Where a schedule entry puts an NPC.
+
+    Attributes:
+        schedule_id: Schedule row ID.
+        entity_id: Scheduled entity ID.
+        entity_key: Scheduled entity key.
+        activity: What the NPC is doing.
+        location_key: Where the NPC is (None if unspecified).
+        priority: Higher priority wins on overlap.
+    """
+
+    schedule_id: int
+    entity_id: int
+    entity_key: str
+    activity: str
+    location_key: str | None
+    priority: int
+
+
+class ScheduleIndex:
+    """Minute-of-week index of a game session's schedules.
+
+    Usage:
+        index = get_schedule_index(db, session_id)
+        for location_key, npcs in index.presence_at(DayOfWeek.MONDAY, "09:30").items():
+            ...
+    """
+
+    def __init__(self, entries: list[ScheduledPresence], ranges: list[tuple[str, str, DayOfWeek]]):
+        """Build the index.
+
+        Args:
+            entries: Schedule entries, in schedule ID order.
+            ranges: (start, end, day pattern) for each entry.
+        """
+        self.entries = entries
+        bucket_count = len(WEEK_DAYS) * MINUTES_PER_DAY // BUCKET_MINUTES
+        self._buckets: list[list[tuple[int, int, ScheduledPresence]]] = [
+            [] for _ in range(bucket_count)
+        ]
+        for entry, (start, end, pattern) in zip(entries, ranges, strict=True):
+            try:
+                start_minutes, end_minutes = parse_minutes(start), parse_minutes(end)
+            except ValueError:
+                logger.warning(f"Skipping schedule {entry.schedule_id} with bad time range")
+                continue
+            if start_minutes <= end_minutes:
+                spans = [(start_minutes, end_minutes)]
+            else:
+                spans = [(start_minutes, MINUTES_PER_DAY), (0, end_minutes)]
+            for day_index in _PATTERN_DAYS.get(pattern, ()):
+                offset = day_index * MINUTES_PER_DAY
+                for low, high in spans:
+                    if low < high:
+                        self._add(offset + low, offset + high, entry)
+
+    def _add(self, low: int, high: int, entry: ScheduledPresence) -> None:
+        """Add [low, high) minute-of-week interval to every bucket it touches."""
+        for bucket in range(low // BUCKET_MINUTES, (high - 1) // BUCKET_MINUTES + 1):
+            self._buckets[bucket].append((low, high, entry))
+
+    @classmethod
+    def load(cls, db: Session, session_id: int) -> "ScheduleIndex":
+        """Load a session's schedules into a new index.
+
+        Args:
+            db: Database session
+            session_id: Game session ID
+
+        Returns:
+            The index
+        """
+        rows = (
+            db.query(Schedule, Entity.entity_key)
+            .join(Entity, Schedule.entity_id == Entity.id)
+            .filter(Entity.session_id == session_id)
+            .order_by(Schedule.id)
+            .all()
+        )
+        entries = [
+            ScheduledPresence(
+                schedule_id=schedule.id,
+                entity_id=schedule.entity_id,
+                entity_key=entity_key,
+                activity=schedule.activity,
+                location_key=schedule.location_key,
+                priority=schedule.priority,
+            )
+            for schedule, entity_key in rows
+        ]
+        ranges = [(s.start_time, s.end_time, s.day_pattern) for s, _ in rows]
+        return cls(entries, ranges)
+
+    def matching(self, day: DayOfWeek, time: str) -> list[ScheduledPresence]:
+        """All entries covering a time, in schedule ID order.
+
+        Args:
+            day: Concrete day of the week.
+            time: Time in HH:MM format.
+
+        Returns:
+            Matching entries (an NPC may have several).
+        """
+        minute = minute_of_week(day, time)
+        # Buckets are filled in ID order and an entry's intervals never overlap
+        return [
+            entry
+            for low, high, entry in self._buckets[minute // BUCKET_MINUTES]
+            if low <= minute < high
+        ]
+
+    def resolve(self, day: DayOfWeek, time: str) -> dict[int, ScheduledPresence]:
+        """The winning entry for every scheduled NPC at a time.
+
+        Args:
+            day: Concrete day of the week.
+            time: Time in HH:MM format.
+
+        Returns:
+            Entity ID -> highest-priority matching entry.
+        """
+        winners: dict[int, ScheduledPresence] = {}
+        for entry in self.matching(day, time):
+            current = winners.get(entry.entity_id)
+            if current is None or entry.priority > current.priority:
+                winners[entry.entity_id] = entry
+        return winners
+
+    def entry_for(self, entity_id: int, day: DayOfWeek, time: str) -> ScheduledPresence | None:
+        """The winning entry for one NPC at a time, if any.
+
+        Args:
+            entity_id: Entity ID.
+            day: Concrete day of the week.
+            time: Time in HH:MM format.
+
+        Returns:
+            Highest-priority matching entry, or None.
+        """
+        winner = None
+        for entry in self.matching(day, time):
+            if entry.entity_id != entity_id:
+                continue
+            if winner is None or entry.priority > winner.priority:
+                winner = entry
+        return winner
+
+    def presence_at(self, day: DayOfWeek, time: str) -> dict[str, list[ScheduledPresence]]:
+        """Who is where at a time, for every location.
+
+        Args:
+            day: Concrete day of the week.
+            time: Time in HH:MM format.
+
+        Returns:
+            Location key -> winning entries placing NPCs there (entries
+            without a location are left out).
+        """
+        presence: dict[str, list[ScheduledPresence]] = {}
+        for entry in self.resolve(day, time).values():
+            if entry.location_key is not None:
+                presence.setdefault(entry.location_key, []).append(entry)
+        return presence
+
+    def at_location(self, location_key: str, day: DayOfWeek, time: str) -> list[ScheduledPresence]:
+        """Winning entries placing NPCs at one location at a time.
+
+        Args:
+            location_key: Location key.
+            day: Concrete day of the week.
+            time: Time in HH:MM format.
+
+        Returns:
+            Entries in schedule ID order.
+        """
+        return self.presence_at(day, time).get(location_key, [])
+
+
+def get_schedule_index(db: Session, session_id: int) -> ScheduleIndex:
+    """Get the cached schedule index for a game session, building it if needed.
+
+    Pending changes are flushed first (as a query would autoflush them),
+    so edits made through the ORM are never missed.
+
+    Args:
+        db: Database session
+        session_id: Game session ID
+
+    Returns:
+        The session's schedule index
+    """
+    if not isinstance(db, Session):
+        return ScheduleIndex.load(db, session_id)
+
+    if db.autoflush:
+        db.flush()  # No-op when nothing is pending
+
+    if not db.info.get(_LISTENING_KEY):
+        event.listen(db, "after_flush", _on_flush)
+        event.listen(db, "after_rollback", _on_rollback)
+        db.info[_LISTENING_KEY] = True
+
+    indexes: dict[int, ScheduleIndex] = db.info.setdefault(_INDEXES_KEY, {})
+    index = indexes.get(session_id)
+    if index is None:
+        index = ScheduleIndex.load(db, session_id)
+        indexes[session_id] = index
+    return index
+
+
+def invalidate_schedule_index(db: Session, session_id: int | None = None) -> None:
+    """Drop cached schedule indexes so they are rebuilt on next use.
+
+    Args:
+        db: Database session
+        session_id: Game session to drop (all if None)
+    """
+    if not isinstance(db, Session):
+        return
+    indexes: dict[int, ScheduleIndex] = db.info.get(_INDEXES_KEY, {})
+    if session_id is None:
+        indexes.clear()
+    else:
+        indexes.pop(session_id, None)
+
+
+def _on_flush(session: Session, flush_context: object) -> None:
+    """Drop indexes whose schedules or scheduled entities changed."""
+    indexes: dict[int, ScheduleIndex] = session.info.get(_INDEXES_KEY, {})
+    if not indexes:
+        return
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Schedule):
+            # Schedules have no session column; rebuilding is cheap
+            indexes.clear()
+            return
+    for obj in session.deleted:
+        if isinstance(obj, Entity):
+            indexes.pop(obj.session_id, None)
+    for obj in session.dirty:
+        if isinstance(obj, Entity) and inspect(obj).attrs.entity_key.history.has_changes():
+            indexes.pop(obj.session_id, None)
+
+
+def _on_rollback(session: Session) -> None:
+    """Drop all indexes; they may contain rolled-back rows."""
+    session.info.get(_INDEXES_KEY, {}).clear()
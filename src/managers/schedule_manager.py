@@ -10,6 +10,11 @@ from src.database.models.enums import DayOfWeek
 from src.database.models.session import GameSession
 from src.database.models.world import Schedule
 from src.managers.base import BaseManager
+from src.managers.schedule_index import (
+    ScheduleIndex,
+    get_schedule_index,
+    invalidate_schedule_index,
+)
 
 if TYPE_CHECKING:
     from src.managers.time_manager import TimeManager
@@ -39,6 +44,9 @@ class ScheduleManager(BaseManager):
     - Activity lookup by time
     - Location-based NPC queries
     - Time range and day pattern matching
+
+    Time lookups go through the session's ScheduleIndex, which the
+    write methods here invalidate.
     """
 
     def __init__(
@@ -57,6 +65,11 @@ class ScheduleManager(BaseManager):
         super().__init__(db, game_session)
         self.time_manager = time_manager
 
+    @property
+    def index(self) -> ScheduleIndex:
+        """The session's schedule index (rebuilt after schedule writes)."""
+        return get_schedule_index(self.db, self.session_id)
+
     def get_schedule(self, entity_id: int) -> list[Schedule]:
         """Get all schedule entries for entity.
 
@@ -85,16 +98,10 @@ class ScheduleManager(BaseManager):
         Returns:
             Matching Schedule or None.
         """
-        schedules = self.get_schedule(entity_id)
-        matching = [
-            s for s in schedules
-            if self.day_matches(day, s.day_pattern)
-            and self.is_time_in_range(time, s.start_time, s.end_time)
-        ]
-        if not matching:
+        entry = self.index.entry_for(entity_id, day, time)
+        if entry is None:
             return None
-        # Return highest priority
-        return max(matching, key=lambda s: s.priority)
+        return self.db.get(Schedule, entry.schedule_id)
 
     def set_schedule_entry(
         self,
@@ -131,6 +138,7 @@ class ScheduleManager(BaseManager):
         )
         self.db.add(schedule)
         self.db.flush()
+        invalidate_schedule_index(self.db, self.session_id)
         return schedule
 
     def delete_schedule_entry(self, schedule_id: int) -> bool:
@@ -152,6 +160,7 @@ class ScheduleManager(BaseManager):
 
         self.db.delete(schedule)
         self.db.flush()
+        invalidate_schedule_index(self.db, self.session_id)
         return True
 
     def get_activity_at_time(
@@ -167,7 +176,7 @@ class ScheduleManager(BaseManager):
         Returns:
             Tuple of (activity, location_key) or None if no schedule.
         """
-        entry = self.get_schedule_entry(entity_id, day, time)
+        entry = self.index.entry_for(entity_id, day, time)
         if entry is None:
             return None
         return (entry.activity, entry.location_key)
@@ -198,6 +207,9 @@ class ScheduleManager(BaseManager):
     ) -> list[int]:
         """Get entity IDs of NPCs scheduled at location/time.
 
+        An NPC whose higher-priority entry puts them elsewhere at that
+        time is not included.
+
         Args:
             location_key: Location key.
             day: Day of week.
@@ -206,23 +218,22 @@ class ScheduleManager(BaseManager):
         Returns:
             List of entity IDs.
         """
-        # Get all schedules at this location
-        schedules = (
-            self.db.query(Schedule)
-            .filter(Schedule.location_key == location_key)
-            .all()
-        )
+        return [entry.entity_id for entry in self.index.at_location(location_key, day, time)]
 
-        entity_ids = []
-        for schedule in schedules:
-            if (
-                self.day_matches(day, schedule.day_pattern)
-                and self.is_time_in_range(time, schedule.start_time, schedule.end_time)
-            ):
-                if schedule.entity_id not in entity_ids:
-                    entity_ids.append(schedule.entity_id)
+    def get_npc_locations_at_time(self, day: DayOfWeek, time: str) -> dict[str, list[int]]:
+        """Get scheduled NPCs for every location at once.
 
-        return entity_ids
+        Args:
+            day: Day of week.
+            time: Time in HH:MM format.
+
+        Returns:
+            Location key -> entity IDs scheduled there.
+        """
+        return {
+            location_key: [entry.entity_id for entry in entries]
+            for location_key, entries in self.index.presence_at(day, time).items()
+        }
 
     def get_npcs_at_location_now(self, location_key: str) -> list[int]:
         """Get NPCs at location using current time.
@@ -297,6 +308,8 @@ class ScheduleManager(BaseManager):
             Schedule.entity_id == entity_id
         ).delete()
         self.db.flush()
+        # Bulk deletes bypass the flush hook
+        invalidate_schedule_index(self.db, self.session_id)
 
     def copy_schedule(
         self, from_entity_id: int, to_entity_id: int
@@ -327,4 +340,5 @@ class ScheduleManager(BaseManager):
             new_schedules.append(new_schedule)
 
         self.db.flush()
+        invalidate_schedule_index(self.db, self.session_id)
         return new_schedules
@@ -1,9 +1,22 @@
-"""Snapshot manager for capturing and restoring complete session state."""
-
-from datetime import datetime
+"""Snapshot manager for capturing and restoring complete session state.
+
+Snapshots form keyframe + delta chains. A keyframe stores every
+session-scoped row; a delta stores only the rows inserted, changed or
+deleted since its base snapshot. Both are JSON compressed with zlib.
+Restoring reconstructs the target state from its chain, diffs it against
+the live tables and applies only the difference with bulk statements.
+"""
+
+import json
+import logging
+import zlib
+from datetime import date, datetime
 from typing import Any
 
-from sqlalchemy import inspect
+from sqlalchemy import Date, DateTime
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy import bindparam, delete, event, insert, inspect, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from src.database.models import (
@@ -94,11 +107,15 @@ from src.database.models import (
     Milestone,
     ContextSummary,
     NarrativeMentionLog,
+    SummaryJob,
+    TurnChunkSummary,
     # Snapshots
     SessionSnapshot,
 )
 from src.managers.base import BaseManager
 
+logger = logging.getLogger(__name__)
+
 
 # Models that have session_id and need to be captured in snapshots
 # Ordered for safe deletion (children before parents to respect FKs)
@@ -180,18 +197,36 @@ SESSION_SCOPED_MODELS = [
 # Map table names to model classes for restoration
 TABLE_TO_MODEL = {model.__tablename__: model for model in SESSION_SCOPED_MODELS}
 
+# Session state: table name -> row id -> serialized row
+SnapshotState = dict[str, dict[int, dict[str, Any]]]
+
+# Key in Session.info holding (snapshot id, state) of the last snapshot seen
+_STATE_CACHE_KEY = "snapshot_state"
+_LISTENING_KEY = "snapshot_state_listening"
+
+
+def _without_version(row: dict[str, Any]) -> dict[str, Any]:
+    """Get a serialized row without its version counter, for comparing content."""
+    return {key: value for key, value in row.items() if key != "row_version"}
+
 
 class SnapshotManager(BaseManager):
     """Manager for capturing and restoring complete session state.
 
     Provides functionality to:
-    - Capture complete session state at the start of each turn
-    - Restore session to a previous snapshot
+    - Capture session state at the start of each turn as a keyframe or delta
+    - Restore session to a previous snapshot, touching only changed rows
     - Prune old snapshots based on retention policy
     """
 
+    # Deltas allowed after a keyframe before the next keyframe is written
+    keyframe_interval = 20
+
     def capture_snapshot(self, turn_number: int) -> SessionSnapshot | None:
-        """Capture complete session state at the start of a turn.
+        """Capture session state at the start of a turn.
+
+        Writes a delta against the latest earlier snapshot, or a keyframe
+        when there is none or its chain has reached keyframe_interval.
 
         Args:
             turn_number: The turn number this snapshot is for.
@@ -200,7 +235,7 @@ class SnapshotManager(BaseManager):
             The created SessionSnapshot record, or None if snapshot already exists.
         """
         # Check if snapshot already exists for this turn
-        existing = self.db.query(SessionSnapshot).filter(
+        existing = self.db.query(SessionSnapshot.id).filter(
             SessionSnapshot.session_id == self.session_id,
             SessionSnapshot.turn_number == turn_number,
         ).first()
@@ -209,50 +244,43 @@ class SnapshotManager(BaseManager):
             # Snapshot already exists, skip creation
             return None
 
-        data = {}
+        state = self._read_state()
+        chains = self._get_chain_index()
+        earlier = [turn for turn in chains if turn < turn_number]
+        base_turn = max(earlier) if earlier else None
 
-        for model in SESSION_SCOPED_MODELS:
-            table_name = model.__tablename__
-
-            # Check if model has session_id column
-            if not hasattr(model, "session_id"):
-                # Some models might be linked via entity_id instead
-                if hasattr(model, "entity_id"):
-                    # Get entities for this session first
-                    entity_ids = [
-                        e.id for e in self.db.query(Entity.id).filter(
-                            Entity.session_id == self.session_id
-                        ).all()
-                    ]
-                    if entity_ids:
-                        records = self.db.query(model).filter(
-                            model.entity_id.in_(entity_ids)
-                        ).all()
-                    else:
-                        records = []
-                else:
-                    continue
-            else:
-                records = self.db.query(model).filter(
-                    model.session_id == self.session_id
-                ).all()
-
-            data[table_name] = [self._model_to_dict(record) for record in records]
+        if base_turn is None or len(self._chain_for(base_turn, chains)) > self.keyframe_interval:
+            payload: dict[str, Any] = {
+                table: list(rows.values()) for table, rows in state.items()
+            }
+            base_turn = None
+        else:
+            payload = self._diff_states(self._reconstruct_state(base_turn, chains), state)
 
         snapshot = SessionSnapshot(
             session_id=self.session_id,
             turn_number=turn_number,
-            snapshot_data=data,
+            base_turn_number=base_turn,
+            compressed_data=self._compress(payload),
         )
         self.db.add(snapshot)
         self.db.flush()
 
+        self._cache_state(snapshot.id, state)
+        kind = "keyframe" if base_turn is None else f"delta on turn {base_turn}"
+        logger.debug(
+            f"Captured snapshot for turn {turn_number} ({kind}, "
+            f"{len(snapshot.compressed_data)} bytes)"
+        )
         return snapshot
 
     def restore_snapshot(self, turn_number: int) -> None:
         """Restore session to a previous snapshot.
 
-        This deletes all current session data and replaces it with the snapshot.
+        Only rows that differ from the snapshot are inserted, updated or
+        deleted. If the incremental restore hits a constraint violation
+        (e.g. a natural key reused by a row created later), the session is
+        rewritten in full instead.
 
         Args:
             turn_number: The turn number to restore to.
@@ -260,62 +288,49 @@ class SnapshotManager(BaseManager):
         Raises:
             ValueError: If no snapshot exists for the given turn.
         """
-        snapshot = self.db.query(SessionSnapshot).filter(
-            SessionSnapshot.session_id == self.session_id,
-            SessionSnapshot.turn_number == turn_number,
-        ).first()
+        snapshot = self.get_snapshot(turn_number)
 
         if not snapshot:
             raise ValueError(f"No snapshot found for turn {turn_number}")
 
-        # 1. Delete ALL current session data (FK-safe order - children first)
-        for model in SESSION_SCOPED_MODELS:
-            if hasattr(model, "session_id"):
-                self.db.query(model).filter(
-                    model.session_id == self.session_id
-                ).delete(synchronize_session="fetch")
-            elif hasattr(model, "entity_id"):
-                # Get entities for this session
-                entity_ids = [
-                    e.id for e in self.db.query(Entity.id).filter(
-                        Entity.session_id == self.session_id
-                    ).all()
-                ]
-                if entity_ids:
-                    self.db.query(model).filter(
-                        model.entity_id.in_(entity_ids)
-                    ).delete(synchronize_session="fetch")
-
-        self.db.flush()
-
-        # 2. Insert snapshot data (reverse order - parents first)
-        # Flush after each model type to enforce insertion order and avoid FK violations
-        for model in reversed(SESSION_SCOPED_MODELS):
-            table_name = model.__tablename__
-            records_data = snapshot.snapshot_data.get(table_name, [])
-
-            if records_data:
-                for record_data in records_data:
-                    record = self._dict_to_model(model, record_data)
-                    self.db.add(record)
-                self.db.flush()  # Flush each model type before moving to dependents
-
-        # 3. Delete turns after target
+        # 1. Bring session tables back to the snapshot state
+        target = self._reconstruct_state(turn_number, self._get_chain_index())
+        current = self._read_state()
+        try:
+            with self.db.begin_nested():
+                self._apply_diff(current, target)
+        except IntegrityError as e:
+            logger.warning(f"Incremental restore failed ({e.orig}), rewriting session")
+            self._apply_diff(current, {})
+            self._apply_diff({}, target, replaced=current)
+
+        # Rows were changed with bulk statements; drop stale ORM state
+        self.db.expire_all()
+
+        # 2. Delete turns after target
         self.db.query(Turn).filter(
             Turn.session_id == self.session_id,
             Turn.turn_number > turn_number
         ).delete(synchronize_session="fetch")
 
-        # 4. Update session
+        # Summaries of deleted turns go with them (re-queued as turns are replayed)
+        for model in (TurnChunkSummary, SummaryJob):
+            self.db.query(model).filter(
+                model.session_id == self.session_id,
+                model.to_turn > turn_number
+            ).delete(synchronize_session="fetch")
+
+        # 3. Update session
         self.game_session.total_turns = turn_number
 
-        # 5. Delete snapshots after target
+        # 4. Delete snapshots after target (nothing earlier depends on them)
         self.db.query(SessionSnapshot).filter(
             SessionSnapshot.session_id == self.session_id,
             SessionSnapshot.turn_number > turn_number
         ).delete(synchronize_session="fetch")
 
         self.db.flush()
+        self._cache_state(snapshot.id, target)
 
     def prune_snapshots(self, min_keep: int = 10) -> int:
         """Remove old snapshots based on retention policy.
@@ -324,6 +339,9 @@ class SnapshotManager(BaseManager):
         - All snapshots since last milestone
         - At minimum, the most recent `min_keep` snapshots
 
+        A kept delta whose base chain would be deleted is rewritten as a
+        keyframe first.
+
         Args:
             min_keep: Minimum number of snapshots to retain.
 
@@ -357,6 +375,23 @@ class SnapshotManager(BaseManager):
             if snapshot.turn_number >= milestone_turn:
                 keep_turns.add(snapshot.turn_number)
 
+        if len(keep_turns) == len(snapshots):
+            return 0
+
+        # Promote kept deltas that would lose part of their chain
+        chains = self._get_chain_index()
+        for snapshot in reversed(snapshots):
+            if snapshot.turn_number not in keep_turns or snapshot.is_keyframe:
+                continue
+            if not keep_turns.issuperset(self._chain_for(snapshot.turn_number, chains)):
+                state = self._reconstruct_state(snapshot.turn_number, chains)
+                snapshot.compressed_data = self._compress(
+                    {table: list(rows.values()) for table, rows in state.items()}
+                )
+                snapshot.snapshot_data = None
+                snapshot.base_turn_number = None
+                chains[snapshot.turn_number] = None
+
         # Delete the rest
         deleted = 0
         for snapshot in snapshots:
@@ -392,59 +427,301 @@ class SnapshotManager(BaseManager):
             SessionSnapshot.turn_number == turn_number,
         ).first()
 
-    def _model_to_dict(self, record: Any) -> dict:
-        """Convert a SQLAlchemy model instance to a dictionary.
+    def get_snapshot_state(self, turn_number: int) -> dict[str, list[dict[str, Any]]]:
+        """Get the full session state recorded by a snapshot.
+
+        Args:
+            turn_number: The turn number to read.
+
+        Returns:
+            Dict of table name to serialized rows.
+
+        Raises:
+            ValueError: If no snapshot exists for the given turn.
+        """
+        chains = self._get_chain_index()
+        if turn_number not in chains:
+            raise ValueError(f"No snapshot found for turn {turn_number}")
+        state = self._reconstruct_state(turn_number, chains)
+        return {table: list(rows.values()) for table, rows in state.items()}
+
+    # =========================================================================
+    # State Reading and Reconstruction
+    # =========================================================================
+
+    def _read_state(self) -> SnapshotState:
+        """Read every session-scoped row with one column-level query per table.
+
+        Returns:
+            Current session state.
+        """
+        entity_ids = select(Entity.id).where(Entity.session_id == self.session_id)
+        state: SnapshotState = {}
+
+        for model in SESSION_SCOPED_MODELS:
+            # Some models are linked via entity_id instead of session_id
+            if hasattr(model, "session_id"):
+                scope = model.session_id == self.session_id
+            elif hasattr(model, "entity_id"):
+                scope = model.entity_id.in_(entity_ids)
+            else:
+                continue
+
+            columns = inspect(model).columns
+            query = select(*[column.label(key) for key, column in columns.items()]).where(scope)
+            state[model.__tablename__] = {
+                row["id"]: {key: self._serialize_value(value) for key, value in row.items()}
+                for row in self.db.execute(query).mappings()
+            }
+
+        return state
+
+    def _get_chain_index(self) -> dict[int, int | None]:
+        """Map each snapshot's turn to its base turn (None for keyframes)."""
+        rows = self.db.query(
+            SessionSnapshot.turn_number, SessionSnapshot.base_turn_number
+        ).filter(SessionSnapshot.session_id == self.session_id).all()
+        return dict(rows)
+
+    def _chain_for(self, turn_number: int, chains: dict[int, int | None]) -> list[int]:
+        """Get the turns needed to rebuild a snapshot, keyframe first.
+
+        Raises:
+            ValueError: If the chain is broken.
+        """
+        chain = [turn_number]
+        while chains.get(chain[-1]) is not None:
+            base = chains[chain[-1]]
+            if base not in chains:
+                raise ValueError(f"Snapshot chain for turn {turn_number} is missing turn {base}")
+            chain.append(base)
+        chain.reverse()
+        return chain
+
+    def _reconstruct_state(
+        self, turn_number: int, chains: dict[int, int | None]
+    ) -> SnapshotState:
+        """Rebuild the full state of a snapshot from its keyframe and deltas.
+
+        Starts from the cached state when it belongs to a snapshot on the
+        chain, so consecutive captures only decode their own base.
 
         Args:
-            record: The model instance to convert.
+            turn_number: Snapshot turn to rebuild.
+            chains: Chain index from _get_chain_index().
 
         Returns:
-            Dictionary representation of the record.
+            Session state recorded by the snapshot.
         """
-        result = {}
-        mapper = inspect(record.__class__)
+        chain = self._chain_for(turn_number, chains)
+        snapshots = {
+            snapshot.turn_number: snapshot
+            for snapshot in self.db.query(SessionSnapshot).filter(
+                SessionSnapshot.session_id == self.session_id,
+                SessionSnapshot.turn_number.in_(chain),
+            )
+        }
+
+        state: SnapshotState | None = None
+        cached_id, cached_state = self.db.info.get(_STATE_CACHE_KEY, (None, None))
+        for position, turn in enumerate(chain):
+            if snapshots[turn].id == cached_id:
+                state = {table: dict(rows) for table, rows in cached_state.items()}
+                chain = chain[position + 1:]
+                break
+
+        for turn in chain:
+            snapshot = snapshots[turn]
+            payload = self._load_payload(snapshot)
+            if snapshot.is_keyframe:
+                state = {
+                    table: {row["id"]: row for row in rows} for table, rows in payload.items()
+                }
+                continue
+            for table, changes in payload.items():
+                rows = state.setdefault(table, {})
+                for row_id in changes.get("deletes", []):
+                    rows.pop(row_id, None)
+                for row in changes.get("upserts", []):
+                    rows[row["id"]] = row
+
+        return state or {}
+
+    def _diff_states(self, old: SnapshotState, new: SnapshotState) -> dict[str, Any]:
+        """Get the rows inserted, changed or deleted between two states."""
+        delta: dict[str, Any] = {}
+        for table in old.keys() | new.keys():
+            old_rows = old.get(table, {})
+            new_rows = new.get(table, {})
+            upserts = [row for row_id, row in new_rows.items() if old_rows.get(row_id) != row]
+            deletes = [row_id for row_id in old_rows if row_id not in new_rows]
+            if upserts or deletes:
+                delta[table] = {"upserts": upserts, "deletes": deletes}
+        return delta
+
+    def _apply_diff(
+        self,
+        current: SnapshotState,
+        target: SnapshotState,
+        replaced: SnapshotState | None = None,
+    ) -> None:
+        """Make the session tables match a target state with bulk statements.
+
+        Inserts run parents first and deletes children first, with updates
+        in between, so foreign keys hold at every step. Written rows get a
+        row_version above both the snapshotted and the current one, so
+        versions never move backwards and results cached against the
+        rolled-back state go stale.
 
-        for column in mapper.columns:
-            value = getattr(record, column.key)
+        Args:
+            current: State currently in the database.
+            target: State to restore.
+            replaced: State the rows were just deleted from, if inserting
+                rows anew (their versions must still grow).
+        """
+        changes: dict[type, tuple[list[dict], list[dict], list[int]]] = {}
+        for model in SESSION_SCOPED_MODELS:
+            table = model.__tablename__
+            current_rows = current.get(table, {})
+            target_rows = target.get(table, {})
+            inserts = [row for row_id, row in target_rows.items() if row_id not in current_rows]
+            updates = [
+                row
+                for row_id, row in target_rows.items()
+                if row_id in current_rows
+                and _without_version(current_rows[row_id]) != _without_version(row)
+            ]
+            deletes = [row_id for row_id in current_rows if row_id not in target_rows]
+            changes[model] = (inserts, updates, deletes)
 
-            # Handle datetime serialization
-            if isinstance(value, datetime):
-                value = value.isoformat()
+        for model in reversed(SESSION_SCOPED_MODELS):
+            inserts, _, _ = changes[model]
+            # Rows from older snapshots may lack columns; insert each shape separately
+            by_columns: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+            previous_rows = (replaced or {}).get(model.__tablename__, {})
+            for row in inserts:
+                parsed = self._parse_row(model, row)
+                if "row_version" in parsed:
+                    previous = previous_rows.get(row["id"], {}).get("row_version", 0)
+                    parsed["row_version"] = max(parsed["row_version"], previous) + 1
+                by_columns.setdefault(tuple(parsed), []).append(parsed)
+            for rows in by_columns.values():
+                self.db.execute(insert(model.__table__), rows)
 
-            # Handle enum serialization
-            if hasattr(value, "value"):
-                value = value.value
+        for model in reversed(SESSION_SCOPED_MODELS):
+            _, updates, _ = changes[model]
+            if updates:
+                current_rows = current.get(model.__tablename__, {})
+                table = model.__table__
+                statement = (
+                    update(table)
+                    .where(table.c.id == bindparam("_row_id"))
+                    .values({name: bindparam(name) for name in table.c.keys() if name != "id"})
+                )
+                rows = []
+                for row in updates:
+                    # Columns missing from the snapshot keep their current value
+                    current_row = current_rows[row["id"]]
+                    parsed = self._parse_row(model, {**current_row, **row})
+                    if "row_version" in current_row:
+                        parsed["row_version"] = current_row["row_version"] + 1
+                    parsed["_row_id"] = parsed.pop("id")
+                    rows.append(parsed)
+                self.db.execute(statement, rows)
 
-            result[column.key] = value
+        for model in SESSION_SCOPED_MODELS:
+            _, _, deletes = changes[model]
+            if deletes:
+                self.db.execute(delete(model.__table__).where(model.__table__.c.id.in_(deletes)))
+
+        logger.debug(
+            "Restored snapshot rows: "
+            f"{sum(len(c[0]) for c in changes.values())} inserted, "
+            f"{sum(len(c[1]) for c in changes.values())} updated, "
+            f"{sum(len(c[2]) for c in changes.values())} deleted"
+        )
 
-        return result
+    # =========================================================================
+    # Serialization
+    # =========================================================================
+
+    def _cache_state(self, snapshot_id: int, state: SnapshotState) -> None:
+        """Remember the state of a snapshot for the next capture or restore."""
+        if not isinstance(self.db, Session):
+            return
+        if not self.db.info.get(_LISTENING_KEY):
+            # Snapshot ids from a rolled-back transaction can be reused
+            event.listen(
+                self.db, "after_rollback", lambda session: session.info.pop(_STATE_CACHE_KEY, None)
+            )
+            self.db.info[_LISTENING_KEY] = True
+        self.db.info[_STATE_CACHE_KEY] = (snapshot_id, state)
+
+    def _compress(self, payload: dict[str, Any]) -> bytes:
+        """Encode a keyframe or delta payload."""
+        return zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+
+    def _load_payload(self, snapshot: SessionSnapshot) -> dict[str, Any]:
+        """Decode a snapshot payload, including legacy uncompressed keyframes."""
+        if snapshot.compressed_data is not None:
+            return json.loads(zlib.decompress(snapshot.compressed_data))
+        return snapshot.snapshot_data or {}
+
+    def _serialize_value(self, value: Any) -> Any:
+        """Convert a column value to its JSON form.
 
-    def _dict_to_model(self, model_class: type, data: dict) -> Any:
-        """Convert a dictionary back to a SQLAlchemy model instance.
+        Args:
+            value: The column value.
+
+        Returns:
+            JSON-compatible value.
+        """
+        # Handle datetime serialization
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+
+        # Handle enum serialization
+        if hasattr(value, "value"):
+            return value.value
+
+        return value
+
+    def _parse_row(self, model_class: type, data: dict) -> dict[str, Any]:
+        """Convert a serialized row back to column values.
 
         Args:
-            model_class: The model class to instantiate.
-            data: Dictionary of column values.
+            model_class: The model class the row belongs to.
+            data: Dictionary of serialized column values.
+
+        Columns missing from the data (added after the snapshot was taken)
+        get their Python-side default, or are left out so the database
+        default applies.
 
         Returns:
-            New model instance (not yet added to session).
+            Column values ready for a Core insert or update.
         """
-        # Parse datetime strings back to datetime objects
         mapper = inspect(model_class)
         parsed_data = {}
 
-        for column in mapper.columns:
-            key = column.key
+        for key, column in mapper.columns.items():
             if key not in data:
+                default = column.default
+                if default is None or not (default.is_scalar or default.is_callable):
+                    continue
+                parsed_data[column.name] = (
+                    default.arg(None) if default.is_callable else default.arg
+                )
                 continue
-
             value = data[key]
 
-            # Parse datetime strings
-            if value is not None and hasattr(column.type, "python_type"):
-                if column.type.python_type == datetime and isinstance(value, str):
-                    value = datetime.fromisoformat(value)
+            if isinstance(value, str):
+                # Parse enum values and datetime strings
+                if isinstance(column.type, SAEnum) and column.type.enum_class is not None:
+                    value = column.type.enum_class(value)
+                elif isinstance(column.type, (DateTime, Date)):
+                    parse = datetime if isinstance(column.type, DateTime) else date
+                    value = parse.fromisoformat(value)
 
-            parsed_data[key] = value
+            parsed_data[column.name] = value
 
-        return model_class(**parsed_data)
+        return parsed_data
@@ -4,16 +4,25 @@ This manager handles:
 - Story summary: From start to last milestone (regenerate at milestones)
 - Recent summary: From last milestone to last night (regenerate daily)
 - Raw turns: Full text since last night
-"""
 
-from datetime import datetime
+Summaries are generated off the turn's critical path: enqueue_due_jobs()
+records what became due when a turn is saved, and SummaryWorker runs
+the jobs in the background. Turns are also summarized in fixed chunks
+as they accumulate, so story and recent summaries are built from a few
+chunk summaries plus the turns since the last chunk.
+"""
 
+from sqlalchemy import ColumnElement, func, update
 from sqlalchemy.orm import Session
 
 from src.database.models.context_summary import (
     ContextSummary,
     Milestone,
+    SummaryJob,
+    SummaryJobStatus,
+    SummaryJobType,
     SummaryType,
+    TurnChunkSummary,
 )
 from src.database.models.session import GameSession, Turn
 from src.database.models.world import TimeState
@@ -81,6 +90,25 @@ Write a summary of what happened since the milestone, focusing on:
 
 Keep the summary under 400 words."""
 
+CHUNK_SUMMARY_SYSTEM = """You are a narrative summarizer for an RPG game.
+Your task is to condense a short run of turns into a brief record.
+
+Guidelines:
+- Keep every event, NPC, item, place and decision that could matter later
+- Drop descriptive flourishes
+- Maximum 100-150 words
+- Write in third person past tense
+"""
+
+CHUNK_SUMMARY_PROMPT = """Summarize turns {from_turn} to {to_turn}:
+
+{turns}
+
+Write a compact summary of what happened in these turns."""
+
+# Turns per rolling chunk summary (chunks cover turns 1-10, 11-20, ...)
+CHUNK_TURNS = 10
+
 
 class SummaryManager(BaseManager):
     """Manages layered context summaries.
@@ -144,45 +172,25 @@ class SummaryManager(BaseManager):
         )
 
     def get_story_summary(self) -> str:
-        """Get story summary, regenerating if needed.
+        """Get the latest generated story summary.
+
+        Never blocks on generation: a newer summary may still be queued.
 
         Returns:
             Story summary text (may be empty if no milestones yet)
         """
         summary = self._get_summary(SummaryType.STORY)
-        last_milestone = self.milestone_manager.get_last_milestone()
-
-        # Check if we need to regenerate
-        needs_regen = False
-        if summary is None:
-            needs_regen = last_milestone is not None
-        elif last_milestone and summary.milestone_id != last_milestone.id:
-            needs_regen = True
-
-        if needs_regen:
-            # Regenerate synchronously would block, return existing or empty
-            # Actual regeneration happens via regenerate_story_on_milestone
-            return summary.summary_text if summary else ""
-
         return summary.summary_text if summary else ""
 
     def get_recent_summary(self) -> str:
-        """Get recent summary (last milestone → last night).
+        """Get the latest generated recent summary (last milestone → last night).
+
+        Never blocks on generation: a newer summary may still be queued.
 
         Returns:
             Recent summary text (may be empty if too early)
         """
         summary = self._get_summary(SummaryType.RECENT)
-        current_day = self._get_current_day()
-
-        # Check if we need to regenerate (new day)
-        if summary is None:
-            return ""
-        elif summary.covers_through_day < current_day - 1:
-            # Summary is stale, but regeneration is async
-            # Return existing for now
-            pass
-
         return summary.summary_text if summary else ""
 
     def get_turns_since_night(self, current_day: int | None = None) -> str:
@@ -271,6 +279,110 @@ class SummaryManager(BaseManager):
 
         return "\n".join(lines)
 
+    def _format_turns_with_chunks(self, turns: list[Turn]) -> str:
+        """Format turns for LLM input, using chunk summaries where possible.
+
+        A chunk summary replaces its turns only if all of them are in the
+        list; other turns are formatted as brief summaries.
+
+        Args:
+            turns: List of Turn objects, in turn order
+
+        Returns:
+            Formatted string of chunk summaries and brief turns
+        """
+        if not turns:
+            return self._format_turns_brief(turns)
+
+        numbers = {turn.turn_number for turn in turns}
+        chunks = {
+            chunk.from_turn: chunk
+            for chunk in self.db.query(TurnChunkSummary).filter(
+                TurnChunkSummary.session_id == self.session_id,
+                TurnChunkSummary.from_turn >= turns[0].turn_number,
+                TurnChunkSummary.to_turn <= turns[-1].turn_number,
+            )
+            if all(n in numbers for n in range(chunk.from_turn, chunk.to_turn + 1))
+        }
+
+        parts: list[str] = []
+        pending: list[Turn] = []
+        covered_through = 0
+        for turn in turns:
+            if turn.turn_number <= covered_through:
+                continue
+            chunk = chunks.get(turn.turn_number)
+            if chunk is None:
+                pending.append(turn)
+                continue
+            if pending:
+                parts.append(self._format_turns_brief(pending))
+                pending = []
+            parts.append(f"Turns {chunk.from_turn}-{chunk.to_turn}: {chunk.summary_text}")
+            covered_through = chunk.to_turn
+        if pending:
+            parts.append(self._format_turns_brief(pending))
+
+        return "\n".join(parts)
+
+    async def summarize_chunk(self, from_turn: int, to_turn: int) -> TurnChunkSummary | None:
+        """Generate (or regenerate) the summary of a run of turns.
+
+        Args:
+            from_turn: First turn of the chunk
+            to_turn: Last turn of the chunk
+
+        Returns:
+            The TurnChunkSummary, or None if the chunk has no turns
+        """
+        turns = (
+            self.db.query(Turn)
+            .filter(
+                Turn.session_id == self.session_id,
+                Turn.turn_number >= from_turn,
+                Turn.turn_number <= to_turn,
+            )
+            .order_by(Turn.turn_number.asc())
+            .all()
+        )
+        if not turns:
+            return None
+
+        prompt = CHUNK_SUMMARY_PROMPT.format(
+            from_turn=from_turn,
+            to_turn=to_turn,
+            turns=self._format_turns_raw(turns),
+        )
+        messages = [Message(role=MessageRole.USER, content=prompt)]
+        response = await self.llm_provider.complete(
+            messages=messages,
+            system_prompt=CHUNK_SUMMARY_SYSTEM,
+            temperature=0.3,
+            max_tokens=300,
+        )
+
+        summary_text = response.content if hasattr(response, "content") else str(response)
+
+        chunk = (
+            self.db.query(TurnChunkSummary)
+            .filter(
+                TurnChunkSummary.session_id == self.session_id,
+                TurnChunkSummary.from_turn == from_turn,
+            )
+            .first()
+        )
+        if chunk is None:
+            chunk = TurnChunkSummary(session_id=self.session_id, from_turn=from_turn)
+            self.db.add(chunk)
+        chunk.to_turn = to_turn
+        chunk.from_day = turns[0].game_day_at_turn
+        chunk.to_day = turns[-1].game_day_at_turn
+        chunk.summary_text = summary_text
+        chunk.token_count = len(summary_text) // 4
+
+        self.db.flush()
+        return chunk
+
     async def regenerate_story_on_milestone(self, milestone: Milestone) -> ContextSummary:
         """Regenerate story summary when a milestone is reached.
 
@@ -294,7 +406,7 @@ class SummaryManager(BaseManager):
             .order_by(Turn.turn_number.asc())
             .all()
         )
-        turn_summaries = self._format_turns_brief(all_turns)
+        turn_summaries = self._format_turns_with_chunks(all_turns)
 
         # Build prompt
         prompt = STORY_SUMMARY_PROMPT.format(
@@ -373,7 +485,7 @@ class SummaryManager(BaseManager):
         if not turns:
             return None
 
-        turn_summaries = self._format_turns_brief(turns)
+        turn_summaries = self._format_turns_with_chunks(turns)
 
         # Build prompt
         prompt = RECENT_SUMMARY_PROMPT.format(
@@ -456,3 +568,142 @@ class SummaryManager(BaseManager):
             return True, last_milestone
 
         return False, None
+
+    def enqueue_due_jobs(self) -> list[SummaryJob]:
+        """Queue the summaries that the turns saved so far make due.
+
+        Called when a turn is saved; SummaryWorker generates them later.
+        Each target (chunk start, milestone, day) is queued at most once,
+        and a newer story or recent target replaces a pending older one
+        instead of queueing a second job.
+
+        Returns:
+            Jobs added or retargeted
+        """
+        last_turn = (
+            self.db.query(func.max(Turn.turn_number))
+            .filter(Turn.session_id == self.session_id)
+            .scalar()
+        )
+        if last_turn is None:
+            return []
+
+        jobs: list[SummaryJob] = []
+
+        # Rolling chunks, queued once their last turn exists
+        last_queued = (
+            self.db.query(func.max(SummaryJob.from_turn))
+            .filter(
+                SummaryJob.session_id == self.session_id,
+                SummaryJob.job_type == SummaryJobType.CHUNK,
+            )
+            .scalar()
+        )
+        from_turn = 1 if last_queued is None else last_queued + CHUNK_TURNS
+        while from_turn + CHUNK_TURNS - 1 <= last_turn:
+            job = SummaryJob(
+                session_id=self.session_id,
+                job_type=SummaryJobType.CHUNK,
+                from_turn=from_turn,
+                to_turn=from_turn + CHUNK_TURNS - 1,
+            )
+            self.db.add(job)
+            jobs.append(job)
+            from_turn += CHUNK_TURNS
+
+        needs_story, milestone = self.needs_story_regeneration()
+        if needs_story and milestone is not None:
+            job = self._queue_job(
+                SummaryJobType.STORY,
+                SummaryJob.milestone_id == milestone.id,
+                milestone_id=milestone.id,
+                to_turn=milestone.turn_number,
+            )
+            if job is not None:
+                jobs.append(job)
+
+        if self.is_new_day() and self.milestone_manager.get_last_milestone() is not None:
+            current_day = self._get_current_day()
+            job = self._queue_job(
+                SummaryJobType.RECENT,
+                SummaryJob.target_day == current_day,
+                target_day=current_day,
+                to_turn=last_turn,
+            )
+            if job is not None:
+                jobs.append(job)
+
+        self.db.flush()
+        return jobs
+
+    def _queue_job(
+        self, job_type: SummaryJobType, same_target: ColumnElement[bool], **target: int
+    ) -> SummaryJob | None:
+        """Queue a story or recent job unless its target was already queued.
+
+        Args:
+            job_type: Type of job
+            same_target: Filter matching jobs for the same target
+            **target: Target columns for the job
+
+        Returns:
+            The added or retargeted job, or None if nothing changed
+        """
+        jobs = self.db.query(SummaryJob).filter(
+            SummaryJob.session_id == self.session_id,
+            SummaryJob.job_type == job_type,
+        )
+        if jobs.filter(same_target).first() is not None:
+            return None
+
+        # Coalesce: a job not yet started only needs the newest target. The
+        # update is conditional, as the worker may claim the job meanwhile.
+        job = jobs.filter(SummaryJob.status == SummaryJobStatus.PENDING).first()
+        if job is not None:
+            retargeted = self.db.execute(
+                update(SummaryJob)
+                .where(SummaryJob.id == job.id, SummaryJob.status == SummaryJobStatus.PENDING)
+                .values(**target)
+            )
+            if retargeted.rowcount == 1:
+                return job
+
+        job = SummaryJob(session_id=self.session_id, job_type=job_type, **target)
+        self.db.add(job)
+        return job
+
+    async def run_job(self, job: SummaryJob) -> bool:
+        """Generate the summary a job asks for, unless it is already there.
+
+        Args:
+            job: The job to run
+
+        Returns:
+            True if a summary was generated, False if the job was redundant
+        """
+        if job.job_type == SummaryJobType.CHUNK:
+            chunk = (
+                self.db.query(TurnChunkSummary)
+                .filter(
+                    TurnChunkSummary.session_id == self.session_id,
+                    TurnChunkSummary.from_turn == job.from_turn,
+                )
+                .first()
+            )
+            if chunk is not None and chunk.to_turn == job.to_turn:
+                return False
+            return await self.summarize_chunk(job.from_turn, job.to_turn) is not None
+
+        if job.job_type == SummaryJobType.STORY:
+            summary = self._get_summary(SummaryType.STORY)
+            if job.milestone is None or (
+                summary is not None and summary.milestone_id == job.milestone_id
+            ):
+                return False
+            await self.regenerate_story_on_milestone(job.milestone)
+            return True
+
+        summary = self._get_summary(SummaryType.RECENT)
+        if summary is not None and summary.generated_at_day >= job.target_day:
+            return False
+        return await self.regenerate_recent_on_new_day(job.target_day) is not None
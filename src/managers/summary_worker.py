@@ -0,0 +1,208 @@
+"""Background worker generating queued context summaries.
+
+SummaryManager.enqueue_due_jobs() records summaries as they become due
+(rolling turn chunks, the story summary at a milestone, the recent
+summary on a new day) in the summary_jobs table. SummaryWorker runs
+them as an asyncio task, so the LLM calls never hold up a turn; the
+context compiler keeps reading the latest completed summaries until the
+new ones are committed.
+
+Each job runs on its own database session. A job is claimed with a
+conditional UPDATE (pending -> running), so a job is never run twice;
+a failed job goes back to pending until it has used max_attempts, and
+jobs left running by an interrupted worker are requeued on start().
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from src.database.models.context_summary import SummaryJob, SummaryJobStatus
+from src.database.models.session import GameSession
+from src.llm.base import LLMProvider
+from src.managers.summary_manager import SummaryManager
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryWorker:
+    """Runs a session's pending summary jobs in the background.
+
+    Usage:
+        worker = SummaryWorker(SessionLocal, game_session.id)
+        await worker.start()
+        ...
+        SummaryManager(db, game_session).enqueue_due_jobs()
+        db.commit()
+        worker.notify()
+        ...
+        await worker.stop()
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        session_id: int,
+        llm_provider: LLMProvider | None = None,
+        poll_interval: float = 30.0,
+        max_attempts: int = 3,
+    ) -> None:
+        """Initialize the worker.
+
+        Args:
+            session_factory: Creates a database session per job
+            session_id: Game session whose jobs to run
+            llm_provider: LLM provider for summaries (cheap provider if None)
+            poll_interval: Seconds between checks for jobs when not notified
+            max_attempts: Attempts before a job is marked failed
+        """
+        self._session_factory = session_factory
+        self._session_id = session_id
+        self._llm_provider = llm_provider
+        self._poll_interval = poll_interval
+        self._max_attempts = max_attempts
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.generated = 0
+        self.skipped = 0
+        self.failed = 0
+
+    async def start(self) -> None:
+        """Requeue interrupted jobs and start the background loop."""
+        if self._task is not None:
+            return
+        with self._session_factory() as db:
+            db.execute(
+                update(SummaryJob)
+                .where(
+                    SummaryJob.session_id == self._session_id,
+                    SummaryJob.status == SummaryJobStatus.RUNNING,
+                )
+                .values(status=SummaryJobStatus.PENDING)
+            )
+            db.commit()
+        self._task = asyncio.create_task(self._loop())
+        logger.info("Started summary worker")
+
+    async def stop(self) -> None:
+        """Stop the background loop (an interrupted job is requeued on start)."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        logger.info("Stopped summary worker")
+
+    def notify(self) -> None:
+        """Wake the worker after new jobs were committed."""
+        self._wake.set()
+
+    async def run_pending(self) -> int:
+        """Run pending jobs until none are left or one fails.
+
+        Returns:
+            Number of jobs run successfully
+        """
+        completed = 0
+        while (job_id := self._claim_next()) is not None:
+            if not await self._run_job(job_id):
+                break  # Retried on the next wake-up rather than straight away
+            completed += 1
+        return completed
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get job counts since the worker was created."""
+        return {"generated": self.generated, "skipped": self.skipped, "failed": self.failed}
+
+    async def _loop(self) -> None:
+        """Run pending jobs whenever notified, or every poll_interval."""
+        while True:
+            self._wake.clear()
+            try:
+                await self.run_pending()
+            except Exception:
+                logger.exception("Summary worker error")
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self._poll_interval)
+            except TimeoutError:
+                pass
+
+    def _claim_next(self) -> int | None:
+        """Mark the oldest pending job running.
+
+        Returns:
+            ID of the claimed job, or None if no job is pending
+        """
+        with self._session_factory() as db:
+            while True:
+                job_id = db.scalar(
+                    select(SummaryJob.id)
+                    .where(
+                        SummaryJob.session_id == self._session_id,
+                        SummaryJob.status == SummaryJobStatus.PENDING,
+                    )
+                    .order_by(SummaryJob.id)
+                    .limit(1)
+                )
+                if job_id is None:
+                    return None
+                claimed = db.execute(
+                    update(SummaryJob)
+                    .where(
+                        SummaryJob.id == job_id,
+                        SummaryJob.status == SummaryJobStatus.PENDING,
+                    )
+                    .values(
+                        status=SummaryJobStatus.RUNNING,
+                        attempts=SummaryJob.attempts + 1,
+                    )
+                )
+                db.commit()
+                if claimed.rowcount == 1:
+                    return job_id
+
+    async def _run_job(self, job_id: int) -> bool:
+        """Run a claimed job and record its outcome.
+
+        Args:
+            job_id: ID of a job in the running state
+
+        Returns:
+            True if the job is done, False if it failed
+        """
+        with self._session_factory() as db:
+            try:
+                job = db.get(SummaryJob, job_id)
+                game_session = db.get(GameSession, self._session_id)
+                if job is None or game_session is None:
+                    return True  # Deleted meanwhile (e.g. by a snapshot restore)
+                manager = SummaryManager(db, game_session, llm_provider=self._llm_provider)
+                if await manager.run_job(job):
+                    self.generated += 1
+                else:
+                    self.skipped += 1
+                job.status = SummaryJobStatus.DONE
+                job.last_error = None
+                db.commit()
+                return True
+            except Exception as e:
+                db.rollback()
+                self.failed += 1
+                logger.warning(f"Summary job {job_id} failed: {e}")
+                job = db.get(SummaryJob, job_id)
+                if job is not None:
+                    job.status = (
+                        SummaryJobStatus.FAILED
+                        if job.attempts >= self._max_attempts
+                        else SummaryJobStatus.PENDING
+                    )
+                    job.last_error = str(e)
+                    db.commit()
+                return False
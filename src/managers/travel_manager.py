@@ -11,6 +11,7 @@ from src.database.models.navigation import TerrainZone, ZoneConnection
 from src.database.models.session import GameSession
 from src.managers.base import BaseManager
 from src.managers.pathfinding_manager import PathfindingManager
+from src.managers.zone_graph import get_zone_graph
 from src.managers.zone_manager import ZoneManager
 
 
@@ -341,8 +342,8 @@ class TravelManager(BaseManager):
             - reason: str (if not success)
         """
         # Check if zone is adjacent to current position
-        adjacent_zones = self._zone_manager.get_adjacent_zones(journey.current_zone_key)
-        adjacent_keys = {z.zone_key for z in adjacent_zones}
+        graph = get_zone_graph(self.db, self.session_id)
+        adjacent_keys = {z.zone_key for z in graph.adjacent_zones(journey.current_zone_key)}
 
         if zone_key not in adjacent_keys:
             return {
@@ -351,7 +352,7 @@ class TravelManager(BaseManager):
             }
 
         # Get the target zone
-        target_zone = self._zone_manager.get_zone(zone_key)
+        target_zone = graph.zone(zone_key)
         if target_zone is None:
             return {
                 "success": False,
@@ -366,7 +367,7 @@ class TravelManager(BaseManager):
             }
 
         # Calculate travel time
-        current_zone = self._zone_manager.get_zone(journey.current_zone_key)
+        current_zone = graph.zone(journey.current_zone_key)
         segment_time = self._calculate_segment_time(
             current_zone, target_zone, journey.transport_mode
         ) if current_zone else target_zone.base_travel_cost
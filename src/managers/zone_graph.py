@@ -0,0 +1,300 @@
+"""In-memory zone graph for pathfinding.
+
+Loading TerrainZone and ZoneConnection rows once per session and keeping
+them as adjacency arrays turns A* from one query per expanded node into
+pure in-memory work. The graph:
+
+- Indexes zones 0..n-1 and stores passable edges as adjacency lists
+  (outgoing connections plus the reverse of bidirectional ones)
+- Caches per-zone traversal costs for each transport mode
+- Optionally precomputes landmark distances (ALT) for a tighter A*
+  heuristic on large regions
+
+Graphs live in the SQLAlchemy session's info dict, so every manager
+sharing a session shares one graph. Any flush that writes a zone,
+connection or transport mode (including ZoneManager.connect_zones)
+drops it; it is rebuilt on next use.
+"""
+
+import heapq
+import logging
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.database.models.navigation import TerrainZone, TransportMode, ZoneConnection
+
+logger = logging.getLogger(__name__)
+
+_GRAPHS_KEY = "zone_graphs"
+_LISTENING_KEY = "zone_graph_listening"
+
+ZoneCostFn = Callable[[TerrainZone], int | None]
+
+
+class ZoneGraph:
+    """Adjacency-array view of a session's terrain zones.
+
+    Usage:
+        graph = get_zone_graph(db, session_id)
+        start = graph.index_of("forest_edge")
+        for neighbor, crossing_minutes in graph.neighbors(start):
+            ...
+    """
+
+    # Regions smaller than this are searched with Dijkstra ordering only
+    LANDMARK_MIN_ZONES = 32
+    LANDMARK_COUNT = 4
+
+    def __init__(self, zones: list[TerrainZone], connections: list[ZoneConnection]):
+        """Build the graph from zone and connection rows.
+
+        Args:
+            zones: All zones in the session
+            connections: All passable connections in the session
+        """
+        self.zones = zones
+        self._index_by_id = {zone.id: index for index, zone in enumerate(zones)}
+        self._index_by_key = {zone.zone_key: index for index, zone in enumerate(zones)}
+        self.terrain = [zone.terrain_type for zone in zones]
+
+        self._adjacency: list[list[tuple[int, int]]] = [[] for _ in zones]
+        for conn in connections:
+            from_index = self._index_by_id.get(conn.from_zone_id)
+            to_index = self._index_by_id.get(conn.to_zone_id)
+            if from_index is None or to_index is None:
+                continue
+            self._adjacency[from_index].append((to_index, conn.crossing_minutes))
+            if conn.is_bidirectional:
+                self._adjacency[to_index].append((from_index, conn.crossing_minutes))
+
+        self._zone_costs: dict[str, list[int | None]] = {}
+        # mode -> (forward distances from each landmark, distances to each landmark)
+        self._landmarks: dict[str, tuple[list[list[float]], list[list[float]]]] = {}
+
+    @classmethod
+    def load(cls, db: Session, session_id: int) -> "ZoneGraph":
+        """Load a session's zones and passable connections (two queries).
+
+        Args:
+            db: Database session
+            session_id: Game session ID
+
+        Returns:
+            The built graph
+        """
+        zones = (
+            db.query(TerrainZone)
+            .filter(TerrainZone.session_id == session_id)
+            .order_by(TerrainZone.id)
+            .all()
+        )
+        connections = (
+            db.query(ZoneConnection)
+            .filter(
+                ZoneConnection.session_id == session_id,
+                ZoneConnection.is_passable == True,  # noqa: E712
+            )
+            .order_by(ZoneConnection.id)
+            .all()
+        )
+        logger.debug(f"Built zone graph: {len(zones)} zones, {len(connections)} connections")
+        return cls(zones, connections)
+
+    def __len__(self) -> int:
+        return len(self.zones)
+
+    def index_of(self, zone_key: str) -> int | None:
+        """Get a zone's index by key."""
+        return self._index_by_key.get(zone_key)
+
+    def zone(self, zone_key: str) -> TerrainZone | None:
+        """Get a zone by key without a query."""
+        index = self._index_by_key.get(zone_key)
+        return self.zones[index] if index is not None else None
+
+    def neighbors(self, index: int) -> list[tuple[int, int]]:
+        """Get (neighbor index, crossing minutes) for each passable edge."""
+        return self._adjacency[index]
+
+    def adjacent_zones(self, zone_key: str) -> list[TerrainZone]:
+        """Get zones reachable in one step, like ZoneManager.get_adjacent_zones."""
+        index = self._index_by_key.get(zone_key)
+        if index is None:
+            return []
+        seen = dict.fromkeys(neighbor for neighbor, _ in self._adjacency[index])
+        return [self.zones[neighbor] for neighbor in seen]
+
+    def zone_costs(self, mode_key: str, cost_fn: ZoneCostFn) -> list[int | None]:
+        """Get each zone's traversal cost for a transport mode, cached.
+
+        Args:
+            mode_key: Transport mode key
+            cost_fn: Computes one zone's cost (None = impassable)
+
+        Returns:
+            Cost per zone index
+        """
+        costs = self._zone_costs.get(mode_key)
+        if costs is None:
+            costs = [cost_fn(zone) for zone in self.zones]
+            self._zone_costs[mode_key] = costs
+        return costs
+
+    def landmark_heuristic(
+        self, mode_key: str, cost_fn: ZoneCostFn
+    ) -> Callable[[int, int], float] | None:
+        """Get an admissible ALT heuristic for a transport mode.
+
+        Landmark distances are computed once per mode with Dijkstra. The
+        bound stays admissible when a search skips edges (avoided
+        terrain), since removing edges can only lengthen paths.
+
+        Args:
+            mode_key: Transport mode key
+            cost_fn: Zone cost function for the mode
+
+        Returns:
+            h(node, goal) lower bound, or None if the graph is too small
+        """
+        if len(self.zones) < self.LANDMARK_MIN_ZONES:
+            return None
+
+        if mode_key not in self._landmarks:
+            self._landmarks[mode_key] = self._build_landmarks(self.zone_costs(mode_key, cost_fn))
+        from_landmark, to_landmark = self._landmarks[mode_key]
+
+        def heuristic(node: int, goal: int) -> float:
+            best = 0.0
+            for forward, backward in zip(from_landmark, to_landmark, strict=True):
+                # d(L, goal) - d(L, node) and d(node, L) - d(goal, L) are lower bounds
+                if forward[goal] != float("inf") and forward[node] != float("inf"):
+                    best = max(best, forward[goal] - forward[node])
+                if backward[node] != float("inf") and backward[goal] != float("inf"):
+                    best = max(best, backward[node] - backward[goal])
+            return best
+
+        return heuristic
+
+    def _edge_weights(self, costs: list[int | None]) -> list[list[tuple[int, int]]]:
+        """Resolve edge weights (entry cost of target zone + crossing)."""
+        return [
+            [
+                (neighbor, costs[neighbor] + crossing)
+                for neighbor, crossing in edges
+                if costs[neighbor] is not None
+            ]
+            for edges in self._adjacency
+        ]
+
+    def _build_landmarks(
+        self, costs: list[int | None]
+    ) -> tuple[list[list[float]], list[list[float]]]:
+        """Pick landmarks by farthest-point selection and compute distances."""
+        forward_edges = self._edge_weights(costs)
+        reverse_edges: list[list[tuple[int, int]]] = [[] for _ in self.zones]
+        for node, edges in enumerate(forward_edges):
+            for neighbor, weight in edges:
+                reverse_edges[neighbor].append((node, weight))
+
+        from_landmark: list[list[float]] = []
+        to_landmark: list[list[float]] = []
+        landmark = 0
+        for _ in range(min(self.LANDMARK_COUNT, len(self.zones))):
+            forward = _dijkstra(forward_edges, landmark)
+            from_landmark.append(forward)
+            to_landmark.append(_dijkstra(reverse_edges, landmark))
+
+            # Next landmark: reachable zone farthest from all chosen so far
+            reachable = [
+                (min(distances[node] for distances in from_landmark), node)
+                for node in range(len(self.zones))
+                if forward[node] != float("inf")
+            ]
+            landmark = max(reachable)[1]
+
+        return from_landmark, to_landmark
+
+
+def _dijkstra(edges: list[list[tuple[int, int]]], source: int) -> list[float]:
+    """Single-source shortest distances over weighted adjacency lists."""
+    distances = [float("inf")] * len(edges)
+    distances[source] = 0
+    heap = [(0, source)]
+    while heap:
+        distance, node = heapq.heappop(heap)
+        if distance > distances[node]:
+            continue
+        for neighbor, weight in edges[node]:
+            candidate = distance + weight
+            if candidate < distances[neighbor]:
+                distances[neighbor] = candidate
+                heapq.heappush(heap, (candidate, neighbor))
+    return distances
+
+
+def get_zone_graph(db: Session, session_id: int) -> ZoneGraph:
+    """Get the cached zone graph for a game session, building it if needed.
+
+    Pending changes are flushed first (as a query would autoflush them),
+    so edits made through the ORM are never missed.
+
+    Args:
+        db: Database session
+        session_id: Game session ID
+
+    Returns:
+        The session's zone graph
+    """
+    if not isinstance(db, Session):
+        return ZoneGraph.load(db, session_id)
+
+    if db.autoflush:
+        db.flush()  # No-op when nothing is pending
+
+    if not db.info.get(_LISTENING_KEY):
+        event.listen(db, "after_flush", _on_flush)
+        event.listen(db, "after_rollback", _on_rollback)
+        db.info[_LISTENING_KEY] = True
+
+    graphs: dict[int, ZoneGraph] = db.info.setdefault(_GRAPHS_KEY, {})
+    graph = graphs.get(session_id)
+    if graph is None:
+        graph = ZoneGraph.load(db, session_id)
+        graphs[session_id] = graph
+    return graph
+
+
+def invalidate_zone_graph(db: Session, session_id: int | None = None) -> None:
+    """Drop cached zone graphs so they are rebuilt on next use.
+
+    Args:
+        db: Database session
+        session_id: Game session to drop (all if None)
+    """
+    if not isinstance(db, Session):
+        return
+    graphs: dict[int, ZoneGraph] = db.info.get(_GRAPHS_KEY, {})
+    if session_id is None:
+        graphs.clear()
+    else:
+        graphs.pop(session_id, None)
+
+
+def _on_flush(session: Session, flush_context: object) -> None:
+    """Drop graphs whose zones, connections or transport modes changed."""
+    graphs: dict[int, ZoneGraph] = session.info.get(_GRAPHS_KEY, {})
+    if not graphs:
+        return
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, TransportMode):
+            graphs.clear()  # Global definitions affect every session's costs
+            return
+        if isinstance(obj, (TerrainZone, ZoneConnection)):
+            graphs.pop(obj.session_id, None)
+
+
+def _on_rollback(session: Session) -> None:
+    """Drop all graphs; they may contain rolled-back rows."""
+    session.info.get(_GRAPHS_KEY, {}).clear()
@@ -19,6 +19,7 @@ from src.database.models.navigation import (
 from src.database.models.session import GameSession
 from src.database.models.world import Location
 from src.managers.base import BaseManager
+from src.managers.zone_graph import invalidate_zone_graph
 
 
 class ZoneManager(BaseManager):
@@ -191,7 +192,52 @@ class ZoneManager(BaseManager):
             description=description,
         )
         self.db.add(connection)
+        self.db.flush()  # Drops the cached zone graph
+        return connection
+
+    def set_connection_passable(
+        self,
+        from_zone_key: str,
+        to_zone_key: str,
+        is_passable: bool,
+    ) -> ZoneConnection | None:
+        """Open or close the connection between two zones.
+
+        Matches a connection in either direction, so closing a bridge
+        closes it both ways. Pathfinding picks up the change immediately.
+
+        Args:
+            from_zone_key: One end of the connection.
+            to_zone_key: Other end of the connection.
+            is_passable: Whether the connection can be crossed.
+
+        Returns:
+            Updated ZoneConnection, or None if no such connection exists.
+        """
+        from_zone = self.get_zone(from_zone_key)
+        to_zone = self.get_zone(to_zone_key)
+        if from_zone is None or to_zone is None:
+            return None
+
+        connection = (
+            self.db.query(ZoneConnection)
+            .filter(
+                ZoneConnection.session_id == self.session_id,
+                or_(
+                    (ZoneConnection.from_zone_id == from_zone.id)
+                    & (ZoneConnection.to_zone_id == to_zone.id),
+                    (ZoneConnection.from_zone_id == to_zone.id)
+                    & (ZoneConnection.to_zone_id == from_zone.id),
+                ),
+            )
+            .first()
+        )
+        if connection is None:
+            return None
+
+        connection.is_passable = is_passable
         self.db.flush()
+        invalidate_zone_graph(self.db, self.session_id)
         return connection
 
     def get_adjacent_zones(self, zone_key: str) -> list[TerrainZone]:
@@ -15,6 +15,7 @@ import logging
 import re
 from typing import TYPE_CHECKING
 
+from src.gm.narrative_scanner import PhraseIndex
 from src.world.schemas import (
     EntityRef,
     InvalidReference,
@@ -74,6 +75,21 @@ class NarratorValidator:
                     if word not in self._name_to_key:
                         self._name_to_key[word] = key
 
+        # Names and significant name words, all found in one pass per text
+        self._name_parts: dict[str, list[str]] = {
+            key: [
+                part
+                for part in entity.display_name.lower().split()
+                if len(part) > 3 and part not in {"the", "and", "for", "with", "from"}
+            ]
+            for key, entity in self.manifest.entities.items()
+        }
+        self._phrases = PhraseIndex(
+            phrase
+            for key, entity in self.manifest.entities.items()
+            for phrase in (entity.display_name.lower(), *self._name_parts[key])
+        )
+
     def validate(self, text: str) -> ValidationResult:
         """Validate narrator output.
 
@@ -165,6 +181,7 @@ class NarratorValidator:
         """
         errors = []
         text_lower = text.lower()
+        positions = self._phrases.first_positions(text_lower)
 
         # Get the keys that were properly used
         used_keys = {key for key, _ in keyed_refs}
@@ -178,14 +195,26 @@ class NarratorValidator:
             # Check for display name mention (simple name like "cottage")
             display_lower = entity.display_name.lower()
 
-            # Use word boundary to find standalone mentions
-            pattern = rf"\b{re.escape(display_lower)}\b"
-            if re.search(pattern, text_lower):
-                # Check it's not inside a [key:text] reference
-                # by looking for the key nearby
-                match = re.search(pattern, text_lower)
-                if match:
-                    pos = match.start()
+            # First standalone (whole-word) mention
+            pos = positions.get(display_lower)
+            if pos is not None:
+                # Check if there's a [key: pattern within 50 chars before
+                before_text = text[max(0, pos - 50) : pos]
+                if f"[{key}:" not in before_text.lower():
+                    errors.append(
+                        UnkeyedReference(
+                            entity_key=key,
+                            display_name=entity.display_name,
+                            error=f"'{entity.display_name}' mentioned without [key:text] format. Use [{key}:{entity.display_name}].",
+                        )
+                    )
+                    continue
+
+            # Check for significant name parts for NPCs
+            # (first name, last name - not just articles)
+            for part in self._name_parts[key]:
+                pos = positions.get(part)
+                if pos is not None:
                     # Check if there's a [key: pattern within 50 chars before
                     before_text = text[max(0, pos - 50) : pos]
                     if f"[{key}:" not in before_text.lower():
@@ -193,32 +222,9 @@ class NarratorValidator:
                             UnkeyedReference(
                                 entity_key=key,
                                 display_name=entity.display_name,
-                                error=f"'{entity.display_name}' mentioned without [key:text] format. Use [{key}:{entity.display_name}].",
+                                error=f"'{part}' (from {entity.display_name}) mentioned without [key:text] format. Use [{key}:{part}].",
                             )
                         )
-                        continue
-
-            # Check for significant name parts for NPCs
-            # (first name, last name - not just articles)
-            name_parts = display_lower.split()
-            for part in name_parts:
-                if len(part) > 3 and part not in {"the", "and", "for", "with", "from"}:
-                    # Check if this part appears as a standalone word
-                    pattern = rf"\b{re.escape(part)}\b"
-                    if re.search(pattern, text_lower):
-                        match = re.search(pattern, text_lower)
-                        if match:
-                            pos = match.start()
-                            # Check if there's a [key: pattern within 50 chars before
-                            before_text = text[max(0, pos - 50) : pos]
-                            if f"[{key}:" not in before_text.lower():
-                                errors.append(
-                                    UnkeyedReference(
-                                        entity_key=key,
-                                        display_name=entity.display_name,
-                                        error=f"'{part}' (from {entity.display_name}) mentioned without [key:text] format. Use [{key}:{part}].",
-                                    )
-                                )
-                                break  # Only report once per entity
+                        break  # Only report once per entity
 
         return errors
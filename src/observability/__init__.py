@@ -1,7 +1,8 @@
 """Observability module for GM pipeline monitoring.
 
 Provides hooks and observers for real-time visibility into pipeline phases,
-LLM calls, tool executions, and validation steps.
+LLM calls, tool executions, and validation steps, plus nested tracing spans
+with latency histograms and JSONL trace export.
 """
 
 from src.observability.events import (
@@ -19,6 +20,9 @@ from src.observability.hooks import (
     CompositeHook,
 )
 from src.observability.console_observer import RichConsoleObserver
+from src.observability.tracing import Span, Tracer, current_span
+from src.observability.histogram import LatencyHistogram, LatencyHistogramHook
+from src.observability.jsonl_exporter import JSONLTraceExporter
 
 __all__ = [
     # Events
@@ -35,4 +39,11 @@ __all__ = [
     "CompositeHook",
     # Observers
     "RichConsoleObserver",
+    # Tracing
+    "Span",
+    "Tracer",
+    "current_span",
+    "LatencyHistogram",
+    "LatencyHistogramHook",
+    "JSONLTraceExporter",
 ]
@@ -16,6 +16,10 @@ class PhaseStartEvent:
     phase: str
     timestamp: datetime = field(default_factory=datetime.now)
     details: dict[str, Any] = field(default_factory=dict)
+    # Set for spans emitted by a Tracer
+    trace_id: str | None = None
+    span_id: str | None = None
+    parent_id: str | None = None
 
 
 @dataclass
@@ -27,6 +31,10 @@ class PhaseEndEvent:
     success: bool = True
     timestamp: datetime = field(default_factory=datetime.now)
     details: dict[str, Any] = field(default_factory=dict)
+    # Set for spans emitted by a Tracer
+    trace_id: str | None = None
+    span_id: str | None = None
+    parent_id: str | None = None
 
 
 @dataclass
@@ -0,0 +1,161 @@
+"""Latency histograms for observability hooks.
+
+LatencyHistogram buckets values the way HdrHistogram does: exact below
+a threshold, then log-linear, so every bucket is within a fixed relative
+error of the values in it and percentiles stay accurate from
+sub-millisecond cache lookups to multi-second LLM calls without keeping
+individual samples.
+"""
+
+import math
+from collections import defaultdict
+from typing import Any
+
+from src.observability.events import PhaseEndEvent
+from src.observability.hooks import NullHook
+
+
+class LatencyHistogram:
+    """Log-linear histogram of latencies in milliseconds.
+
+    Values are stored as whole microseconds. Below 2**sub_bucket_bits
+    microseconds every value has its own bucket; above, each power of two
+    is split into 2**(sub_bucket_bits - 1) buckets, so reported
+    percentiles are within 1/2**(sub_bucket_bits - 1) of the true value
+    (1.6% with the default 7 bits).
+
+    Args:
+        sub_bucket_bits: Precision in bits.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 7) -> None:
+        """Initialize an empty histogram.
+
+        Args:
+            sub_bucket_bits: Precision in bits.
+        """
+        self.sub_bucket_bits = sub_bucket_bits
+        self._sub_bucket_count = 1 << sub_bucket_bits
+        self._half_count = self._sub_bucket_count >> 1
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us: int | None = None
+        self.max_us = 0
+
+    def _index(self, value_us: int) -> int:
+        """Bucket index for a value."""
+        if value_us < self._sub_bucket_count:
+            return value_us
+        shift = value_us.bit_length() - self.sub_bucket_bits
+        return (
+            self._sub_bucket_count
+            + (shift - 1) * self._half_count
+            + (value_us >> shift)
+            - self._half_count
+        )
+
+    def _highest_value(self, index: int) -> int:
+        """Largest value that falls into a bucket."""
+        if index < self._sub_bucket_count:
+            return index
+        shift, offset = divmod(index - self._sub_bucket_count, self._half_count)
+        return ((offset + self._half_count + 1) << (shift + 1)) - 1
+
+    def record(self, value_ms: float) -> None:
+        """Record one latency.
+
+        Args:
+            value_ms: Latency in milliseconds (negative values count as 0).
+        """
+        value_us = max(0, round(value_ms * 1000))
+        index = self._index(value_us)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total_us += value_us
+        self.min_us = value_us if self.min_us is None else min(self.min_us, value_us)
+        self.max_us = max(self.max_us, value_us)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's values to this one.
+
+        Args:
+            other: Histogram with the same precision.
+
+        Raises:
+            ValueError: If the precisions differ.
+        """
+        if other.sub_bucket_bits != self.sub_bucket_bits:
+            raise ValueError("Cannot merge histograms with different precision")
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total_us += other.total_us
+        if other.min_us is not None:
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+        self.max_us = max(self.max_us, other.max_us)
+
+    def percentile(self, percent: float) -> float:
+        """Latency at or below which a percentage of values fall.
+
+        Args:
+            percent: Percentile, 0-100.
+
+        Returns:
+            Latency in milliseconds (0.0 for an empty histogram).
+        """
+        if not self.count:
+            return 0.0
+        target = max(1, math.ceil(percent / 100 * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._highest_value(index), self.max_us) / 1000
+        return self.max_us / 1000
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in milliseconds."""
+        return self.total_us / self.count / 1000 if self.count else 0.0
+
+    def summary(self) -> dict[str, float]:
+        """Count, mean, p50, p95, p99 and max in milliseconds."""
+        return {
+            "count": self.count,
+            "mean": round(self.mean, 3),
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max_us / 1000,
+        }
+
+
+class LatencyHistogramHook(NullHook):
+    """Hook keeping a latency histogram per phase name.
+
+    Args:
+        sub_bucket_bits: Histogram precision in bits.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 7) -> None:
+        """Initialize with no recorded phases.
+
+        Args:
+            sub_bucket_bits: Histogram precision in bits.
+        """
+        self.histograms: defaultdict[str, LatencyHistogram] = defaultdict(
+            lambda: LatencyHistogram(sub_bucket_bits)
+        )
+
+    def on_phase_end(self, event: PhaseEndEvent) -> None:
+        """Record the phase's duration."""
+        self.histograms[event.phase].record(event.duration_ms)
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Per-phase latency summaries, keyed by phase name."""
+        return {phase: hist.summary() for phase, hist in sorted(self.histograms.items())}
+
+    def reset(self) -> None:
+        """Discard all recorded latencies."""
+        self.histograms.clear()
@@ -0,0 +1,69 @@
+"""JSONL trace exporter.
+
+Writes every finished span as one JSON object per line, so a slow turn
+can be reconstructed from its trace_id and parent_id links, e.g.:
+
+    {"trace_id": "...", "span_id": "...", "parent_id": "...", "name": "manifest",
+     "start": "2025-01-01T12:00:00.000000", "duration_ms": 12.5, "success": true,
+     "attributes": {"session_id": 1, "turn": 3, "location": "market_square"}}
+"""
+
+import json
+import threading
+from datetime import timedelta
+from pathlib import Path
+from typing import IO
+
+from src.observability.events import PhaseEndEvent
+from src.observability.hooks import NullHook
+
+
+class JSONLTraceExporter(NullHook):
+    """Hook appending finished spans to a JSONL file.
+
+    Lines are buffered and flushed whenever a root span (e.g. a whole
+    turn) ends. Phase events not emitted by a Tracer are ignored.
+
+    Args:
+        path: File to append to (parent directories are created).
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the exporter; the file is opened on the first span.
+
+        Args:
+            path: File to append to.
+        """
+        self.path = Path(path)
+        self._file: IO[str] | None = None
+        self._lock = threading.Lock()
+
+    def on_phase_end(self, event: PhaseEndEvent) -> None:
+        """Write the finished span."""
+        if event.span_id is None:
+            return
+        record = {
+            "trace_id": event.trace_id,
+            "span_id": event.span_id,
+            "parent_id": event.parent_id,
+            "name": event.phase,
+            "start": (event.timestamp - timedelta(milliseconds=event.duration_ms)).isoformat(),
+            "duration_ms": round(event.duration_ms, 3),
+            "success": event.success,
+            "attributes": event.details,
+        }
+        line = json.dumps(record, default=str)
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("a", encoding="utf-8")
+            self._file.write(line + "\n")
+            if event.parent_id is None:
+                self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,152 @@
+"""Nested tracing spans for pipeline phases.
+
+A Tracer turns ``with tracer.span("name", key=value):`` blocks into
+PhaseStartEvent/PhaseEndEvent pairs on an ObservabilityHook. The open
+span is tracked in a context variable, so spans opened in awaited
+coroutines, and in tasks created inside a span, nest under it. Child
+spans inherit their parent's attributes (e.g. session, turn and location
+set on the turn span).
+
+Without a hook, span() does nothing, so instrumented code costs next to
+nothing when tracing is off.
+"""
+
+import contextvars
+import secrets
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+from src.observability.events import PhaseEndEvent, PhaseStartEvent
+from src.observability.hooks import ObservabilityHook
+
+
+@dataclass
+class Span:
+    """An open tracing span.
+
+    Attributes:
+        name: Phase name (e.g. "turn", "manifest", "llm.complete").
+        trace_id: ID shared by every span under the same root.
+        span_id: ID of this span.
+        parent_id: ID of the enclosing span, None for a root span.
+        attributes: Key/value details, inherited by child spans.
+        success: False if the span's block raised or fail() was called.
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    success: bool = True
+    start: float = field(default_factory=time.perf_counter)
+
+    def set(self, **attributes: Any) -> None:
+        """Add attributes to the span (not to already-open children)."""
+        self.attributes.update(attributes)
+
+    def fail(self, error: str) -> None:
+        """Mark the span failed without raising (e.g. a handled error)."""
+        self.success = False
+        self.attributes["error"] = error
+
+
+class _NullSpan:
+    """Span yielded when tracing is disabled."""
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+    def fail(self, error: str) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+_current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+
+def current_span() -> Span | None:
+    """Get the innermost open span in this context, if any."""
+    return _current_span.get()
+
+
+class Tracer:
+    """Emits nested spans to an observability hook.
+
+    Args:
+        hook: Hook receiving span start/end events (None disables tracing).
+    """
+
+    def __init__(self, hook: ObservabilityHook | None = None) -> None:
+        """Initialize the tracer.
+
+        Args:
+            hook: Hook receiving span start/end events (None disables tracing).
+        """
+        self.hook = hook
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are emitted."""
+        return self.hook is not None
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span | _NullSpan]:
+        """Open a span around a block.
+
+        The span ends when the block exits; if it raises, the span is
+        marked failed with the exception type as its "error" attribute.
+
+        Args:
+            name: Phase name.
+            **attributes: Span attributes.
+
+        Yields:
+            The span, for adding attributes with set().
+        """
+        if self.hook is None:
+            yield _NULL_SPAN
+            return
+
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else secrets.token_hex(16),
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            attributes={**parent.attributes, **attributes} if parent else dict(attributes),
+        )
+        token = _current_span.set(span)
+        self.hook.on_phase_start(
+            PhaseStartEvent(
+                phase=name,
+                details=dict(span.attributes),
+                trace_id=span.trace_id,
+                span_id=span.span_id,
+                parent_id=span.parent_id,
+            )
+        )
+        try:
+            yield span
+        except BaseException as e:
+            span.success = False
+            span.attributes.setdefault("error", type(e).__name__)
+            raise
+        finally:
+            _current_span.reset(token)
+            self.hook.on_phase_end(
+                PhaseEndEvent(
+                    phase=name,
+                    duration_ms=(time.perf_counter() - span.start) * 1000,
+                    success=span.success,
+                    details=span.attributes,
+                    trace_id=span.trace_id,
+                    span_id=span.span_id,
+                    parent_id=span.parent_id,
+                )
+            )
@@ -22,8 +22,9 @@ from sqlalchemy import or_
 from src.database.models.enums import DayOfWeek, EntityType
 from src.database.models.entities import Entity, NPCExtension
 from src.database.models.relationships import Relationship
-from src.database.models.world import Location, Schedule, TimeState
+from src.database.models.world import Location, TimeState
 from src.managers.base import BaseManager
+from src.managers.schedule_index import get_schedule_index
 from src.world.constraints import RealisticConstraintChecker
 from src.world.schemas import (
     ConstraintResult,
@@ -167,97 +168,20 @@ class WorldMechanics(BaseManager):
             List of NPCPlacement for scheduled NPCs.
         """
         time_state = self.get_time_state()
-        current_time = time_state.current_time
         current_day = self.get_day_of_week()
 
-        # Query all schedules for this location
-        schedules = (
-            self.db.query(Schedule)
-            .filter(Schedule.location_key == location_key)
-            .all()
-        )
-
-        placements = []
-        for schedule in schedules:
-            # Check if day matches
-            if not self._day_matches(current_day, schedule.day_pattern):
-                continue
-
-            # Check if time is in range
-            if not self._time_in_range(
-                current_time,
-                schedule.start_time,
-                schedule.end_time,
-            ):
-                continue
-
-            # Get the entity
-            entity = self.db.query(Entity).filter(
-                Entity.id == schedule.entity_id,
-                Entity.session_id == self.session_id,
-            ).first()
-
-            if entity is None:
-                continue
-
-            # Create placement
-            placement = NPCPlacement(
-                entity_key=entity.entity_key,
+        index = get_schedule_index(self.db, self.session_id)
+        return [
+            NPCPlacement(
+                entity_key=entry.entity_key,
                 presence_reason=PresenceReason.SCHEDULE,
-                presence_justification=f"Scheduled: {schedule.activity}",
-                activity=schedule.activity,
+                presence_justification=f"Scheduled: {entry.activity}",
+                activity=entry.activity,
                 mood="neutral",
                 position_in_scene="at their usual spot",
             )
-            placements.append(placement)
-
-        return placements
-
-    def _day_matches(self, current_day: DayOfWeek, pattern: DayOfWeek) -> bool:
-        """Check if current day matches schedule pattern.
-
-        Args:
-            current_day: The current day of week.
-            pattern: The schedule's day pattern.
-
-        Returns:
-            True if day matches pattern.
-        """
-        if pattern == DayOfWeek.DAILY:
-            return True
-        if pattern == DayOfWeek.WEEKDAY:
-            return current_day in WEEKDAYS
-        if pattern == DayOfWeek.WEEKEND:
-            return current_day in WEEKEND
-        return current_day == pattern
-
-    def _time_in_range(self, current: str, start: str, end: str) -> bool:
-        """Check if current time is within schedule range.
-
-        Handles midnight crossing (e.g., 22:00 to 06:00).
-
-        Args:
-            current: Current time in HH:MM format.
-            start: Range start in HH:MM format.
-            end: Range end in HH:MM format.
-
-        Returns:
-            True if current is in range.
-        """
-        def to_minutes(t: str) -> int:
-            h, m = map(int, t.split(":"))
-            return h * 60 + m
-
-        current_mins = to_minutes(current)
-        start_mins = to_minutes(start)
-        end_mins = to_minutes(end)
-
-        if start_mins <= end_mins:
-            # Same day range
-            return start_mins <= current_mins < end_mins
-        else:
-            # Crosses midnight
-            return current_mins >= start_mins or current_mins < end_mins
+            for entry in index.at_location(location_key, current_day, time_state.current_time)
+        ]
 
     # =========================================================================
     # Resident NPCs
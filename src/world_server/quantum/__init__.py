@@ -12,6 +12,7 @@ Key Components:
 - GMDecisionOracle: Predicts whether GM would add a twist
 - BranchGenerator: Generates narrative variants for each branch
 - QuantumBranchCache: LRU cache for pre-generated branches
+- AnticipationScheduler: Runs background generation concurrently within a budget
 - BranchCollapseManager: Rolls dice and commits selected branch
 - QuantumPipeline: Main entry point for turn processing
 
@@ -32,7 +33,7 @@ from src.world_server.quantum.schemas import (
     QuantumMetrics,
 )
 from src.world_server.quantum.action_predictor import ActionPredictor
-from src.world_server.quantum.action_matcher import ActionMatcher, MatchResult
+from src.world_server.quantum.action_matcher import ActionMatcher, MatchResult, PredictionIndex
 from src.world_server.quantum.intent import (
     IntentType,
     IntentClassification,
@@ -95,10 +96,35 @@ from src.world_server.quantum.cleanup import (
     replace_entity_key,
     add_entity_ref,
 )
+from src.world_server.quantum.streaming import StreamingNarrative
+from src.world_server.quantum.speculation import (
+    SpeculationPolicy,
+    SpeculationReport,
+    SpeculativeNarration,
+)
 from src.world_server.quantum.cache import (
     QuantumBranchCache,
     CacheEntry,
 )
+from src.world_server.quantum.topic_index import (
+    TopicIndex,
+    TopicVectorizer,
+    calibrate_threshold,
+    dialogue_topic,
+)
+from src.world_server.quantum.branch_store import (
+    BranchStore,
+    SQLiteBranchStore,
+    compute_world_fingerprint,
+    serialize_branch,
+    deserialize_branch,
+)
+from src.world_server.quantum.versioning import (
+    WorldVersionIndex,
+    VersionVector,
+    branch_refs,
+    delta_refs,
+)
 from src.world_server.quantum.collapse import (
     BranchCollapseManager,
     CollapseResult,
@@ -106,6 +132,11 @@ from src.world_server.quantum.collapse import (
     strip_entity_references,
     extract_entity_references,
 )
+from src.world_server.quantum.anticipation import (
+    AnticipationJob,
+    AnticipationScheduler,
+    SchedulerStats,
+)
 from src.world_server.quantum.pipeline import (
     QuantumPipeline,
     TurnResult,
@@ -145,6 +176,7 @@ __all__ = [
     # Action Prediction
     "ActionPredictor",
     "ActionMatcher",
+    "PredictionIndex",
     "MatchResult",
     # Intent Classification (Phase 1)
     "IntentType",
@@ -203,9 +235,29 @@ __all__ = [
     "validate_entity_refs",
     "replace_entity_key",
     "add_entity_ref",
+    # Streaming
+    "StreamingNarrative",
+    # Speculation
+    "SpeculationPolicy",
+    "SpeculationReport",
+    "SpeculativeNarration",
     # Cache
     "QuantumBranchCache",
     "CacheEntry",
+    "TopicIndex",
+    "TopicVectorizer",
+    "calibrate_threshold",
+    "dialogue_topic",
+    "BranchStore",
+    "SQLiteBranchStore",
+    "compute_world_fingerprint",
+    "serialize_branch",
+    "deserialize_branch",
+    # Versioning
+    "WorldVersionIndex",
+    "VersionVector",
+    "branch_refs",
+    "delta_refs",
     # Collapse
     "BranchCollapseManager",
     "CollapseResult",
@@ -216,6 +268,9 @@ __all__ = [
     "QuantumPipeline",
     "TurnResult",
     "AnticipationConfig",
+    "AnticipationJob",
+    "AnticipationScheduler",
+    "SchedulerStats",
     # Validation
     "IssueSeverity",
     "ValidationIssue",
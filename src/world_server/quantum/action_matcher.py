@@ -9,12 +9,21 @@ matching strategies:
 
 The matcher returns the best matching prediction with a confidence
 score, or None if no good match is found.
+
+Predictions are compiled once per (prediction list, manifest) into a
+PredictionIndex: precompiled regexes, pattern words and target names,
+plus an inverted index over action types, words and character trigrams.
+Each input only scores the predictions it shares a word or trigram
+with, plus those a verb or fuzzy target match could still lift to the
+confidence threshold.
 """
 
 import logging
 import re
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from difflib import SequenceMatcher
+from functools import lru_cache
 
 from src.gm.grounding import GroundingManifest
 from src.world_server.quantum.schemas import ActionType, ActionPrediction
@@ -90,6 +99,144 @@ ACTION_VERBS = {
 # Stopwords to ignore in matching
 STOPWORDS = {"the", "a", "an", "to", "at", "in", "on", "with", "and", "or", "i", "my"}
 
+# Regex syntax stripped from patterns to get their plain words
+REGEX_SYNTAX = re.compile(r"[\\^$.*+?{}|()\[\]]")
+
+# Character n-gram size for the inverted index
+NGRAM_SIZE = 3
+
+
+@lru_cache(maxsize=1024)
+def normalize_input(text: str) -> str:
+    """Normalize input text for matching.
+
+    Args:
+        text: Raw input text
+
+    Returns:
+        Normalized lowercase text with punctuation (except apostrophes)
+        removed and whitespace collapsed
+    """
+    # Lowercase and strip
+    text = text.lower().strip()
+
+    # Remove punctuation except apostrophes
+    text = re.sub(r"[^\w\s']", " ", text)
+
+    # Collapse whitespace and strip trailing
+    return re.sub(r"\s+", " ", text).strip()
+
+
+@lru_cache(maxsize=1024)
+def extract_verb_and_target(normalized: str) -> tuple[str | None, str | None]:
+    """Extract action verb and target from normalized input.
+
+    Args:
+        normalized: Normalized input text
+
+    Returns:
+        Tuple of (verb, target_text) - either may be None
+    """
+    words = normalized.split()
+    if not words:
+        return None, None
+
+    verb = None
+    target_start = 0
+
+    # Find first action verb
+    for i, word in enumerate(words):
+        if word in ACTION_VERBS:
+            verb = word
+            target_start = i + 1
+            break
+
+    # Extract target (rest of sentence minus stopwords)
+    target_text = None
+    if target_start < len(words):
+        target_words = [w for w in words[target_start:] if w not in STOPWORDS]
+        target_text = " ".join(target_words) if target_words else None
+
+    return verb, target_text
+
+
+def index_keys(text: str) -> set[str]:
+    """Get inverted-index keys for text: its words and their character trigrams.
+
+    Args:
+        text: Lowercase text
+
+    Returns:
+        Set of keys ("w:<word>" and "g:<trigram>")
+    """
+    keys = set()
+    for word in text.split():
+        keys.add(f"w:{word}")
+        for i in range(len(word) - NGRAM_SIZE + 1):
+            keys.add(f"g:{word[i:i + NGRAM_SIZE]}")
+    return keys
+
+
+@dataclass
+class CompiledPrediction:
+    """A prediction with its patterns and target name precomputed."""
+
+    prediction: ActionPrediction
+    regexes: list[re.Pattern]
+    pattern_words: list[set[str]]  # Plain words per pattern, minus stopwords
+    target_name: str | None  # Lowercase display name of the target entity
+    target_matcher: SequenceMatcher | None  # Holds target_name as its second sequence
+    always_candidate: bool  # Patterns can't be indexed by their words
+
+
+@dataclass
+class PredictionIndex:
+    """Predictions compiled for matching against one manifest.
+
+    Build with ActionMatcher.compile(); match() and match_all() compile
+    (and cache) one automatically.
+    """
+
+    predictions: list[ActionPrediction]
+    manifest: GroundingManifest
+    entries: list[CompiledPrediction] = field(default_factory=list)
+    postings: dict[str, set[int]] = field(default_factory=dict)  # key -> entry indices
+    by_action_type: dict[ActionType, list[int]] = field(default_factory=dict)
+    with_target: list[int] = field(default_factory=list)
+    always: list[int] = field(default_factory=list)
+
+    def candidates(
+        self,
+        normalized: str,
+        verb: str | None,
+        target_text: str | None,
+        include_verb_matches: bool,
+        include_targets: bool = False,
+    ) -> list[int]:
+        """Get the entries an input can score against, in prediction order.
+
+        Args:
+            normalized: Normalized input text
+            verb: Extracted action verb
+            target_text: Extracted target text
+            include_verb_matches: Include every prediction of the verb's action type
+            include_targets: Include every prediction with a target (a fuzzy
+                target match needs no shared trigram)
+
+        Returns:
+            Entry indices sharing a word, trigram or verb with the input
+        """
+        found: set[int] = set(self.always)
+        for key in index_keys(normalized):
+            found.update(self.postings.get(key, ()))
+        if target_text and (include_targets or len(target_text) < NGRAM_SIZE):
+            # Fuzzy matches need no shared trigram, and a target too short
+            # for trigrams may still be contained in a name
+            found.update(self.with_target)
+        if include_verb_matches and verb:
+            found.update(self.by_action_type.get(ACTION_VERBS[verb], ()))
+        return sorted(found)
+
 
 @dataclass
 class MatchResult:
@@ -113,6 +260,9 @@ class ActionMatcher:
     - Verb match: 0.2 weight
     """
 
+    # Compiled prediction indexes kept (one per recent prediction list)
+    INDEX_CACHE_SIZE = 8
+
     def __init__(
         self,
         pattern_weight: float = 0.4,
@@ -129,6 +279,7 @@ class ActionMatcher:
         self.pattern_weight = pattern_weight
         self.target_weight = target_weight
         self.verb_weight = verb_weight
+        self._index_cache: OrderedDict[tuple, PredictionIndex] = OrderedDict()
 
     def match(
         self,
@@ -151,27 +302,9 @@ class ActionMatcher:
         if not player_input or not predictions:
             return None
 
-        # Normalize input
-        normalized = self._normalize(player_input)
-
-        # Extract action verb and target
-        verb, target_text = self._extract_verb_and_target(normalized)
-
-        # Score each prediction
-        results: list[MatchResult] = []
-
-        for pred in predictions:
-            score, reason = self._score_prediction(
-                normalized, verb, target_text, pred, manifest
-            )
-
-            if score >= min_confidence:
-                results.append(MatchResult(
-                    prediction=pred,
-                    confidence=score,
-                    match_reason=reason,
-                ))
-
+        results = self._score_candidates(
+            player_input, predictions, manifest, min_confidence, best_only=True
+        )
         if not results:
             return None
 
@@ -213,28 +346,162 @@ class ActionMatcher:
         if not player_input or not predictions:
             return []
 
+        results = self._score_candidates(player_input, predictions, manifest, min_confidence)
+        results.sort(reverse=True)
+        return results[:max_results]
+
+    def compile(
+        self,
+        predictions: list[ActionPrediction],
+        manifest: GroundingManifest,
+    ) -> PredictionIndex:
+        """Compile predictions into an index for matching.
+
+        The index is cached for the exact prediction list and manifest,
+        so repeated matches against the same predictions reuse it.
+
+        Args:
+            predictions: Predictions to index
+            manifest: Grounding manifest for target names
+
+        Returns:
+            PredictionIndex for these predictions
+        """
+        cache_key = (id(manifest), tuple(id(pred) for pred in predictions))
+        index = self._index_cache.get(cache_key)
+        if index is not None:
+            self._index_cache.move_to_end(cache_key)
+            return index
+
+        index = PredictionIndex(predictions=list(predictions), manifest=manifest)
+        for i, pred in enumerate(predictions):
+            entry = self._compile_prediction(pred, manifest)
+            index.entries.append(entry)
+
+            keys: set[str] = set()
+            for words in entry.pattern_words:
+                keys.update(index_keys(" ".join(words)))
+            if entry.target_name:
+                keys.update(index_keys(entry.target_name))
+                index.with_target.append(i)
+            for key in keys:
+                index.postings.setdefault(key, set()).add(i)
+
+            index.by_action_type.setdefault(pred.action_type, []).append(i)
+            if entry.always_candidate or (
+                entry.target_name and len(entry.target_name) < NGRAM_SIZE
+            ):
+                index.always.append(i)
+
+        # Cached entries hold references to their predictions and manifest,
+        # so the ids in their keys can't be reused while cached
+        self._index_cache[cache_key] = index
+        if len(self._index_cache) > self.INDEX_CACHE_SIZE:
+            self._index_cache.popitem(last=False)
+        return index
+
+    def _compile_prediction(
+        self, pred: ActionPrediction, manifest: GroundingManifest
+    ) -> CompiledPrediction:
+        """Precompute a prediction's regexes, pattern words and target name."""
+        regexes: list[re.Pattern] = []
+        pattern_words: list[set[str]] = []
+        always_candidate = False
+
+        for pattern in pred.input_patterns:
+            try:
+                regexes.append(re.compile(pattern, re.IGNORECASE))
+            except re.error:
+                # Invalid regex pattern
+                pass
+
+            plain = REGEX_SYNTAX.sub(" ", pattern)
+            words = set(plain.split()) - STOPWORDS
+            if words:
+                pattern_words.append(words)
+
+            # Alternations and patterns without a trigram-length word can
+            # match input that shares none of their indexed words
+            if "|" in pattern or all(len(w) < NGRAM_SIZE for w in words):
+                always_candidate = True
+
+        target_name = None
+        if pred.target_key:
+            entity = manifest.get_entity(pred.target_key)
+            if entity:
+                target_name = entity.display_name.lower()
+
+        return CompiledPrediction(
+            prediction=pred,
+            regexes=regexes,
+            pattern_words=pattern_words,
+            target_name=target_name,
+            target_matcher=SequenceMatcher(None, "", target_name) if target_name else None,
+            always_candidate=always_candidate,
+        )
+
+    def _score_candidates(
+        self,
+        player_input: str,
+        predictions: list[ActionPrediction],
+        manifest: GroundingManifest,
+        min_confidence: float,
+        best_only: bool = False,
+    ) -> list[MatchResult]:
+        """Score the indexed candidates for an input.
+
+        Predictions sharing no word or trigram with the input can still
+        score through a verb match plus a fuzzy target match, or a fuzzy
+        target match alone, so those are candidates whenever their weights
+        can reach min_confidence; other predictions are skipped. If nothing
+        is a candidate, every prediction is scored.
+
+        Args:
+            player_input: Raw player input text
+            predictions: Predictions to match against
+            manifest: Grounding manifest
+            min_confidence: Minimum confidence threshold
+            best_only: Only the best match is needed, so the threshold
+                rises to the best score found so far
+
+        Returns:
+            Unsorted MatchResults at or above min_confidence (with
+            best_only, the best match is among them)
+        """
         normalized = self._normalize(player_input)
         verb, target_text = self._extract_verb_and_target(normalized)
+        text_words = set(normalized.split()) - STOPWORDS
+
+        index = self.compile(predictions, manifest)
+        candidates = index.candidates(
+            normalized,
+            verb,
+            target_text,
+            include_verb_matches=min_confidence <= self.verb_weight + self.target_weight,
+            include_targets=min_confidence <= self.target_weight,
+        )
+        if not candidates:
+            candidates = range(len(index.entries))
 
         results: list[MatchResult] = []
-
-        for pred in predictions:
-            score, reason = self._score_prediction(
-                normalized, verb, target_text, pred, manifest
+        threshold = min_confidence
+        for i in candidates:
+            entry = index.entries[i]
+            score, reason = self._score_entry(
+                normalized, text_words, verb, target_text, entry, threshold
             )
-
-            if score >= min_confidence:
+            if score >= threshold:
                 results.append(MatchResult(
-                    prediction=pred,
+                    prediction=entry.prediction,
                     confidence=score,
                     match_reason=reason,
                 ))
-
-        results.sort(reverse=True)
-        return results[:max_results]
+                if best_only:
+                    threshold = score
+        return results
 
     def _normalize(self, text: str) -> str:
-        """Normalize input text for matching.
+        """Normalize input text for matching (memoized).
 
         Args:
             text: Raw input text
@@ -242,21 +509,12 @@ class ActionMatcher:
         Returns:
             Normalized lowercase text with extra whitespace removed
         """
-        # Lowercase and strip
-        text = text.lower().strip()
-
-        # Remove punctuation except apostrophes
-        text = re.sub(r"[^\w\s']", " ", text)
-
-        # Collapse whitespace and strip trailing
-        text = re.sub(r"\s+", " ", text).strip()
-
-        return text
+        return normalize_input(text)
 
     def _extract_verb_and_target(
         self, normalized: str
     ) -> tuple[str | None, str | None]:
-        """Extract action verb and target from input.
+        """Extract action verb and target from input (memoized).
 
         Args:
             normalized: Normalized input text
@@ -264,48 +522,27 @@ class ActionMatcher:
         Returns:
             Tuple of (verb, target_text) - either may be None
         """
-        words = normalized.split()
-        if not words:
-            return None, None
-
-        verb = None
-        target_start = 0
-
-        # Find first action verb
-        for i, word in enumerate(words):
-            if word in ACTION_VERBS:
-                verb = word
-                target_start = i + 1
-                break
-
-        # Extract target (rest of sentence minus stopwords)
-        if target_start < len(words):
-            target_words = [
-                w for w in words[target_start:]
-                if w not in STOPWORDS
-            ]
-            target_text = " ".join(target_words) if target_words else None
-        else:
-            target_text = None
+        return extract_verb_and_target(normalized)
 
-        return verb, target_text
-
-    def _score_prediction(
+    def _score_entry(
         self,
         normalized: str,
+        text_words: set[str],
         verb: str | None,
         target_text: str | None,
-        pred: ActionPrediction,
-        manifest: GroundingManifest,
+        entry: CompiledPrediction,
+        min_confidence: float | None = None,
     ) -> tuple[float, str]:
-        """Score how well a prediction matches the input.
+        """Score how well a compiled prediction matches the input.
 
         Args:
             normalized: Normalized input text
+            text_words: Input words minus stopwords
             verb: Extracted action verb
             target_text: Extracted target text
-            pred: Prediction to score
-            manifest: Grounding manifest
+            entry: Compiled prediction to score
+            min_confidence: Threshold below which the exact score doesn't
+                matter (None = always score fully)
 
         Returns:
             Tuple of (score, primary_match_reason)
@@ -317,36 +554,39 @@ class ActionMatcher:
         }
 
         # Pattern matching
-        for pattern in pred.input_patterns:
-            try:
-                if re.search(pattern, normalized, re.IGNORECASE):
-                    scores["pattern"] = 1.0
-                    break
-            except re.error:
-                # Invalid regex pattern
-                continue
-
-        # Partial pattern matching (if no exact match)
-        if scores["pattern"] == 0.0:
-            scores["pattern"] = self._partial_pattern_score(normalized, pred.input_patterns)
-
-        # Target matching
-        if pred.target_key and target_text:
-            entity = manifest.get_entity(pred.target_key)
-            if entity:
-                scores["target"] = self._fuzzy_match_score(
-                    target_text, entity.display_name.lower()
-                )
+        if any(regex.search(normalized) for regex in entry.regexes):
+            scores["pattern"] = 1.0
+        else:
+            # Partial pattern matching (if no exact match)
+            scores["pattern"] = self._partial_pattern_score(text_words, entry.pattern_words)
 
         # Verb matching
         if verb:
             expected_type = ACTION_VERBS.get(verb)
-            if expected_type == pred.action_type:
+            if expected_type == entry.prediction.action_type:
                 scores["verb"] = 1.0
             elif expected_type is None:
                 # Unknown verb - don't penalize
                 scores["verb"] = 0.5
 
+        # Target matching
+        if entry.target_name and target_text:
+            # Skip the fuzzy match when even a perfect target can't reach
+            # min_confidence; the result is discarded either way
+            reachable = (
+                scores["pattern"] * self.pattern_weight
+                + self.target_weight
+                + scores["verb"] * self.verb_weight
+            )
+            if min_confidence is None:
+                floor = 0.0
+            else:
+                floor = 1.0 - (reachable - min_confidence + 1e-9) / self.target_weight
+            if floor <= 1.0:
+                scores["target"] = self._fuzzy_match_score(
+                    target_text, entry.target_name, entry.target_matcher, floor
+                )
+
         # Calculate weighted score
         total_score = (
             scores["pattern"] * self.pattern_weight +
@@ -367,50 +607,44 @@ class ActionMatcher:
         return total_score, reason
 
     def _partial_pattern_score(
-        self, text: str, patterns: list[str]
+        self, text_words: set[str], pattern_words: list[set[str]]
     ) -> float:
-        """Score partial pattern matches.
+        """Score partial pattern matches by word overlap.
 
         Args:
-            text: Input text
-            patterns: List of regex patterns
+            text_words: Input words minus stopwords
+            pattern_words: Plain words of each pattern, minus stopwords
 
         Returns:
             Score between 0.0 and 0.7 (capped for partial matches)
         """
         best_score = 0.0
 
-        for pattern in patterns:
-            try:
-                # Extract key words from pattern
-                # Remove regex syntax to get plain words
-                plain = re.sub(r"[\\^$.*+?{}|()\[\]]", " ", pattern)
-                plain = re.sub(r"\s+", " ", plain).strip()
-                pattern_words = set(plain.split()) - STOPWORDS
-
-                if not pattern_words:
-                    continue
-
-                text_words = set(text.split()) - STOPWORDS
-
-                # Calculate word overlap
-                overlap = len(pattern_words & text_words)
-                if overlap > 0:
-                    score = overlap / len(pattern_words)
-                    best_score = max(best_score, score)
-
-            except Exception:
-                continue
+        for words in pattern_words:
+            overlap = len(words & text_words)
+            if overlap > 0:
+                best_score = max(best_score, overlap / len(words))
 
         # Cap partial matches at 0.7
         return min(best_score, 0.7)
 
-    def _fuzzy_match_score(self, text1: str, text2: str) -> float:
+    def _fuzzy_match_score(
+        self,
+        text1: str,
+        text2: str,
+        matcher: SequenceMatcher | None = None,
+        floor: float = 0.0,
+    ) -> float:
         """Calculate fuzzy string similarity.
 
         Args:
             text1: First string
             text2: Second string
+            matcher: SequenceMatcher already holding text2 as its second
+                sequence (reuses its precomputed index)
+            floor: Similarity below which the exact value doesn't matter;
+                a lower bound is returned instead when the cheap upper
+                bound already falls short
 
         Returns:
             Similarity score between 0.0 and 1.0
@@ -426,19 +660,24 @@ class ActionMatcher:
         if text1 in text2 or text2 in text1:
             return 0.9
 
-        # Use SequenceMatcher for fuzzy matching
-        ratio = SequenceMatcher(None, text1, text2).ratio()
-
         # Also check word-level matching
         words1 = set(text1.split())
         words2 = set(text2.split())
-
+        word_overlap = 0.0
         if words1 and words2:
             word_overlap = len(words1 & words2) / max(len(words1), len(words2))
-            # Combine character and word matching
-            return max(ratio, word_overlap)
 
-        return ratio
+        # Use SequenceMatcher for fuzzy matching
+        if matcher is None:
+            matcher = SequenceMatcher(None, text1, text2)
+        else:
+            matcher.set_seq1(text1)
+        if floor > word_overlap and matcher.quick_ratio() < floor:
+            return word_overlap
+        ratio = matcher.ratio()
+
+        # Combine character and word matching
+        return max(ratio, word_overlap)
 
     def identify_action_type(self, player_input: str) -> ActionType | None:
         """Identify the action type from input without predictions.
@@ -0,0 +1,334 @@
+"""Anticipation Scheduler for background branch generation.
+
+Replaces the serial generate-one-branch-at-a-time anticipation loop with
+a scheduler that:
+- Ranks jobs in a priority queue by action x GM decision probability
+- Runs generations concurrently, bounded per LLM provider
+- Cancels queued and in-flight work when the player changes location
+- Enforces a per-cycle token and wall-clock budget
+- Tracks queue depth and wasted generations for get_stats()
+
+The scheduler knows nothing about how a branch is generated; the
+pipeline supplies a coroutine that turns an AnticipationJob into a
+QuantumBranch (or None if generation was skipped).
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from src.world_server.quantum.schemas import (
+    ActionPrediction,
+    GMDecision,
+    QuantumBranch,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AnticipationJob:
+    """A single branch to pre-generate."""
+
+    location_key: str
+    action: ActionPrediction
+    gm_decision: GMDecision
+    branch_key: str
+    provider: str = "default"  # Concurrency bucket (LLM provider name)
+    fingerprint: str | None = None  # World state the job was planned for
+    manifest: Any = None  # GroundingManifest shared by a cycle's jobs
+    context: Any = None  # BranchContext shared by a cycle's jobs
+    versions: dict[str, int] | None = None  # Row versions the job was planned on
+
+    @property
+    def priority(self) -> float:
+        """Likelihood this branch is needed (higher runs first)."""
+        return self.action.probability * self.gm_decision.probability
+
+
+@dataclass
+class SchedulerStats:
+    """Counters for scheduler activity."""
+
+    jobs_submitted: int = 0
+    jobs_completed: int = 0
+    jobs_failed: int = 0
+    jobs_dropped: int = 0  # Removed from queue before starting
+    jobs_cancelled: int = 0  # Cancelled while in flight
+    wasted_generations: int = 0  # Finished or cancelled after becoming irrelevant
+    tokens_used: int = 0
+    wasted_tokens: int = 0
+    budget_exhausted_cycles: int = 0
+    cycles_run: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging/display."""
+        return {
+            "jobs_submitted": self.jobs_submitted,
+            "jobs_completed": self.jobs_completed,
+            "jobs_failed": self.jobs_failed,
+            "jobs_dropped": self.jobs_dropped,
+            "jobs_cancelled": self.jobs_cancelled,
+            "wasted_generations": self.wasted_generations,
+            "tokens_used": self.tokens_used,
+            "wasted_tokens": self.wasted_tokens,
+            "budget_exhausted_cycles": self.budget_exhausted_cycles,
+            "cycles_run": self.cycles_run,
+        }
+
+
+GenerateFn = Callable[[AnticipationJob], Awaitable[QuantumBranch | None]]
+
+
+class AnticipationScheduler:
+    """Priority scheduler for background branch generation.
+
+    Usage:
+        scheduler = AnticipationScheduler(generate_fn, max_concurrency=2)
+        scheduler.submit(jobs)
+        await scheduler.run_cycle()
+
+        # When the player moves
+        scheduler.cancel_except(new_location_key)
+    """
+
+    def __init__(
+        self,
+        generate: GenerateFn,
+        max_concurrency: int = 2,
+        provider_limits: dict[str, int] | None = None,
+        cycle_token_budget: int | None = None,
+        cycle_time_budget_seconds: float | None = None,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            generate: Coroutine that generates (and caches) a job's branch
+            max_concurrency: Default concurrent generations per provider
+            provider_limits: Per-provider overrides of max_concurrency
+            cycle_token_budget: Stop starting jobs once a cycle used this many tokens
+            cycle_time_budget_seconds: Cancel a cycle's remaining work after this long
+        """
+        self._generate = generate
+        self.max_concurrency = max(1, max_concurrency)
+        self.provider_limits = provider_limits or {}
+        self.cycle_token_budget = cycle_token_budget
+        self.cycle_time_budget_seconds = cycle_time_budget_seconds
+
+        self._queue: list[tuple[float, int, AnticipationJob]] = []
+        self._queued_keys: set[str] = set()
+        self._counter = itertools.count()
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._in_flight: dict[asyncio.Task, AnticipationJob] = {}
+        self._active_location: str | None = None
+        self._stats = SchedulerStats()
+
+    @property
+    def stats(self) -> SchedulerStats:
+        """Get scheduler counters."""
+        return self._stats
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of jobs waiting to start."""
+        return len(self._queue)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of jobs currently generating."""
+        return len(self._in_flight)
+
+    def submit(self, jobs: list[AnticipationJob]) -> int:
+        """Queue jobs, skipping any already queued or in flight.
+
+        Args:
+            jobs: Jobs to schedule
+
+        Returns:
+            Number of jobs actually queued
+        """
+        running_keys = {job.branch_key for job in self._in_flight.values()}
+        queued = 0
+        for job in jobs:
+            if job.branch_key in self._queued_keys or job.branch_key in running_keys:
+                continue
+            heapq.heappush(self._queue, (-job.priority, next(self._counter), job))
+            self._queued_keys.add(job.branch_key)
+            self._active_location = job.location_key
+            queued += 1
+        self._stats.jobs_submitted += queued
+        return queued
+
+    async def run_cycle(self) -> list[QuantumBranch]:
+        """Run queued jobs until the queue drains or the budget runs out.
+
+        Returns:
+            Branches generated during this cycle
+        """
+        self._stats.cycles_run += 1
+        start = time.perf_counter()
+        tokens_this_cycle = 0
+        generated: list[QuantumBranch] = []
+        budget_hit = False
+
+        while self._queue or self._in_flight:
+            # Launch as many jobs as provider limits allow
+            while self._queue and not budget_hit:
+                if self._token_budget_exhausted(tokens_this_cycle):
+                    budget_hit = True
+                    break
+                job = self._queue[0][2]
+                if self._bucket_full(job.provider):
+                    break
+                heapq.heappop(self._queue)
+                self._queued_keys.discard(job.branch_key)
+                task = asyncio.create_task(self._run_job(job))
+                self._in_flight[task] = job
+
+            if not self._in_flight:
+                break
+
+            timeout = None
+            if self.cycle_time_budget_seconds is not None:
+                timeout = self.cycle_time_budget_seconds - (time.perf_counter() - start)
+                if timeout <= 0:
+                    self._cancel_tasks(list(self._in_flight))
+                    budget_hit = True
+                    break
+
+            done, _ = await asyncio.wait(
+                set(self._in_flight),
+                timeout=timeout,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                job = self._in_flight.pop(task, None)
+                if job is None:
+                    continue  # Cancelled by cancel_except() while we waited
+                branch = self._collect(task, job)
+                if branch is not None:
+                    tokens_this_cycle += branch.tokens_used
+                    generated.append(branch)
+
+        if budget_hit:
+            self._stats.budget_exhausted_cycles += 1
+            logger.debug(
+                f"Anticipation budget exhausted: {tokens_this_cycle} tokens, "
+                f"{time.perf_counter() - start:.1f}s, {self.queue_depth} jobs deferred"
+            )
+
+        return generated
+
+    def cancel_except(self, location_key: str) -> int:
+        """Drop queued jobs and cancel in-flight jobs for other locations.
+
+        Called when the player moves, so work for the old scene stops.
+
+        Args:
+            location_key: The location whose jobs should survive
+
+        Returns:
+            Number of jobs dropped or cancelled
+        """
+        self._active_location = location_key
+        kept = [entry for entry in self._queue if entry[2].location_key == location_key]
+        dropped = len(self._queue) - len(kept)
+        if dropped:
+            heapq.heapify(kept)
+            self._queue = kept
+            self._queued_keys = {entry[2].branch_key for entry in kept}
+            self._stats.jobs_dropped += dropped
+
+        stale_tasks = [
+            task for task, job in self._in_flight.items() if job.location_key != location_key
+        ]
+        self._cancel_tasks(stale_tasks)
+
+        if dropped or stale_tasks:
+            logger.debug(
+                f"Anticipation moved to {location_key}: dropped {dropped}, "
+                f"cancelled {len(stale_tasks)}"
+            )
+        return dropped + len(stale_tasks)
+
+    def cancel_all(self) -> int:
+        """Drop all queued jobs and cancel all in-flight jobs.
+
+        Returns:
+            Number of jobs dropped or cancelled
+        """
+        dropped = len(self._queue)
+        self._queue.clear()
+        self._queued_keys.clear()
+        self._stats.jobs_dropped += dropped
+
+        tasks = list(self._in_flight)
+        self._cancel_tasks(tasks)
+        return dropped + len(tasks)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get scheduler statistics."""
+        return {
+            "queue_depth": self.queue_depth,
+            "in_flight": self.in_flight,
+            "max_concurrency": self.max_concurrency,
+            **self._stats.to_dict(),
+        }
+
+    async def _run_job(self, job: AnticipationJob) -> QuantumBranch | None:
+        """Run a job under its provider's concurrency limit."""
+        async with self._semaphore(job.provider):
+            return await self._generate(job)
+
+    def _collect(self, task: asyncio.Task, job: AnticipationJob) -> QuantumBranch | None:
+        """Record the outcome of a finished task."""
+        if task.cancelled():
+            return None
+
+        error = task.exception()
+        if error is not None:
+            self._stats.jobs_failed += 1
+            logger.warning(f"Anticipation generation failed for {job.branch_key}: {error}")
+            return None
+
+        branch = task.result()
+        if branch is None:
+            return None
+
+        self._stats.jobs_completed += 1
+        self._stats.tokens_used += branch.tokens_used
+        if self._active_location is not None and job.location_key != self._active_location:
+            # Player moved on while this was generating
+            self._stats.wasted_generations += 1
+            self._stats.wasted_tokens += branch.tokens_used
+        return branch
+
+    def _cancel_tasks(self, tasks: list[asyncio.Task]) -> None:
+        """Cancel in-flight tasks and count them as wasted."""
+        for task in tasks:
+            self._in_flight.pop(task, None)
+            if not task.done():
+                task.cancel()
+                self._stats.jobs_cancelled += 1
+                self._stats.wasted_generations += 1
+
+    def _semaphore(self, provider: str) -> asyncio.Semaphore:
+        """Get or create the concurrency limiter for a provider."""
+        if provider not in self._semaphores:
+            limit = self.provider_limits.get(provider, self.max_concurrency)
+            self._semaphores[provider] = asyncio.Semaphore(max(1, limit))
+        return self._semaphores[provider]
+
+    def _bucket_full(self, provider: str) -> bool:
+        """Check whether a provider is already running at its limit."""
+        limit = self.provider_limits.get(provider, self.max_concurrency)
+        running = sum(1 for job in self._in_flight.values() if job.provider == provider)
+        return running >= limit
+
+    def _token_budget_exhausted(self, tokens_used: int) -> bool:
+        """Check whether the cycle's token budget has been spent."""
+        return self.cycle_token_budget is not None and tokens_used >= self.cycle_token_budget
@@ -0,0 +1,655 @@
+"""Turn-Pipeline Benchmark for the Quantum Pipeline.
+
+Measures QuantumPipeline.process_turn latency and throughput without a
+live model:
+
+1. Seeds a world (default: data/worlds/millbrook*) into SQLite via
+   load_complete_world, plus a player entity and time state
+2. Swaps every LLM for a ScriptedProvider with configurable latency,
+   answering intent classification and branch generation from
+   deterministic rules over the prompt
+3. Replays scripted player inputs, committing after each turn like the
+   game loop
+4. Reports p50/p95/p99 per phase and the cache hit rate, as a
+   machine-readable baseline that later runs are compared against
+
+Phases are timed by wrapping pipeline components, so a turn's phase
+time is the sum of its calls (a MOVE builds the destination manifest
+inside generation, which counts toward both).
+
+Usage:
+    report = await run_benchmark(BenchmarkConfig(latency_ms=200))
+    regressions = compare_to_baseline(report, json.loads(baseline_path.read_text()))
+"""
+
+import functools
+import inspect
+import random
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+import src.database.models  # noqa: F401 - register every table
+from src.database.models.base import Base
+from src.database.models.entities import Entity, NPCExtension
+from src.database.models.enums import DayOfWeek, EntityType
+from src.database.models.session import GameSession, Turn
+from src.database.models.world import TimeState
+from src.llm.scripted_provider import ScriptedProvider, ScriptedRequest
+from src.managers.schedule_manager import ScheduleManager
+from src.observability.hooks import ObservabilityHook
+from src.services.world_loader_extended import load_complete_world
+from src.world_server.quantum.pipeline import QuantumPipeline, TurnResult
+
+# Bump when the baseline format changes
+BASELINE_VERSION = 1
+
+DEFAULT_WORLD_DIR = Path(__file__).resolve().parents[3] / "data" / "worlds"
+
+# Phases in turn order; "total" is the whole process_turn call
+PHASES = (
+    "manifest",
+    "prediction",
+    "intent",
+    "cache_lookup",
+    "generation",
+    "collapse",
+    "db_commit",
+    "total",
+)
+
+# A short Millbrook session in the market square (Millbrook locations
+# have no exits, so it stays put). Repeats give the branch cache
+# something to hit.
+DEFAULT_INPUTS = (
+    "look around",
+    "talk to master corin",
+    "look around",
+    "ask old aldric about the well",
+    "wait for a while",
+    "talk to master corin",
+    "look around",
+    "wait for a while",
+    "ask old aldric about the well",
+    "search the stalls for anything unusual",
+)
+
+
+# =============================================================================
+# Scripted Responses
+# =============================================================================
+
+# Input keywords -> action type, checked in order
+_ACTION_KEYWORDS = (
+    (("talk", "ask", "speak", "greet", "chat"), "interact_npc"),
+    (("go ", "walk", "head ", "enter", "leave", "travel"), "move"),
+    (("take", "pick up", "grab", "use "), "manipulate_item"),
+    (("wait", "rest", "sit"), "wait"),
+    (("look", "examine", "search", "observe", "inspect"), "observe"),
+)
+
+
+def _prompt_line(prompt: str, prefix: str) -> str:
+    """Get the rest of the first prompt line starting with prefix."""
+    for line in prompt.splitlines():
+        if line.startswith(prefix):
+            return line[len(prefix) :].strip()
+    return ""
+
+
+def _find_target(player_input: str, names: list[str]) -> str | None:
+    """Pick the scene name sharing a significant word with the input."""
+    words = set(re.findall(r"[a-z']+", player_input.lower()))
+    for name in names:
+        name_words = {w for w in re.findall(r"[a-z']+", name.lower()) if len(w) > 3}
+        if name_words & words:
+            return name
+    return None
+
+
+def classify_intent(request: ScriptedRequest) -> dict[str, Any]:
+    """Answer IntentClassificationResponse from keywords in the prompt."""
+    prompt = request.prompt
+    player_input = _prompt_line(prompt, "## Player Input").strip('"')
+    if not player_input:
+        match = re.search(r'## Player Input\s*\n"(.*)"', prompt)
+        player_input = match.group(1) if match else ""
+    lowered = player_input.lower()
+
+    if lowered.endswith("?"):
+        return {"intent_type": "question", "confidence": 0.9}
+
+    action_type = next(
+        (
+            mapped
+            for keywords, mapped in _ACTION_KEYWORDS
+            if any(keyword in f"{lowered} " for keyword in keywords)
+        ),
+        None,
+    )
+    if action_type is None:
+        return {"intent_type": "action", "confidence": 0.5, "action_type": "skill_use"}
+
+    names = {
+        "interact_npc": _prompt_line(prompt, "NPCs present:"),
+        "manipulate_item": _prompt_line(prompt, "Items available:"),
+        "move": _prompt_line(prompt, "Exits:"),
+    }.get(action_type, "")
+    target = _find_target(player_input, [n.strip() for n in names.split(",") if n.strip()])
+
+    return {
+        "intent_type": "action",
+        "confidence": 0.9,
+        "action_type": action_type,
+        "target": target,
+    }
+
+
+def generate_branch(request: ScriptedRequest) -> dict[str, Any]:
+    """Answer BranchGenerationResponse with a rolled success/failure pair."""
+    prompt = request.prompt
+    player_key = _prompt_line(prompt, "PLAYER ENTITY KEY:") or "player"
+    action = _prompt_line(prompt, "PLAYER ACTION:") or "act"
+    summary = action[0].lower() + action[1:]
+
+    def variant(variant_type: str, outcome: str) -> dict[str, Any]:
+        return {
+            "variant_type": variant_type,
+            "narrative": f"[{player_key}:You] {summary}. {outcome}",
+            "state_deltas": [],
+            "time_passed_minutes": 5,
+            "requires_skill_check": True,
+            "skill": "perception",
+            "dc": 12,
+        }
+
+    return {
+        "variants": [
+            variant("success", "It goes as you hoped."),
+            variant("failure", "It does not go quite as planned."),
+        ],
+        "action_summary": action,
+    }
+
+
+SCRIPTED_RESPONDERS = {
+    "IntentClassificationResponse": classify_intent,
+    "BranchGenerationResponse": generate_branch,
+}
+
+
+# =============================================================================
+# Phase Timing
+# =============================================================================
+
+
+class PhaseRecorder:
+    """Accumulates time spent in each phase of the current turn."""
+
+    def __init__(self) -> None:
+        self.current: dict[str, float] = {}
+
+    def add(self, phase: str, elapsed_ms: float) -> None:
+        """Add time to a phase of the current turn."""
+        self.current[phase] = self.current.get(phase, 0.0) + elapsed_ms
+
+    def take(self) -> dict[str, float]:
+        """Return the current turn's phase times and start a new turn."""
+        phases, self.current = self.current, {}
+        return phases
+
+    def wrap(self, owner: Any, method: str, phase: str) -> None:
+        """Time every call of owner.method (sync or async) as phase."""
+        original = getattr(owner, method)
+
+        if inspect.iscoroutinefunction(original):
+
+            @functools.wraps(original)
+            async def timed_async(*args: Any, **kwargs: Any) -> Any:
+                start = time.perf_counter()
+                try:
+                    return await original(*args, **kwargs)
+                finally:
+                    self.add(phase, (time.perf_counter() - start) * 1000)
+
+            setattr(owner, method, timed_async)
+        else:
+
+            @functools.wraps(original)
+            def timed(*args: Any, **kwargs: Any) -> Any:
+                start = time.perf_counter()
+                try:
+                    return original(*args, **kwargs)
+                finally:
+                    self.add(phase, (time.perf_counter() - start) * 1000)
+
+            setattr(owner, method, timed)
+
+    def instrument(self, pipeline: QuantumPipeline) -> None:
+        """Wrap the pipeline components behind each phase."""
+        self.wrap(pipeline, "_build_manifest", "manifest")
+        self.wrap(pipeline.action_predictor, "predict_actions", "prediction")
+        self.wrap(pipeline, "_classify_intent", "intent")
+        self.wrap(pipeline.branch_cache, "get_branch", "cache_lookup")
+        self.wrap(pipeline.branch_generator, "generate_branch", "generation")
+        self.wrap(pipeline.reasoning_engine, "reason", "generation")
+        self.wrap(pipeline.narrator_engine, "narrate", "generation")
+        self.wrap(pipeline.collapse_manager, "collapse_branch", "collapse")
+
+
+# =============================================================================
+# Report
+# =============================================================================
+
+
+@dataclass
+class PhaseStats:
+    """Latency distribution of one phase (milliseconds).
+
+    Attributes:
+        count: Turns in which the phase ran.
+        mean: Mean time per turn it ran in.
+        p50: Median.
+        p95: 95th percentile.
+        p99: 99th percentile.
+        max: Slowest turn.
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    p50: float = 0.0
+    p95: float = 0.0
+    p99: float = 0.0
+    max: float = 0.0
+
+    @classmethod
+    def from_samples(cls, samples: list[float]) -> "PhaseStats":
+        """Summarize per-turn samples."""
+        if not samples:
+            return cls()
+        values = np.asarray(samples)
+        p50, p95, p99 = np.percentile(values, [50, 95, 99])
+        return cls(
+            count=len(samples),
+            mean=float(values.mean()),
+            p50=float(p50),
+            p95=float(p95),
+            p99=float(p99),
+            max=float(values.max()),
+        )
+
+
+@dataclass
+class BenchmarkReport:
+    """Results of a benchmark run.
+
+    Attributes:
+        turns: Turns processed.
+        cache_hits: Turns served from a cached branch.
+        errors: Turns that returned an error.
+        wall_time_s: Time to process all turns (including commits).
+        phases: Phase name -> latency distribution.
+        config: Settings the run used.
+    """
+
+    turns: int = 0
+    cache_hits: int = 0
+    errors: int = 0
+    wall_time_s: float = 0.0
+    phases: dict[str, PhaseStats] = field(default_factory=dict)
+    config: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of turns served from cache."""
+        return self.cache_hits / self.turns if self.turns else 0.0
+
+    @property
+    def turns_per_second(self) -> float:
+        """Throughput over the whole run."""
+        return self.turns / self.wall_time_s if self.wall_time_s else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-compatible baseline."""
+        return {
+            "version": BASELINE_VERSION,
+            "config": self.config,
+            "turns": self.turns,
+            "cache_hits": self.cache_hits,
+            "cache_hit_rate": self.cache_hit_rate,
+            "errors": self.errors,
+            "wall_time_s": self.wall_time_s,
+            "turns_per_second": self.turns_per_second,
+            "phases": {name: vars(stats) for name, stats in self.phases.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "BenchmarkReport":
+        """Load a baseline written by to_dict()."""
+        if data.get("version") != BASELINE_VERSION:
+            raise ValueError(
+                f"Unsupported baseline version {data.get('version')}; expected {BASELINE_VERSION}"
+            )
+        return cls(
+            turns=data["turns"],
+            cache_hits=data["cache_hits"],
+            errors=data["errors"],
+            wall_time_s=data["wall_time_s"],
+            phases={name: PhaseStats(**stats) for name, stats in data["phases"].items()},
+            config=data.get("config", {}),
+        )
+
+    def format_table(self) -> str:
+        """Format phase percentiles as a plain-text table."""
+        lines = [
+            f"{self.turns} turns in {self.wall_time_s:.2f}s "
+            f"({self.turns_per_second:.1f} turns/s), "
+            f"cache hit rate {self.cache_hit_rate:.0%}, {self.errors} errors",
+            "",
+            f"{'phase':<14}{'n':>5}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}",
+        ]
+        for name in PHASES:
+            stats = self.phases.get(name)
+            if stats is None or not stats.count:
+                continue
+            lines.append(
+                f"{name:<14}{stats.count:>5}{stats.p50:>10.2f}{stats.p95:>10.2f}"
+                f"{stats.p99:>10.2f}{stats.max:>10.2f}"
+            )
+        return "\n".join(lines)
+
+
+def compare_to_baseline(
+    report: BenchmarkReport,
+    baseline: BenchmarkReport,
+    latency_tolerance: float = 0.25,
+    min_latency_delta_ms: float = 1.0,
+    hit_rate_tolerance: float = 0.05,
+) -> list[str]:
+    """Find regressions against a baseline run.
+
+    A phase regresses when its p95 grows by more than latency_tolerance
+    (relative) and min_latency_delta_ms (absolute, to ignore noise in
+    sub-millisecond phases). The cache hit rate regresses when it drops
+    by more than hit_rate_tolerance. Runs with different settings are
+    not comparable and are reported as such.
+
+    Args:
+        report: The new run.
+        baseline: The reference run.
+        latency_tolerance: Allowed relative p95 growth.
+        min_latency_delta_ms: Smallest p95 growth worth reporting.
+        hit_rate_tolerance: Allowed absolute hit-rate drop.
+
+    Returns:
+        Human-readable regression messages (empty if none).
+    """
+    regressions = []
+
+    changed = sorted(
+        key
+        for key in set(report.config) | set(baseline.config)
+        if report.config.get(key) != baseline.config.get(key)
+    )
+    if changed:
+        regressions.append(f"run settings differ from baseline: {', '.join(changed)}")
+
+    if report.cache_hit_rate < baseline.cache_hit_rate - hit_rate_tolerance:
+        regressions.append(
+            f"cache hit rate {report.cache_hit_rate:.0%} < baseline {baseline.cache_hit_rate:.0%}"
+        )
+
+    for name, base in baseline.phases.items():
+        current = report.phases.get(name)
+        if current is None or not base.count:
+            continue
+        growth = current.p95 - base.p95
+        if growth > min_latency_delta_ms and growth > base.p95 * latency_tolerance:
+            percent = f" (+{growth / base.p95:.0%})" if base.p95 else ""
+            regressions.append(
+                f"{name} p95 {current.p95:.2f}ms > baseline {base.p95:.2f}ms{percent}"
+            )
+
+    return regressions
+
+
+# =============================================================================
+# Runner
+# =============================================================================
+
+
+@dataclass
+class BenchmarkConfig:
+    """Settings for a benchmark run.
+
+    Attributes:
+        inputs: Scripted player inputs, replayed in order.
+        repeat: How many times to replay the inputs.
+        start_location: Location key of the first turn.
+        start_time: In-game time of the first turn (HH:MM).
+        world_dir: Directory with the world files.
+        world_name: Base name of the world files.
+        latency_ms: Simulated LLM latency per call.
+        ms_per_output_token: Simulated LLM time per output token.
+        jitter: Random +/- fraction applied to LLM latency.
+        seed: Seed for dice, GM decisions and latency jitter.
+    """
+
+    inputs: tuple[str, ...] = DEFAULT_INPUTS
+    repeat: int = 1
+    start_location: str = "market_square"
+    start_time: str = "10:00"
+    world_dir: Path = DEFAULT_WORLD_DIR
+    world_name: str = "millbrook"
+    latency_ms: float = 0.0
+    ms_per_output_token: float = 0.0
+    jitter: float = 0.0
+    seed: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Settings recorded in the baseline."""
+        return {
+            "turns": len(self.inputs) * self.repeat,
+            "start_location": self.start_location,
+            "start_time": self.start_time,
+            "world_name": self.world_name,
+            "latency_ms": self.latency_ms,
+            "ms_per_output_token": self.ms_per_output_token,
+            "jitter": self.jitter,
+            "seed": self.seed,
+        }
+
+
+def create_benchmark_database() -> Session:
+    """Create an in-memory SQLite session with every table."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)()
+
+
+def seed_world(
+    db: Session,
+    world_dir: Path,
+    world_name: str,
+    start_time: str = "10:00",
+) -> GameSession:
+    """Create a session with a loaded world, a player and a time state.
+
+    NPCs are placed where their schedules put them on day 1 (a Monday)
+    at start_time, or at their workplace without a schedule entry.
+
+    Args:
+        db: Database session.
+        world_dir: Directory with the world files.
+        world_name: Base name of the world files.
+        start_time: In-game time of the first turn (HH:MM).
+
+    Returns:
+        The new GameSession.
+
+    Raises:
+        ValueError: If the world fails to load.
+    """
+    game_session = GameSession(
+        session_name=f"benchmark-{world_name}",
+        setting="fantasy",
+        status="active",
+        total_turns=0,
+        llm_provider="scripted",
+        gm_model="scripted",
+    )
+    db.add(game_session)
+    db.flush()
+
+    results = load_complete_world(db, game_session, world_dir, world_name)
+    if results["world"].get("errors") or not results["world"].get("locations"):
+        raise ValueError(f"Failed to load world '{world_name}': {results['world']}")
+
+    db.add(
+        Entity(
+            session_id=game_session.id,
+            entity_key="player",
+            display_name="The Traveler",
+            entity_type=EntityType.PLAYER,
+            is_alive=True,
+            is_active=True,
+        )
+    )
+    db.add(
+        TimeState(
+            session_id=game_session.id,
+            current_day=1,
+            current_time=start_time,
+            day_of_week=DayOfWeek.MONDAY.value,
+        )
+    )
+    _place_npcs(db, game_session, DayOfWeek.MONDAY, start_time)
+    db.commit()
+    return game_session
+
+
+def _place_npcs(db: Session, game_session: GameSession, day: DayOfWeek, time_str: str) -> None:
+    """Set each NPC's current location from its schedule or workplace."""
+    scheduled = ScheduleManager(db, game_session).index.resolve(day, time_str)
+    npcs = (
+        db.query(Entity)
+        .join(NPCExtension, Entity.id == NPCExtension.entity_id)
+        .filter(Entity.session_id == game_session.id)
+        .all()
+    )
+    for npc in npcs:
+        entry = scheduled.get(npc.id)
+        location_key = entry.location_key if entry else None
+        npc.npc_extension.current_location = (
+            location_key or npc.npc_extension.workplace or npc.npc_extension.home_location
+        )
+
+
+def _commit_turn(
+    db: Session,
+    game_session: GameSession,
+    turn_number: int,
+    player_input: str,
+    result: TurnResult,
+    location_key: str,
+) -> None:
+    """Persist the turn and commit, like the game loop."""
+    db.add(
+        Turn(
+            session_id=game_session.id,
+            turn_number=turn_number,
+            player_input=player_input,
+            gm_response=result.narrative,
+            location_at_turn=location_key,
+        )
+    )
+    game_session.total_turns = turn_number
+    db.commit()
+
+
+async def run_benchmark(
+    config: BenchmarkConfig | None = None,
+    db: Session | None = None,
+    on_turn: Callable[[int, str, TurnResult], Awaitable[None] | None] | None = None,
+    observability_hook: ObservabilityHook | None = None,
+) -> BenchmarkReport:
+    """Replay scripted inputs through a QuantumPipeline and time each phase.
+
+    Args:
+        config: Benchmark settings (default: Millbrook, no LLM latency).
+        db: Database session (default: a fresh in-memory SQLite database).
+        on_turn: Optional callback with (turn number, input, result).
+        observability_hook: Optional hook receiving the pipeline's tracing
+            spans (e.g. to export traces of the run).
+
+    Returns:
+        BenchmarkReport with per-phase percentiles.
+    """
+    config = config or BenchmarkConfig()
+    db = db or create_benchmark_database()
+    game_session = seed_world(
+        db, Path(config.world_dir), config.world_name, config.start_time
+    )
+
+    # Dice and GM decisions use the global random module
+    random.seed(config.seed)
+    llm = ScriptedProvider(
+        SCRIPTED_RESPONDERS,
+        latency_ms=config.latency_ms,
+        ms_per_output_token=config.ms_per_output_token,
+        jitter=config.jitter,
+        seed=config.seed,
+    )
+    pipeline = QuantumPipeline(
+        db,
+        game_session,
+        llm_provider=llm,
+        reasoning_provider=llm,
+        intent_provider=llm,
+        observability_hook=observability_hook,
+    )
+    recorder = PhaseRecorder()
+    recorder.instrument(pipeline)
+
+    samples: dict[str, list[float]] = {name: [] for name in PHASES}
+    report = BenchmarkReport(config=config.to_dict())
+    location_key = config.start_location
+
+    run_start = time.perf_counter()
+    turn_number = 0
+    for _ in range(config.repeat):
+        for player_input in config.inputs:
+            turn_number += 1
+            turn_start = time.perf_counter()
+            result = await pipeline.process_turn(
+                player_input=player_input,
+                location_key=location_key,
+                turn_number=turn_number,
+            )
+            recorder.add("total", (time.perf_counter() - turn_start) * 1000)
+
+            location_key = result.new_location or location_key
+            commit_start = time.perf_counter()
+            _commit_turn(db, game_session, turn_number, player_input, result, location_key)
+            recorder.add("db_commit", (time.perf_counter() - commit_start) * 1000)
+
+            for phase, elapsed_ms in recorder.take().items():
+                samples[phase].append(elapsed_ms)
+            report.turns += 1
+            report.cache_hits += result.was_cache_hit
+            report.errors += result.error is not None
+
+            if on_turn is not None:
+                awaitable = on_turn(turn_number, player_input, result)
+                if awaitable is not None:
+                    await awaitable
+
+    report.wall_time_s = time.perf_counter() - run_start
+    report.phases = {name: PhaseStats.from_samples(samples[name]) for name in PHASES}
+    return report
@@ -40,6 +40,7 @@ from src.world_server.quantum.schemas import (
     StateDelta,
     VariantType,
 )
+from src.world_server.quantum.topic_index import dialogue_topic, target_names
 
 logger = logging.getLogger(__name__)
 
@@ -137,6 +138,7 @@ class BranchGenerator:
         prompt = self._build_generation_prompt(action, gm_decision, manifest, context)
 
         # Generate variants
+        tokens_used = 0
         try:
             response = await self.llm.complete_structured(
                 messages=[Message.user(prompt)],
@@ -145,6 +147,8 @@ class BranchGenerator:
                 temperature=0.7,
                 max_tokens=4096,
             )
+            if response.usage:
+                tokens_used = response.usage.total_tokens
 
             if response.parsed_content:
                 # parsed_content may be a dict or Pydantic model depending on provider
@@ -166,12 +170,16 @@ class BranchGenerator:
 
         generation_time_ms = (time.perf_counter() - start_time) * 1000
 
-        # Create branch
+        # Create branch; NPC dialogue is keyed by what the player asked about
+        topic = None
+        if action.action_type == ActionType.INTERACT_NPC:
+            topic = dialogue_topic(context.player_input, target_names(action))
         branch_key = QuantumBranch.create_key(
             location_key=context.location_key,
             action_type=action.action_type,
             target_key=action.target_key,
             gm_decision_type=gm_decision.decision_type,
+            topic=topic,
         )
 
         branch = QuantumBranch(
@@ -181,6 +189,8 @@ class BranchGenerator:
             variants=variants,
             generated_at=datetime.now(),
             generation_time_ms=generation_time_ms,
+            tokens_used=tokens_used,
+            topic=topic,
         )
 
         logger.info(
@@ -0,0 +1,441 @@
+"""Persistent second-tier storage for quantum branches.
+
+The in-process QuantumBranchCache loses every pre-generated branch when
+the game restarts and cannot share work between processes running the
+same world. A BranchStore sits behind the cache as an L2 tier:
+
+- Entries are keyed by branch key AND a world-state fingerprint, so a
+  branch generated against one version of the scene is never served
+  against another.
+- SQLiteBranchStore is the local, file-backed implementation. It uses
+  WAL mode so several game processes can read and write the same file.
+
+Stores are synchronous; QuantumBranchCache calls them off the event loop.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from src.gm.grounding import GroundingManifest
+from src.world_server.quantum.schemas import (
+    ActionPrediction,
+    ActionType,
+    DeltaType,
+    GMDecision,
+    OutcomeVariant,
+    QuantumBranch,
+    StateDelta,
+    VariantType,
+)
+from src.world_server.schemas import PredictionReason
+
+logger = logging.getLogger(__name__)
+
+
+def compute_world_fingerprint(manifest: GroundingManifest) -> str:
+    """Compute a stable fingerprint of the scene a branch was generated for.
+
+    Covers everything a branch's narrative and deltas can refer to: the
+    location, the player, and every grounded entity with its display name
+    and description. Session IDs are deliberately excluded so that two
+    sessions of the same world in the same state share branches.
+
+    Args:
+        manifest: Grounding manifest for the current scene.
+
+    Returns:
+        Hex digest identifying this world state.
+    """
+    sections: dict[str, list[tuple[str, str, str]]] = {}
+    for name in (
+        "npcs",
+        "items_at_location",
+        "inventory",
+        "equipped",
+        "storages",
+        "exits",
+    ):
+        entities = getattr(manifest, name)
+        sections[name] = sorted(
+            (key, entity.display_name, entity.short_description)
+            for key, entity in entities.items()
+        )
+
+    payload = json.dumps(
+        {
+            "location": [manifest.location_key, manifest.location_display],
+            "player": manifest.player_key,
+            "sections": sections,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+# =============================================================================
+# Serialization
+# =============================================================================
+
+
+def serialize_branch(branch: QuantumBranch) -> str:
+    """Serialize a branch to a JSON string.
+
+    Args:
+        branch: The branch to serialize.
+
+    Returns:
+        JSON representation of the branch.
+    """
+    action = branch.action
+    data = {
+        "branch_key": branch.branch_key,
+        "action": {
+            "action_type": action.action_type.value,
+            "target_key": action.target_key,
+            "input_patterns": action.input_patterns,
+            "probability": action.probability,
+            "reason": action.reason.value,
+            "context": action.context,
+            "display_name": action.display_name,
+        },
+        "gm_decision": {
+            "decision_type": branch.gm_decision.decision_type,
+            "probability": branch.gm_decision.probability,
+            "grounding_facts": branch.gm_decision.grounding_facts,
+            "context": branch.gm_decision.context,
+        },
+        "variants": {
+            name: {
+                "variant_type": variant.variant_type.value,
+                "requires_dice": variant.requires_dice,
+                "skill": variant.skill,
+                "dc": variant.dc,
+                "modifier_reason": variant.modifier_reason,
+                "narrative": variant.narrative,
+                "state_deltas": [
+                    {
+                        "delta_type": delta.delta_type.value,
+                        "target_key": delta.target_key,
+                        "changes": delta.changes,
+                        "expected_state": delta.expected_state,
+                    }
+                    for delta in variant.state_deltas
+                ],
+                "time_passed_minutes": variant.time_passed_minutes,
+                "generated_at": variant.generated_at.isoformat(),
+            }
+            for name, variant in branch.variants.items()
+        },
+        "generated_at": branch.generated_at.isoformat(),
+        "generation_time_ms": branch.generation_time_ms,
+        "tokens_used": branch.tokens_used,
+        "expiry_seconds": branch.expiry_seconds,
+        "version_vector": branch.version_vector,
+        "topic": branch.topic,
+    }
+    return json.dumps(data, default=str)
+
+
+def deserialize_branch(payload: str) -> QuantumBranch:
+    """Rebuild a branch from serialize_branch() output.
+
+    Args:
+        payload: JSON produced by serialize_branch().
+
+    Returns:
+        The reconstructed QuantumBranch (never marked as collapsed).
+    """
+    data = json.loads(payload)
+    action_data = data["action"]
+    action = ActionPrediction(
+        action_type=ActionType(action_data["action_type"]),
+        target_key=action_data["target_key"],
+        input_patterns=action_data["input_patterns"],
+        probability=action_data["probability"],
+        reason=PredictionReason(action_data["reason"]),
+        context=action_data.get("context") or {},
+        display_name=action_data.get("display_name"),
+    )
+
+    decision_data = data["gm_decision"]
+    gm_decision = GMDecision(
+        decision_type=decision_data["decision_type"],
+        probability=decision_data["probability"],
+        grounding_facts=decision_data.get("grounding_facts") or [],
+        context=decision_data.get("context") or {},
+    )
+
+    variants: dict[str, OutcomeVariant] = {}
+    for name, variant_data in data["variants"].items():
+        variants[name] = OutcomeVariant(
+            variant_type=VariantType(variant_data["variant_type"]),
+            requires_dice=variant_data["requires_dice"],
+            skill=variant_data.get("skill"),
+            dc=variant_data.get("dc"),
+            modifier_reason=variant_data.get("modifier_reason"),
+            narrative=variant_data.get("narrative", ""),
+            state_deltas=[
+                StateDelta(
+                    delta_type=DeltaType(delta["delta_type"]),
+                    target_key=delta["target_key"],
+                    changes=delta.get("changes") or {},
+                    expected_state=delta.get("expected_state"),
+                )
+                for delta in variant_data.get("state_deltas", [])
+            ],
+            time_passed_minutes=variant_data.get("time_passed_minutes", 1),
+            generated_at=datetime.fromisoformat(variant_data["generated_at"]),
+        )
+
+    return QuantumBranch(
+        branch_key=data["branch_key"],
+        action=action,
+        gm_decision=gm_decision,
+        variants=variants,
+        generated_at=datetime.fromisoformat(data["generated_at"]),
+        generation_time_ms=data.get("generation_time_ms", 0.0),
+        tokens_used=data.get("tokens_used", 0),
+        expiry_seconds=data.get("expiry_seconds", 180),
+        version_vector=data.get("version_vector"),
+        topic=data.get("topic"),
+    )
+
+
+# =============================================================================
+# Stores
+# =============================================================================
+
+
+class BranchStore(ABC):
+    """Second-tier branch storage behind QuantumBranchCache.
+
+    Implementations must be safe to call from worker threads. Every
+    entry is identified by (branch_key, fingerprint); a lookup with a
+    different fingerprint must never return the entry.
+    """
+
+    @abstractmethod
+    def get(self, branch_key: str, fingerprint: str) -> QuantumBranch | None:
+        """Load a branch generated for the given world state.
+
+        Args:
+            branch_key: Key from QuantumBranch.create_key().
+            fingerprint: World-state fingerprint of the current scene.
+
+        Returns:
+            The stored branch, or None if absent or expired.
+        """
+
+    @abstractmethod
+    def put(self, branch: QuantumBranch, fingerprint: str) -> None:
+        """Store a branch for the given world state.
+
+        Args:
+            branch: The branch to persist.
+            fingerprint: World-state fingerprint the branch was generated for.
+        """
+
+    @abstractmethod
+    def delete(self, branch_key: str) -> int:
+        """Delete every stored version of a branch.
+
+        Returns:
+            Number of entries removed.
+        """
+
+    @abstractmethod
+    def invalidate_location(self, location_key: str) -> int:
+        """Delete all branches for a location.
+
+        Returns:
+            Number of entries removed.
+        """
+
+    @abstractmethod
+    def clear(self) -> int:
+        """Delete all stored branches.
+
+        Returns:
+            Number of entries removed.
+        """
+
+    @abstractmethod
+    def count(self) -> int:
+        """Get number of stored branches."""
+
+    def close(self) -> None:
+        """Release any resources held by the store.
+
+        Does nothing by default, for stores without resources to release.
+        """
+        return None
+
+
+class SQLiteBranchStore(BranchStore):
+    """File-backed branch store using SQLite.
+
+    Usage:
+        store = SQLiteBranchStore("data/cache/quantum_branches.sqlite")
+        cache = QuantumBranchCache(store=store)
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int = 5000,
+        ttl_seconds: float = 7 * 24 * 3600,
+    ):
+        """Initialize the store, creating the database file if needed.
+
+        Args:
+            path: SQLite file path (":memory:" for a private in-memory store).
+            max_entries: Maximum stored branches before LRU eviction.
+            ttl_seconds: Maximum age of a stored branch. World-state changes
+                are caught by the fingerprint; this only bounds disk usage.
+        """
+        self.path = str(path)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.path, timeout=10.0, check_same_thread=False)
+        if self.path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS quantum_branches (
+                branch_key TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                location_key TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_accessed REAL NOT NULL,
+                PRIMARY KEY (branch_key, fingerprint)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_quantum_branches_location "
+            "ON quantum_branches (location_key)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_quantum_branches_accessed "
+            "ON quantum_branches (last_accessed)"
+        )
+        self._conn.commit()
+
+    def get(self, branch_key: str, fingerprint: str) -> QuantumBranch | None:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM quantum_branches "
+                "WHERE branch_key = ? AND fingerprint = ?",
+                (branch_key, fingerprint),
+            ).fetchone()
+            if row is None:
+                return None
+
+            payload, created_at = row
+            if now - created_at > self.ttl_seconds:
+                self._conn.execute(
+                    "DELETE FROM quantum_branches WHERE branch_key = ? AND fingerprint = ?",
+                    (branch_key, fingerprint),
+                )
+                self._conn.commit()
+                return None
+
+            self._conn.execute(
+                "UPDATE quantum_branches SET last_accessed = ? "
+                "WHERE branch_key = ? AND fingerprint = ?",
+                (now, branch_key, fingerprint),
+            )
+            self._conn.commit()
+
+        try:
+            return deserialize_branch(payload)
+        except (KeyError, ValueError, TypeError) as e:
+            logger.warning(f"Discarding unreadable stored branch {branch_key}: {e}")
+            self.delete(branch_key)
+            return None
+
+    def put(self, branch: QuantumBranch, fingerprint: str) -> None:
+        now = time.time()
+        payload = serialize_branch(branch)
+        location_key = branch.branch_key.split("::", 1)[0]
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO quantum_branches "
+                "(branch_key, fingerprint, location_key, payload, created_at, last_accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (branch.branch_key, fingerprint, location_key, payload, now, now),
+            )
+            self._evict_if_needed()
+            self._conn.commit()
+
+    def delete(self, branch_key: str) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM quantum_branches WHERE branch_key = ?", (branch_key,)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def invalidate_location(self, location_key: str) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM quantum_branches WHERE location_key = ?", (location_key,)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def clear(self) -> int:
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM quantum_branches")
+            self._conn.commit()
+            return cursor.rowcount
+
+    def count(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM quantum_branches").fetchone()
+            return count
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get store statistics."""
+        return {
+            "path": self.path,
+            "size": self.count(),
+            "max_entries": self.max_entries,
+        }
+
+    def _evict_if_needed(self) -> None:
+        """Drop expired and least recently used entries (called under lock)."""
+        self._conn.execute(
+            "DELETE FROM quantum_branches WHERE created_at < ?",
+            (time.time() - self.ttl_seconds,),
+        )
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM quantum_branches").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM quantum_branches WHERE rowid IN ("
+                "SELECT rowid FROM quantum_branches ORDER BY last_accessed ASC LIMIT ?)",
+                (overflow,),
+            )
+            logger.debug(f"Evicted {overflow} stored branches")
@@ -4,9 +4,14 @@ This module provides an LRU cache for storing pre-generated quantum branches.
 Key features:
 - LRU eviction when max capacity is reached
 - TTL-based expiry for stale branches
+- Version-vector freshness: branches that record the row versions of their
+  inputs stay valid until those rows change, regardless of age
 - Location-based invalidation when world state changes
 - Thread-safe with asyncio locks
 - Metrics tracking for hit/miss rates
+- Optional persistent L2 tier (BranchStore) keyed by world-state fingerprint
+- Topic-aware NPC dialogue: lookups given the player's input are served
+  the nearest cached conversation topic, or nothing (see topic_index.py)
 """
 
 import asyncio
@@ -15,17 +20,28 @@ import time
 from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Iterator
+from typing import Callable, Iterator
 
+from src.world_server.quantum.branch_store import BranchStore
 from src.world_server.quantum.schemas import (
     ActionPrediction,
     ActionType,
     QuantumBranch,
     QuantumMetrics,
 )
+from src.world_server.quantum.topic_index import (
+    DEFAULT_TOPIC_THRESHOLD,
+    TopicIndex,
+    TopicVectorizer,
+    dialogue_topic,
+    target_names,
+)
 
 logger = logging.getLogger(__name__)
 
+# Returns True if a branch's recorded version vector is still current
+VersionCheck = Callable[[dict[str, int]], bool]
+
 
 @dataclass
 class CacheEntry:
@@ -35,6 +51,7 @@ class CacheEntry:
     inserted_at: datetime = field(default_factory=datetime.now)
     last_accessed: datetime = field(default_factory=datetime.now)
     access_count: int = 0
+    fingerprint: str | None = None  # World-state fingerprint at generation
 
     def touch(self) -> None:
         """Update access metadata."""
@@ -46,6 +63,31 @@ class CacheEntry:
         age = (datetime.now() - self.inserted_at).total_seconds()
         return age > ttl_seconds
 
+    def is_stale_for(
+        self,
+        ttl_seconds: float,
+        fingerprint: str | None = None,
+        version_check: VersionCheck | None = None,
+    ) -> bool:
+        """Check if entry should no longer be served.
+
+        When both the entry and the lookup carry a world-state fingerprint,
+        the fingerprint must match. If the branch recorded a version vector
+        and a version_check is given, the vector decides freshness and no
+        wall-clock TTL applies. Otherwise the cache TTL applies, plus the
+        branch's own expiry when there is no fingerprint to compare.
+        """
+        if fingerprint is not None and self.fingerprint is not None:
+            if fingerprint != self.fingerprint:
+                return True
+        if version_check is not None and self.branch.version_vector is not None:
+            return not version_check(self.branch.version_vector)
+        if self.is_expired(ttl_seconds):
+            return True
+        if fingerprint is not None and self.fingerprint is not None:
+            return False
+        return self.branch.is_stale()
+
 
 class QuantumBranchCache:
     """LRU cache for quantum branches with TTL expiry.
@@ -61,6 +103,12 @@ class QuantumBranchCache:
     - TTL-based expiry
     - Location-based invalidation
     - Action-based lookups
+    - Optional persistent L2 store, consulted on L1 misses when the
+      caller supplies a world-state fingerprint
+    - Optional version check, which replaces TTL expiry for branches
+      that recorded a version vector
+    - Nearest-topic lookup of INTERACT_NPC branches against the
+      player's input, accepted above topic_threshold
     """
 
     def __init__(
@@ -68,6 +116,10 @@ class QuantumBranchCache:
         max_branches: int = 50,
         ttl_seconds: float = 180.0,
         metrics: QuantumMetrics | None = None,
+        store: BranchStore | None = None,
+        version_check: VersionCheck | None = None,
+        topic_threshold: float = DEFAULT_TOPIC_THRESHOLD,
+        vectorizer: TopicVectorizer | None = None,
     ):
         """Initialize the cache.
 
@@ -75,12 +127,22 @@ class QuantumBranchCache:
             max_branches: Maximum number of branches to store
             ttl_seconds: Time-to-live in seconds (default 3 minutes)
             metrics: Optional metrics tracker
+            store: Optional persistent second-tier store
+            version_check: Optional check of a branch's version vector
+                against current world state (e.g. WorldVersionIndex.is_current)
+            topic_threshold: Cosine similarity a cached dialogue topic
+                needs to be served for the player's input
+            vectorizer: Topic vectorizer (default TopicVectorizer())
         """
         self.max_branches = max_branches
         self.ttl_seconds = ttl_seconds
         self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
         self._lock = asyncio.Lock()
+        # Bumped by invalidation so a store read racing it is not promoted
+        self._generation = 0
         self._metrics = metrics or QuantumMetrics()
+        self._store = store
+        self._version_check = version_check
 
         # Index by location for fast invalidation
         self._location_index: dict[str, set[str]] = {}
@@ -88,11 +150,21 @@ class QuantumBranchCache:
         # Index by action for finding all branches for an action
         self._action_index: dict[str, set[str]] = {}
 
+        # Topic vectors of dialogue branches, grouped by base key
+        self.topic_threshold = topic_threshold
+        self._vectorizer = vectorizer or TopicVectorizer()
+        self._topic_index = TopicIndex()
+
     @property
     def metrics(self) -> QuantumMetrics:
         """Get the metrics tracker."""
         return self._metrics
 
+    @property
+    def store(self) -> BranchStore | None:
+        """Get the persistent second-tier store, if any."""
+        return self._store
+
     @property
     def size(self) -> int:
         """Get current number of cached branches."""
@@ -103,13 +175,23 @@ class QuantumBranchCache:
         location_key: str,
         action: ActionPrediction,
         gm_decision_type: str,
+        fingerprint: str | None = None,
+        player_input: str | None = None,
     ) -> QuantumBranch | None:
         """Get a cached branch if available and not expired.
 
+        For INTERACT_NPC actions with player input, the branch must match
+        what the player talks about: an input with a topic is served the
+        most similar cached topic for that NPC (or its exact topic from
+        the persistent store), never the topic-agnostic branch.
+
         Args:
             location_key: Current location
             action: The predicted action
             gm_decision_type: The GM decision type
+            fingerprint: World-state fingerprint of the current scene.
+                Required for the persistent store to be consulted.
+            player_input: The player's input, for topic-aware dialogue
 
         Returns:
             Cached branch if found and valid, None otherwise
@@ -122,73 +204,104 @@ class QuantumBranchCache:
             gm_decision_type=gm_decision_type,
         )
 
-        async with self._lock:
-            entry = self._entries.get(key)
-
-            if entry is None:
-                self._metrics.record_cache_miss()
-                return None
-
-            # Check if expired
-            if entry.is_expired(self.ttl_seconds) or entry.branch.is_stale():
-                # Remove expired entry
-                self._remove_entry(key)
-                self._metrics.record_cache_miss()
-                self._metrics.record_branch_expired()
-                return None
-
-            # Update LRU order and access metadata
-            self._entries.move_to_end(key)
-            entry.touch()
-
-            latency_ms = (time.perf_counter() - start_time) * 1000
-            self._metrics.record_cache_hit(latency_ms)
-
-            logger.debug(f"Cache hit for {key} (accessed {entry.access_count} times)")
-            return entry.branch
-
-    async def get_branch_by_key(self, branch_key: str) -> QuantumBranch | None:
+        topic = None
+        if action.action_type == ActionType.INTERACT_NPC:
+            topic = dialogue_topic(player_input, target_names(action))
+        if topic is not None:
+            vector = self._vectorizer.vectorize(topic)
+            async with self._lock:
+                match = self._topic_index.nearest(key, vector, self.topic_threshold)
+            if match is not None:
+                logger.debug(f"Topic '{topic}' matched {match[0]} (similarity {match[1]:.2f})")
+                key = match[0]
+            else:
+                key = QuantumBranch.create_key(
+                    location_key=location_key,
+                    action_type=action.action_type,
+                    target_key=action.target_key,
+                    gm_decision_type=gm_decision_type,
+                    topic=topic,
+                )
+
+        return await self._get(key, fingerprint, start_time)
+
+    async def get_branch_by_key(
+        self,
+        branch_key: str,
+        fingerprint: str | None = None,
+    ) -> QuantumBranch | None:
         """Get a branch by its exact key.
 
         Args:
             branch_key: The full branch key
+            fingerprint: Optional world-state fingerprint of the current scene
 
         Returns:
             Cached branch if found and valid, None otherwise
         """
         start_time = time.perf_counter()
+        return await self._get(branch_key, fingerprint, start_time)
+
+    async def _get(
+        self,
+        key: str,
+        fingerprint: str | None,
+        start_time: float,
+    ) -> QuantumBranch | None:
+        """Look up a branch in L1, falling back to the persistent store.
 
+        The lock is not held while the store is read, so other lookups
+        keep being served from memory meanwhile.
+        """
         async with self._lock:
-            entry = self._entries.get(branch_key)
+            entry = self._fresh_entry(key, fingerprint)
+            if entry is not None:
+                return self._hit(key, entry, start_time)
+            generation = self._generation
+
+        branch = await self._read_store(key, fingerprint)
 
+        async with self._lock:
+            # Another task may have cached the key while the store was read
+            entry = self._fresh_entry(key, fingerprint)
+            if entry is None and branch is not None and generation == self._generation:
+                entry = self._promote(branch, fingerprint)
             if entry is None:
                 self._metrics.record_cache_miss()
                 return None
+            return self._hit(key, entry, start_time)
 
-            if entry.is_expired(self.ttl_seconds) or entry.branch.is_stale():
-                self._remove_entry(branch_key)
-                self._metrics.record_cache_miss()
-                self._metrics.record_branch_expired()
-                return None
+    async def contains(self, branch_key: str, fingerprint: str | None = None) -> bool:
+        """Check whether a valid branch is in memory without touching metrics.
 
-            self._entries.move_to_end(branch_key)
-            entry.touch()
+        Used by anticipation planning so that cache probes don't count
+        as player-facing hits or misses.
 
-            latency_ms = (time.perf_counter() - start_time) * 1000
-            self._metrics.record_cache_hit(latency_ms)
+        Args:
+            branch_key: The full branch key
+            fingerprint: Optional world-state fingerprint of the current scene
 
-            return entry.branch
+        Returns:
+            True if a servable branch is cached in memory
+        """
+        async with self._lock:
+            entry = self._entries.get(branch_key)
+            return entry is not None and not self._is_stale(entry, fingerprint)
 
     async def get_branches_for_action(
         self,
         location_key: str,
         action: ActionPrediction,
+        fingerprint: str | None = None,
     ) -> list[QuantumBranch]:
         """Get all cached branches for an action (any GM decision).
 
+        Only the in-memory tier is searched.
+
         Args:
             location_key: Current location
             action: The predicted action
+            fingerprint: Optional world-state fingerprint of the current scene
 
         Returns:
             List of all valid cached branches for this action
@@ -205,7 +318,7 @@ class QuantumBranchCache:
                     branch_keys.discard(key)
                     continue
 
-                if entry.is_expired(self.ttl_seconds) or entry.branch.is_stale():
+                if self._is_stale(entry, fingerprint):
                     self._remove_entry(key)
                     continue
 
@@ -213,39 +326,49 @@ class QuantumBranchCache:
 
             return branches
 
-    async def put_branch(self, branch: QuantumBranch) -> None:
+    async def put_branch(
+        self,
+        branch: QuantumBranch,
+        fingerprint: str | None = None,
+    ) -> None:
         """Store a single branch in the cache.
 
         Args:
             branch: The branch to cache
+            fingerprint: World-state fingerprint the branch was generated for
         """
-        await self.put_branches([branch])
+        await self.put_branches([branch], fingerprint=fingerprint)
 
-    async def put_branches(self, branches: list[QuantumBranch]) -> None:
+    async def put_branches(
+        self,
+        branches: list[QuantumBranch],
+        fingerprint: str | None = None,
+    ) -> None:
         """Store multiple branches in the cache.
 
+        Branches with a fingerprint are also written through to the
+        persistent store, if one is configured.
+
         Args:
             branches: List of branches to cache
+            fingerprint: World-state fingerprint the branches were generated for
         """
         async with self._lock:
             for branch in branches:
-                key = branch.branch_key
-
-                # Create entry
-                entry = CacheEntry(branch=branch)
-                self._entries[key] = entry
-
-                # Update LRU order
-                self._entries.move_to_end(key)
-
-                # Update indexes
-                self._add_to_indexes(key, branch)
-
-                logger.debug(f"Cached branch: {key}")
+                self._insert(CacheEntry(branch=branch, fingerprint=fingerprint))
+                logger.debug(f"Cached branch: {branch.branch_key}")
 
             # Evict if over capacity
             self._evict_if_needed()
 
+        if self._store is not None and fingerprint is not None:
+            try:
+                for branch in branches:
+                    await asyncio.to_thread(self._store.put, branch, fingerprint)
+                    self._metrics.record_store_write()
+            except Exception as e:
+                logger.warning(f"Failed to persist branches: {e}")
+
     async def invalidate_location(self, location_key: str) -> int:
         """Invalidate all branches for a location.
 
@@ -258,6 +381,7 @@ class QuantumBranchCache:
             Number of branches invalidated
         """
         async with self._lock:
+            self._generation += 1
             keys_to_remove = self._location_index.get(location_key, set()).copy()
 
             for key in keys_to_remove:
@@ -265,10 +389,17 @@ class QuantumBranchCache:
                 self._metrics.record_branch_invalidated()
 
             count = len(keys_to_remove)
-            if count > 0:
-                logger.info(f"Invalidated {count} branches for location: {location_key}")
 
-            return count
+        if self._store is not None:
+            try:
+                count += await asyncio.to_thread(self._store.invalidate_location, location_key)
+            except Exception as e:
+                logger.warning(f"Failed to invalidate stored branches: {e}")
+
+        if count > 0:
+            logger.info(f"Invalidated {count} branches for location: {location_key}")
+
+        return count
 
     async def invalidate_branch(self, branch_key: str) -> bool:
         """Invalidate a specific branch.
@@ -280,25 +411,43 @@ class QuantumBranchCache:
             True if branch was found and removed
         """
         async with self._lock:
-            if branch_key in self._entries:
+            self._generation += 1
+            found = branch_key in self._entries
+            if found:
                 self._remove_entry(branch_key)
                 self._metrics.record_branch_invalidated()
-                return True
-            return False
 
-    async def clear(self) -> int:
+        if self._store is not None:
+            try:
+                found = await asyncio.to_thread(self._store.delete, branch_key) > 0 or found
+            except Exception as e:
+                logger.warning(f"Failed to delete stored branch: {e}")
+
+        return found
+
+    async def clear(self, include_store: bool = False) -> int:
         """Clear all cached branches.
 
+        Args:
+            include_store: Also wipe the persistent store, which may be
+                shared with other processes.
+
         Returns:
-            Number of branches cleared
+            Number of in-memory branches cleared
         """
         async with self._lock:
+            self._generation += 1
             count = len(self._entries)
             self._entries.clear()
             self._location_index.clear()
             self._action_index.clear()
-            logger.info(f"Cleared {count} branches from cache")
-            return count
+            self._topic_index.clear()
+
+        if include_store and self._store is not None:
+            await asyncio.to_thread(self._store.clear)
+
+        logger.info(f"Cleared {count} branches from cache")
+        return count
 
     async def cleanup_expired(self) -> int:
         """Remove all expired branches.
@@ -309,7 +458,7 @@ class QuantumBranchCache:
         async with self._lock:
             expired_keys = [
                 key for key, entry in self._entries.items()
-                if entry.is_expired(self.ttl_seconds) or entry.branch.is_stale()
+                if self._is_stale(entry)
             ]
 
             for key in expired_keys:
@@ -327,17 +476,23 @@ class QuantumBranchCache:
         Returns:
             Dictionary with cache stats
         """
-        return {
+        stats = {
             "size": self.size,
             "max_branches": self.max_branches,
             "ttl_seconds": self.ttl_seconds,
             "locations_cached": len(self._location_index),
             "actions_cached": len(self._action_index),
+            "topics_cached": len(self._topic_index),
             "hit_rate": f"{self._metrics.hit_rate:.1%}",
             "hits": self._metrics.cache_hits,
             "misses": self._metrics.cache_misses,
             "avg_hit_latency_ms": f"{self._metrics.avg_cache_hit_latency_ms:.2f}",
+            "store_enabled": self._store is not None,
         }
+        if self._store is not None:
+            stats["store_hits"] = self._metrics.store_hits
+            stats["store_writes"] = self._metrics.store_writes
+        return stats
 
     def iter_branches(self) -> Iterator[QuantumBranch]:
         """Iterate over all cached branches (not async-safe).
@@ -348,6 +503,61 @@ class QuantumBranchCache:
         for entry in self._entries.values():
             yield entry.branch
 
+    def _is_stale(self, entry: CacheEntry, fingerprint: str | None = None) -> bool:
+        """Check an entry against the cache's TTL and version check."""
+        return entry.is_stale_for(self.ttl_seconds, fingerprint, self._version_check)
+
+    def _insert(self, entry: CacheEntry) -> None:
+        """Insert an entry as most recently used (called under lock)."""
+        key = entry.branch.branch_key
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self._add_to_indexes(key, entry.branch)
+
+    def _fresh_entry(self, key: str, fingerprint: str | None) -> CacheEntry | None:
+        """Get a servable L1 entry, dropping it if stale (called under lock)."""
+        entry = self._entries.get(key)
+        if entry is not None and self._is_stale(entry, fingerprint):
+            self._remove_entry(key)
+            self._metrics.record_branch_expired()
+            return None
+        return entry
+
+    def _hit(self, key: str, entry: CacheEntry, start_time: float) -> QuantumBranch:
+        """Record a hit and update LRU order (called under lock)."""
+        self._entries.move_to_end(key)
+        entry.touch()
+
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        self._metrics.record_cache_hit(latency_ms)
+
+        logger.debug(f"Cache hit for {key} (accessed {entry.access_count} times)")
+        return entry.branch
+
+    async def _read_store(self, key: str, fingerprint: str | None) -> QuantumBranch | None:
+        """Read a branch from the persistent store (called without the lock).
+
+        Returns:
+            The stored branch, or None if the store has no matching branch
+        """
+        if self._store is None or fingerprint is None:
+            return None
+
+        try:
+            return await asyncio.to_thread(self._store.get, key, fingerprint)
+        except Exception as e:
+            logger.warning(f"Branch store lookup failed for {key}: {e}")
+            return None
+
+    def _promote(self, branch: QuantumBranch, fingerprint: str) -> CacheEntry:
+        """Insert a stored branch into L1 (called under lock)."""
+        entry = CacheEntry(branch=branch, fingerprint=fingerprint)
+        self._insert(entry)
+        self._evict_if_needed()
+        self._metrics.record_store_hit()
+        logger.debug(f"Promoted stored branch to memory: {branch.branch_key}")
+        return entry
+
     def _add_to_indexes(self, key: str, branch: QuantumBranch) -> None:
         """Add branch to lookup indexes (called under lock)."""
         # Parse location from key
@@ -365,6 +575,11 @@ class QuantumBranchCache:
                 self._action_index[action_prefix] = set()
             self._action_index[action_prefix].add(key)
 
+        if branch.topic:
+            self._topic_index.add(
+                branch.base_key, key, self._vectorizer.vectorize(branch.topic)
+            )
+
     def _remove_from_indexes(self, key: str) -> None:
         """Remove branch from lookup indexes (called under lock)."""
         parts = key.split("::")
@@ -382,6 +597,8 @@ class QuantumBranchCache:
                 if not self._action_index[action_prefix]:
                     del self._action_index[action_prefix]
 
+        self._topic_index.remove(key)
+
     def _remove_entry(self, key: str) -> None:
         """Remove an entry from cache and indexes (called under lock)."""
         if key in self._entries:
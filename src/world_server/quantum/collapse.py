@@ -7,7 +7,8 @@ the actual roll.
 
 Responsibilities:
 - Select appropriate variant based on dice roll
-- Validate that state deltas are still applicable
+- Validate that state deltas are still applicable (version vector check,
+  falling back to per-delta state queries for unversioned branches)
 - Apply state deltas atomically
 - Strip [key:text] format for display
 - Track collapse metrics
@@ -25,6 +26,7 @@ from sqlalchemy.orm import Session
 from src.database.models.session import GameSession
 from src.database.models.world import Location
 from src.dice.checks import make_skill_check
+from src.dice.probability import check_outcome_distribution
 from src.dice.skills import get_attribute_for_skill
 from src.managers.entity_manager import EntityManager
 from src.managers.fact_manager import FactManager
@@ -33,6 +35,8 @@ from src.managers.needs import NeedsManager
 from src.managers.relationship_manager import RelationshipManager
 from src.managers.time_manager import TimeManager
 from src.dice.types import AdvantageType, SkillCheckResult
+from src.gm.manifest_cache import ManifestCache
+from src.observability.tracing import Tracer
 from src.world_server.quantum.schemas import (
     DeltaType,
     GMDecision,
@@ -42,6 +46,7 @@ from src.world_server.quantum.schemas import (
     StateDelta,
     VariantType,
 )
+from src.world_server.quantum.versioning import WorldVersionIndex
 
 logger = logging.getLogger(__name__)
 
@@ -128,6 +133,9 @@ class BranchCollapseManager:
         db: Session,
         game_session: GameSession,
         metrics: QuantumMetrics | None = None,
+        version_index: WorldVersionIndex | None = None,
+        manifest_cache: ManifestCache | None = None,
+        tracer: Tracer | None = None,
     ):
         """Initialize the collapse manager.
 
@@ -135,10 +143,16 @@ class BranchCollapseManager:
             db: Database session for state queries
             game_session: Current game session
             metrics: Optional metrics tracker
+            version_index: Optional row-version index for cheap staleness checks
+            manifest_cache: Optional manifest cache to notify of applied deltas
+            tracer: Optional tracer for collapse spans
         """
         self.db = db
         self.game_session = game_session
         self._metrics = metrics or QuantumMetrics()
+        self._version_index = version_index
+        self._manifest_cache = manifest_cache
+        self._tracer = tracer or Tracer()
 
     @property
     def metrics(self) -> QuantumMetrics:
@@ -177,6 +191,30 @@ class BranchCollapseManager:
         Raises:
             StaleStateError: If state has changed and deltas are invalid
         """
+        with self._tracer.span("collapse", branch_key=branch.branch_key) as span:
+            result = await self._collapse(
+                branch=branch,
+                turn_number=turn_number,
+                attribute_modifier=attribute_modifier,
+                skill_modifier=skill_modifier,
+                advantage_type=advantage_type,
+                validate_deltas=validate_deltas,
+                apply_deltas=apply_deltas,
+            )
+            span.set(variant=result.selected_variant.value)
+            return result
+
+    async def _collapse(
+        self,
+        branch: QuantumBranch,
+        turn_number: int,
+        attribute_modifier: int,
+        skill_modifier: int,
+        advantage_type: AdvantageType,
+        validate_deltas: bool,
+        apply_deltas: bool,
+    ) -> CollapseResult:
+        """Collapse a branch inside its tracing span (see collapse_branch)."""
         start_time = time.perf_counter()
 
         # 1. Select variant based on dice roll
@@ -189,7 +227,11 @@ class BranchCollapseManager:
 
         # 2. Validate deltas if requested
         if validate_deltas and variant.state_deltas:
-            validation_result = await self._validate_deltas(variant.state_deltas)
+            with self._tracer.span("collapse.validate"):
+                if branch.version_vector is not None and self._version_index is not None:
+                    validation_result = self._validate_versions(branch)
+                else:
+                    validation_result = await self._validate_deltas(variant.state_deltas)
             if not validation_result.success:
                 raise StaleStateError(
                     f"State delta validation failed: {validation_result.error_message}",
@@ -198,7 +240,8 @@ class BranchCollapseManager:
 
         # 3. Apply deltas if requested
         if apply_deltas and variant.state_deltas:
-            await self._apply_deltas(variant.state_deltas, turn_number)
+            with self._tracer.span("collapse.apply_deltas", deltas=len(variant.state_deltas)):
+                await self._apply_deltas(variant.state_deltas, turn_number)
 
         # 4. Strip entity references for display
         display_narrative = strip_entity_references(variant.narrative)
@@ -302,6 +345,62 @@ class BranchCollapseManager:
 
         return selected_variant, skill_result
 
+    def variant_probabilities(
+        self,
+        branch: QuantumBranch,
+        attribute_modifier: int = 0,
+        skill_modifier: int = 0,
+        advantage_type: AdvantageType = AdvantageType.NORMAL,
+    ) -> dict[str, float]:
+        """Get the chance that collapsing a branch selects each variant.
+
+        Uses the exact 2d10 outcome distribution with the same selection
+        rules as collapse, so no dice are rolled.
+
+        Args:
+            branch: The branch to assess
+            attribute_modifier: Player's attribute modifier
+            skill_modifier: Player's skill modifier
+            advantage_type: Advantage/disadvantage state
+
+        Returns:
+            Probability per variant key (variants that can't be selected are omitted)
+        """
+        variants = branch.variants
+        if not variants:
+            return {}
+
+        # Same fallbacks as _select_variant when nothing is rolled
+        check_key = "success" if variants.get("success") else next(iter(variants))
+        check_variant = variants[check_key]
+        requires_roll = any(v.requires_dice for v in variants.values())
+        if not requires_roll or not check_variant.dc:
+            return {check_key: 1.0}
+
+        keys_by_id = {id(variant): key for key, variant in variants.items()}
+        probabilities: dict[str, float] = {}
+        for outcome in check_outcome_distribution(
+            check_variant.dc, attribute_modifier + skill_modifier, advantage_type
+        ):
+            selected = self._variant_for_result(
+                variants,
+                SkillCheckResult(
+                    roll_result=None,
+                    dc=check_variant.dc,
+                    success=outcome.success,
+                    margin=outcome.margin,
+                    is_critical_success=outcome.is_critical_success,
+                    is_critical_failure=outcome.is_critical_failure,
+                    advantage_type=advantage_type,
+                    outcome_tier=outcome.outcome_tier,
+                    is_auto_success=outcome.is_auto_success,
+                ),
+            )
+            key = keys_by_id[id(selected)]
+            probabilities[key] = probabilities.get(key, 0.0) + outcome.probability
+
+        return {key: round(probability, 12) for key, probability in probabilities.items()}
+
     def _variant_for_result(
         self,
         variants: dict[str, OutcomeVariant],
@@ -370,6 +469,31 @@ class BranchCollapseManager:
 
         return DeltaApplicationResult(success=True, applied_count=len(deltas))
 
+    def _validate_versions(self, branch: QuantumBranch) -> DeltaApplicationResult:
+        """Validate a branch by comparing its version vector to current rows.
+
+        Replaces per-delta state queries for branches that recorded the
+        row versions of their inputs at generation time.
+
+        Args:
+            branch: Branch with a version vector
+
+        Returns:
+            DeltaApplicationResult indicating success/failure
+        """
+        if self._version_index.is_current(branch.version_vector):
+            return DeltaApplicationResult(success=True, applied_count=0)
+
+        current = self._version_index.snapshot(branch.version_vector.keys())
+        changed = sorted(
+            ref for ref, version in branch.version_vector.items() if current[ref] != version
+        )
+        return DeltaApplicationResult(
+            success=False,
+            applied_count=0,
+            error_message=f"World state changed since generation: {', '.join(changed)}",
+        )
+
     def _get_entity_id(self, entity_key: str) -> int | None:
         """Look up entity database ID from key.
 
@@ -466,6 +590,23 @@ class BranchCollapseManager:
         Returns:
             DeltaApplicationResult indicating success/failure
         """
+        if self._manifest_cache is None:
+            return await self._apply_deltas_in_order(deltas, turn_number)
+
+        with self._manifest_cache.applying_deltas():
+            result = await self._apply_deltas_in_order(deltas, turn_number)
+        # Report every delta, even after a failure, since a failed delta may
+        # have written part of its changes
+        for delta in deltas:
+            self._manifest_cache.apply_delta(delta.delta_type, delta.target_key, delta.changes)
+        return result
+
+    async def _apply_deltas_in_order(
+        self,
+        deltas: list[StateDelta],
+        turn_number: int,
+    ) -> DeltaApplicationResult:
+        """Apply deltas one by one, stopping at the first failure."""
         applied_count = 0
 
         for delta in deltas:
@@ -22,10 +22,10 @@ from __future__ import annotations
 import logging
 import re
 from dataclasses import dataclass, field
-from difflib import SequenceMatcher
 from typing import TYPE_CHECKING
 
 from src.gm.grounding import GroundingManifest
+from src.gm.key_index import KeyIndex
 from src.world_server.quantum.schemas import DeltaType, StateDelta
 
 if TYPE_CHECKING:
@@ -772,8 +772,7 @@ class DeltaPostProcessor:
         from src.llm.message_types import Message
 
         # Find similar keys
-        all_keys = list(self.manifest.all_keys())
-        candidates = self._find_similar_keys(unknown_key, all_keys, limit=2)
+        candidates = self._find_similar_keys(unknown_key, limit=2)
 
         # Build options
         options = []
@@ -812,7 +811,7 @@ Reply with just the number."""
     def _find_similar_keys(
         self,
         unknown_key: str,
-        all_keys: list[str],
+        all_keys: list[str] | None = None,
         limit: int = 2,
         threshold: float = 0.6,
     ) -> list[str]:
@@ -820,24 +819,18 @@ Reply with just the number."""
 
         Args:
             unknown_key: The key to match against.
-            all_keys: All valid keys in the manifest.
+            all_keys: Keys to search (default: the manifest's, via its key index).
             limit: Maximum number of matches to return.
             threshold: Minimum similarity score (0.0-1.0).
 
         Returns:
             List of similar keys, sorted by similarity (best first).
         """
-        matches: list[tuple[str, float]] = []
-
-        for key in all_keys:
-            ratio = SequenceMatcher(None, unknown_key.lower(), key.lower()).ratio()
-            if ratio >= threshold:
-                matches.append((key, ratio))
-
-        # Sort by similarity (descending)
-        matches.sort(key=lambda x: x[1], reverse=True)
-
-        return [key for key, _ in matches[:limit]]
+        if all_keys is None:
+            matches = self.manifest.find_similar_keys(unknown_key, threshold, limit)
+        else:
+            matches = KeyIndex(all_keys).similar(unknown_key, threshold, limit)
+        return [key for key, _ in matches]
 
     def _apply_key_replacements(
         self,
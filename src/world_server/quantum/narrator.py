@@ -15,16 +15,20 @@ Output: Prose string with [entity_key:display_text] format
 
 import logging
 from dataclasses import dataclass, field
+from typing import Callable
 
 from pydantic import BaseModel, Field
 
 from src.gm.grounding import GroundedEntity, GroundingManifest
-from src.gm.grounding_validator import GroundingValidator
+from src.gm.grounding_validator import GroundingScan, GroundingValidator
 from src.llm.base import LLMProvider
 from src.llm.factory import get_narrator_provider
 from src.llm.message_types import Message
+from src.llm.token_counter import get_token_counter
+from src.world_server.quantum.cleanup import cleanup_narrative
 from src.world_server.quantum.reasoning import SemanticOutcome
 from src.world_server.quantum.delta_translator import TranslationResult
+from src.world_server.quantum.streaming import StreamingNarrative
 
 logger = logging.getLogger(__name__)
 
@@ -248,12 +252,15 @@ class NarratorEngine:
         self,
         narrative: str,
         context: NarrationContext,
+        validator: GroundingValidator | GroundingScan | None = None,
     ) -> tuple[bool, list[str]]:
         """Validate narrative output for [key:text] format compliance.
 
         Args:
             narrative: The generated narrative text.
             context: The narration context with valid keys.
+            validator: Validator (or streaming scan) built for this context,
+                to reuse across calls.
 
         Returns:
             Tuple of (is_valid, error_messages).
@@ -261,8 +268,9 @@ class NarratorEngine:
         if not self.strict_grounding:
             return True, []
 
-        manifest = self._build_validation_manifest(context)
-        validator = GroundingValidator(manifest, skip_player_items=True)
+        if validator is None:
+            manifest = self._build_validation_manifest(context)
+            validator = GroundingValidator(manifest, skip_player_items=True)
         result = validator.validate(narrative)
 
         if result.valid:
@@ -284,9 +292,15 @@ class NarratorEngine:
 
         return False, errors
 
+    @property
+    def can_stream(self) -> bool:
+        """Whether the provider supports token streaming."""
+        return callable(getattr(self.llm, "complete_with_tools_streaming", None))
+
     async def narrate(
         self,
         context: NarrationContext,
+        on_text: Callable[[str], None] | None = None,
     ) -> NarrationResponse:
         """Generate narrative prose for an outcome with validation and retry.
 
@@ -296,15 +310,35 @@ class NarratorEngine:
         3. On failure, retry with error feedback (max attempts)
         4. Fall back to safe narration if all retries fail
 
+        With on_text, the first attempt is streamed as plain prose and
+        validated, cleaned-up sentences are passed to on_text as they
+        complete (see StreamingNarrative). Retries are not streamed, so
+        the caller should display the returned narrative if it differs
+        from what was streamed. Providers without streaming pass the
+        whole cleaned narrative to on_text once it is ready.
+
         Args:
             context: Context including what happened and key mappings.
+            on_text: Optional callback for cleaned prose as it streams.
 
         Returns:
             NarrationResponse with prose using [key:display] format.
         """
         errors: list[str] = []
+        attempts = self.max_retries
+
+        if on_text is not None:
+            if not self.can_stream:
+                result = await self.narrate(context)
+                on_text(cleanup_narrative(result.narrative, player_key=context.player_key).text)
+                return result
 
-        for attempt in range(self.max_retries):
+            result, errors = await self._narrate_streaming(context, on_text)
+            if result is not None:
+                return result
+            attempts -= 1
+
+        for attempt in range(attempts):
             prompt = self._build_prompt(context, previous_errors=errors)
 
             try:
@@ -356,6 +390,60 @@ class NarratorEngine:
         )
         return self._fallback_narration(context)
 
+    async def _narrate_streaming(
+        self,
+        context: NarrationContext,
+        on_text: Callable[[str], None],
+    ) -> tuple[NarrationResponse | None, list[str]]:
+        """Make one streamed narration attempt.
+
+        Args:
+            context: The narration context.
+            on_text: Callback for validated, cleaned prose.
+
+        Returns:
+            Tuple of (response, errors); response is None if the attempt
+            failed and errors should be fed back into a retry.
+        """
+        # Each sentence is validated as it completes; the scan only looks at new text
+        scan = None
+        if self.strict_grounding:
+            manifest = self._build_validation_manifest(context)
+            scan = GroundingValidator(manifest, skip_player_items=True).scan()
+        stream = StreamingNarrative(
+            on_text,
+            validate=lambda text: self._validate_narrative(text, context, scan)[1],
+            player_key=context.player_key,
+        )
+
+        try:
+            await self.llm.complete_with_tools_streaming(
+                messages=[Message.user(self._build_prompt(context, plain_text=True))],
+                tools=[],
+                tool_choice="none",
+                system_prompt=NARRATOR_SYSTEM_PROMPT,
+                temperature=self.temperature,
+                max_tokens=512,
+                on_token=stream.feed,
+            )
+        except Exception as e:
+            logger.error(f"Streamed narration failed: {e}")
+            return None, [f"LLM error: {e}"]
+
+        if not stream.raw.strip():
+            logger.warning("Narrator streamed no content")
+            return None, ["LLM returned no content"]
+
+        errors = stream.finish()
+        if errors:
+            logger.debug(
+                f"Streamed narration validation failed: {len(errors)} errors, "
+                f"{len(stream.emitted)} chars already shown"
+            )
+            return None, errors
+
+        return NarrationResponse(narrative=stream.raw.strip()), []
+
     async def narrate_from_outcome(
         self,
         outcome: SemanticOutcome,
@@ -365,6 +453,7 @@ class NarratorEngine:
         location_key: str = "",
         npcs_in_scene: dict[str, str] | None = None,
         items_in_scene: dict[str, str] | None = None,
+        on_text: Callable[[str], None] | None = None,
     ) -> NarrationResponse:
         """Convenience method to narrate from outcome and translation.
 
@@ -376,6 +465,7 @@ class NarratorEngine:
             location_key: Entity key of current location.
             npcs_in_scene: NPCs in scene (display -> key).
             items_in_scene: Items in scene (display -> key).
+            on_text: Optional callback for cleaned prose as it streams.
 
         Returns:
             NarrationResponse with grounded prose.
@@ -390,18 +480,44 @@ class NarratorEngine:
             npcs_in_scene=npcs_in_scene or {},
             items_in_scene=items_in_scene or {},
         )
-        return await self.narrate(context)
+        return await self.narrate(context, on_text=on_text)
+
+    def estimate_tokens(
+        self,
+        context: NarrationContext,
+        response: NarrationResponse | None = None,
+    ) -> int:
+        """Estimate tokens used by one narration call.
+
+        Args:
+            context: The narration context (prompt side).
+            response: The narration produced, if it finished (output side).
+
+        Returns:
+            Estimated prompt + output tokens.
+        """
+        model = getattr(self.llm, "default_model", None)
+        model = model if isinstance(model, str) else None
+        counter = get_token_counter()
+        tokens = counter.count(NARRATOR_SYSTEM_PROMPT, model) + counter.count(
+            self._build_prompt(context), model
+        )
+        if response is not None:
+            tokens += counter.count(response.narrative, model)
+        return tokens
 
     def _build_prompt(
         self,
         context: NarrationContext,
         previous_errors: list[str] | None = None,
+        plain_text: bool = False,
     ) -> str:
         """Build the narration prompt.
 
         Args:
             context: The narration context.
             previous_errors: Errors from a previous attempt (for retry).
+            plain_text: Ask for bare prose instead of structured output (streaming).
 
         Returns:
             Formatted prompt string.
@@ -453,6 +569,9 @@ class NarratorEngine:
             ]
         )
 
+        if plain_text:
+            lines.append("Respond with the narrative prose only - no JSON, headings or commentary.")
+
         if context.tone_hints:
             lines.append("")
             lines.append(f"Tone: {', '.join(context.tone_hints)}")
@@ -22,17 +22,28 @@ import random
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import Any, Awaitable, Callable
 
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Session
 
+from src.database.async_support import run_sync_read
 from src.database.models.session import GameSession, Turn
 from src.database.models.world import TimeState
-from src.dice.types import AdvantageType
+from src.dice.checks import make_skill_check
+from src.dice.types import AdvantageType, SkillCheckResult
 from src.gm.context_builder import GMContextBuilder
 from src.gm.grounding import GroundingManifest
+from src.gm.manifest_cache import ManifestCache
 from src.llm.base import LLMProvider
-from src.llm.factory import get_narrator_provider, get_reasoning_provider
+from src.llm.factory import (
+    get_cheap_provider,
+    get_narrator_provider,
+    get_reasoning_provider,
+)
+from src.llm.tracing_provider import TracingProvider
+from src.observability.hooks import ObservabilityHook
+from src.observability.tracing import Tracer
 from src.world_server.quantum.action_matcher import ActionMatcher, MatchResult
 from src.world_server.quantum.action_predictor import ActionPredictor
 from src.world_server.quantum.intent import IntentType
@@ -69,9 +80,24 @@ from src.world_server.quantum.ref_manifest import RefManifest
 from src.world_server.quantum.narrator import (
     NarratorEngine,
     NarrationContext,
+    NarrationResponse,
+)
+from src.world_server.quantum.speculation import (
+    SpeculationPolicy,
+    SpeculativeNarration,
+    outcome_key_for_check,
+    outcome_probabilities,
 )
 from src.world_server.quantum.cleanup import cleanup_narrative
+from src.world_server.quantum.anticipation import AnticipationJob, AnticipationScheduler
+from src.world_server.quantum.versioning import (
+    VersionVector,
+    WorldVersionIndex,
+    branch_refs,
+    manifest_refs,
+)
 from src.world_server.quantum.cache import QuantumBranchCache
+from src.world_server.quantum.branch_store import BranchStore, compute_world_fingerprint
 from src.world_server.quantum.collapse import (
     BranchCollapseManager,
     CollapseResult,
@@ -163,6 +189,7 @@ class TurnResult:
     total_time_ms: float = 0.0
     cache_lookup_time_ms: float = 0.0
     generation_time_ms: float = 0.0
+    time_to_first_token_ms: float | None = None  # Set when narration was streamed
 
     # Error handling
     error: str | None = None
@@ -191,7 +218,10 @@ class AnticipationConfig:
     """Configuration for background anticipation.
 
     Note: Anticipation is disabled by default due to the topic-awareness problem.
-    Pre-generated branches can't know what the player wants to discuss with NPCs.
+    Pre-generated branches can't know what the player wants to discuss with NPCs,
+    so the cache only serves anticipated NPC branches for inputs without a topic
+    ("talk to Tom"); topical dialogue hits come from branches generated for
+    earlier inputs on a similar topic (see topic_index.py).
     See docs/quantum-branching/anticipation-caching-issue.md for details.
     """
 
@@ -200,6 +230,9 @@ class AnticipationConfig:
     max_gm_decisions_per_action: int = 2  # Top N GM decisions per action
     cycle_delay_seconds: float = 0.5  # Delay between anticipation cycles
     error_delay_seconds: float = 2.0  # Delay after errors
+    max_concurrent_generations: int = 2  # Parallel generations per LLM provider
+    cycle_token_budget: int | None = None  # Stop starting jobs after this many tokens
+    cycle_time_budget_seconds: float | None = 60.0  # Cancel a cycle's work after this long
 
 
 class QuantumPipeline:
@@ -229,6 +262,12 @@ class QuantumPipeline:
         llm_provider: LLMProvider | None = None,
         metrics: QuantumMetrics | None = None,
         anticipation_config: AnticipationConfig | None = None,
+        branch_store: BranchStore | None = None,
+        anticipation_sessions: async_sessionmaker[AsyncSession] | None = None,
+        speculation_policy: SpeculationPolicy | None = None,
+        reasoning_provider: LLMProvider | None = None,
+        intent_provider: LLMProvider | None = None,
+        observability_hook: ObservabilityHook | None = None,
     ):
         """Initialize the pipeline.
 
@@ -238,32 +277,70 @@ class QuantumPipeline:
             llm_provider: LLM provider for branch generation (default: narrator)
             metrics: Optional shared metrics tracker
             anticipation_config: Configuration for background anticipation
+            branch_store: Optional persistent store backing the branch cache
+            anticipation_sessions: Optional AsyncSession factory; anticipation
+                then reads the scene on its own pooled session without
+                blocking the foreground turn
+            speculation_policy: When to narrate every plausible outcome
+                before the skill check resolves (default: never)
+            reasoning_provider: LLM provider for reasoning and branch
+                generation (default: reasoning)
+            intent_provider: LLM provider for intent classification
+                (default: cheap)
+            observability_hook: Optional hook receiving nested tracing
+                spans for turn phases, collapse, anticipation and LLM calls
         """
         self.db = db
+        self._anticipation_sessions = anticipation_sessions
         self.game_session = game_session
         self._metrics = metrics or QuantumMetrics()
+        self.tracer = Tracer(observability_hook)
 
         # Dual-model separation:
         # - Reasoning (qwen3): Logic, predictions, tool decisions
         # - Narrator (magmell): Prose generation, narrative output
-        self._reasoning_llm = get_reasoning_provider()
+        self._reasoning_llm = reasoning_provider or get_reasoning_provider()
         self._narrator_llm = llm_provider or get_narrator_provider()
+        if self.tracer.enabled:
+            # LLM calls become spans under the phase that made them
+            self._reasoning_llm = TracingProvider(self._reasoning_llm, self.tracer)
+            self._narrator_llm = TracingProvider(self._narrator_llm, self.tracer)
+            intent_provider = TracingProvider(
+                intent_provider or get_cheap_provider(), self.tracer
+            )
 
         # Initialize components
         self.action_predictor = ActionPredictor(db, game_session)
         self.action_matcher = ActionMatcher()
-        self.intent_classifier = IntentClassifier()  # Phase 1: LLM-based intent classification
+        # Phase 1: LLM-based intent classification
+        self.intent_classifier = IntentClassifier(llm=intent_provider)
         self.gm_oracle = GMDecisionOracle(db, game_session)
         # BranchGenerator needs structured JSON output → use reasoning model
         self.branch_generator = BranchGenerator(db, game_session, self._reasoning_llm)
-        self.branch_cache = QuantumBranchCache(metrics=self._metrics)
-        self.collapse_manager = BranchCollapseManager(db, game_session, self._metrics)
+        # Row versions of branch inputs decide branch freshness
+        self.version_index = WorldVersionIndex(db, game_session)
+        self.branch_cache = QuantumBranchCache(
+            metrics=self._metrics,
+            store=branch_store,
+            version_check=self.version_index.is_current,
+        )
+        # Manifest sections are reused until applied deltas or writes change them
+        self.manifest_cache = ManifestCache(db)
+        self.collapse_manager = BranchCollapseManager(
+            db,
+            game_session,
+            self._metrics,
+            version_index=self.version_index,
+            manifest_cache=self.manifest_cache,
+            tracer=self.tracer,
+        )
 
         # Split architecture components (Phases 2-5)
         self.reasoning_engine = ReasoningEngine(self._reasoning_llm)  # Phase 2
         self.delta_translator = DeltaTranslator()  # Phase 3
         self.ref_delta_translator = RefDeltaTranslator()  # Phase 3 (ref-based)
         self.narrator_engine = NarratorEngine(self._narrator_llm)  # Phase 4
+        self._speculation_policy = speculation_policy or SpeculationPolicy()
         # Phase 5 (cleanup) is a function, not a class
 
         # Configuration for split architecture (disabled by default for comparison)
@@ -272,19 +349,32 @@ class QuantumPipeline:
         self._use_ref_based = False
 
         # Context builder for manifests
-        self._context_builder = GMContextBuilder(db, game_session)
+        self._context_builder = GMContextBuilder(
+            db, game_session, manifest_cache=self.manifest_cache
+        )
 
         # Anticipation state
         self._anticipation_config = anticipation_config or AnticipationConfig()
         self._anticipation_task: asyncio.Task | None = None
         self._current_location: str | None = None
         self._running = False
+        self.anticipation_scheduler = AnticipationScheduler(
+            generate=self._generate_anticipated_branch,
+            max_concurrency=self._anticipation_config.max_concurrent_generations,
+            cycle_token_budget=self._anticipation_config.cycle_token_budget,
+            cycle_time_budget_seconds=self._anticipation_config.cycle_time_budget_seconds,
+        )
 
     @property
     def metrics(self) -> QuantumMetrics:
         """Get the metrics tracker."""
         return self._metrics
 
+    @property
+    def anticipation_config(self) -> AnticipationConfig:
+        """Get the background anticipation configuration."""
+        return self._anticipation_config
+
     async def process_turn(
         self,
         player_input: str,
@@ -294,6 +384,8 @@ class QuantumPipeline:
         attribute_modifier: int = 0,
         skill_modifier: int = 0,
         advantage_type: AdvantageType = AdvantageType.NORMAL,
+        on_text: Callable[[str], None] | None = None,
+        on_roll: Callable[[SkillCheckResult], Awaitable[None]] | None = None,
     ) -> TurnResult:
         """Process a player turn.
 
@@ -302,6 +394,17 @@ class QuantumPipeline:
         2. If no cache hit, generate synchronously (slow path)
         3. Trigger background anticipation for new state
 
+        With on_text, slow-path narration (split and ref-based
+        architectures) is streamed: validated, cleaned prose is passed to
+        on_text as it is generated, and the time to the first chunk is
+        recorded in the metrics and on the TurnResult. The returned
+        narrative is authoritative if it differs from the streamed text.
+
+        With on_roll, the slow path awaits it with the skill check that
+        selects the outcome before narrating (e.g. to show the roll). With
+        a speculation policy, narration of every plausible outcome runs
+        while on_roll is awaited.
+
         Args:
             player_input: The player's input text
             location_key: Current location key
@@ -310,52 +413,104 @@ class QuantumPipeline:
             attribute_modifier: Player's attribute modifier for skill checks
             skill_modifier: Player's skill modifier for skill checks
             advantage_type: Whether player has advantage/disadvantage
+            on_text: Optional callback for streamed narrative text
+            on_roll: Optional coroutine awaited with the skill check
 
         Returns:
             TurnResult with narrative and metadata
         """
+        with self.tracer.span(
+            "turn",
+            session_id=self.game_session.id,
+            turn=turn_number,
+            location=location_key,
+        ) as span:
+            result = await self._process_turn(
+                player_input=player_input,
+                location_key=location_key,
+                turn_number=turn_number,
+                player_id=player_id,
+                attribute_modifier=attribute_modifier,
+                skill_modifier=skill_modifier,
+                advantage_type=advantage_type,
+                on_text=on_text,
+                on_roll=on_roll,
+            )
+            span.set(cache_hit=result.was_cache_hit)
+            if result.error:
+                span.fail(result.error)
+            return result
+
+    async def _process_turn(
+        self,
+        player_input: str,
+        location_key: str,
+        turn_number: int,
+        player_id: int | None,
+        attribute_modifier: int,
+        skill_modifier: int,
+        advantage_type: AdvantageType,
+        on_text: Callable[[str], None] | None,
+        on_roll: Callable[[SkillCheckResult], Awaitable[None]] | None,
+    ) -> TurnResult:
+        """Process a player turn inside its tracing span (see process_turn)."""
         start_time = time.perf_counter()
         self._current_location = location_key
 
+        first_text_ms: list[float] = []
+
+        def stream_text(text: str) -> None:
+            if not first_text_ms:
+                first_text_ms.append((time.perf_counter() - start_time) * 1000)
+                self._metrics.record_first_token(first_text_ms[0])
+            on_text(text)
+
         try:
             # 1. Build manifest for current scene
-            manifest = await self._build_manifest(player_id, location_key)
+            with self.tracer.span("manifest"):
+                manifest = await self._build_manifest(player_id, location_key)
+                fingerprint = compute_world_fingerprint(manifest)
 
             # 2. Get predictions
-            predictions = self.action_predictor.predict_actions(
-                location_key=location_key,
-                manifest=manifest,
-            )
+            with self.tracer.span("prediction") as span:
+                predictions = self.action_predictor.predict_actions(
+                    location_key=location_key,
+                    manifest=manifest,
+                )
+                span.set(predictions=len(predictions))
             self._metrics.predictions_made += 1
             self._metrics.actions_predicted += len(predictions)
 
             # 3. Classify player intent (Phase 1 of split architecture)
-            intent_result = await self._classify_intent(
-                player_input=player_input,
-                manifest=manifest,
-                location_key=location_key,
-            )
-
-            # Handle informational intents (questions/hypotheticals) - no state change
-            if intent_result and intent_result.is_informational:
-                return await self._handle_informational_intent(
-                    intent_result=intent_result,
+            with self.tracer.span("intent"):
+                intent_result = await self._classify_intent(
+                    player_input=player_input,
                     manifest=manifest,
                     location_key=location_key,
-                    start_time=start_time,
                 )
 
+            # Handle informational intents (questions/hypotheticals) - no state change
+            if intent_result and intent_result.is_informational:
+                with self.tracer.span("informational"):
+                    return await self._handle_informational_intent(
+                        intent_result=intent_result,
+                        manifest=manifest,
+                        location_key=location_key,
+                        start_time=start_time,
+                    )
+
             # 4. Match player input (fallback to old matcher if intent classifier uncertain)
-            if intent_result and intent_result.confidence >= 0.7:
-                # Use intent classifier result for matching
-                match_result = self._intent_to_match_result(intent_result, predictions)
-            else:
-                # Fall back to fuzzy matcher
-                match_result = self.action_matcher.match(
-                    player_input=player_input,
-                    predictions=predictions,
-                    manifest=manifest,
-                )
+            with self.tracer.span("match"):
+                if intent_result and intent_result.confidence >= 0.7:
+                    # Use intent classifier result for matching
+                    match_result = self._intent_to_match_result(intent_result, predictions)
+                else:
+                    # Fall back to fuzzy matcher
+                    match_result = self.action_matcher.match(
+                        player_input=player_input,
+                        predictions=predictions,
+                        manifest=manifest,
+                    )
 
             if match_result:
                 action = match_result.prediction
@@ -367,17 +522,22 @@ class QuantumPipeline:
 
                 # 5. Check cache for this branch
                 cache_start = time.perf_counter()
-                branch = await self.branch_cache.get_branch(
-                    location_key=location_key,
-                    action=action,
-                    gm_decision_type=selected_decision.decision_type,
-                )
+                with self.tracer.span("cache_lookup") as span:
+                    branch = await self.branch_cache.get_branch(
+                        location_key=location_key,
+                        action=action,
+                        gm_decision_type=selected_decision.decision_type,
+                        fingerprint=fingerprint,
+                        player_input=player_input,
+                    )
+                    span.set(hit=branch is not None)
                 cache_lookup_time_ms = (time.perf_counter() - cache_start) * 1000
 
                 if branch:
                     # CACHE HIT - Validate before collapse
-                    validator = BranchValidator(manifest, self.db, self.game_session)
-                    validation_result = validator.validate(branch)
+                    with self.tracer.span("validation"):
+                        validator = BranchValidator(manifest, self.db, self.game_session)
+                        validation_result = validator.validate(branch)
 
                     # Check for blocking grounding errors (stale/hallucinated entities)
                     should_block, fallback_narrative = _has_blocking_grounding_errors(
@@ -433,23 +593,28 @@ class QuantumPipeline:
                         # Fall through to sync generation
 
             # 6. CACHE MISS - Generate synchronously
-            result = await self._generate_sync(
-                player_input=player_input,
-                location_key=location_key,
-                turn_number=turn_number,
-                manifest=manifest,
-                predictions=predictions,
-                match_result=match_result,
-                attribute_modifier=attribute_modifier,
-                skill_modifier=skill_modifier,
-                advantage_type=advantage_type,
-                intent_result=intent_result,
-            )
+            with self.tracer.span("generation"):
+                result = await self._generate_sync(
+                    player_input=player_input,
+                    location_key=location_key,
+                    turn_number=turn_number,
+                    manifest=manifest,
+                    predictions=predictions,
+                    match_result=match_result,
+                    attribute_modifier=attribute_modifier,
+                    skill_modifier=skill_modifier,
+                    advantage_type=advantage_type,
+                    intent_result=intent_result,
+                    on_text=stream_text if on_text is not None else None,
+                    on_roll=on_roll,
+                )
 
             result.total_time_ms = (time.perf_counter() - start_time) * 1000
+            if first_text_ms:
+                result.time_to_first_token_ms = first_text_ms[0]
 
-            # Trigger anticipation
-            self._trigger_anticipation(location_key)
+            # Trigger anticipation (for the destination if the player moved)
+            self._trigger_anticipation(result.new_location or location_key)
 
             return result
 
@@ -493,13 +658,18 @@ class QuantumPipeline:
             destination_hint=destination_hint,
         )
 
-    def _get_player_entity(self):
-        """Get player entity from session."""
+    def _get_player_entity(self, db: Session | None = None):
+        """Get player entity from session.
+
+        Args:
+            db: Session to read through (default: the pipeline's session)
+        """
         from src.database.models.entities import Entity
         from src.database.models.enums import EntityType
 
+        db = db or self.db
         return (
-            self.db.query(Entity)
+            db.query(Entity)
             .filter(
                 Entity.session_id == self.game_session.id,
                 Entity.entity_type == EntityType.PLAYER,
@@ -800,6 +970,8 @@ class QuantumPipeline:
         skill_modifier: int,
         advantage_type: AdvantageType,
         intent_result=None,
+        on_text: Callable[[str], None] | None = None,
+        on_roll: Callable[[SkillCheckResult], Awaitable[None]] | None = None,
     ) -> TurnResult:
         """Generate a branch synchronously on cache miss.
 
@@ -814,6 +986,8 @@ class QuantumPipeline:
             skill_modifier: Player's skill modifier
             advantage_type: Advantage state
             intent_result: Optional intent classification from Phase 1
+            on_text: Optional callback for streamed narrative text
+            on_roll: Optional coroutine awaited with the skill check
 
         Returns:
             TurnResult from synchronous generation
@@ -857,6 +1031,8 @@ class QuantumPipeline:
                 attribute_modifier=attribute_modifier,
                 skill_modifier=skill_modifier,
                 advantage_type=advantage_type,
+                on_text=on_text,
+                on_roll=on_roll,
             )
 
         # Use split architecture if enabled
@@ -872,6 +1048,8 @@ class QuantumPipeline:
                 attribute_modifier=attribute_modifier,
                 skill_modifier=skill_modifier,
                 advantage_type=advantage_type,
+                on_text=on_text,
+                on_roll=on_roll,
             )
 
         # Get GM decision
@@ -926,6 +1104,11 @@ class QuantumPipeline:
             origin_location_key=origin_location_for_context,
         )
 
+        # Pin the versions of the state generation starts from
+        planned_versions = self.version_index.snapshot(
+            manifest_refs(manifest) | manifest_refs(generation_manifest)
+        )
+
         # Generate branch
         try:
             branch = await self.branch_generator.generate_branch(
@@ -943,7 +1126,7 @@ class QuantumPipeline:
             for variant in branch.variants.values():
                 for delta in variant.state_deltas:
                     if delta.delta_type == DeltaType.CREATE_ENTITY:
-                        generation_manifest.additional_valid_keys.add(delta.target_key)
+                        generation_manifest.add_valid_key(delta.target_key)
 
             # Validate the branch for grounding/hallucination issues
             # Use the same manifest that was used for generation (destination for MOVE)
@@ -975,7 +1158,10 @@ class QuantumPipeline:
 
             # Cache the branch for potential reuse (only if valid)
             if validation_result.valid:
-                await self.branch_cache.put_branch(branch)
+                self._record_versions(branch, planned_versions)
+                await self.branch_cache.put_branch(
+                    branch, fingerprint=compute_world_fingerprint(manifest)
+                )
 
             # Collapse immediately
             collapse_result = await self.collapse_manager.collapse_branch(
@@ -1024,7 +1210,7 @@ class QuantumPipeline:
                 for variant in branch.variants.values():
                     for delta in variant.state_deltas:
                         if delta.delta_type == DeltaType.CREATE_ENTITY:
-                            generation_manifest.additional_valid_keys.add(delta.target_key)
+                            generation_manifest.add_valid_key(delta.target_key)
 
                 # Validate and collapse the retry
                 validator = BranchValidator(generation_manifest, self.db, self.game_session)
@@ -1049,7 +1235,10 @@ class QuantumPipeline:
                         )
 
                 if validation_result.valid:
-                    await self.branch_cache.put_branch(branch)
+                    self._record_versions(branch, planned_versions)
+                    await self.branch_cache.put_branch(
+                        branch, fingerprint=compute_world_fingerprint(manifest)
+                    )
 
                 collapse_result = await self.collapse_manager.collapse_branch(
                     branch=branch,
@@ -1111,6 +1300,7 @@ class QuantumPipeline:
         location_key: str,
         player_input: str | None = None,
         origin_location_key: str | None = None,
+        db: Session | None = None,
     ) -> BranchContext:
         """Build context for branch generation.
 
@@ -1118,13 +1308,16 @@ class QuantumPipeline:
             location_key: Current location (or destination for MOVE)
             player_input: Optional player input for topic-awareness
             origin_location_key: For MOVE actions, the origin location
+            db: Session to read through (default: the pipeline's session)
 
         Returns:
             BranchContext with scene info
         """
+        db = db or self.db
+
         # Get time state
         time_state = (
-            self.db.query(TimeState)
+            db.query(TimeState)
             .filter(TimeState.session_id == self.game_session.id)
             .first()
         )
@@ -1154,7 +1347,7 @@ class QuantumPipeline:
         from src.database.models.world import Location
 
         location = (
-            self.db.query(Location)
+            db.query(Location)
             .filter(
                 Location.session_id == self.game_session.id,
                 Location.location_key == location_key,
@@ -1165,7 +1358,7 @@ class QuantumPipeline:
 
         # Get recent events (last 3 turns)
         recent_turns = (
-            self.db.query(Turn)
+            db.query(Turn)
             .filter(Turn.session_id == self.game_session.id)
             .order_by(Turn.turn_number.desc())
             .limit(3)
@@ -1174,14 +1367,14 @@ class QuantumPipeline:
         recent_events = [t.gm_response[:100] for t in recent_turns if t.gm_response]
 
         # Get actual player entity key (not hardcoded "player")
-        player = self._get_player_entity()
+        player = self._get_player_entity(db)
         player_key = player.entity_key if player else "player"
 
         # For MOVE actions, get origin location display name
         origin_location_display = None
         if origin_location_key:
             origin_location = (
-                self.db.query(Location)
+                db.query(Location)
                 .filter(
                     Location.session_id == self.game_session.id,
                     Location.location_key == origin_location_key,
@@ -1220,6 +1413,8 @@ class QuantumPipeline:
         attribute_modifier: int = 0,
         skill_modifier: int = 0,
         advantage_type: AdvantageType = AdvantageType.NORMAL,
+        on_text: Callable[[str], None] | None = None,
+        on_roll: Callable[[SkillCheckResult], Awaitable[None]] | None = None,
     ) -> TurnResult:
         """Generate using the split 5-phase architecture.
 
@@ -1239,6 +1434,8 @@ class QuantumPipeline:
             attribute_modifier: Player's attribute modifier
             skill_modifier: Player's skill modifier
             advantage_type: Advantage state
+            on_text: Optional callback for streamed narrative text
+            on_roll: Optional coroutine awaited with the skill check
 
         Returns:
             TurnResult from split architecture
@@ -1258,28 +1455,62 @@ class QuantumPipeline:
                 location_key=location_key,
             )
 
-            reasoning_response = await self.reasoning_engine.reason(
-                context=reasoning_context,
-                intent=intent_result,
-            )
+            with self.tracer.span("reasoning"):
+                reasoning_response = await self.reasoning_engine.reason(
+                    context=reasoning_context,
+                    intent=intent_result,
+                )
 
             logger.debug(
                 f"Reasoning: requires_check={reasoning_response.requires_skill_check}, "
                 f"skill={reasoning_response.skill_name}"
             )
 
-            # Select outcome based on skill check (if needed)
-            outcome = await self._select_outcome_from_reasoning(
+            # ===== PHASES 3-4: Delta Translation and Narration =====
+            manifest_context = self._build_manifest_context(manifest, location_key, player_key)
+
+            # Fetch time state for narrator context
+            time_state = self._get_time_state()
+            game_time = str(time_state.current_time)[:5] if time_state else "12:00"
+            game_day = time_state.current_day if time_state else 1
+            game_period = self._calculate_game_period(game_time)
+
+            def prepare(
+                outcome: SemanticOutcome,
+            ) -> tuple[TranslationResult, NarrationContext]:
+                translation = self.delta_translator.translate(outcome, manifest_context)
+                # Build narration context with full key mapping
+                return translation, NarrationContext(
+                    what_happens=outcome.what_happens,
+                    outcome_type=outcome.outcome_type,
+                    key_mapping=translation.key_mapping,
+                    player_key=player_key,
+                    location_display=manifest.location_display or location_key,
+                    location_key=location_key,
+                    npcs_in_scene={
+                        npc.display_name: npc.key
+                        for npc in (manifest.npcs or {}).values()
+                    },
+                    items_in_scene={
+                        item.display_name: item.key
+                        for item in (manifest.items_at_location or {}).values()
+                    },
+                    game_time=game_time,
+                    game_period=game_period,
+                    game_day=game_day,
+                )
+
+            # Roll the skill check (if needed) and narrate the selected outcome
+            outcome, translation, narration_response = await self._roll_and_narrate(
                 reasoning_response=reasoning_response,
+                prepare=prepare,
                 attribute_modifier=attribute_modifier,
                 skill_modifier=skill_modifier,
                 advantage_type=advantage_type,
+                on_text=on_text,
+                on_roll=on_roll,
             )
 
-            # ===== PHASE 3: Delta Translation =====
-            manifest_context = self._build_manifest_context(manifest, location_key, player_key)
-            translation = self.delta_translator.translate(outcome, manifest_context)
-
             if translation.has_errors:
                 logger.warning(f"Delta translation errors: {translation.errors}")
 
@@ -1287,36 +1518,6 @@ class QuantumPipeline:
                 f"Deltas: {len(translation.deltas)}, "
                 f"new_keys: {list(translation.key_mapping.values())}"
             )
-
-            # ===== PHASE 4: Narration =====
-            # Fetch time state for narrator context
-            time_state = self._get_time_state()
-            game_time = str(time_state.current_time)[:5] if time_state else "12:00"
-            game_day = time_state.current_day if time_state else 1
-            game_period = self._calculate_game_period(game_time)
-
-            # Build narration context with full key mapping
-            narration_context = NarrationContext(
-                what_happens=outcome.what_happens,
-                outcome_type=outcome.outcome_type,
-                key_mapping=translation.key_mapping,
-                player_key=player_key,
-                location_display=manifest.location_display or location_key,
-                location_key=location_key,
-                npcs_in_scene={
-                    npc.display_name: npc.key
-                    for npc in (manifest.npcs or {}).values()
-                },
-                items_in_scene={
-                    item.display_name: item.key
-                    for item in (manifest.items_at_location or {}).values()
-                },
-                game_time=game_time,
-                game_period=game_period,
-                game_day=game_day,
-            )
-
-            narration_response = await self.narrator_engine.narrate(narration_context)
             raw_narrative = narration_response.narrative
 
             logger.debug(f"Raw narrative: {raw_narrative[:100]}...")
@@ -1497,59 +1698,132 @@ class QuantumPipeline:
             player_key=player_key,
         )
 
-    async def _select_outcome_from_reasoning(
+    def _roll_skill_check(
         self,
-        reasoning_response: ReasoningResponse,
+        reasoning_response: ReasoningResponse | RefReasoningResponse,
         attribute_modifier: int,
         skill_modifier: int,
         advantage_type: AdvantageType,
-    ) -> SemanticOutcome:
-        """Select the appropriate outcome based on skill check.
-
-        If the action requires a skill check, roll dice and select
-        the appropriate outcome. Otherwise, return success.
+    ) -> SkillCheckResult | None:
+        """Roll the skill check a reasoning response asks for.
 
         Args:
-            reasoning_response: Response from Phase 2
+            reasoning_response: Response from Phase 2 (either architecture)
             attribute_modifier: Player's attribute modifier
             skill_modifier: Player's skill modifier
             advantage_type: Advantage state
 
         Returns:
-            Selected SemanticOutcome
+            SkillCheckResult, or None if no check is required
         """
         if not reasoning_response.requires_skill_check:
-            return reasoning_response.success
-
-        # Roll skill check
-        from src.dice.roller import DiceRoller
+            return None
 
         dc = difficulty_to_dc(reasoning_response.difficulty)
-        roller = DiceRoller()
-
-        result = roller.skill_check(
+        result = make_skill_check(
             dc=dc,
-            modifier=attribute_modifier + skill_modifier,
+            attribute_modifier=attribute_modifier,
+            skill_modifier=skill_modifier,
             advantage_type=advantage_type,
+            skill_name=reasoning_response.skill_name or "",
         )
 
         logger.info(
             f"Skill check: {reasoning_response.skill_name} DC {dc}, "
-            f"rolled {result.total} ({'success' if result.success else 'failure'})"
+            f"rolled {result.margin + dc} ({'success' if result.success else 'failure'})"
         )
+        return result
 
-        # Select outcome based on roll
-        if result.is_critical_success and reasoning_response.critical_success:
-            return reasoning_response.critical_success
-        elif result.is_critical_failure and reasoning_response.critical_failure:
-            return reasoning_response.critical_failure
-        elif result.success:
-            return reasoning_response.success
-        elif reasoning_response.failure:
-            return reasoning_response.failure
-        else:
-            # Fallback to success if no failure variant
-            return reasoning_response.success
+    async def _roll_and_narrate(
+        self,
+        reasoning_response: ReasoningResponse | RefReasoningResponse,
+        prepare: Callable[[Any], tuple[TranslationResult, NarrationContext]],
+        attribute_modifier: int = 0,
+        skill_modifier: int = 0,
+        advantage_type: AdvantageType = AdvantageType.NORMAL,
+        on_text: Callable[[str], None] | None = None,
+        on_roll: Callable[[SkillCheckResult], Awaitable[None]] | None = None,
+    ) -> tuple[Any, TranslationResult, NarrationResponse]:
+        """Roll the skill check and narrate the selected outcome.
+
+        Serially this is roll -> translate -> narrate. When there is an
+        on_roll to wait on (e.g. the player's roll prompt) and the speculation
+        policy allows the narrator's cost class, every plausible outcome is
+        translated and narrated concurrently with it, and the narration
+        matching the roll is kept. Without on_roll the roll is instant, so
+        there is nothing to hide the extra narrations behind.
+
+        Args:
+            reasoning_response: Response from Phase 2 (either architecture)
+            prepare: Translates an outcome and builds its narration context
+            attribute_modifier: Player's attribute modifier
+            skill_modifier: Player's skill modifier
+            advantage_type: Advantage state
+            on_text: Optional callback for streamed narrative text
+            on_roll: Optional coroutine shown the skill check before narration
+
+        Returns:
+            Tuple of (selected outcome, its translation, its narration)
+        """
+        prepared: dict[str, tuple[TranslationResult, NarrationContext]] = {}
+        speculation: SpeculativeNarration | None = None
+
+        if (
+            reasoning_response.requires_skill_check
+            and on_roll is not None
+            and self._speculation_policy.allows(self._narrator_llm)
+        ):
+            probabilities = outcome_probabilities(
+                reasoning_response,
+                dc=difficulty_to_dc(reasoning_response.difficulty),
+                modifier=attribute_modifier + skill_modifier,
+                advantage_type=advantage_type,
+            )
+            for key in self._speculation_policy.plausible_outcomes(probabilities):
+                prepared[key] = prepare(getattr(reasoning_response, key))
+            if prepared:
+                speculation = SpeculativeNarration(self.narrator_engine)
+                speculation.start({key: context for key, (_, context) in prepared.items()})
+
+        try:
+            with self.tracer.span("roll", speculating=speculation is not None):
+                check = self._roll_skill_check(
+                    reasoning_response, attribute_modifier, skill_modifier, advantage_type
+                )
+                if check is not None and on_roll is not None:
+                    await on_roll(check)
+        except BaseException:
+            if speculation is not None:
+                speculation.cancel()
+            raise
+
+        outcome_key = outcome_key_for_check(reasoning_response, check)
+        outcome = getattr(reasoning_response, outcome_key)
+
+        if speculation is not None:
+            speculation.mark_rolled()
+            with self.tracer.span("narration", outcome=outcome_key, speculative=True):
+                narration_response, report = await speculation.resolve(outcome_key)
+            self._metrics.record_speculation(
+                hit=report.hit,
+                wasted_branches=report.wasted_branches,
+                wasted_tokens=report.wasted_tokens,
+                latency_saved_ms=report.latency_saved_ms,
+            )
+            if narration_response is not None:
+                translation, context = prepared[outcome_key]
+                if on_text is not None:
+                    on_text(
+                        cleanup_narrative(
+                            narration_response.narrative, player_key=context.player_key
+                        ).text
+                    )
+                return outcome, translation, narration_response
+
+        translation, context = prepared.get(outcome_key) or prepare(outcome)
+        with self.tracer.span("narration", outcome=outcome_key):
+            narration_response = await self.narrator_engine.narrate(context, on_text=on_text)
+        return outcome, translation, narration_response
 
     # =========================================================================
     # Ref-Based Architecture Generation
@@ -1566,6 +1840,8 @@ class QuantumPipeline:
         attribute_modifier: int = 0,
         skill_modifier: int = 0,
         advantage_type: AdvantageType = AdvantageType.NORMAL,
+        on_text: Callable[[str], None] | None = None,
+        on_roll: Callable[[SkillCheckResult], Awaitable[None]] | None = None,
     ) -> TurnResult:
         """Generate using the ref-based architecture.
 
@@ -1590,6 +1866,8 @@ class QuantumPipeline:
             attribute_modifier: Player's attribute modifier
             skill_modifier: Player's skill modifier
             advantage_type: Advantage state
+            on_text: Optional callback for streamed narrative text
+            on_roll: Optional coroutine awaited with the skill check
 
         Returns:
             TurnResult from ref-based architecture
@@ -1656,24 +1934,57 @@ class QuantumPipeline:
                 recent_events=recent_events,
             )
 
-            reasoning_response = await reason_with_refs(ref_context, self._reasoning_llm)
+            with self.tracer.span("reasoning"):
+                reasoning_response = await reason_with_refs(ref_context, self._reasoning_llm)
 
             logger.debug(
                 f"Ref reasoning: requires_check={reasoning_response.requires_skill_check}, "
                 f"skill={reasoning_response.skill_name}"
             )
 
-            # Select outcome based on skill check (if needed)
-            outcome = await self._select_ref_outcome(
+            # ===== PHASES 3-4: Delta Translation with Refs and Narration =====
+            # Fetch time state for narrator context
+            time_state = self._get_time_state()
+            game_time = str(time_state.current_time)[:5] if time_state else "12:00"
+            game_day = time_state.current_day if time_state else 1
+            game_period = self._calculate_game_period(game_time)
+
+            def prepare(
+                outcome: RefBasedOutcome,
+            ) -> tuple[TranslationResult, NarrationContext]:
+                translation = self.ref_delta_translator.translate(outcome, ref_manifest)
+                # Build narration context with resolved entity keys
+                return translation, NarrationContext(
+                    what_happens=outcome.what_happens,
+                    outcome_type=outcome.outcome_type,
+                    key_mapping=translation.key_mapping,
+                    player_key=player_key,
+                    location_display=manifest.location_display or location_key,
+                    location_key=location_key,
+                    npcs_in_scene={
+                        npc.display_name: npc.key
+                        for npc in (manifest.npcs or {}).values()
+                    },
+                    items_in_scene={
+                        item.display_name: item.key
+                        for item in (manifest.items_at_location or {}).values()
+                    },
+                    game_time=game_time,
+                    game_period=game_period,
+                    game_day=game_day,
+                )
+
+            # Roll the skill check (if needed) and narrate the selected outcome
+            outcome, translation, narration_response = await self._roll_and_narrate(
                 reasoning_response=reasoning_response,
+                prepare=prepare,
                 attribute_modifier=attribute_modifier,
                 skill_modifier=skill_modifier,
                 advantage_type=advantage_type,
+                on_text=on_text,
+                on_roll=on_roll,
             )
 
-            # ===== PHASE 3: Delta Translation with Refs =====
-            translation = self.ref_delta_translator.translate(outcome, ref_manifest)
-
             if translation.has_errors:
                 logger.warning(f"Ref delta translation errors: {translation.errors}")
                 # Continue anyway - some errors are recoverable
@@ -1682,36 +1993,6 @@ class QuantumPipeline:
                 f"Ref deltas: {len(translation.deltas)}, "
                 f"key_mapping: {translation.key_mapping}"
             )
-
-            # ===== PHASE 4: Narration =====
-            # Fetch time state for narrator context
-            time_state = self._get_time_state()
-            game_time = str(time_state.current_time)[:5] if time_state else "12:00"
-            game_day = time_state.current_day if time_state else 1
-            game_period = self._calculate_game_period(game_time)
-
-            # Build narration context with resolved entity keys
-            narration_context = NarrationContext(
-                what_happens=outcome.what_happens,
-                outcome_type=outcome.outcome_type,
-                key_mapping=translation.key_mapping,
-                player_key=player_key,
-                location_display=manifest.location_display or location_key,
-                location_key=location_key,
-                npcs_in_scene={
-                    npc.display_name: npc.key
-                    for npc in (manifest.npcs or {}).values()
-                },
-                items_in_scene={
-                    item.display_name: item.key
-                    for item in (manifest.items_at_location or {}).values()
-                },
-                game_time=game_time,
-                game_period=game_period,
-                game_day=game_day,
-            )
-
-            narration_response = await self.narrator_engine.narrate(narration_context)
             raw_narrative = narration_response.narrative
 
             logger.debug(f"Raw narrative: {raw_narrative[:100]}...")
@@ -1787,57 +2068,6 @@ class QuantumPipeline:
                 used_fallback=True,
             )
 
-    async def _select_ref_outcome(
-        self,
-        reasoning_response: RefReasoningResponse,
-        attribute_modifier: int,
-        skill_modifier: int,
-        advantage_type: AdvantageType,
-    ) -> RefBasedOutcome:
-        """Select the appropriate ref-based outcome based on skill check.
-
-        Args:
-            reasoning_response: Response from ref-based reasoning
-            attribute_modifier: Player's attribute modifier
-            skill_modifier: Player's skill modifier
-            advantage_type: Advantage state
-
-        Returns:
-            Selected RefBasedOutcome
-        """
-        if not reasoning_response.requires_skill_check:
-            return reasoning_response.success
-
-        # Roll skill check
-        from src.dice.roller import DiceRoller
-
-        dc = difficulty_to_dc(reasoning_response.difficulty)
-        roller = DiceRoller()
-
-        result = roller.skill_check(
-            dc=dc,
-            modifier=attribute_modifier + skill_modifier,
-            advantage_type=advantage_type,
-        )
-
-        logger.info(
-            f"Ref skill check: {reasoning_response.skill_name} DC {dc}, "
-            f"rolled {result.total} ({'success' if result.success else 'failure'})"
-        )
-
-        # Select outcome based on roll
-        if result.is_critical_success and reasoning_response.critical_success:
-            return reasoning_response.critical_success
-        elif result.is_critical_failure and reasoning_response.critical_failure:
-            return reasoning_response.critical_failure
-        elif result.success:
-            return reasoning_response.success
-        elif reasoning_response.failure:
-            return reasoning_response.failure
-        else:
-            # Fallback to success if no failure variant
-            return reasoning_response.success
-
     # =========================================================================
     # Background Anticipation
     # =========================================================================
@@ -1858,6 +2088,7 @@ class QuantumPipeline:
     async def stop_anticipation(self) -> None:
         """Stop background anticipation loop."""
         self._running = False
+        self.anticipation_scheduler.cancel_all()
 
         if self._anticipation_task is not None:
             self._anticipation_task.cancel()
@@ -1872,17 +2103,23 @@ class QuantumPipeline:
     def _trigger_anticipation(self, location_key: str) -> None:
         """Trigger anticipation for a new location.
 
+        Queued and in-flight generations for any other location are
+        cancelled so the scheduler only spends tokens on the new scene.
+
         Args:
             location_key: Location to anticipate for
         """
         self._current_location = location_key
+        self.anticipation_scheduler.cancel_except(location_key)
         # Anticipation loop will pick this up on next cycle
 
     async def _anticipation_loop(self) -> None:
         """Background loop that pre-generates branches.
 
-        Runs continuously, predicting actions and generating branches
-        for the current location. Uses exponential backoff on errors.
+        Each cycle plans jobs for the top predicted actions and GM
+        decisions at the current location, skips branches already cached,
+        and hands the rest to the scheduler, which runs them concurrently
+        in probability order within the cycle budget.
         """
         config = self._anticipation_config
 
@@ -1893,71 +2130,182 @@ class QuantumPipeline:
                     await asyncio.sleep(config.cycle_delay_seconds)
                     continue
 
-                # Build manifest
-                player_id = self._get_player_id()
-                manifest = await self._build_manifest(player_id, location_key)
+                with self.tracer.span(
+                    "anticipation.cycle",
+                    session_id=self.game_session.id,
+                    location=location_key,
+                ) as span:
+                    with self.tracer.span("anticipation.plan"):
+                        jobs = await self._plan_anticipation_jobs(location_key)
+                    span.set(jobs=len(jobs))
+                    if jobs:
+                        self.anticipation_scheduler.submit(jobs)
+                        branches = await self.anticipation_scheduler.run_cycle()
+                        span.set(branches=len(branches))
+                        if branches:
+                            logger.debug(f"Anticipation generated {len(branches)} branches")
 
-                # Predict actions
-                predictions = self.action_predictor.predict_actions(
+                await asyncio.sleep(config.cycle_delay_seconds)
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Anticipation error: {e}")
+                await asyncio.sleep(config.error_delay_seconds)
+
+    async def _plan_anticipation_jobs(self, location_key: str) -> list[AnticipationJob]:
+        """Build the uncached generation jobs for a location.
+
+        With an anticipation session factory, scene reads run on a pooled
+        AsyncSession of their own and are awaited, so planning overlaps the
+        foreground turn instead of blocking the event loop.
+
+        Args:
+            location_key: Location to anticipate for
+
+        Returns:
+            Jobs for branches not already in the cache
+        """
+        if self._anticipation_sessions is None:
+            return await self._plan_jobs_on_session(self.db, location_key)
+
+        async with self._anticipation_sessions() as session:
+            return await self._plan_jobs_on_session(session.sync_session, location_key)
+
+    async def _plan_jobs_on_session(self, db: Session, location_key: str) -> list[AnticipationJob]:
+        """Plan anticipation jobs, reading the scene through a given session.
+
+        Args:
+            db: The pipeline's session, or an anticipation session
+            location_key: Location to anticipate for
+
+        Returns:
+            Jobs for branches not already in the cache
+        """
+        config = self._anticipation_config
+
+        if db is self.db:
+            manifest = await self._build_manifest(self._get_player_id(), location_key)
+            predictor, oracle = self.action_predictor, self.gm_oracle
+        else:
+            # Section caches are bound to the foreground session; build fresh
+            manifest = await run_sync_read(db, self._build_scene_manifest, db, location_key)
+            predictor = ActionPredictor(db, self.game_session)
+            oracle = GMDecisionOracle(db, self.game_session)
+        fingerprint = compute_world_fingerprint(manifest)
+
+        predictions = await run_sync_read(
+            db,
+            predictor.predict_actions,
+            location_key=location_key,
+            manifest=manifest,
+        )
+
+        provider = getattr(self._reasoning_llm, "provider_name", None) or "default"
+        context = None
+        versions = None
+        jobs: list[AnticipationJob] = []
+        for action in predictions[: config.max_actions_per_cycle]:
+            gm_decisions = await run_sync_read(db, oracle.predict_decisions, action, manifest)
+            for decision in gm_decisions[: config.max_gm_decisions_per_action]:
+                branch_key = QuantumBranch.create_key(
                     location_key=location_key,
-                    manifest=manifest,
+                    action_type=action.action_type,
+                    target_key=action.target_key,
+                    gm_decision_type=decision.decision_type,
                 )
+                if await self.branch_cache.contains(branch_key, fingerprint):
+                    continue
 
-                # Generate branches for top N predictions
-                branches_generated = 0
-                for action in predictions[: config.max_actions_per_cycle]:
-                    # Check if action already cached
-                    cached_branches = await self.branch_cache.get_branches_for_action(
+                if context is None:
+                    context = await run_sync_read(
+                        db, self._build_branch_context, location_key, db=db
+                    )
+                if versions is None:
+                    index = (
+                        self.version_index
+                        if db is self.db
+                        else WorldVersionIndex(db, self.game_session)
+                    )
+                    versions = await run_sync_read(db, index.snapshot, manifest_refs(manifest))
+                jobs.append(
+                    AnticipationJob(
                         location_key=location_key,
                         action=action,
+                        gm_decision=decision,
+                        branch_key=branch_key,
+                        provider=str(provider),
+                        fingerprint=fingerprint,
+                        manifest=manifest,
+                        context=context,
+                        versions=versions,
                     )
-                    if len(cached_branches) >= config.max_gm_decisions_per_action:
-                        continue
+                )
 
-                    # Get GM decisions
-                    gm_decisions = self.gm_oracle.predict_decisions(action, manifest)
-
-                    # Generate branches for top GM decisions
-                    context = self._build_branch_context(location_key)
-                    for decision in gm_decisions[: config.max_gm_decisions_per_action]:
-                        # Check if this specific branch is cached
-                        existing = await self.branch_cache.get_branch(
-                            location_key=location_key,
-                            action=action,
-                            gm_decision_type=decision.decision_type,
-                        )
-                        if existing:
-                            continue
-
-                        # Generate and cache
-                        try:
-                            branch = await self.branch_generator.generate_branch(
-                                action=action,
-                                gm_decision=decision,
-                                manifest=manifest,
-                                context=context,
-                            )
-                            await self.branch_cache.put_branch(branch)
-                            branches_generated += 1
-
-                        except RegenerationNeeded as e:
-                            # Skip branches with unfixable deltas during anticipation
-                            self._metrics.record_regeneration(e.reason)
-                            logger.debug(f"Anticipation skipped (regeneration): {e.reason}")
-
-                        except Exception as e:
-                            logger.warning(f"Anticipation generation failed: {e}")
-
-                if branches_generated > 0:
-                    logger.debug(f"Anticipation generated {branches_generated} branches")
+        return jobs
 
-                await asyncio.sleep(config.cycle_delay_seconds)
+    def _build_scene_manifest(self, db: Session, location_key: str) -> GroundingManifest:
+        """Build an uncached grounding manifest on another session.
 
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Anticipation error: {e}")
-                await asyncio.sleep(config.error_delay_seconds)
+        Args:
+            db: Session to read through
+            location_key: Current location key
+
+        Returns:
+            GroundingManifest for the player at the location
+        """
+        player = self._get_player_entity(db)
+        builder = GMContextBuilder(db, self.game_session)
+        return builder.build_grounding_manifest(
+            player_id=player.id if player else 0,
+            location_key=location_key,
+        )
+
+    async def _generate_anticipated_branch(self, job: AnticipationJob) -> QuantumBranch | None:
+        """Generate and cache the branch for a scheduled job.
+
+        Args:
+            job: The scheduled job
+
+        Returns:
+            The generated branch, or None if it had to be skipped
+        """
+        try:
+            with self.tracer.span("anticipation.generate", branch_key=job.branch_key):
+                branch = await self.branch_generator.generate_branch(
+                    action=job.action,
+                    gm_decision=job.gm_decision,
+                    manifest=job.manifest,
+                    context=job.context,
+                )
+        except RegenerationNeeded as e:
+            # Skip branches with unfixable deltas during anticipation
+            self._metrics.record_regeneration(e.reason)
+            logger.debug(f"Anticipation skipped (regeneration): {e.reason}")
+            return None
+
+        self._metrics.record_branch_generated(branch.generation_time_ms)
+        self._record_versions(branch, job.versions or {})
+        await self.branch_cache.put_branch(branch, fingerprint=job.fingerprint)
+        return branch
+
+    def _record_versions(self, branch: QuantumBranch, planned: VersionVector) -> None:
+        """Record the row versions of the state a branch's deltas touch.
+
+        The cache and collapse manager compare this vector against the
+        version index instead of expiring the branch on a timer. Versions
+        come from the snapshot taken before generation, so rows written
+        while the LLM ran make the branch stale; refs outside it (e.g.
+        entities the branch itself creates) are read now.
+
+        Args:
+            branch: Newly generated branch
+            planned: Versions snapshotted when generation was planned
+        """
+        refs = branch_refs(branch)
+        vector = {ref: planned[ref] for ref in refs if ref in planned}
+        vector.update(self.version_index.snapshot(refs - vector.keys()))
+        branch.version_vector = vector
 
     # =========================================================================
     # Cache Management
@@ -2026,11 +2374,13 @@ class QuantumPipeline:
         """
         return {
             "cache": self.branch_cache.get_stats(),
+            "manifest_cache": self.manifest_cache.get_stats(),
             "metrics": self._metrics.to_dict(),
             "anticipation": {
                 "enabled": self._anticipation_config.enabled,
                 "running": self._running,
                 "current_location": self._current_location,
+                "scheduler": self.anticipation_scheduler.get_stats(),
             },
             "split_architecture": {
                 "enabled": self._use_split_architecture,
@@ -8,6 +8,7 @@ These schemas define the core data structures used for:
 - State deltas (changes to apply on collapse)
 """
 
+import hashlib
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -18,6 +19,9 @@ from src.world_server.schemas import PredictionReason
 
 logger = logging.getLogger(__name__)
 
+# Separates a dialogue topic digest from the rest of a branch key
+TOPIC_KEY_SEPARATOR = "::topic-"
+
 
 class ActionType(str, Enum):
     """Type of player action predicted or matched."""
@@ -163,7 +167,7 @@ class QuantumBranch:
     when the player observes it.
     """
 
-    branch_key: str  # "location::action_type::target::gm_decision"
+    branch_key: str  # "location::action_type::target::gm_decision[::topic-<digest>]"
     action: ActionPrediction
     gm_decision: GMDecision
     variants: dict[str, OutcomeVariant]  # variant_type -> OutcomeVariant
@@ -171,7 +175,14 @@ class QuantumBranch:
     # Metadata
     generated_at: datetime = field(default_factory=datetime.now)
     generation_time_ms: float = 0.0
+    tokens_used: int = 0  # LLM tokens spent generating this branch
     expiry_seconds: int = 180  # 3 minutes default
+    # Row versions of the entities/items/needs the deltas touch, recorded at
+    # generation time. None means not recorded (fall back to expiry).
+    version_vector: dict[str, int] | None = None
+    # Dialogue topic the branch was generated for (see topic_index.py).
+    # None means topic-agnostic, e.g. an anticipated "talk to NPC" branch.
+    topic: str | None = None
 
     # Tracking
     is_collapsed: bool = False
@@ -194,6 +205,11 @@ class QuantumBranch:
         """Get a specific variant by type."""
         return self.variants.get(variant_type.value)
 
+    @property
+    def base_key(self) -> str:
+        """Branch key without its topic part."""
+        return self.branch_key.split(TOPIC_KEY_SEPARATOR, 1)[0]
+
     @classmethod
     def create_key(
         cls,
@@ -201,10 +217,19 @@ class QuantumBranch:
         action_type: ActionType,
         target_key: str | None,
         gm_decision_type: str,
+        topic: str | None = None,
     ) -> str:
-        """Create a branch key from components."""
+        """Create a branch key from components.
+
+        A topic adds a short digest, so branches for different
+        conversation topics with the same NPC are cached side by side.
+        """
         target = target_key or "none"
-        return f"{location_key}::{action_type.value}::{target}::{gm_decision_type}"
+        key = f"{location_key}::{action_type.value}::{target}::{gm_decision_type}"
+        if topic:
+            digest = hashlib.blake2b(topic.encode("utf-8"), digest_size=6).hexdigest()
+            key = f"{key}{TOPIC_KEY_SEPARATOR}{digest}"
+        return key
 
 
 @dataclass
@@ -222,6 +247,10 @@ class QuantumMetrics:
     cache_hits: int = 0
     cache_misses: int = 0
 
+    # Persistent store (L2) counters
+    store_hits: int = 0  # L1 misses served from the persistent store
+    store_writes: int = 0
+
     # Branch generation
     branches_generated: int = 0
     branches_collapsed: int = 0
@@ -240,6 +269,17 @@ class QuantumMetrics:
     total_collapse_time_ms: float = 0.0
     total_cache_hit_latency_ms: float = 0.0
 
+    # Streamed narration (time from turn start to first displayed text)
+    streamed_narrations: int = 0
+    total_time_to_first_token_ms: float = 0.0
+
+    # Speculative narration (outcomes narrated before the roll resolves)
+    speculative_turns: int = 0
+    speculation_hits: int = 0  # Selected outcome was among those narrated
+    wasted_speculative_narrations: int = 0
+    wasted_speculative_tokens: int = 0  # Estimated
+    total_speculation_saved_ms: float = 0.0
+
     # GM decisions
     twists_applied: int = 0
     no_twists: int = 0
@@ -264,6 +304,27 @@ class QuantumMetrics:
             return 0.0
         return self.total_cache_hit_latency_ms / self.cache_hits
 
+    @property
+    def avg_time_to_first_token_ms(self) -> float:
+        """Average time to first streamed narrative text in milliseconds."""
+        if self.streamed_narrations == 0:
+            return 0.0
+        return self.total_time_to_first_token_ms / self.streamed_narrations
+
+    @property
+    def avg_speculation_saved_ms(self) -> float:
+        """Average latency saved per speculative turn in milliseconds."""
+        if self.speculative_turns == 0:
+            return 0.0
+        return self.total_speculation_saved_ms / self.speculative_turns
+
+    @property
+    def wasted_tokens_per_second_saved(self) -> float:
+        """Estimated tokens wasted on discarded narrations per second saved."""
+        if self.total_speculation_saved_ms <= 0:
+            return float("inf") if self.wasted_speculative_tokens else 0.0
+        return self.wasted_speculative_tokens / (self.total_speculation_saved_ms / 1000)
+
     @property
     def success_rate(self) -> float:
         """Player success rate on skill checks."""
@@ -281,6 +342,34 @@ class QuantumMetrics:
         """Record a cache miss."""
         self.cache_misses += 1
 
+    def record_first_token(self, latency_ms: float) -> None:
+        """Record time to first token of a streamed narration."""
+        self.streamed_narrations += 1
+        self.total_time_to_first_token_ms += latency_ms
+
+    def record_speculation(
+        self,
+        hit: bool,
+        wasted_branches: int,
+        wasted_tokens: int,
+        latency_saved_ms: float,
+    ) -> None:
+        """Record a turn that narrated outcomes before the roll resolved."""
+        self.speculative_turns += 1
+        if hit:
+            self.speculation_hits += 1
+        self.wasted_speculative_narrations += wasted_branches
+        self.wasted_speculative_tokens += wasted_tokens
+        self.total_speculation_saved_ms += latency_saved_ms
+
+    def record_store_hit(self) -> None:
+        """Record a branch promoted from the persistent store."""
+        self.store_hits += 1
+
+    def record_store_write(self) -> None:
+        """Record a branch written to the persistent store."""
+        self.store_writes += 1
+
     def record_branch_generated(self, generation_time_ms: float) -> None:
         """Record a branch was generated."""
         self.branches_generated += 1
@@ -333,6 +422,8 @@ class QuantumMetrics:
             "cache_hits": self.cache_hits,
             "cache_misses": self.cache_misses,
             "hit_rate": f"{self.hit_rate:.1%}",
+            "store_hits": self.store_hits,
+            "store_writes": self.store_writes,
             "branches_generated": self.branches_generated,
             "branches_collapsed": self.branches_collapsed,
             "branches_expired": self.branches_expired,
@@ -340,6 +431,13 @@ class QuantumMetrics:
             "regenerations_triggered": self.regenerations_triggered,
             "avg_generation_time_ms": f"{self.avg_generation_time_ms:.0f}",
             "avg_cache_hit_latency_ms": f"{self.avg_cache_hit_latency_ms:.1f}",
+            "streamed_narrations": self.streamed_narrations,
+            "avg_time_to_first_token_ms": f"{self.avg_time_to_first_token_ms:.0f}",
+            "speculative_turns": self.speculative_turns,
+            "speculation_hits": self.speculation_hits,
+            "wasted_speculative_tokens": self.wasted_speculative_tokens,
+            "avg_speculation_saved_ms": f"{self.avg_speculation_saved_ms:.0f}",
+            "wasted_tokens_per_second_saved": f"{self.wasted_tokens_per_second_saved:.0f}",
             "success_rate": f"{self.success_rate:.1%}",
             "twists_applied": self.twists_applied,
             "no_twists": self.no_twists,
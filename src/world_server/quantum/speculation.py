@@ -0,0 +1,296 @@
+"""Speculative Narration for the Quantum Pipeline (Phase 4).
+
+On a cache miss the split and ref-based architectures reason about an
+action, roll the skill check, then narrate the selected outcome. When
+the roll takes real time (e.g. the player pressing ENTER to roll),
+narration can start for every plausible outcome as soon as reasoning
+returns; once the roll lands, the matching narration is kept and the
+rest are cancelled.
+
+Speculation trades tokens for latency, so it is enabled per provider
+cost class: free local models can afford it, metered APIs usually not.
+Every speculative turn reports the estimated tokens wasted on discarded
+narrations and the latency saved, min(roll time, narration time).
+
+This is DETERMINISTIC CODE - no LLM calls of its own.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.dice.probability import check_outcome_distribution
+from src.dice.types import AdvantageType, SkillCheckResult
+from src.llm.base import LLMProvider
+from src.world_server.quantum.narrator import (
+    NarrationContext,
+    NarrationResponse,
+    NarratorEngine,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Cost Classes
+# =============================================================================
+
+# Provider name -> cost class
+PROVIDER_COST_CLASSES: dict[str, str] = {
+    "ollama": "local",
+    "qwen-agent": "local",
+    "anthropic": "metered",
+    "openai": "metered",
+}
+
+COST_CLASSES = ("local", "metered")
+
+
+def provider_cost_class(provider: LLMProvider) -> str:
+    """Get the cost class of a provider (unknown providers are metered)."""
+    return PROVIDER_COST_CLASSES.get(provider.provider_name, "metered")
+
+
+def outcome_key_for_check(reasoning_response: Any, check: SkillCheckResult | None) -> str:
+    """Pick the reasoning outcome a skill check selects.
+
+    Works for both ReasoningResponse and RefReasoningResponse. Criticals
+    and failure fall back when the response has no such outcome.
+
+    Args:
+        reasoning_response: Response with success/failure/critical_* outcomes.
+        check: The skill check, or None when no check was needed.
+
+    Returns:
+        Attribute name of the selected outcome.
+    """
+    if check is None:
+        return "success"
+    if check.is_critical_success and reasoning_response.critical_success:
+        return "critical_success"
+    if check.is_critical_failure and reasoning_response.critical_failure:
+        return "critical_failure"
+    if check.success:
+        return "success"
+    if reasoning_response.failure:
+        return "failure"
+    # Fallback to success if no failure variant
+    return "success"
+
+
+def outcome_probabilities(
+    reasoning_response: Any,
+    dc: int,
+    modifier: int,
+    advantage_type: AdvantageType = AdvantageType.NORMAL,
+) -> dict[str, float]:
+    """Get the exact chance of each reasoning outcome being selected.
+
+    Mirrors outcome_key_for_check() over every possible roll.
+
+    Args:
+        reasoning_response: Response with success/failure/critical_* outcomes.
+        dc: Difficulty Class of the check.
+        modifier: Total modifier (attribute + skill).
+        advantage_type: Advantage for the roll.
+
+    Returns:
+        Outcome key -> probability, for outcomes that can be selected.
+    """
+    probabilities: dict[str, float] = {}
+    for outcome in check_outcome_distribution(dc, modifier, advantage_type):
+        check = SkillCheckResult(
+            roll_result=None,
+            dc=dc,
+            success=outcome.success,
+            margin=outcome.margin,
+            is_critical_success=outcome.is_critical_success,
+            is_critical_failure=outcome.is_critical_failure,
+            advantage_type=advantage_type,
+        )
+        key = outcome_key_for_check(reasoning_response, check)
+        probabilities[key] = probabilities.get(key, 0.0) + outcome.probability
+    return probabilities
+
+
+# =============================================================================
+# Policy
+# =============================================================================
+
+
+@dataclass
+class SpeculationPolicy:
+    """When to narrate several outcomes before the roll.
+
+    Attributes:
+        cost_classes: Narrator cost classes allowed to speculate (empty = off).
+        min_probability: Skip outcomes less likely than this (e.g. 1% criticals).
+        max_branches: Most narrations to start per turn.
+    """
+
+    cost_classes: frozenset[str] = frozenset()
+    min_probability: float = 0.05
+    max_branches: int = 4
+
+    @classmethod
+    def from_setting(cls, value: str) -> "SpeculationPolicy":
+        """Build a policy from a setting such as "off", "local" or "all".
+
+        Args:
+            value: "off", "all", or comma-separated cost classes.
+
+        Returns:
+            SpeculationPolicy for those cost classes.
+        """
+        value = value.strip().lower()
+        if value in ("", "off", "none"):
+            return cls()
+        if value == "all":
+            return cls(cost_classes=frozenset(COST_CLASSES))
+        classes = frozenset(part.strip() for part in value.split(",") if part.strip())
+        unknown = classes - set(COST_CLASSES)
+        if unknown:
+            raise ValueError(
+                f"Unknown cost class(es) {sorted(unknown)}; expected {list(COST_CLASSES)}"
+            )
+        return cls(cost_classes=classes)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any cost class may speculate."""
+        return bool(self.cost_classes)
+
+    def allows(self, provider: LLMProvider) -> bool:
+        """Whether narration with this provider may speculate."""
+        return provider_cost_class(provider) in self.cost_classes
+
+    def plausible_outcomes(self, probabilities: dict[str, float]) -> list[str]:
+        """Pick the outcomes worth narrating, most likely first.
+
+        Args:
+            probabilities: Outcome key -> chance of selection.
+
+        Returns:
+            Outcome keys (empty if there is nothing to race).
+        """
+        ranked = sorted(
+            (key for key, p in probabilities.items() if p >= self.min_probability),
+            key=lambda key: -probabilities[key],
+        )[: self.max_branches]
+        return ranked if len(ranked) > 1 else []
+
+
+# =============================================================================
+# Speculative Narration
+# =============================================================================
+
+
+@dataclass
+class SpeculationReport:
+    """Cost and benefit of one speculative turn.
+
+    Attributes:
+        branches: Narrations started.
+        hit: Whether the selected outcome was among them.
+        wasted_branches: Narrations discarded (cancelled or finished unused).
+        wasted_tokens: Estimated tokens spent on discarded narrations.
+        latency_saved_ms: Narration time hidden behind the roll.
+    """
+
+    branches: int
+    hit: bool
+    wasted_branches: int = 0
+    wasted_tokens: int = 0
+    latency_saved_ms: float = 0.0
+
+
+@dataclass
+class SpeculativeNarration:
+    """Narrations for several outcomes racing a skill check.
+
+    Usage:
+        speculation = SpeculativeNarration(narrator)
+        speculation.start({"success": ctx_a, "failure": ctx_b})
+        check = await roll()
+        speculation.mark_rolled()
+        response, report = await speculation.resolve("failure")
+    """
+
+    narrator: NarratorEngine
+    contexts: dict[str, NarrationContext] = field(default_factory=dict)
+    _tasks: dict[str, asyncio.Task] = field(default_factory=dict, init=False)
+    _finished_at: dict[str, float] = field(default_factory=dict, init=False)
+    _started_at: float = field(default=0.0, init=False)
+    _rolled_at: float | None = field(default=None, init=False)
+
+    def start(self, contexts: dict[str, NarrationContext]) -> None:
+        """Start narrating every outcome concurrently.
+
+        Args:
+            contexts: Outcome key -> narration context.
+        """
+        self.contexts = dict(contexts)
+        self._started_at = time.perf_counter()
+        for key, context in self.contexts.items():
+            self._tasks[key] = asyncio.create_task(self._narrate(key, context))
+
+    def mark_rolled(self) -> None:
+        """Record that the roll has landed."""
+        self._rolled_at = time.perf_counter()
+
+    async def _narrate(self, key: str, context: NarrationContext) -> NarrationResponse:
+        response = await self.narrator.narrate(context)
+        self._finished_at[key] = time.perf_counter()
+        return response
+
+    async def resolve(self, outcome_key: str) -> tuple[NarrationResponse | None, SpeculationReport]:
+        """Keep the selected outcome's narration and cancel the rest.
+
+        Args:
+            outcome_key: The outcome the roll selected.
+
+        Returns:
+            Tuple of (narration, report); narration is None if the selected
+            outcome was not speculated and must be narrated normally.
+        """
+        rolled_at = self._rolled_at or time.perf_counter()
+        selected = self._tasks.pop(outcome_key, None)
+
+        wasted_tokens = 0
+        for key, task in self._tasks.items():
+            response = None
+            if task.done() and not task.cancelled() and task.exception() is None:
+                response = task.result()
+            else:
+                task.cancel()
+            wasted_tokens += self.narrator.estimate_tokens(self.contexts[key], response)
+        wasted_branches = len(self._tasks)
+        self._tasks.clear()
+
+        report = SpeculationReport(
+            branches=wasted_branches + (1 if selected else 0),
+            hit=selected is not None,
+            wasted_branches=wasted_branches,
+            wasted_tokens=wasted_tokens,
+        )
+        if selected is None:
+            return None, report
+
+        response = await selected
+        roll_ms = (rolled_at - self._started_at) * 1000
+        narration_ms = (self._finished_at[outcome_key] - self._started_at) * 1000
+        report.latency_saved_ms = min(roll_ms, narration_ms)
+
+        logger.debug(
+            f"Speculation kept {outcome_key}: saved {report.latency_saved_ms:.0f}ms, "
+            f"wasted ~{wasted_tokens} tokens on {wasted_branches} branches"
+        )
+        return response, report
+
+    def cancel(self) -> None:
+        """Cancel all running narrations (e.g. when the turn fails)."""
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
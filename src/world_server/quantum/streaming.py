@@ -0,0 +1,129 @@
+"""Streaming Narration for the Quantum Pipeline (Phases 4-5).
+
+Bridges a token stream from the narrator LLM to the player's display.
+Streamed text is only passed on once it is safe to show:
+
+1. Held until a sentence ends outside any [key:display] reference
+2. Validated for grounding (the whole prefix, so results match full validation)
+3. Cleaned with cleanup_narrative, emitting only the newly cleaned text
+
+If a prefix fails validation the rest of the stream is held back. When
+the finished narrative validates after all (e.g. a later keyed mention
+makes an earlier name valid), everything is flushed; otherwise the
+narrator retries and the caller replaces the partial display.
+
+This is DETERMINISTIC CODE - no LLM calls.
+"""
+
+import re
+from typing import Callable
+
+from src.world_server.quantum.cleanup import cleanup_narrative
+
+# Sentence end followed by whitespace (closing quotes/emphasis included)
+SENTENCE_END_PATTERN = re.compile(r"[.!?]+[\"'”’*)]*(?=\s)")
+
+
+class StreamingNarrative:
+    """Incrementally validate and clean a streamed narrative.
+
+    Feed raw tokens with feed() (usable as a provider's on_token
+    callback) and call finish() once the completion is done.
+
+    Example:
+        >>> chunks = []
+        >>> stream = StreamingNarrative(chunks.append, player_key="hero")
+        >>> for token in ["[hero:You] open ", "the door. It ", "creaks."]:
+        ...     stream.feed(token)
+        >>> chunks
+        ['You open the door.']
+        >>> stream.finish()
+        []
+        >>> chunks
+        ['You open the door.', ' It creaks.']
+    """
+
+    def __init__(
+        self,
+        on_text: Callable[[str], None],
+        validate: Callable[[str], list[str]] | None = None,
+        player_key: str = "player",
+    ) -> None:
+        """Initialize the stream.
+
+        Args:
+            on_text: Receives each newly released chunk of cleaned prose.
+            validate: Returns grounding errors for raw text (empty if valid).
+            player_key: The player's entity key (for cleanup).
+        """
+        self.on_text = on_text
+        self.validate = validate
+        self.player_key = player_key
+
+        self.raw = ""  # Raw text with [key:display] refs
+        self.emitted = ""  # Cleaned text passed to on_text
+        self.errors: list[str] = []
+        self.held = False  # Output stopped at an invalid or inconsistent prefix
+        self._released_upto = 0  # End of the raw prefix already released
+
+    @property
+    def complete(self) -> bool:
+        """Whether all streamed text was released (valid after finish())."""
+        return not self.held and self._released_upto == len(self.raw)
+
+    def feed(self, token: str) -> None:
+        """Add a streamed token, releasing any newly completed sentences.
+
+        Args:
+            token: Raw text from the LLM.
+        """
+        self.raw += token
+        for boundary in self._safe_boundaries():
+            if self.held:
+                return
+            self._release(boundary, validated=False)
+
+    def finish(self) -> list[str]:
+        """Validate the full narrative and release whatever is left.
+
+        Returns:
+            Grounding errors for the full narrative (empty if valid).
+        """
+        self.errors = self.validate(self.raw) if self.validate else []
+        if not self.errors:
+            self.held = False
+            self._release(len(self.raw), validated=True)
+        return self.errors
+
+    def _safe_boundaries(self) -> list[int]:
+        """Find unreleased sentence ends that are not inside a [key:display] ref."""
+        if self.held:
+            return []
+        return [
+            match.end()
+            for match in SENTENCE_END_PATTERN.finditer(self.raw, self._released_upto)
+            if self.raw.count("[", 0, match.end()) == self.raw.count("]", 0, match.end())
+        ]
+
+    def _release(self, end: int, validated: bool) -> None:
+        """Validate and clean raw[:end], emitting the new cleaned text."""
+        prefix = self.raw[:end]
+
+        if not validated and self.validate:
+            errors = self.validate(prefix)
+            if errors:
+                self.errors = errors
+                self.held = True
+                return
+
+        cleaned = cleanup_narrative(prefix, player_key=self.player_key).text
+        if not cleaned.startswith(self.emitted):
+            # Cleanup of the longer prefix rewrote text already shown
+            self.held = True
+            return
+
+        self._released_upto = end
+        chunk = cleaned[len(self.emitted) :]
+        if chunk:
+            self.emitted = cleaned
+            self.on_text(chunk)
@@ -0,0 +1,295 @@
+"""Topic matching for cached NPC dialogue branches.
+
+Branch keys (location::action::target::gm_decision) say who the player
+talks to but not what about, so a branch generated for "ask Tom about a
+room" used to be served for "ask Tom about rumors". Dialogue branches
+now carry a topic descriptor: the content words of the input they were
+generated for, minus conversational filler and the NPC's own name. The
+descriptor is part of the branch key, and QuantumBranchCache keeps a
+vector of it so an INTERACT_NPC lookup can take the nearest cached topic
+for that NPC when it is similar enough to the player's input.
+
+Vectors come from a small hashing vectorizer (word unigrams and bigrams
+plus character trigrams, sublinear TF, L2 norm), so nothing is trained
+or fetched and the same text always gives the same vector. An input
+with no content words ("talk to Tom") has no topic and is served by the
+topic-agnostic branch, which is what anticipation pre-generates.
+
+DEFAULT_TOPIC_THRESHOLD was set with calibrate_threshold() on the
+paraphrase and wrong-topic pairs in tests/test_world_server/
+test_quantum/test_topic_index.py; the closest wrong-topic pair there
+("is the road north safe" / "...south safe") scores 0.62. Matching is
+lexical: "who runs this town" and "who is in charge" are different
+topics to it, which costs a miss rather than a wrong reply.
+"""
+
+import hashlib
+import math
+import re
+from collections import Counter
+from collections.abc import Iterable
+from functools import lru_cache
+from itertools import pairwise
+
+import numpy as np
+
+from src.world_server.quantum.schemas import ActionPrediction
+
+# Cosine similarity a cached topic needs to be served for an input
+DEFAULT_TOPIC_THRESHOLD = 0.65
+
+_WORD = re.compile(r"[^\W_]+")
+
+# Filler of dialogue requests that says nothing about the topic
+STOPWORDS = frozenset(
+    """
+    a about after again all am an and any anything are around as ask asked asking at
+    be been being but by can could d did do does doing don find for from get give go
+    going good had has have he hear heard hello her here hers hey hi him his how i if
+    in into is it its just know lately let like ll looking m me mind more much my need
+    of on or our please point re recently s say says see seen she should so some
+    something speak t talk talking tell than that the their them then there they this
+    those to up us ve want was we were what when where which who whom why will with
+    would you your
+    """.split()
+)
+
+# Suffixes folded so "rumors", "rumored" and "rumor" share a word feature
+_SUFFIXES = ("ing", "ed", "es", "s")
+
+# Feature weights by kind: words, word bigrams, character trigrams
+_WEIGHTS = {"w": 1.0, "b": 0.5, "c": 0.4}
+
+
+def _stem(word: str) -> str:
+    """Strip one common English suffix, keeping at least three letters."""
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[: -len(suffix)]
+    return word
+
+
+def content_words(text: str, exclude: Iterable[str] = ()) -> list[str]:
+    """Lowercase, stemmed words of text without stopwords.
+
+    Args:
+        text: Text to split.
+        exclude: Extra words to drop (e.g. the NPC's name).
+
+    Returns:
+        Content words in order.
+    """
+    excluded = {word for text_part in exclude for word in _WORD.findall(text_part.lower())}
+    return [
+        _stem(word)
+        for word in _WORD.findall(text.lower())
+        if word not in STOPWORDS and word not in excluded
+    ]
+
+
+def target_names(action: ActionPrediction) -> list[str]:
+    """Names of an action's target, to leave out of its topic.
+
+    Args:
+        action: The predicted action.
+
+    Returns:
+        Target key words and display name.
+    """
+    names = [action.target_key.replace("_", " ")] if action.target_key else []
+    if action.display_name:
+        names.append(action.display_name)
+    return names
+
+
+def dialogue_topic(text: str | None, exclude: Iterable[str] = ()) -> str | None:
+    """Topic descriptor of a dialogue input.
+
+    Args:
+        text: Player input (None for anticipated branches).
+        exclude: Words to leave out, usually target_names(action).
+
+    Returns:
+        Space-joined content words, or None if the input has no topic.
+    """
+    if not text:
+        return None
+    words = content_words(text, exclude)
+    return " ".join(words) if words else None
+
+
+@lru_cache(maxsize=4096)
+def _bucket(feature: str, dimensions: int) -> tuple[int, float]:
+    """Stable hashed index and sign of a feature."""
+    digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+    value = int.from_bytes(digest, "big")
+    return value % dimensions, 1.0 if value >> 63 else -1.0
+
+
+class TopicVectorizer:
+    """Hashing vectorizer for topic descriptors.
+
+    Args:
+        dimensions: Vector length (hash buckets).
+    """
+
+    def __init__(self, dimensions: int = 4096) -> None:
+        """Initialize the vectorizer.
+
+        Args:
+            dimensions: Vector length (hash buckets).
+        """
+        self.dimensions = dimensions
+
+    def features(self, topic: str) -> Counter[str]:
+        """Feature counts of a topic descriptor.
+
+        Args:
+            topic: Descriptor from dialogue_topic() (or any text).
+
+        Returns:
+            Feature -> occurrences; "w:", "b:" and "c:" prefixes mark
+            words, word bigrams and character trigrams.
+        """
+        words = content_words(topic)
+        features: Counter[str] = Counter()
+        for word in words:
+            features[f"w:{word}"] += 1
+            padded = f"<{word}>"
+            for start in range(len(padded) - 2):
+                features[f"c:{padded[start:start + 3]}"] += 1
+        for first, second in pairwise(words):
+            features[f"b:{first} {second}"] += 1
+        return features
+
+    def vectorize(self, topic: str) -> np.ndarray:
+        """Unit vector of a topic descriptor (all zeros if it has no words).
+
+        Args:
+            topic: Descriptor from dialogue_topic() (or any text).
+
+        Returns:
+            float64 vector of length dimensions.
+        """
+        vector = np.zeros(self.dimensions)
+        for feature, count in self.features(topic).items():
+            index, sign = _bucket(feature, self.dimensions)
+            vector[index] += sign * _WEIGHTS[feature[0]] * (1 + math.log(count))
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def similarity(self, first: str, second: str) -> float:
+        """Cosine similarity of two topics.
+
+        Args:
+            first: A topic descriptor or text.
+            second: Another topic descriptor or text.
+
+        Returns:
+            Similarity in [-1, 1] (0 if either has no words).
+        """
+        return float(self.vectorize(first) @ self.vectorize(second))
+
+
+def calibrate_threshold(
+    same_topic: Iterable[tuple[str, str]],
+    different_topic: Iterable[tuple[str, str]],
+    vectorizer: TopicVectorizer | None = None,
+) -> float:
+    """Pick an acceptance threshold from labelled input pairs.
+
+    The threshold sits halfway between the best-scoring wrong-topic pair
+    and the worst-scoring same-topic pair. If the two overlap, it is set
+    just above the best wrong-topic pair: a miss only costs a generation,
+    a wrong-topic reply costs the scene.
+
+    Args:
+        same_topic: Pairs of inputs that one reply would fit.
+        different_topic: Pairs that need different replies.
+        vectorizer: Vectorizer to score with (default TopicVectorizer()).
+
+    Returns:
+        Cosine similarity threshold.
+
+    Raises:
+        ValueError: If either set of pairs is empty.
+    """
+    vectorizer = vectorizer or TopicVectorizer()
+    same = [vectorizer.similarity(first, second) for first, second in same_topic]
+    different = [vectorizer.similarity(first, second) for first, second in different_topic]
+    if not same or not different:
+        raise ValueError("Calibration needs same-topic and different-topic pairs")
+    highest_wrong = max(different)
+    lowest_right = min(same)
+    if lowest_right > highest_wrong:
+        return (lowest_right + highest_wrong) / 2
+    return math.nextafter(highest_wrong, math.inf)
+
+
+class TopicIndex:
+    """Topic vectors of cached dialogue branches, grouped by base key.
+
+    A group holds the topical branches for one location, NPC and GM
+    decision; nearest() only compares against that group.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self._groups: dict[str, dict[str, np.ndarray]] = {}
+        self._group_of: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._group_of)
+
+    def add(self, group: str, key: str, vector: np.ndarray) -> None:
+        """Add or replace a branch's topic vector.
+
+        Args:
+            group: Branch key without its topic part.
+            key: Full branch key.
+            vector: Unit topic vector.
+        """
+        self.remove(key)
+        self._groups.setdefault(group, {})[key] = vector
+        self._group_of[key] = group
+
+    def remove(self, key: str) -> None:
+        """Drop a branch (no-op if absent).
+
+        Args:
+            key: Full branch key.
+        """
+        group = self._group_of.pop(key, None)
+        if group is None:
+            return
+        del self._groups[group][key]
+        if not self._groups[group]:
+            del self._groups[group]
+
+    def clear(self) -> None:
+        """Drop every branch."""
+        self._groups.clear()
+        self._group_of.clear()
+
+    def nearest(
+        self, group: str, vector: np.ndarray, threshold: float
+    ) -> tuple[str, float] | None:
+        """Most similar branch in a group, if it clears the threshold.
+
+        Args:
+            group: Branch key without its topic part.
+            vector: Unit topic vector of the player's input.
+            threshold: Minimum cosine similarity.
+
+        Returns:
+            (branch key, similarity), or None.
+        """
+        members = self._groups.get(group)
+        if not members:
+            return None
+        keys = list(members)
+        scores = np.stack([members[key] for key in keys]) @ vector
+        best = int(np.argmax(scores))
+        if scores[best] < threshold:
+            return None
+        return keys[best], float(scores[best])
@@ -21,6 +21,8 @@ from sqlalchemy.orm import Session
 from src.database.models.session import GameSession
 from src.gm.grounding import GroundingManifest
 from src.gm.grounding_validator import GroundingValidator
+from src.gm.key_index import KeyIndex
+from src.gm.narrative_scanner import RuleMatches, RuleSet
 from src.world_server.quantum.schemas import (
     DeltaType,
     OutcomeVariant,
@@ -154,13 +156,6 @@ NPC_DIALOGUE_PATTERNS = [
     r"\b(?:says?|said|replies?|replied|asks?|asked|tells?|told|whispers?|shouts?|grunts?|mutters?|exclaims?)\b",
 ]
 
-# Compile patterns for efficiency
-META_QUESTION_RE = [re.compile(p, re.IGNORECASE) for p in META_QUESTION_PATTERNS]
-AI_IDENTITY_RE = [re.compile(p, re.IGNORECASE) for p in AI_IDENTITY_PATTERNS]
-THIRD_PERSON_RE = [re.compile(p, re.IGNORECASE) for p in THIRD_PERSON_PATTERNS]
-PLACEHOLDER_RE = [re.compile(p, re.IGNORECASE) for p in PLACEHOLDER_PATTERNS]
-NPC_DIALOGUE_RE = [re.compile(p, re.IGNORECASE) for p in NPC_DIALOGUE_PATTERNS]
-
 # Tool-call meta-commentary patterns (LLM exposing game mechanics)
 TOOL_CALL_PATTERNS = [
     # Direct tool name mentions
@@ -176,7 +171,21 @@ TOOL_CALL_PATTERNS = [
     r"\binventory\s+(?:is\s+)?(?:now\s+)?updated\b",
 ]
 
-TOOL_CALL_RE = [re.compile(p, re.IGNORECASE) for p in TOOL_CALL_PATTERNS]
+# Rules checked against the whole narrative, compiled into one combined
+# search; dialogue rules only apply where no NPCs are present
+NARRATIVE_RULES = {
+    "identity": AI_IDENTITY_PATTERNS,
+    "perspective": THIRD_PERSON_PATTERNS,
+    "placeholder": PLACEHOLDER_PATTERNS,
+    "meta_commentary": TOOL_CALL_PATTERNS,
+}
+NARRATIVE_RULE_SET = RuleSet(NARRATIVE_RULES, re.IGNORECASE)
+NARRATIVE_RULE_SET_NO_NPCS = RuleSet(
+    {**NARRATIVE_RULES, "npc_hallucination": NPC_DIALOGUE_PATTERNS}, re.IGNORECASE
+)
+
+# Meta-questions are only looked for in the last sentence
+META_QUESTION_RULE_SET = RuleSet({"meta": META_QUESTION_PATTERNS}, re.IGNORECASE)
 
 
 class NarrativeConsistencyValidator:
@@ -241,26 +250,30 @@ class NarrativeConsistencyValidator:
         # 3. Grounding validation (entity references)
         issues.extend(self._check_grounding(narrative))
 
+        # One combined pass for the pattern rules, fanned out to the checks below
+        rule_set = NARRATIVE_RULE_SET if self.manifest.npcs else NARRATIVE_RULE_SET_NO_NPCS
+        matches = rule_set.search(narrative)
+
         # 4. NPC hallucination detection (dialogue when no NPCs present)
-        issues.extend(self._check_npc_hallucination(narrative))
+        issues.extend(self._check_npc_hallucination(matches))
 
         # 5. Meta-question detection
         issues.extend(self._check_meta_questions(narrative))
 
         # 6. AI identity detection
-        issues.extend(self._check_ai_identity(narrative))
+        issues.extend(self._check_ai_identity(matches))
 
         # 7. Third-person detection
-        issues.extend(self._check_third_person(narrative))
+        issues.extend(self._check_third_person(matches))
 
         # 8. Placeholder detection
-        issues.extend(self._check_placeholders(narrative))
+        issues.extend(self._check_placeholders(matches))
 
         # 9. Narrative quality checks
         issues.extend(self._check_quality(narrative))
 
         # 10. Tool-call meta-commentary detection
-        issues.extend(self._check_tool_commentary(narrative))
+        issues.extend(self._check_tool_commentary(matches))
 
         # Valid if no errors
         valid = not any(i.severity == IssueSeverity.ERROR for i in issues)
@@ -318,7 +331,7 @@ class NarrativeConsistencyValidator:
 
         return issues
 
-    def _check_npc_hallucination(self, narrative: str) -> list[ValidationIssue]:
+    def _check_npc_hallucination(self, matches: RuleMatches) -> list[ValidationIssue]:
         """Check for NPC dialogue when no NPCs are present.
 
         If the manifest has no NPCs at the location, but the narrative contains
@@ -327,13 +340,8 @@ class NarrativeConsistencyValidator:
         """
         issues = []
 
-        # Only check if there are NO NPCs in the manifest
-        if self.manifest.npcs:
-            return issues  # NPCs present, dialogue is OK
-
-        # Check for dialogue patterns
-        for pattern in NPC_DIALOGUE_RE:
-            match = pattern.search(narrative)
+        # Only checked (and only scanned for) if there are NO NPCs in the manifest
+        for match in matches.get("npc_hallucination", ()):
             if match:
                 issues.append(ValidationIssue(
                     category="npc_hallucination",
@@ -354,25 +362,22 @@ class NarrativeConsistencyValidator:
         sentences = narrative.strip().split(".")
         last_sentence = sentences[-1].strip() if sentences else ""
 
-        for pattern in META_QUESTION_RE:
-            if pattern.search(last_sentence):
-                issues.append(ValidationIssue(
-                    category="meta",
-                    message="Narrative ends with meta-question to player",
-                    severity=IssueSeverity.WARNING,
-                    location=last_sentence[-50:] if len(last_sentence) > 50 else last_sentence,
-                    suggestion="End at a natural pause, not with a question to the player",
-                ))
-                break
+        if any(META_QUESTION_RULE_SET.search(last_sentence)["meta"]):
+            issues.append(ValidationIssue(
+                category="meta",
+                message="Narrative ends with meta-question to player",
+                severity=IssueSeverity.WARNING,
+                location=last_sentence[-50:] if len(last_sentence) > 50 else last_sentence,
+                suggestion="End at a natural pause, not with a question to the player",
+            ))
 
         return issues
 
-    def _check_ai_identity(self, narrative: str) -> list[ValidationIssue]:
+    def _check_ai_identity(self, matches: RuleMatches) -> list[ValidationIssue]:
         """Check for AI/assistant identity leakage."""
         issues = []
 
-        for pattern in AI_IDENTITY_RE:
-            match = pattern.search(narrative)
+        for match in matches["identity"]:
             if match:
                 issues.append(ValidationIssue(
                     category="identity",
@@ -384,12 +389,11 @@ class NarrativeConsistencyValidator:
 
         return issues
 
-    def _check_third_person(self, narrative: str) -> list[ValidationIssue]:
+    def _check_third_person(self, matches: RuleMatches) -> list[ValidationIssue]:
         """Check for third-person player references."""
         issues = []
 
-        for pattern in THIRD_PERSON_RE:
-            match = pattern.search(narrative)
+        for match in matches["perspective"]:
             if match:
                 issues.append(ValidationIssue(
                     category="perspective",
@@ -401,12 +405,11 @@ class NarrativeConsistencyValidator:
 
         return issues
 
-    def _check_placeholders(self, narrative: str) -> list[ValidationIssue]:
+    def _check_placeholders(self, matches: RuleMatches) -> list[ValidationIssue]:
         """Check for placeholder content."""
         issues = []
 
-        for pattern in PLACEHOLDER_RE:
-            match = pattern.search(narrative)
+        for match in matches["placeholder"]:
             if match:
                 issues.append(ValidationIssue(
                     category="placeholder",
@@ -450,7 +453,7 @@ class NarrativeConsistencyValidator:
 
         return issues
 
-    def _check_tool_commentary(self, narrative: str) -> list[ValidationIssue]:
+    def _check_tool_commentary(self, matches: RuleMatches) -> list[ValidationIssue]:
         """Check for tool-call meta-commentary that breaks immersion.
 
         Detects when the LLM exposes game mechanics by mentioning tool names,
@@ -458,8 +461,7 @@ class NarrativeConsistencyValidator:
         """
         issues = []
 
-        for pattern in TOOL_CALL_RE:
-            match = pattern.search(narrative)
+        for match in matches["meta_commentary"]:
             if match:
                 issues.append(ValidationIssue(
                     category="meta_commentary",
@@ -819,18 +821,7 @@ class DeltaValidator:
         Returns:
             The most similar valid key if above threshold, None otherwise.
         """
-        from difflib import SequenceMatcher
-
-        best_match: str | None = None
-        best_score = threshold
-
-        for valid_key in valid_keys:
-            score = SequenceMatcher(None, invalid_key.lower(), valid_key.lower()).ratio()
-            if score > best_score:
-                best_match = valid_key
-                best_score = score
-
-        return best_match
+        return KeyIndex(valid_keys).most_similar(invalid_key, threshold)
 
     def _check_conflicts(self, deltas: list[StateDelta]) -> list[ValidationIssue]:
         """Check for conflicting deltas."""
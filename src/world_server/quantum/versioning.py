@@ -0,0 +1,284 @@
+"""World-state version vectors for quantum branches.
+
+A branch is only as fresh as the rows its state deltas touch. Instead of
+expiring branches on a wall-clock TTL and re-querying every target at
+collapse time, each branch records a version vector: the row_version of
+every entity, item and needs row its deltas read or write. A branch stays
+valid exactly as long as that vector still matches the database.
+
+Refs are strings of the form "<kind>:<key>":
+- entity:<entity_key>  - Entity row plus its NPCExtension (location, activity)
+- item:<item_key>      - Item row (holder, owner, storage)
+- needs:<entity_key>   - CharacterNeeds row
+
+A ref whose row does not exist has version 0, so creating the row later
+also invalidates the branch.
+
+WorldVersionIndex keeps the versions it has read in memory and drops them
+when its session flushes a change to one of those rows, so a steady-state
+freshness check is a dict comparison with no database round-trip. Bulk
+UPDATE/DELETE statements run through the session (batch need decay,
+snapshot restore) bypass the flush, so they drop every cached version of
+the kind their table backs.
+"""
+
+import logging
+from typing import Iterable
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from src.database.models.character_state import CharacterNeeds
+from src.database.models.entities import Entity, NPCExtension
+from src.database.models.items import Item
+from src.database.models.session import GameSession
+from src.gm.grounding import GroundingManifest
+from src.world_server.quantum.schemas import DeltaType, QuantumBranch, StateDelta
+
+logger = logging.getLogger(__name__)
+
+VersionVector = dict[str, int]
+
+ENTITY_REF = "entity"
+ITEM_REF = "item"
+NEEDS_REF = "needs"
+
+# Ref kind backed by each versioned table, for bulk statements
+_TABLE_REF_KINDS = {
+    Entity.__tablename__: ENTITY_REF,
+    NPCExtension.__tablename__: ENTITY_REF,
+    Item.__tablename__: ITEM_REF,
+    CharacterNeeds.__tablename__: NEEDS_REF,
+}
+
+# Delta types whose target is an entity row
+_ENTITY_DELTAS = {
+    DeltaType.UPDATE_ENTITY,
+    DeltaType.DELETE_ENTITY,
+    DeltaType.UPDATE_LOCATION,
+}
+
+
+def delta_refs(delta: StateDelta) -> list[str]:
+    """Get the version refs a delta depends on.
+
+    Relationship, fact, creation and time deltas are additive and don't
+    depend on existing row state, so they contribute no refs.
+
+    Args:
+        delta: The state delta
+
+    Returns:
+        Refs in "<kind>:<key>" form
+    """
+    if delta.delta_type in _ENTITY_DELTAS:
+        return [f"{ENTITY_REF}:{delta.target_key}"]
+    if delta.delta_type == DeltaType.TRANSFER_ITEM:
+        return [f"{ITEM_REF}:{delta.target_key}"]
+    if delta.delta_type == DeltaType.UPDATE_NEED:
+        entity_key = delta.changes.get("entity_key", delta.target_key)
+        return [f"{NEEDS_REF}:{entity_key}"]
+    return []
+
+
+def branch_refs(branch: QuantumBranch) -> set[str]:
+    """Get the version refs touched by any variant of a branch.
+
+    Args:
+        branch: The branch
+
+    Returns:
+        Set of refs across all variants
+    """
+    refs: set[str] = set()
+    for variant in branch.variants.values():
+        for delta in variant.state_deltas:
+            refs.update(delta_refs(delta))
+    return refs
+
+
+def manifest_refs(manifest: GroundingManifest) -> set[str]:
+    """Get the version refs of everything a manifest grounds a branch in.
+
+    Snapshotting these before generation pins the state a branch was
+    planned on, so writes made while the LLM runs leave it stale.
+
+    Args:
+        manifest: Grounding manifest the branch is generated from
+
+    Returns:
+        Entity and needs refs for the player and NPCs, item refs for items
+    """
+    refs: set[str] = set()
+    for key in (manifest.player_key, *manifest.npcs):
+        refs.update((f"{ENTITY_REF}:{key}", f"{NEEDS_REF}:{key}"))
+    for items in (manifest.items_at_location, manifest.inventory, manifest.equipped):
+        refs.update(f"{ITEM_REF}:{key}" for key in items)
+    return refs
+
+
+class WorldVersionIndex:
+    """In-memory view of row versions for one game session.
+
+    Usage:
+        index = WorldVersionIndex(db, game_session)
+        branch.version_vector = index.snapshot(branch_refs(branch))
+        ...
+        if not index.is_current(branch.version_vector):
+            # Inputs changed since generation
+    """
+
+    def __init__(self, db: Session, game_session: GameSession):
+        """Initialize the index and subscribe to the session's flushes.
+
+        Args:
+            db: Database session whose writes should invalidate versions
+            game_session: Current game session
+        """
+        self.db = db
+        self.game_session = game_session
+        self._versions: VersionVector = {}
+        self._entity_keys: dict[int, str] = {}  # Entity.id -> entity_key
+        self.loads = 0  # Database reads performed, for stats
+
+        if isinstance(db, Session):
+            event.listen(db, "after_flush", self._on_flush)
+            event.listen(db, "after_rollback", self._on_rollback)
+            event.listen(db, "do_orm_execute", self._on_execute)
+
+    def snapshot(self, refs: Iterable[str]) -> VersionVector:
+        """Get current versions for a set of refs.
+
+        Args:
+            refs: Refs to read
+
+        Returns:
+            Version vector covering every ref
+        """
+        refs = set(refs)
+        self._ensure_loaded(refs)
+        return {ref: self._versions.get(ref, 0) for ref in refs}
+
+    def is_current(self, vector: VersionVector) -> bool:
+        """Check whether every version in a vector is still current.
+
+        Args:
+            vector: Versions recorded when a branch was generated
+
+        Returns:
+            True if none of the branch's inputs changed
+        """
+        self._ensure_loaded(vector.keys())
+        return all(self._versions.get(ref, 0) == version for ref, version in vector.items())
+
+    def invalidate(self, refs: Iterable[str] | None = None) -> None:
+        """Forget cached versions so they are re-read on next use.
+
+        Args:
+            refs: Refs to forget (all if None)
+        """
+        if refs is None:
+            self._versions.clear()
+            return
+        for ref in refs:
+            self._versions.pop(ref, None)
+
+    def _ensure_loaded(self, refs: Iterable[str]) -> None:
+        """Read versions for refs not yet in memory, one query per kind."""
+        missing: dict[str, list[str]] = {}
+        for ref in refs:
+            if ref not in self._versions:
+                kind, _, key = ref.partition(":")
+                missing.setdefault(kind, []).append(key)
+        if not missing:
+            return
+
+        self.loads += 1
+        for kind, keys in missing.items():
+            if kind == ENTITY_REF:
+                found = self._load_entity_versions(keys)
+            elif kind == ITEM_REF:
+                found = self._load_item_versions(keys)
+            elif kind == NEEDS_REF:
+                found = self._load_needs_versions(keys)
+            else:
+                logger.warning(f"Unknown version ref kind: {kind}")
+                found = {}
+            for key in keys:
+                self._versions[f"{kind}:{key}"] = found.get(key, 0)
+
+    def _load_entity_versions(self, keys: list[str]) -> dict[str, int]:
+        rows = self.db.execute(
+            select(Entity.id, Entity.entity_key, Entity.row_version, NPCExtension.row_version)
+            .outerjoin(NPCExtension, NPCExtension.entity_id == Entity.id)
+            .where(
+                Entity.session_id == self.game_session.id,
+                Entity.entity_key.in_(keys),
+            )
+        ).all()
+        versions = {}
+        for entity_id, key, version, extension_version in rows:
+            self._entity_keys[entity_id] = key
+            # Both counters only grow, so the sum changes whenever either does
+            versions[key] = version + (extension_version or 0)
+        return versions
+
+    def _load_item_versions(self, keys: list[str]) -> dict[str, int]:
+        rows = self.db.execute(
+            select(Item.item_key, Item.row_version).where(
+                Item.session_id == self.game_session.id,
+                Item.item_key.in_(keys),
+            )
+        ).all()
+        return dict(rows)
+
+    def _load_needs_versions(self, keys: list[str]) -> dict[str, int]:
+        rows = self.db.execute(
+            select(Entity.id, Entity.entity_key, CharacterNeeds.row_version)
+            .outerjoin(CharacterNeeds, CharacterNeeds.entity_id == Entity.id)
+            .where(
+                Entity.session_id == self.game_session.id,
+                Entity.entity_key.in_(keys),
+            )
+        ).all()
+        versions = {}
+        for entity_id, key, version in rows:
+            self._entity_keys[entity_id] = key
+            versions[key] = version or 0
+        return versions
+
+    def _on_flush(self, session: Session, flush_context: object) -> None:
+        """Drop cached versions for rows written by this flush."""
+        if not self._versions:
+            return
+        for obj in (*session.new, *session.dirty, *session.deleted):
+            if isinstance(obj, Entity):
+                self._versions.pop(f"{ENTITY_REF}:{obj.entity_key}", None)
+            elif isinstance(obj, NPCExtension):
+                key = self._entity_keys.get(obj.entity_id)
+                if key is not None:
+                    self._versions.pop(f"{ENTITY_REF}:{key}", None)
+            elif isinstance(obj, Item):
+                self._versions.pop(f"{ITEM_REF}:{obj.item_key}", None)
+            elif isinstance(obj, CharacterNeeds):
+                key = self._entity_keys.get(obj.entity_id)
+                if key is not None:
+                    self._versions.pop(f"{NEEDS_REF}:{key}", None)
+
+    def _on_execute(self, state: ORMExecuteState) -> None:
+        """Drop cached versions of the kind a bulk UPDATE/DELETE writes.
+
+        The statement's rows are unknown, so every ref of that kind goes.
+        """
+        if not self._versions or not (state.is_update or state.is_delete):
+            return
+        table = getattr(state.statement, "table", None)
+        kind = _TABLE_REF_KINDS.get(getattr(table, "name", None))
+        if kind is not None:
+            prefix = f"{kind}:"
+            for ref in [ref for ref in self._versions if ref.startswith(prefix)]:
+                del self._versions[ref]
+
+    def _on_rollback(self, session: Session) -> None:
+        """Forget everything; rolled-back versions may have been cached."""
+        self.invalidate()
@@ -0,0 +1,33 @@
+"""Tests for running sync manager reads from async code."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.database.async_support import get_async_session, run_sync_read
+from src.managers.entity_manager import EntityManager
+from tests.factories import create_entity
+
+
+class TestRunSyncRead:
+    """Tests for run_sync_read with plain sessions."""
+
+    def test_plain_session_has_no_async_proxy(self, db_session):
+        assert get_async_session(db_session) is None
+        assert get_async_session(MagicMock()) is None
+
+    @pytest.mark.asyncio
+    async def test_passes_arguments_through(self, db_session):
+        def read(a, b, *, db):
+            return (a, b, db)
+
+        assert await run_sync_read(db_session, read, 1, 2, db="x") == (1, 2, "x")
+
+    @pytest.mark.asyncio
+    async def test_manager_async_reads(self, db_session, game_session):
+        create_entity(db_session, game_session, entity_key="hero")
+        manager = EntityManager(db_session, game_session)
+
+        entity = await manager.get_entity_async("hero")
+
+        assert entity is manager.get_entity("hero")
@@ -0,0 +1,154 @@
+"""Tests for vectorized dice resolution."""
+
+import numpy as np
+import pytest
+
+from src.dice.batch import (
+    TIER_ORDER,
+    classify_margins,
+    contested_rolls_batch,
+    make_skill_checks,
+    roll_2d10_batch,
+    roll_dice_batch,
+)
+from src.dice.checks import get_outcome_tier
+from src.dice.probability import outcome_tier_probabilities, success_probability
+from src.dice.types import AdvantageType, DiceExpression, OutcomeTier
+
+
+@pytest.fixture
+def rng():
+    """Seeded generator so statistical tests are deterministic."""
+    return np.random.default_rng(42)
+
+
+class TestClassifyMargins:
+    """Tests for classify_margins."""
+
+    def test_matches_scalar_tiers(self):
+        """Test every margin maps to the same tier as get_outcome_tier."""
+        margins = np.arange(-15, 16)
+        codes = classify_margins(margins)
+
+        for margin, code in zip(margins, codes, strict=True):
+            assert TIER_ORDER[code] == get_outcome_tier(int(margin), margin >= 0)
+
+    def test_codes_ordered_worst_to_best(self):
+        """Test higher codes are better outcomes."""
+        assert TIER_ORDER[0] == OutcomeTier.CATASTROPHIC
+        assert TIER_ORDER[-1] == OutcomeTier.EXCEPTIONAL
+
+
+class TestRoll2d10Batch:
+    """Tests for roll_2d10_batch."""
+
+    @pytest.mark.parametrize("advantage", list(AdvantageType))
+    def test_totals_in_range(self, rng, advantage):
+        """Test kept dice sum to 2-20 plus modifier."""
+        totals, _, _ = roll_2d10_batch(np.full(10_000, 3), advantage, rng)
+
+        assert totals.min() >= 5
+        assert totals.max() <= 23
+
+    def test_advantage_raises_average(self, rng):
+        """Test keeping the best two of three raises the mean."""
+        modifiers = np.zeros(20_000, dtype=int)
+        normal, _, _ = roll_2d10_batch(modifiers, AdvantageType.NORMAL, rng)
+        advantage, _, _ = roll_2d10_batch(modifiers, AdvantageType.ADVANTAGE, rng)
+        disadvantage, _, _ = roll_2d10_batch(modifiers, AdvantageType.DISADVANTAGE, rng)
+
+        assert disadvantage.mean() < normal.mean() < advantage.mean()
+
+    def test_per_roll_advantage(self, rng):
+        """Test advantage can differ per roll."""
+        advantage = [AdvantageType.ADVANTAGE, AdvantageType.NORMAL] * 5_000
+        totals, _, _ = roll_2d10_batch(np.zeros(10_000, dtype=int), advantage, rng)
+
+        assert totals[0::2].mean() > totals[1::2].mean()
+
+    def test_critical_flags(self, rng):
+        """Test double-10 always totals 20 and double-1 always totals 2."""
+        totals, double_ten, double_one = roll_2d10_batch(np.zeros(20_000, dtype=int), rng=rng)
+
+        assert (totals[double_ten] == 20).all()
+        assert (totals[double_one] == 2).all()
+        assert double_ten.any() and double_one.any()
+
+
+class TestMakeSkillChecks:
+    """Tests for make_skill_checks."""
+
+    def test_broadcasts_scalar_dc(self, rng):
+        """Test one DC applies to every modifier."""
+        result = make_skill_checks(dcs=15, modifiers=np.arange(6), rng=rng)
+
+        assert len(result) == 6
+        assert (result.dc == 15).all()
+
+    def test_auto_success(self, rng):
+        """Test DC <= 10 + modifier succeeds without rolling."""
+        result = make_skill_checks(dcs=[12, 20], modifiers=[5, 0], rng=rng)
+
+        assert result.is_auto_success.tolist() == [True, False]
+        assert result.success[0]
+        assert result.margin[0] == 4  # 11 + 5 - 12
+        assert not result.is_critical_success[0]
+
+    def test_tiers_match_margins(self, rng):
+        """Test each check's tier agrees with its margin."""
+        result = make_skill_checks(dcs=np.arange(10, 30), modifiers=2, rng=rng)
+
+        for margin, success, tier in zip(result.margin, result.success, result.outcome_tiers(), strict=True):
+            assert tier == get_outcome_tier(int(margin), bool(success))
+
+    @pytest.mark.parametrize("advantage", list(AdvantageType))
+    def test_matches_exact_odds(self, rng, advantage):
+        """Test large batches converge on the exact probabilities."""
+        result = make_skill_checks(
+            dcs=18, modifiers=np.full(100_000, 2), advantage=advantage, rng=rng
+        )
+        exact = outcome_tier_probabilities(18, 2, advantage)
+
+        assert result.success_rate == pytest.approx(
+            success_probability(18, 2, advantage), abs=0.01
+        )
+        for tier, count in result.tier_counts().items():
+            assert count / len(result) == pytest.approx(exact[tier], abs=0.01)
+
+
+class TestRollDiceBatch:
+    """Tests for roll_dice_batch."""
+
+    def test_multi_die_totals(self, rng):
+        """Test totals include every die and the modifier."""
+        totals = roll_dice_batch(DiceExpression(num_dice=3, die_size=6, modifier=2), 5_000, rng=rng)
+
+        assert totals.min() >= 5
+        assert totals.max() <= 20
+
+    def test_d20_advantage(self, rng):
+        """Test d20 advantage averages about 13.8 versus 10.5."""
+        d20 = DiceExpression(num_dice=1, die_size=20)
+        normal = roll_dice_batch(d20, 50_000, rng=rng)
+        advantage = roll_dice_batch(d20, 50_000, AdvantageType.ADVANTAGE, rng)
+
+        assert normal.mean() == pytest.approx(10.5, abs=0.1)
+        assert advantage.mean() == pytest.approx(13.825, abs=0.1)
+
+
+class TestContestedRollsBatch:
+    """Tests for contested_rolls_batch."""
+
+    def test_ties_go_to_defender(self, rng):
+        """Test equal modifiers favor the defender slightly."""
+        wins, margins = contested_rolls_batch(np.zeros(50_000, dtype=int), 0, rng=rng)
+
+        assert (wins == (margins > 0)).all()
+        # P(attacker > defender) on 2d20 is 190/400
+        assert wins.mean() == pytest.approx(0.475, abs=0.01)
+
+    def test_modifiers_shift_margins(self, rng):
+        """Test a large modifier gap always wins."""
+        wins, _ = contested_rolls_batch(np.full(1_000, 20), 0, rng=rng)
+
+        assert wins.all()
@@ -0,0 +1,104 @@
+"""Tests for exact skill check probabilities."""
+
+import pytest
+
+from src.dice.probability import (
+    check_outcome_distribution,
+    outcome_probability_table,
+    outcome_tier_probabilities,
+    success_probability,
+)
+from src.dice.types import AdvantageType, OutcomeTier
+
+
+class TestCheckOutcomeDistribution:
+    """Tests for check_outcome_distribution."""
+
+    @pytest.mark.parametrize("advantage_type", list(AdvantageType))
+    def test_probabilities_sum_to_one(self, advantage_type):
+        """Test every advantage type yields a full distribution."""
+        outcomes = check_outcome_distribution(18, 2, advantage_type)
+        assert sum(o.probability for o in outcomes) == pytest.approx(1.0)
+
+    def test_auto_success_is_single_outcome(self):
+        """Test routine checks have one certain outcome."""
+        outcomes = check_outcome_distribution(dc=12, modifier=5)
+
+        assert len(outcomes) == 1
+        assert outcomes[0].is_auto_success
+        assert outcomes[0].probability == 1.0
+        assert outcomes[0].margin == 4  # 11 + 5 - 12
+
+    @pytest.mark.parametrize(
+        "advantage_type,double_ten,double_one",
+        [
+            (AdvantageType.NORMAL, 0.01, 0.01),
+            (AdvantageType.ADVANTAGE, 0.028, 0.001),  # 3 * 0.9 * 0.01 + 0.001
+            (AdvantageType.DISADVANTAGE, 0.001, 0.028),
+        ],
+    )
+    def test_critical_odds(self, advantage_type, double_ten, double_one):
+        """Test double-10/double-1 odds with and without advantage."""
+        outcomes = check_outcome_distribution(25, 0, advantage_type)
+
+        assert sum(o.probability for o in outcomes if o.is_critical_success) == pytest.approx(
+            double_ten
+        )
+        assert sum(o.probability for o in outcomes if o.is_critical_failure) == pytest.approx(
+            double_one
+        )
+
+
+class TestSuccessProbability:
+    """Tests for success_probability."""
+
+    def test_known_odds(self):
+        """Test success odds against hand-counted 2d10 sums."""
+        assert success_probability(dc=15, modifier=3) == pytest.approx(0.45)  # 12+
+        assert success_probability(dc=20, modifier=0) == pytest.approx(0.01)  # 20 only
+
+    def test_impossible_dc(self):
+        """Test a DC beyond the best roll never succeeds."""
+        assert success_probability(dc=30, modifier=5) == 0.0
+
+    def test_advantage_improves_odds(self):
+        """Test advantage > normal > disadvantage."""
+        normal = success_probability(18, 2, AdvantageType.NORMAL)
+        advantage = success_probability(18, 2, AdvantageType.ADVANTAGE)
+        disadvantage = success_probability(18, 2, AdvantageType.DISADVANTAGE)
+
+        assert disadvantage < normal < advantage
+
+
+class TestOutcomeTierProbabilities:
+    """Tests for outcome_tier_probabilities and tables."""
+
+    def test_all_tiers_present(self):
+        """Test impossible tiers are reported as 0.0."""
+        tiers = outcome_tier_probabilities(dc=15, modifier=3)
+
+        assert set(tiers) == set(OutcomeTier)
+        assert tiers[OutcomeTier.EXCEPTIONAL] == 0.0
+        assert tiers[OutcomeTier.BARE_SUCCESS] == pytest.approx(0.09)  # Sum of 12
+        assert sum(tiers.values()) == pytest.approx(1.0)
+
+    def test_tiers_agree_with_success_probability(self):
+        """Test success tiers add up to the success chance."""
+        tiers = outcome_tier_probabilities(18, 2, AdvantageType.ADVANTAGE)
+        success_tiers = (
+            OutcomeTier.EXCEPTIONAL,
+            OutcomeTier.CLEAR_SUCCESS,
+            OutcomeTier.NARROW_SUCCESS,
+            OutcomeTier.BARE_SUCCESS,
+        )
+
+        assert sum(tiers[t] for t in success_tiers) == pytest.approx(
+            success_probability(18, 2, AdvantageType.ADVANTAGE)
+        )
+
+    def test_table_has_row_per_dc(self):
+        """Test the table is keyed by DC."""
+        table = outcome_probability_table(range(10, 31, 5), modifier=3)
+
+        assert sorted(table) == [10, 15, 20, 25, 30]
+        assert table[15] == outcome_tier_probabilities(15, 3)
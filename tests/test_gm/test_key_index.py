@@ -0,0 +1,148 @@
+"""Tests for the trigram index behind fuzzy key repair."""
+
+import random
+from difflib import SequenceMatcher
+
+from sqlalchemy.orm import Session
+
+from src.database.models.session import GameSession
+from src.gm.context_builder import GMContextBuilder
+from src.gm.grounding import GroundedEntity, GroundingManifest
+from src.gm.key_index import KeyIndex
+from src.gm.manifest_cache import ManifestCache
+from tests.factories import create_item
+from tests.test_gm.test_manifest_cache import setup_scene
+
+
+def linear_scan(query: str, keys: list[str], threshold: float) -> list[tuple[str, float]]:
+    """What key repair computed before the index."""
+    scores = [
+        (key, SequenceMatcher(None, query.lower(), key.lower()).ratio()) for key in keys
+    ]
+    return sorted(
+        ((key, score) for key, score in scores if score >= threshold),
+        key=lambda match: (-match[1], match[0]),
+    )
+
+
+def world_keys(count: int) -> list[str]:
+    """Keys shaped like a generated world's."""
+    rng = random.Random(7)
+    roles = ["farmer", "guard", "merchant", "tankard", "sword", "cloak", "bread", "priest"]
+    names = ["marcus", "elena", "tom", "ale", "iron", "wool", "rye", "bryn", "ulric"]
+    return [
+        f"{rng.choice(roles)}_{rng.choice(names)}_{number:05d}" for number in range(count)
+    ]
+
+
+def make_manifest(**overrides) -> GroundingManifest:
+    fields = {
+        "location_key": "village_tavern",
+        "location_display": "The Tavern",
+        "player_key": "player_001",
+        "npcs": {
+            "farmer_marcus": GroundedEntity(
+                key="farmer_marcus", display_name="Marcus", entity_type="npc"
+            )
+        },
+    }
+    fields.update(overrides)
+    return GroundingManifest(**fields)
+
+
+class TestKeyIndex:
+    """Tests for KeyIndex on its own."""
+
+    def test_scores_match_linear_scan(self):
+        keys = ["farmer_marcus", "Farmer_Elena", "bread_01", "iron_sword", "tavern_keeper"]
+        index = KeyIndex(keys)
+
+        for query in ["farmer_marc", "FARMER_ELENA", "bread_001", "iron_swrd", "unrelated"]:
+            assert index.similar(query, 0.6) == linear_scan(query, keys, 0.6)
+
+    def test_best_score_agrees_with_linear_scan_at_scale(self):
+        keys = world_keys(3000)
+        index = KeyIndex(keys)
+        rng = random.Random(11)
+
+        for key in rng.sample(keys, 30):
+            typo = key.replace("_", "", 1)[:-1]
+            # Equal-scoring keys may be cut by the candidate limit; the best score may not
+            [(_, best)] = index.similar(typo, 0.6, limit=1)
+            assert best == linear_scan(typo, keys, 0.6)[0][1]
+
+    def test_add_and_discard(self):
+        index = KeyIndex(["farmer_marcus"])
+        index.add("farmer_elena")
+        index.discard("farmer_marcus")
+        index.discard("never_added")
+
+        assert "farmer_marcus" not in index
+        assert len(index) == 1
+        assert [key for key, _ in index.similar("farmer_marcu", 0.6)] == ["farmer_elena"]
+
+    def test_most_similar_needs_score_above_threshold(self):
+        index = KeyIndex(["abcd"])
+
+        assert index.most_similar("abcd", 0.5) == "abcd"
+        assert index.most_similar("abxy", 0.5) is None  # Exactly 0.5
+
+
+class TestManifestKeyIndex:
+    """Tests for fuzzy lookup on GroundingManifest."""
+
+    def test_mid_turn_keys_are_found(self):
+        manifest = make_manifest()
+        assert manifest.find_similar_key("tankard_ale_79") is None
+
+        manifest.add_valid_key("tankard_ale_794")
+        assert manifest.find_similar_key("tankard_ale_79") == "tankard_ale_794"
+
+        manifest.additional_valid_keys.add("iron_sword_001")
+        assert manifest.find_similar_key("iron_swrd_001") == "iron_sword_001"
+
+    def test_find_similar_keys_limit(self):
+        manifest = make_manifest(additional_valid_keys={"farmer_marcus_002", "farmer_elena"})
+
+        matches = manifest.find_similar_keys("farmer_marcus_001", limit=2)
+
+        assert [key for key, _ in matches] == ["farmer_marcus_002", "farmer_marcus"]
+
+    def test_shared_index_hits_are_checked_against_manifest(self):
+        shared = KeyIndex(["farmer_marcus", "deleted_npc_001"])
+        manifest = make_manifest(additional_valid_keys={"farmer_marcus"})
+        manifest.use_session_key_index(shared)
+
+        assert manifest.find_similar_key("deleted_npc_01") is None
+        assert manifest.find_similar_key("farmer_marcs") == "farmer_marcus"
+
+
+class TestSessionKeyIndex:
+    """Tests for the session-wide index kept by ManifestCache."""
+
+    def test_index_is_shared_and_patched(self, db_session: Session, game_session: GameSession):
+        player, _ = setup_scene(db_session, game_session)
+        cache = ManifestCache(db_session)
+        builder = GMContextBuilder(db_session, game_session, manifest_cache=cache)
+        index = cache.get_session_key_index(builder._get_all_session_keys)
+
+        create_item(db_session, game_session, item_key="lost_coin_001")
+        manifest = builder.build_grounding_manifest(player.id, "village_square")
+
+        assert cache.get_session_key_index(builder._get_all_session_keys) is index
+        assert "lost_coin_001" in index
+        assert manifest.find_similar_key("lost_coin_01") == "lost_coin_001"
+
+    def test_rollback_drops_index(self, db_session: Session, game_session: GameSession):
+        setup_scene(db_session, game_session)
+        cache = ManifestCache(db_session)
+        builder = GMContextBuilder(db_session, game_session, manifest_cache=cache)
+        index = cache.get_session_key_index(builder._get_all_session_keys)
+        nested = db_session.begin_nested()
+        create_item(db_session, game_session, item_key="phantom_coin")
+        nested.rollback()
+
+        rebuilt = cache.get_session_key_index(builder._get_all_session_keys)
+
+        assert rebuilt is not index
+        assert "phantom_coin" not in rebuilt
@@ -0,0 +1,128 @@
+"""Tests for the incremental grounding manifest cache."""
+
+from sqlalchemy.orm import Session
+
+from src.database.models.enums import EntityType
+from src.database.models.session import GameSession
+from src.gm.context_builder import GMContextBuilder
+from src.gm.manifest_cache import INVENTORY, NPCS, ManifestCache
+from tests.factories import create_entity, create_item, create_location, create_npc_extension
+
+
+def setup_scene(db_session: Session, game_session: GameSession):
+    """Create a player and one NPC at the village square."""
+    create_location(
+        db_session, game_session, location_key="village_square", display_name="Village Square"
+    )
+    player = create_entity(
+        db_session,
+        game_session,
+        entity_type=EntityType.PLAYER,
+        entity_key="player_001",
+        display_name="Finn",
+    )
+    guard = create_entity(
+        db_session,
+        game_session,
+        entity_type=EntityType.NPC,
+        entity_key="guard_001",
+        display_name="Town Guard",
+    )
+    create_npc_extension(db_session, guard, current_location="village_square")
+    return player, guard
+
+
+class TestManifestCache:
+    """Tests for ManifestCache on its own."""
+
+    def test_get_section_builds_once(self):
+        cache = ManifestCache()
+        calls = []
+
+        def build():
+            calls.append(1)
+            return {"a": 1}
+
+        assert cache.get_section(NPCS, "square", build) == {"a": 1}
+        assert cache.get_section(NPCS, "square", build) == {"a": 1}
+        assert len(calls) == 1
+        assert cache.hits == 1
+
+    def test_apply_delta_dirties_only_affected_sections(self):
+        cache = ManifestCache()
+        cache.get_section(NPCS, "square", lambda: {"npc": 1})
+        cache.get_section(INVENTORY, 1, lambda: {"item": 1})
+
+        cache.apply_delta("transfer_item", "sword_001", {})
+
+        assert cache.get_section(NPCS, "square", lambda: {"npc": 2}) == {"npc": 1}
+        assert cache.get_section(INVENTORY, 1, lambda: {"item": 2}) == {"item": 2}
+
+    def test_unknown_delta_type_invalidates_everything(self):
+        cache = ManifestCache()
+        cache.get_section(NPCS, "square", lambda: {"npc": 1})
+
+        cache.apply_delta("teleport", "guard_001", {})
+
+        assert cache.get_section(NPCS, "square", lambda: {"npc": 2}) == {"npc": 2}
+
+
+class TestBuilderWithManifestCache:
+    """Tests for GMContextBuilder.build_grounding_manifest with a cache."""
+
+    def test_repeated_builds_reuse_sections(self, db_session: Session, game_session: GameSession):
+        player, _ = setup_scene(db_session, game_session)
+        cache = ManifestCache(db_session)
+        builder = GMContextBuilder(db_session, game_session, manifest_cache=cache)
+
+        first = builder.build_grounding_manifest(player.id, "village_square")
+        misses = cache.misses
+        second = builder.build_grounding_manifest(player.id, "village_square")
+
+        assert cache.misses == misses
+        assert first == second
+        assert "guard_001" in second.npcs
+        assert second.location_display == "Village Square"
+
+    def test_out_of_band_write_rebuilds_section(
+        self, db_session: Session, game_session: GameSession
+    ):
+        player, guard = setup_scene(db_session, game_session)
+        builder = GMContextBuilder(db_session, game_session, manifest_cache=ManifestCache(db_session))
+        builder.build_grounding_manifest(player.id, "village_square")
+
+        guard.npc_extension.current_location = "tavern"
+        db_session.flush()
+
+        manifest = builder.build_grounding_manifest(player.id, "village_square")
+        assert "guard_001" not in manifest.npcs
+
+    def test_session_keys_patched_without_rescan(
+        self, db_session: Session, game_session: GameSession
+    ):
+        player, _ = setup_scene(db_session, game_session)
+        builder = GMContextBuilder(db_session, game_session, manifest_cache=ManifestCache(db_session))
+        scans = []
+        original = builder._get_all_session_keys
+        builder._get_all_session_keys = lambda: scans.append(1) or original()
+
+        builder.build_grounding_manifest(player.id, "village_square")
+        create_item(db_session, game_session, item_key="lost_coin")
+        manifest = builder.build_grounding_manifest(player.id, "village_square")
+
+        assert len(scans) == 1
+        assert "lost_coin" in manifest.additional_valid_keys
+
+    def test_manifest_mutation_does_not_leak_into_cache(
+        self, db_session: Session, game_session: GameSession
+    ):
+        player, _ = setup_scene(db_session, game_session)
+        builder = GMContextBuilder(db_session, game_session, manifest_cache=ManifestCache(db_session))
+
+        manifest = builder.build_grounding_manifest(player.id, "village_square")
+        manifest.additional_valid_keys.add("invented_key")
+        manifest.npcs.clear()
+
+        again = builder.build_grounding_manifest(player.id, "village_square")
+        assert "invented_key" not in again.additional_valid_keys
+        assert "guard_001" in again.npcs
@@ -0,0 +1,124 @@
+"""Tests for single-pass narrative matching."""
+
+import re
+from unittest.mock import patch
+
+from src.gm import narrative_scanner
+from src.gm.grounding import GroundedEntity, GroundingManifest
+from src.gm.grounding_validator import GroundingValidator
+from src.gm.narrative_scanner import PhraseIndex, RuleSet, literal_factors
+from src.world_server.quantum.validation import NARRATIVE_RULES, NPC_DIALOGUE_PATTERNS
+
+NARRATIVES = [
+    "",
+    "You greet [npc_tom:Old Tom]. Tom's tankard is empty.",
+    "Old Tom nods. The player's sword gleams. TODO: describe the sword.",
+    "As an AI, I'll check your inventory. Let me check the take_item tool.",
+    "Tommy said 'hello there' to the protagonist <placeholder> ${name}.",
+    "The ſystem updates. İ was designed to serve. [thing...] Sir. Bors waves.",
+]
+
+
+def make_manifest() -> GroundingManifest:
+    names = {"npc_tom": "Old Tom", "sir_bors": "Sir. Bors", "tankard": "Tankard of Ale"}
+    return GroundingManifest(
+        location_key="tavern",
+        location_display="The Tavern",
+        player_key="player",
+        npcs={
+            key: GroundedEntity(key=key, display_name=name, entity_type="npc")
+            for key, name in names.items()
+        },
+        items_at_location={
+            "lucky_coin": GroundedEntity(
+                key="lucky_coin", display_name="'Lucky' Coin", entity_type="item"
+            )
+        },
+    )
+
+
+class TestPhraseIndex:
+    """Tests for whole-word phrase matching."""
+
+    def test_positions_match_word_boundary_search(self):
+        phrases = ["old tom", "tom", "tom's", "sir. bors", "'lucky' coin", "ale", ""]
+        index = PhraseIndex(phrases)
+
+        for narrative in NARRATIVES:
+            text = narrative.lower()
+            expected = {
+                phrase: match.start()
+                for phrase in phrases
+                if (match := re.search(rf"\b{re.escape(phrase)}\b", text))
+            }
+            assert index.first_positions(text) == expected
+
+    def test_window(self):
+        index = PhraseIndex(["tom"])
+        text = "tom and tom"
+
+        assert index.first_positions(text, start=1) == {"tom": 8}
+        assert index.first_positions(text, start=1, stop=8) == {}
+
+    def test_settled_leaves_room_for_the_longest_phrase(self):
+        index = PhraseIndex(["tom", "old tom"])
+
+        assert index.settled(20) == 12
+        assert index.settled(3) == 0
+
+
+class TestRuleSet:
+    """Tests for factor-prefiltered rule matching."""
+
+    def test_literal_factors(self):
+        assert literal_factors(r"\bthe player\b") == {"the player"}
+        assert literal_factors(r"\b(?:call|use)\s+\w+\s+tool\b") == {"tool"}
+        assert literal_factors(r"\b(?:told|asked)\b") == {"told", "asked"}
+        assert literal_factors(r"\w+\s*") is None
+
+    def test_matches_individual_searches(self):
+        rules = {**NARRATIVE_RULES, "dialogue": NPC_DIALOGUE_PATTERNS, "any": [r"\w+\s*"]}
+        rule_set = RuleSet(rules, re.IGNORECASE)
+
+        for narrative in NARRATIVES:
+            matches = rule_set.search(narrative)
+            for name, patterns in rules.items():
+                expected = [re.search(pattern, narrative, re.IGNORECASE) for pattern in patterns]
+                assert [m and m.span() for m in matches[name]] == [
+                    m and m.span() for m in expected
+                ]
+
+
+    def test_rules_always_run_without_parser(self):
+        rules = {"player": [r"\bthe player\b"], "any": [r"\w+\s*"]}
+        broken_parse = patch.object(
+            narrative_scanner.sre_parser, "parse", side_effect=TypeError("new parser")
+        )
+
+        for unavailable in (patch.object(narrative_scanner, "sre_parser", None), broken_parse):
+            with unavailable:
+                assert literal_factors(r"\bthe player\b") is None
+                matches = RuleSet(rules).search("Then the player waves.")
+            assert matches["player"][0].span() == (5, 15)
+            assert matches["any"][0].span() == (0, 5)
+
+
+class TestGroundingScan:
+    """Tests for incremental grounding validation."""
+
+    def test_every_prefix_matches_full_validation(self):
+        validator = GroundingValidator(make_manifest())
+
+        for narrative in NARRATIVES:
+            scan = validator.scan()
+            for end in range(len(narrative) + 1):
+                assert scan.validate(narrative[:end]) == validator.validate(narrative[:end])
+
+    def test_unrelated_text_starts_over(self):
+        validator = GroundingValidator(make_manifest())
+        scan = validator.scan()
+        scan.validate("You see Old Tom. ")
+
+        result = scan.validate("You see [npc_tom:Old Tom]. ")
+
+        assert result.valid
@@ -0,0 +1,14 @@
+"""Shared fixtures for LLM tests."""
+
+import pytest
+
+from src.llm import token_counter
+from src.llm.token_counter import TokenCounter
+
+
+@pytest.fixture(autouse=True)
+def fresh_token_counter(monkeypatch: pytest.MonkeyPatch) -> TokenCounter:
+    """Give each test its own token counter, so mocked usage can't calibrate others."""
+    counter = TokenCounter()
+    monkeypatch.setattr(token_counter, "_token_counter", counter)
+    return counter
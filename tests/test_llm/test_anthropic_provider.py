@@ -1,7 +1,7 @@
 """Tests for Anthropic provider."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.llm.anthropic_provider import AnthropicProvider
 from src.llm.message_types import Message
@@ -40,7 +40,12 @@ def mock_anthropic_tool_response():
     response.content = [tool_use]
     response.stop_reason = "tool_use"
     response.model = "claude-sonnet-4-20250514"
-    response.usage = MagicMock(input_tokens=20, output_tokens=15)
+    response.usage = MagicMock(
+        input_tokens=20,
+        output_tokens=15,
+        cache_read_input_tokens=0,
+        cache_creation_input_tokens=0,
+    )
     return response
 
 
@@ -192,6 +197,26 @@ class TestAnthropicProviderCompleteWithTools:
         assert api_tools[0]["name"] == "test_tool"
         assert "input_schema" in api_tools[0]
 
+    @pytest.mark.asyncio
+    async def test_complete_with_tools_calibrates_token_counter(
+        self, mock_anthropic_tool_response
+    ):
+        """Test that tool-call usage, including tool schemas, feeds calibration."""
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(return_value=mock_anthropic_tool_response)
+        provider = AnthropicProvider(api_key="test-key", client=mock_client)
+        tools = [ToolDefinition(name="get_weather", description="Get weather for a city")]
+
+        with patch("src.llm.anthropic_provider.get_token_counter") as get_counter:
+            response = await provider.complete_with_tools(
+                [Message.user("Weather?")], tools, system_prompt="Be brief."
+            )
+
+        model, text, usage = get_counter.return_value.observe_usage.call_args.args
+        assert model == provider.default_model
+        assert text.startswith("Be brief.\n") and '"name": "get_weather"' in text
+        assert usage is response.usage
+
 
 class TestAnthropicProviderMessageConversion:
     """Tests for message format conversion."""
@@ -0,0 +1,197 @@
+"""Tests for the buffered, compressed JSONL audit sink."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from src.llm.audit_logger import LLMAuditContext, LLMAuditEntry, LLMAuditLogger
+from src.llm.audit_segments import (
+    SegmentAuditLogger,
+    entry_to_record,
+    read_audit_records,
+    record_to_entry,
+    render_markdown,
+)
+from src.llm.response_types import LLMResponse, ToolCall, UsageStats
+
+
+def make_entry(
+    session_id: int | None = 42,
+    turn_number: int | None = 3,
+    call_type: str = "game_master",
+    content: str = "Hello",
+) -> LLMAuditEntry:
+    """Create an audit entry with a tool-calling response."""
+    return LLMAuditEntry(
+        timestamp=datetime(2024, 12, 8, 14, 30, 22),
+        context=LLMAuditContext(
+            session_id=session_id, turn_number=turn_number, call_type=call_type
+        ),
+        provider="anthropic",
+        model="claude-sonnet-4-20250514",
+        method="complete_with_tools",
+        system_prompt="You are a GM",
+        messages=[{"role": "user", "content": content}],
+        tools=[{"name": "roll_dice", "description": "Roll dice"}],
+        parameters={"max_tokens": 2048, "temperature": 0.8},
+        response=LLMResponse(
+            content="Let me roll.",
+            tool_calls=(ToolCall(id="call_1", name="roll_dice", arguments={"dice": "2d10"}),),
+            usage=UsageStats(10, 5, 15, cache_read_tokens=3),
+        ),
+        error=None,
+        duration_seconds=1.25,
+    )
+
+
+class TestRecords:
+    """Tests for entry <-> record conversion."""
+
+    def test_round_trip_renders_identical_markdown(self):
+        """Test that a record renders exactly like the Markdown logger."""
+        entry = make_entry()
+
+        record = entry_to_record(entry)
+
+        assert render_markdown(record) == LLMAuditLogger()._format_entry(entry)
+        assert record_to_entry(record).response.usage.cache_read_tokens == 3
+
+
+class TestSegmentAuditLogger:
+    """Tests for writing and reading segments."""
+
+    @pytest.mark.asyncio
+    async def test_entries_are_written_per_session(self, tmp_path):
+        """Test that entries land in per-session gzip segments in order."""
+        audit = SegmentAuditLogger(log_dir=tmp_path)
+
+        await audit.log(make_entry(content="first"))
+        await audit.log(make_entry(session_id=None, content="orphan"))
+        await audit.log(make_entry(content="second"))
+        audit.close()
+
+        assert audit.written_count == 3
+        assert [path.name for path in (tmp_path / "session_42").iterdir()] == [
+            "segment_000001.jsonl.gz"
+        ]
+        records = read_audit_records(tmp_path / "session_42")
+        assert [r["messages"][0]["content"] for r in records] == ["first", "second"]
+        assert [r["session_id"] for r in read_audit_records(tmp_path / "orphan")] == [None]
+
+    @pytest.mark.asyncio
+    async def test_disabled_logger_writes_nothing(self, tmp_path):
+        """Test that a disabled logger neither queues nor writes."""
+        audit = SegmentAuditLogger(log_dir=tmp_path, enabled=False)
+
+        await audit.log(make_entry())
+        audit.close()
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_segments_rotate(self, tmp_path):
+        """Test that a session's segment rotates past the size limit."""
+        audit = SegmentAuditLogger(log_dir=tmp_path, segment_bytes=1)
+
+        for index in range(3):
+            audit.submit(make_entry(content=f"call {index}"))
+            audit.flush()
+        audit.close()
+
+        assert len(list((tmp_path / "session_42").iterdir())) == 3
+        assert len(list(read_audit_records(tmp_path))) == 3
+
+    def test_new_logger_starts_new_segment(self, tmp_path):
+        """Test that a restart never appends to an existing segment."""
+        for _ in range(2):
+            audit = SegmentAuditLogger(log_dir=tmp_path)
+            audit.submit(make_entry())
+            audit.close()
+
+        assert sorted(path.name for path in (tmp_path / "session_42").iterdir()) == [
+            "segment_000001.jsonl.gz",
+            "segment_000002.jsonl.gz",
+        ]
+
+    def test_entries_over_budget_are_dropped(self, tmp_path):
+        """Test that backpressure drops and counts entries instead of blocking."""
+        audit = SegmentAuditLogger(log_dir=tmp_path, max_buffer_bytes=10)
+
+        assert audit.submit(make_entry()) is False
+        audit.close()
+
+        assert audit.dropped_count == 1
+        assert not tmp_path.joinpath("session_42").exists()
+
+    def test_entries_after_close_are_dropped(self, tmp_path):
+        """Test that logging after close is counted as dropped."""
+        audit = SegmentAuditLogger(log_dir=tmp_path)
+        audit.close()
+
+        assert audit.submit(make_entry()) is False
+        assert audit.dropped_count == 1
+
+    def test_failed_batch_keeps_writer_alive(self, tmp_path):
+        """Test that any writer error drops the batch and later entries still land."""
+        audit = SegmentAuditLogger(log_dir=tmp_path)
+
+        with patch.object(audit, "_write_batch", side_effect=ValueError("bad frame")):
+            audit.submit(make_entry(content="lost"))
+            audit.flush()
+        audit.submit(make_entry(content="kept"))
+        audit.close()
+
+        assert audit.dropped_count == 1
+        assert audit.written_count == 1
+        assert [r["messages"][0]["content"] for r in read_audit_records(tmp_path)] == ["kept"]
+
+    def test_truncated_segment_reads_whole_frames(self, tmp_path):
+        """Test that a torn final frame is skipped."""
+        audit = SegmentAuditLogger(log_dir=tmp_path)
+        audit.submit(make_entry(content="kept"))
+        audit.flush()
+        audit.submit(make_entry(content="torn"))
+        audit.close()
+        segment = tmp_path / "session_42" / "segment_000001.jsonl.gz"
+        segment.write_bytes(segment.read_bytes()[:-5])
+
+        assert [r["messages"][0]["content"] for r in read_audit_records(segment)] == ["kept"]
+
+    def test_zstd_segments(self, tmp_path):
+        """Test writing and reading zstd-compressed segments."""
+        pytest.importorskip("zstandard")
+        audit = SegmentAuditLogger(log_dir=tmp_path, compression="zstd")
+
+        audit.submit(make_entry())
+        audit.close()
+
+        (segment,) = (tmp_path / "session_42").iterdir()
+        assert segment.name == "segment_000001.jsonl.zst"
+        assert render_markdown(next(read_audit_records(segment))).startswith(
+            "# LLM Call: game_master"
+        )
+
+
+class TestGetAuditLoggerFormat:
+    """Tests for choosing the sink from settings."""
+
+    def test_jsonl_format_returns_segment_logger(self, tmp_path):
+        """Test that LLM_LOG_FORMAT=jsonl selects the segment logger."""
+        import src.llm.audit_logger as audit_module
+
+        audit_module._audit_logger = None
+        with patch("src.config.settings") as mock_settings:
+            mock_settings.log_llm_calls = True
+            mock_settings.llm_log_dir = str(tmp_path)
+            mock_settings.llm_log_format = "jsonl"
+            mock_settings.llm_log_compression = "gzip"
+            mock_settings.llm_log_buffer_mb = 1
+
+            audit = audit_module.get_audit_logger()
+
+        try:
+            assert isinstance(audit, SegmentAuditLogger)
+            assert audit.max_buffer_bytes == 1024 * 1024
+        finally:
+            audit.close()
+            audit_module._audit_logger = None
@@ -0,0 +1,232 @@
+"""Tests for LLM caching provider wrapper."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from src.llm.caching_provider import CachingProvider
+from src.llm.exceptions import ResponseCacheMissError
+from src.llm.message_types import Message
+from src.llm.response_cache import LLMResponseCache
+from src.llm.response_types import LLMResponse, ToolCall, UsageStats
+from src.llm.tool_types import ToolDefinition
+
+
+class Intent(BaseModel):
+    """Schema for structured tests."""
+
+    action: str
+
+
+MESSAGES = [Message.user("open the door")]
+
+
+@pytest.fixture
+def mock_provider():
+    """Create a mock LLM provider."""
+    provider = MagicMock()
+    provider.provider_name = "mock"
+    provider.default_model = "mock-model"
+    provider.complete = AsyncMock(return_value=LLMResponse(content="The door opens."))
+    provider.complete_with_tools = AsyncMock(
+        return_value=LLMResponse(
+            content="",
+            tool_calls=(ToolCall(id="call_1", name="open", arguments={"what": "door"}),),
+        )
+    )
+    provider.complete_structured = AsyncMock(
+        return_value=LLMResponse(
+            content="",
+            parsed_content={"action": "open"},
+            usage=UsageStats(15, 8, 23),
+        )
+    )
+    provider.count_tokens = MagicMock(return_value=10)
+    return provider
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a response cache in a temp directory."""
+    return LLMResponseCache(tmp_path)
+
+
+class TestCachingProvider:
+    """Tests for CachingProvider wrapper."""
+
+    def test_delegates_metadata(self, mock_provider, cache):
+        """Test provider name, model and token counting pass through."""
+        caching = CachingProvider(mock_provider, cache)
+
+        assert caching.provider_name == "mock"
+        assert caching.default_model == "mock-model"
+        assert caching.count_tokens("hello") == 10
+
+    def test_rejects_unknown_mode(self, mock_provider, cache):
+        """Test an invalid mode raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown cache mode"):
+            CachingProvider(mock_provider, cache, mode="sometimes")
+
+    @pytest.mark.asyncio
+    async def test_structured_duplicate_served_from_cache(self, mock_provider, cache):
+        """Test a byte-identical structured request reaches the provider once."""
+        caching = CachingProvider(mock_provider, cache)
+
+        first = await caching.complete_structured(MESSAGES, Intent)
+        second = await caching.complete_structured(MESSAGES, Intent)
+
+        assert mock_provider.complete_structured.await_count == 1
+        assert second.parsed_content == first.parsed_content == {"action": "open"}
+        assert second.usage == UsageStats(15, 8, 23)
+        assert cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_different_requests_not_shared(self, mock_provider, cache):
+        """Test changed messages or model miss the cache."""
+        caching = CachingProvider(mock_provider, cache)
+
+        await caching.complete_structured(MESSAGES, Intent)
+        await caching.complete_structured([Message.user("close the door")], Intent)
+        await caching.complete_structured(MESSAGES, Intent, model="other-model")
+
+        assert mock_provider.complete_structured.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_readwrite_skips_sampled_requests(self, mock_provider, cache):
+        """Test temperature > 0 requests bypass the cache in readwrite mode."""
+        caching = CachingProvider(mock_provider, cache)
+
+        await caching.complete(MESSAGES, temperature=0.7)
+        await caching.complete(MESSAGES, temperature=0.7)
+
+        assert mock_provider.complete.await_count == 2
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_sampled(self, mock_provider, cache):
+        """Test cache_sampled also reuses sampled responses."""
+        caching = CachingProvider(mock_provider, cache, cache_sampled=True)
+
+        await caching.complete(MESSAGES, temperature=0.7)
+        await caching.complete(MESSAGES, temperature=0.7)
+
+        assert mock_provider.complete.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_kwargs_are_keyed_and_forwarded(self, mock_provider, cache):
+        """Test provider-specific options reach the provider and the key."""
+        caching = CachingProvider(mock_provider, cache)
+
+        await caching.complete(MESSAGES, temperature=0.0, think=False)
+        await caching.complete(MESSAGES, temperature=0.0, think=True)
+
+        assert mock_provider.complete.await_count == 2
+        assert mock_provider.complete.call_args.kwargs["think"] is True
+
+    @pytest.mark.asyncio
+    async def test_record_always_calls_provider(self, mock_provider, cache):
+        """Test record mode refreshes entries instead of reading them."""
+        caching = CachingProvider(mock_provider, cache, mode="record")
+        tools = [ToolDefinition(name="open", description="Open something")]
+
+        await caching.complete_with_tools(MESSAGES, tools)
+        await caching.complete_with_tools(MESSAGES, tools)
+
+        assert mock_provider.complete_with_tools.await_count == 2
+        assert len(cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_replay_serves_recording(self, mock_provider, cache):
+        """Test replay returns recorded responses without the provider."""
+        recorder = CachingProvider(mock_provider, cache, mode="record")
+        tools = [ToolDefinition(name="open", description="Open something")]
+        await recorder.complete_with_tools(MESSAGES, tools)
+
+        offline = MagicMock()
+        offline.provider_name = "mock"
+        offline.default_model = "mock-model"
+        offline.complete_with_tools = AsyncMock(side_effect=AssertionError("network call"))
+        replay = CachingProvider(offline, cache, mode="replay")
+
+        response = await replay.complete_with_tools(MESSAGES, tools)
+
+        assert response.tool_calls[0].arguments == {"what": "door"}
+        offline.complete_with_tools.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_replay_miss_raises(self, mock_provider, cache):
+        """Test strict replay raises instead of calling the provider."""
+        caching = CachingProvider(mock_provider, cache, mode="replay")
+
+        with pytest.raises(ResponseCacheMissError) as exc_info:
+            await caching.complete(MESSAGES, temperature=0.7)
+
+        assert len(exc_info.value.key) == 64
+        mock_provider.complete.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_errors_not_cached(self, mock_provider, cache):
+        """Test provider failures are raised and not stored."""
+        mock_provider.complete_structured.side_effect = RuntimeError("boom")
+        caching = CachingProvider(mock_provider, cache)
+
+        with pytest.raises(RuntimeError):
+            await caching.complete_structured(MESSAGES, Intent)
+
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_streaming_passes_through_uncached(self, mock_provider, cache):
+        """Test streaming bypasses the cache and is offered only in readwrite mode."""
+        mock_provider.complete_with_tools_streaming = mock_provider.complete_with_tools
+        caching = CachingProvider(mock_provider, cache)
+        plain = CachingProvider(MagicMock(spec=["complete_with_tools"]), cache)
+        replay = CachingProvider(mock_provider, cache, mode="replay")
+
+        for _ in range(2):
+            await caching.complete_with_tools_streaming(
+                MESSAGES, [], temperature=0.0, on_token=print
+            )
+
+        assert mock_provider.complete_with_tools_streaming.await_count == 2
+        assert mock_provider.complete_with_tools_streaming.call_args.kwargs["on_token"] is print
+        assert len(cache) == 0
+        assert not callable(getattr(plain, "complete_with_tools_streaming", None))
+        assert not callable(getattr(replay, "complete_with_tools_streaming", None))
+
+
+class TestFactoryWrapping:
+    """Tests for cache wrapping in the provider factory."""
+
+    def test_wraps_when_enabled(self, cache):
+        """Test LLM_CACHE_MODE wraps providers in CachingProvider."""
+        from src.llm.factory import get_provider
+
+        with patch("src.llm.factory.settings") as mock_settings, patch(
+            "src.llm.response_cache.get_response_cache", return_value=cache
+        ):
+            mock_settings.anthropic_api_key = "test-key"
+            mock_settings.gm_model = "claude-sonnet-4-20250514"
+            mock_settings.llm_cache_mode = "replay"
+            mock_settings.log_llm_calls = False
+
+            provider = get_provider("anthropic")
+
+        assert isinstance(provider, CachingProvider)
+        assert provider.mode == "replay"
+        assert provider.provider_name == "anthropic"
+
+    def test_not_wrapped_when_off(self):
+        """Test the default mode leaves providers unwrapped."""
+        from src.llm.factory import get_provider
+
+        with patch("src.llm.factory.settings") as mock_settings:
+            mock_settings.anthropic_api_key = "test-key"
+            mock_settings.gm_model = "claude-sonnet-4-20250514"
+            mock_settings.llm_cache_mode = "off"
+            mock_settings.log_llm_calls = False
+
+            provider = get_provider("anthropic")
+
+        assert not isinstance(provider, CachingProvider)
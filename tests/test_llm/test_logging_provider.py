@@ -152,6 +152,25 @@ class TestLoggingProvider:
         assert "Tool Calls" in content
         assert "test_tool" in content  # From mock response
 
+    @pytest.mark.asyncio
+    async def test_streaming_only_when_supported(self, mock_provider, tmp_path):
+        """Test streaming is logged, and offered only when the wrapped provider streams."""
+        logger = LLMAuditLogger(log_dir=tmp_path, enabled=True)
+        mock_provider.complete_with_tools_streaming = mock_provider.complete_with_tools
+        logging_provider = LoggingProvider(mock_provider, logger)
+        plain = LoggingProvider(MagicMock(spec=["complete", "complete_with_tools"]), logger)
+
+        set_audit_context(session_id=1, turn_number=1, call_type="narrator")
+        response = await logging_provider.complete_with_tools_streaming(
+            messages=[Message.user("Look around")], tools=[], on_token=print
+        )
+
+        assert response.tool_calls[0].name == "test_tool"
+        assert mock_provider.complete_with_tools_streaming.call_args.kwargs["on_token"] is print
+        content = next((tmp_path / "session_1").glob("*.md")).read_text()
+        assert "complete_with_tools_streaming" in content
+        assert not callable(getattr(plain, "complete_with_tools_streaming", None))
+
     @pytest.mark.asyncio
     async def test_complete_structured_delegates(self, mock_provider, mock_logger):
         """Test that complete_structured() delegates to wrapped provider."""
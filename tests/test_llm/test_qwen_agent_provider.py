@@ -694,11 +694,11 @@ class TestQwenAgentProviderTokenCounting:
     """Tests for token counting."""
 
     def test_count_tokens_basic(self):
-        """Test basic token counting (heuristic)."""
+        """Test basic token counting (approximate)."""
         provider = QwenAgentProvider()
         count = provider.count_tokens("Hello, world!")
-        # 13 chars / 4 = 3 tokens
-        assert count == 3
+        assert isinstance(count, int)
+        assert 2 <= count <= 5
 
     def test_count_tokens_empty(self):
         """Test token counting for empty string."""
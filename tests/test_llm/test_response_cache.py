@@ -0,0 +1,152 @@
+"""Tests for the content-addressed LLM response cache."""
+
+import pytest
+from pydantic import BaseModel
+
+from src.llm.message_types import Message
+from src.llm.response_cache import (
+    LLMResponseCache,
+    request_key,
+    response_from_dict,
+    response_to_dict,
+)
+from src.llm.response_types import LLMResponse, ToolCall, UsageStats
+from src.llm.tool_types import ToolDefinition
+
+
+class Verdict(BaseModel):
+    """Schema for key tests."""
+
+    ok: bool
+
+
+class OtherVerdict(BaseModel):
+    """Schema with a different shape."""
+
+    ok: bool
+    reason: str
+
+
+def _key(**overrides):
+    request = {
+        "method": "complete_structured",
+        "provider": "mock",
+        "model": "mock-model",
+        "messages": [Message.user("Is the door locked?")],
+        "temperature": 0.0,
+        "response_schema": Verdict,
+    }
+    request.update(overrides)
+    return request_key(**request)
+
+
+class TestRequestKey:
+    """Tests for request_key."""
+
+    def test_identical_requests_share_key(self):
+        """Test equal requests built separately hash the same."""
+        assert _key() == _key()
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"model": "other-model"},
+            {"messages": [Message.user("Is the door open?")]},
+            {"temperature": 0.7},
+            {"response_schema": OtherVerdict},
+            {"system_prompt": "Be terse."},
+            {"method": "complete"},
+        ],
+    )
+    def test_request_fields_change_key(self, overrides):
+        """Test every keyed field distinguishes requests."""
+        assert _key(**overrides) != _key()
+
+    def test_tools_change_key(self):
+        """Test tool definitions are part of the key."""
+        tool = ToolDefinition(name="open_door", description="Open a door")
+
+        assert _key(tools=[tool]) != _key()
+
+
+class TestResponseSerialization:
+    """Tests for response_to_dict/response_from_dict."""
+
+    def test_round_trip(self):
+        """Test a response survives serialization (except raw_response)."""
+        response = LLMResponse(
+            content="text",
+            tool_calls=(ToolCall(id="c1", name="tool", arguments={"a": 1}, raw_arguments='{"a": 1}'),),
+            parsed_content={"ok": True},
+            finish_reason="tool_use",
+            model="mock-model",
+            usage=UsageStats(10, 5, 15),
+            raw_response=object(),
+        )
+
+        restored = response_from_dict(response_to_dict(response))
+
+        assert restored == LLMResponse(**{**response.__dict__, "raw_response": None})
+
+
+class TestLLMResponseCache:
+    """Tests for LLMResponseCache."""
+
+    def test_miss_then_hit(self, tmp_path):
+        """Test stored responses are returned and counted."""
+        cache = LLMResponseCache(tmp_path)
+
+        assert cache.get("ab" * 32) is None
+        cache.put("ab" * 32, LLMResponse(content="hello"))
+
+        assert cache.get("ab" * 32).content == "hello"
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert (tmp_path / "ab" / f"{'ab' * 32}.json").exists()
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test a new cache over the same directory sees old entries."""
+        LLMResponseCache(tmp_path).put("cd" * 32, LLMResponse(content="kept"))
+
+        cache = LLMResponseCache(tmp_path)
+
+        assert len(cache) == 1
+        assert cache.get("cd" * 32).content == "kept"
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test the size bound evicts the entry not read for longest."""
+        probe = LLMResponseCache(tmp_path / "probe")
+        probe.put("00" * 32, LLMResponse(content="x" * 100))
+        entry_size = probe.total_bytes
+
+        cache = LLMResponseCache(tmp_path / "cache", max_bytes=entry_size * 2)
+        cache.put("aa" * 32, LLMResponse(content="a" * 100))
+        cache.put("bb" * 32, LLMResponse(content="b" * 100))
+        cache.get("aa" * 32)
+        cache.put("cc" * 32, LLMResponse(content="c" * 100))
+
+        assert "aa" * 32 in cache
+        assert "bb" * 32 not in cache
+        assert "cc" * 32 in cache
+        assert cache.evictions == 1
+        assert cache.total_bytes <= cache.max_bytes
+        assert not (tmp_path / "cache" / "bb" / f"{'bb' * 32}.json").exists()
+
+    def test_unreadable_entry_is_a_miss(self, tmp_path):
+        """Test a corrupt entry is dropped instead of raising."""
+        cache = LLMResponseCache(tmp_path)
+        cache.put("ef" * 32, LLMResponse(content="ok"))
+        (tmp_path / "ef" / f"{'ef' * 32}.json").write_text("not json")
+
+        assert cache.get("ef" * 32) is None
+        assert "ef" * 32 not in cache
+
+    def test_clear(self, tmp_path):
+        """Test clear removes every entry."""
+        cache = LLMResponseCache(tmp_path)
+        cache.put("12" * 32, LLMResponse(content="x"))
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.total_bytes == 0
+        assert not list(tmp_path.glob("*/*.json"))
@@ -0,0 +1,81 @@
+"""Tests for the scripted LLM provider."""
+
+import time
+
+import pytest
+from pydantic import BaseModel
+
+from src.llm.message_types import Message
+from src.llm.response_types import LLMResponse
+from src.llm.scripted_provider import ScriptedProvider, ScriptedRequest
+from src.llm.tool_types import ToolDefinition
+
+
+class Answer(BaseModel):
+    """Schema for structured tests."""
+
+    value: int
+
+
+class TestScriptedProvider:
+    """Tests for ScriptedProvider."""
+
+    @pytest.mark.asyncio
+    async def test_structured_responder_by_schema_name(self):
+        """Test structured calls use the responder named after the schema."""
+        provider = ScriptedProvider({"Answer": lambda request: {"value": len(request.prompt)}})
+
+        response = await provider.complete_structured([Message.user("abcd")], Answer)
+
+        assert response.parsed_content == {"value": 4}
+        assert response.usage.total_tokens > 0
+        assert response.model == "scripted"
+
+    @pytest.mark.asyncio
+    async def test_text_responder_by_method(self):
+        """Test complete and complete_with_tools use method responders."""
+        provider = ScriptedProvider(
+            {
+                "complete": lambda request: "prose",
+                "complete_with_tools": lambda request: LLMResponse(
+                    content=f"{len(request.tools)} tools"
+                ),
+            }
+        )
+        tool = ToolDefinition(name="roll", description="Roll dice")
+
+        text = await provider.complete([Message.user("hi")], system_prompt="narrate")
+        tools = await provider.complete_with_tools([Message.user("hi")], [tool])
+
+        assert text.content == "prose"
+        assert tools.content == "1 tools"
+        assert [call.method for call in provider.calls] == ["complete", "complete_with_tools"]
+        assert provider.calls[0].system_prompt == "narrate"
+
+    @pytest.mark.asyncio
+    async def test_missing_responder_returns_empty(self):
+        """Test unscripted requests look like failed structured output."""
+        provider = ScriptedProvider()
+
+        response = await provider.complete_structured([Message.user("?")], Answer)
+
+        assert response.parsed_content is None
+
+    @pytest.mark.asyncio
+    async def test_simulated_latency(self):
+        """Test calls take at least the configured latency."""
+        provider = ScriptedProvider({"complete": lambda request: "x"}, latency_ms=30)
+
+        start = time.perf_counter()
+        await provider.complete([Message.user("hi")])
+
+        assert (time.perf_counter() - start) * 1000 >= 25
+
+    def test_request_prompt_is_last_message(self):
+        """Test prompt reads the last message's text."""
+        request = ScriptedRequest(
+            "complete", (Message.system("rules"), Message.user("open the door"))
+        )
+
+        assert request.prompt == "open the door"
+        assert ScriptedRequest("complete", ()).prompt == ""
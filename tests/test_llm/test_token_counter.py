@@ -0,0 +1,194 @@
+"""Tests for tokenizer-backed token counting."""
+
+import pytest
+
+from src.llm.message_types import Message
+from src.llm.response_types import UsageStats
+from src.llm.token_counter import TokenCounter, get_token_counter, prompt_text
+
+PROSE = "The innkeeper wipes down the counter and eyes the stranger warily. " * 10
+
+
+@pytest.fixture
+def counter() -> TokenCounter:
+    """Heuristic-only counter, independent of tiktoken availability."""
+    return TokenCounter(use_tokenizers=False)
+
+
+class TestTokenCounterCounting:
+    """Tests for counting and caching."""
+
+    def test_empty_text_returns_zero(self, counter):
+        """Verify empty and None text count as 0 tokens."""
+        assert counter.count("") == 0
+        assert counter.count(None) == 0
+
+    def test_heuristic_count(self, counter):
+        """Verify heuristic fallback rounds characters-per-token up."""
+        assert counter.count("Hello world") == 3
+        assert counter.count("a") == 1
+
+    def test_repeated_text_is_cached(self, counter):
+        """Verify repeated text is counted once."""
+        counter.count(PROSE, "llama3")
+        counter.count(PROSE, "llama3")
+
+        assert counter.misses == 1
+        assert counter.hits == 1
+
+    def test_cache_is_per_model(self, counter):
+        """Verify the same text is cached separately per model."""
+        counter.count(PROSE, "llama3")
+        counter.count(PROSE, "qwen3")
+
+        assert counter.misses == 2
+
+    def test_lru_evicts_oldest(self):
+        """Verify the least recently used entry is evicted."""
+        counter = TokenCounter(max_entries=2, use_tokenizers=False)
+        counter.count("first")
+        counter.count("second")
+        counter.count("first")  # Refresh "first"
+        counter.count("third")  # Evicts "second"
+
+        counter.count("first")
+        assert counter.hits == 2
+        counter.count("second")
+        assert counter.misses == 4
+
+    def test_clear_drops_cache(self, counter):
+        """Verify clear() empties the cache and resets stats."""
+        counter.count(PROSE)
+        counter.clear()
+        counter.count(PROSE)
+
+        assert counter.misses == 1
+        assert counter.hits == 0
+
+
+class TestTokenCounterCalibration:
+    """Tests for per-model calibration from reported usage."""
+
+    def test_first_observation_sets_scale(self, counter):
+        """Verify counts match the usage the model reported."""
+        raw = counter.count(PROSE, "llama3")
+        usage = UsageStats(prompt_tokens=raw * 2, completion_tokens=10, total_tokens=raw * 2 + 10)
+
+        counter.observe_usage("llama3", PROSE, usage)
+
+        assert counter.scale_for("llama3") == pytest.approx(2.0)
+        assert counter.count(PROSE, "llama3") == raw * 2
+
+    def test_calibration_is_per_model(self, counter):
+        """Verify calibrating one model leaves others untouched."""
+        raw = counter.count(PROSE, "qwen3")
+        usage = UsageStats(prompt_tokens=raw * 2, completion_tokens=10, total_tokens=raw * 2 + 10)
+
+        counter.observe_usage("llama3", PROSE, usage)
+
+        assert counter.scale_for("qwen3") is None
+        assert counter.count(PROSE, "qwen3") == raw
+
+    def test_later_observations_are_smoothed(self, counter):
+        """Verify later observations move the scale gradually."""
+        raw = counter.count(PROSE, "llama3")
+        counter.observe_usage(
+            "llama3", PROSE, UsageStats(prompt_tokens=raw, completion_tokens=0, total_tokens=raw)
+        )
+        counter.observe_usage(
+            "llama3", PROSE, UsageStats(prompt_tokens=raw * 2, completion_tokens=0, total_tokens=raw * 2)
+        )
+
+        assert counter.scale_for("llama3") == pytest.approx(1.0 + TokenCounter.CALIBRATION_WEIGHT)
+
+    def test_cached_prompt_tokens_count_toward_usage(self, counter):
+        """Verify Anthropic cache read/creation tokens are part of the prompt."""
+        raw = counter.count(PROSE, "claude-sonnet-4")
+        usage = UsageStats(
+            prompt_tokens=raw,
+            completion_tokens=0,
+            total_tokens=raw,
+            cache_read_tokens=raw,
+        )
+
+        counter.observe_usage("claude-sonnet-4", PROSE, usage)
+
+        assert counter.scale_for("claude-sonnet-4") == pytest.approx(2.0)
+
+    def test_ignores_missing_usage(self, counter):
+        """Verify responses without usage don't calibrate."""
+        counter.observe_usage("llama3", PROSE, None)
+        counter.observe_usage(
+            "llama3", PROSE, UsageStats(prompt_tokens=0, completion_tokens=0, total_tokens=0)
+        )
+
+        assert counter.scale_for("llama3") is None
+
+    def test_ignores_short_prompts(self, counter):
+        """Verify short prompts dominated by template overhead don't calibrate."""
+        usage = UsageStats(prompt_tokens=50, completion_tokens=0, total_tokens=50)
+
+        counter.observe_usage("llama3", "Hi", usage)
+
+        assert counter.scale_for("llama3") is None
+
+
+class TestTokenCounterTokenizers:
+    """Tests for real tokenizer selection."""
+
+    def test_openai_models_use_exact_encoding(self):
+        """Verify OpenAI models count with their own encoding."""
+        pytest.importorskip("tiktoken")
+        counter = TokenCounter()
+        if counter._load_encoding("o200k_base") is None:
+            pytest.skip("tiktoken encoding files unavailable")
+
+        assert counter.is_exact("gpt-4o")
+        assert not counter.is_exact("llama3")
+
+    def test_exact_models_are_not_calibrated(self):
+        """Verify reported usage doesn't rescale exact tokenizers."""
+        pytest.importorskip("tiktoken")
+        counter = TokenCounter()
+        if counter._load_encoding("o200k_base") is None:
+            pytest.skip("tiktoken encoding files unavailable")
+        raw = counter.count(PROSE, "gpt-4o")
+
+        counter.observe_usage(
+            "gpt-4o", PROSE, UsageStats(prompt_tokens=raw * 3, completion_tokens=0, total_tokens=raw * 3)
+        )
+
+        assert counter.scale_for("gpt-4o") is None
+
+    def test_heuristic_only_is_never_exact(self, counter):
+        """Verify heuristic counting never claims exactness."""
+        assert not counter.is_exact("gpt-4o")
+
+
+class TestPromptText:
+    """Tests for prompt_text()."""
+
+    def test_joins_system_and_messages(self):
+        """Verify the system prompt and message text are joined."""
+        messages = [Message.user("Look around"), Message.assistant("You see a tavern.")]
+
+        text = prompt_text(messages, "You are the GM.")
+
+        assert text == "You are the GM.\nLook around\nYou see a tavern."
+
+    def test_without_system_prompt(self):
+        """Verify text is built from messages alone."""
+        assert prompt_text([Message.user("Hello")]) == "Hello"
+
+    def test_includes_tool_definitions(self):
+        """Verify tool schemas sent with a request count as prompt text."""
+        tool = {"name": "roll_dice", "description": "Roll dice"}
+
+        text = prompt_text([Message.user("Attack!")], "You are the GM.", [tool])
+
+        assert text == 'You are the GM.\n{"name": "roll_dice", "description": "Roll dice"}\nAttack!'
+
+
+def test_get_token_counter_is_shared():
+    """Verify get_token_counter() returns one process-wide counter."""
+    assert get_token_counter() is get_token_counter()
@@ -0,0 +1,92 @@
+"""Tests for the tracing provider wrapper."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+from src.llm.message_types import Message
+from src.llm.response_types import LLMResponse, UsageStats
+from src.llm.scripted_provider import ScriptedProvider
+from src.llm.tracing_provider import TracingProvider
+from src.observability.histogram import LatencyHistogramHook
+from src.observability.hooks import NullHook
+from src.observability.tracing import Tracer
+
+
+class Answer(BaseModel):
+    """Schema for structured tests."""
+
+    value: int
+
+
+class RecordingHook(NullHook):
+    """Hook collecting finished spans."""
+
+    def __init__(self):
+        self.ended = []
+
+    def on_phase_end(self, event):
+        self.ended.append(event)
+
+
+class TestTracingProvider:
+    """Tests for TracingProvider."""
+
+    @pytest.mark.asyncio
+    async def test_call_runs_in_span_under_phase(self):
+        """Test each call is a span under the open phase with usage attributes."""
+        hook = RecordingHook()
+        tracer = Tracer(hook)
+        provider = TracingProvider(ScriptedProvider({"Answer": lambda r: {"value": 1}}), tracer)
+
+        with tracer.span("intent", turn=2):
+            response = await provider.complete_structured([Message.user("hi")], Answer)
+
+        llm_span, phase_span = hook.ended
+        assert response.parsed_content == {"value": 1}
+        assert llm_span.phase == "llm.complete_structured"
+        assert llm_span.parent_id == phase_span.span_id
+        assert llm_span.details["turn"] == 2
+        assert llm_span.details["provider"] == "scripted"
+        assert llm_span.details["model"] == "scripted"
+        assert llm_span.details["completion_tokens"] > 0
+
+    @pytest.mark.asyncio
+    async def test_failed_call_marks_span(self):
+        """Test provider errors propagate and fail the span."""
+        hook = RecordingHook()
+        inner = MagicMock()
+        inner.provider_name = "mock"
+        inner.default_model = "mock-model"
+        inner.complete = AsyncMock(side_effect=RuntimeError("timeout"))
+        provider = TracingProvider(inner, Tracer(hook))
+
+        with pytest.raises(RuntimeError):
+            await provider.complete([Message.user("hi")], model="other")
+
+        assert hook.ended[0].success is False
+        assert hook.ended[0].details["model"] == "other"
+
+    @pytest.mark.asyncio
+    async def test_streaming_only_when_supported(self):
+        """Test streaming is offered exactly when the wrapped provider streams."""
+        hook = LatencyHistogramHook()
+        streaming = MagicMock()
+        streaming.provider_name = "mock"
+        streaming.default_model = "mock-model"
+        streaming.complete_with_tools_streaming = AsyncMock(
+            return_value=LLMResponse(content="Hi", usage=UsageStats(3, 1, 4))
+        )
+
+        traced = TracingProvider(streaming, Tracer(hook))
+        plain = TracingProvider(ScriptedProvider(), Tracer(hook))
+        response = await traced.complete_with_tools_streaming(
+            messages=[Message.user("hi")], tools=[], on_token=print
+        )
+
+        assert response.content == "Hi"
+        assert streaming.complete_with_tools_streaming.call_args.kwargs["on_token"] is print
+        assert hook.summary()["llm.complete_with_tools_streaming"]["count"] == 1
+        assert not callable(getattr(plain, "complete_with_tools_streaming", None))
+        assert traced.count_tokens("abcdefgh") == streaming.count_tokens.return_value
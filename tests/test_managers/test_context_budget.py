@@ -145,14 +145,14 @@ class TestContextBudgetTruncation:
         budget = ContextBudget(max_tokens=200)  # Enough for truncated version
         budget.add_section(
             "large",
-            "A" * 1000,  # Very large content
+            "The tavern is crowded tonight. " * 100,  # Very large content
             priority=ContextPriority.HIGH,
         )
         result = budget.compile(truncate_sections=True)
 
         # Should be truncated, not excluded
         assert "large" in result.sections_included
-        assert len(result.content) < 1000
+        assert len(result.content) < 3100
         assert "..." in result.content
 
     def test_excludes_without_truncation(self):
@@ -0,0 +1,123 @@
+"""Tests for the inverted index behind memory matching."""
+
+import pytest
+from sqlalchemy import event
+
+from src.managers.memory_index import MemoryIndex, get_memory_index
+from src.managers.memory_manager import MemoryManager
+from tests.factories import create_character_memory, create_entity
+
+
+class TestMemoryIndexSearch:
+    """Tests for matching and scoring in the index itself."""
+
+    def test_all_phrases_matched_scores_one(self):
+        index = MemoryIndex()
+        index.add(1, "mother's hat", ["hat", "wide-brimmed", "straw"])
+
+        assert index.search("Wide brimmed straw hat, Mother's hat") == [(1, 1.0)]
+
+    def test_words_not_substrings(self):
+        index = MemoryIndex()
+        index.add(1, "old hat", ["hat"])
+
+        assert index.search("that chat") == []
+        assert index.search("two hats")[0][0] == 1
+
+    def test_multi_word_phrase_needs_every_word(self):
+        index = MemoryIndex()
+        index.add(1, "house fire", ["house fire"])
+
+        assert index.search("a house on the hill") == []
+        assert index.search("the house fires")[0][1] == 1.0
+
+    def test_rare_keywords_weigh_more(self):
+        index = MemoryIndex()
+        index.add(1, "duel", ["sword", "blood"])
+        index.add(2, "march", ["sword", "rain"])
+        index.add(3, "siege", ["sword", "snow"])
+
+        scores = dict(index.search("blood on a sword"))
+
+        assert scores[1] > 0.5
+        assert scores[2] == pytest.approx(scores[3])
+        assert scores[2] < 0.5
+
+    def test_remove_and_readd(self):
+        index = MemoryIndex()
+        index.add(1, "hat", ["hat"])
+        index.add(1, "sword", ["sword"])
+
+        assert index.search("hat") == []
+        assert index.with_keyword("SWORD") == {1}
+        index.remove(1)
+        assert len(index) == 0
+        assert index.search("sword") == []
+
+
+class TestMemoryIndexMaintenance:
+    """Tests for keeping the cached index in step with the database."""
+
+    def test_create_update_delete_are_reflected(self, db_session, game_session):
+        entity = create_entity(db_session, game_session)
+        manager = MemoryManager(db_session, game_session)
+        memory = create_character_memory(db_session, game_session, entity)
+        index = manager.memory_index(entity.id)
+
+        assert memory.id in index
+        manager.update_memory(memory.id, keywords=["chicken"], subject="red chicken")
+        assert manager.find_matching_memories(entity.id, "a straw hat") == []
+        assert manager.find_matching_memories(entity.id, "a red chicken")[0][0] is memory
+
+        manager.delete_memory(memory.id)
+        assert memory.id not in index
+        assert manager.memory_index(entity.id) is index
+
+    def test_entities_and_sessions_are_separate(self, db_session, game_session, game_session_2):
+        ours = create_entity(db_session, game_session)
+        other = create_entity(db_session, game_session)
+        theirs = create_entity(db_session, game_session_2)
+        mine = create_character_memory(db_session, game_session, ours)
+        create_character_memory(db_session, game_session, other)
+        create_character_memory(db_session, game_session_2, theirs)
+
+        matches = MemoryManager(db_session, game_session).find_matching_memories(
+            ours.id, "hat", min_relevance=0.1
+        )
+
+        assert [memory for memory, _ in matches] == [mine]
+
+    def test_rollback_drops_indexes(self, db_session, game_session):
+        entity = create_entity(db_session, game_session)
+        index = get_memory_index(db_session, game_session.id, entity.id)
+        nested = db_session.begin_nested()
+        create_character_memory(db_session, game_session, entity)
+        nested.rollback()
+
+        rebuilt = get_memory_index(db_session, game_session.id, entity.id)
+
+        assert rebuilt is not index
+        assert len(rebuilt) == 0
+
+    def test_lookup_loads_only_matches(self, db_session, game_session):
+        entity = create_entity(db_session, game_session)
+        for number in range(50):
+            create_character_memory(
+                db_session, game_session, entity, subject=f"thing {number}", keywords=[f"k{number}"]
+            )
+        manager = MemoryManager(db_session, game_session)
+        manager.memory_index(entity.id)
+        statements = []
+        bind = db_session.connection()
+
+        def listener(conn, cursor, statement, parameters, *args):
+            statements.append(parameters)
+
+        event.listen(bind, "before_cursor_execute", listener)
+        try:
+            matches = manager.find_matching_memories(entity.id, "only k7 here")
+        finally:
+            event.remove(bind, "before_cursor_execute", listener)
+
+        assert [memory.keywords for memory, _ in matches] == [["k7"]]
+        assert len(statements) == 1
@@ -0,0 +1,167 @@
+"""Tests for columnar batch need decay."""
+
+import random
+
+import pytest
+from sqlalchemy import event
+
+from src.database.models.enums import DriveLevel
+from src.managers.needs import ActivityType, NeedsManager
+from src.managers.needs_batch import NEED_COLUMNS
+from tests.factories import (
+    create_character_needs,
+    create_character_preferences,
+    create_entity,
+    create_need_modifier,
+    create_npc_extension,
+)
+
+
+def create_twins(db_session, game_session, count: int, seed: int = 11):
+    """Create pairs of entities with identical random needs, modifiers and preferences."""
+    rng = random.Random(seed)
+    pairs = []
+    for _ in range(count):
+        needs = {name: rng.randint(0, 100) for name in NEED_COLUMNS}
+        modifiers = [
+            {
+                "need_name": rng.choice(NEED_COLUMNS),
+                "decay_rate_multiplier": rng.choice([0.5, 1.0, 1.5, 2.0]),
+                "max_intensity_cap": rng.choice([None, 60, 90]),
+                "is_active": rng.random() < 0.8,
+            }
+            for _ in range(rng.randint(0, 3))
+        ]
+        drive_level = rng.choice([None, *DriveLevel])
+        pair = []
+        for _ in range(2):
+            entity = create_entity(db_session, game_session)
+            create_character_needs(db_session, game_session, entity, **needs)
+            for modifier in modifiers:
+                create_need_modifier(db_session, game_session, entity, **modifier)
+            if drive_level is not None:
+                create_character_preferences(
+                    db_session, game_session, entity, drive_level=drive_level
+                )
+            pair.append(entity)
+        pairs.append(tuple(pair))
+    return pairs
+
+
+class TestBatchMatchesSingleDecay:
+    """The batch engine must agree with apply_time_decay entity by entity."""
+
+    @pytest.mark.parametrize("activity", list(ActivityType))
+    @pytest.mark.parametrize("is_alone", [True, False])
+    def test_same_values_as_apply_time_decay(
+        self, db_session, game_session, activity, is_alone
+    ):
+        pairs = create_twins(db_session, game_session, 25)
+        manager = NeedsManager(db_session, game_session)
+
+        for single, _ in pairs:
+            manager.apply_time_decay(single.id, 2.5, activity=activity, is_alone=is_alone)
+        result = manager.apply_batch_time_decay(
+            2.5,
+            activity=activity,
+            is_alone=is_alone,
+            entity_ids=[batched.id for _, batched in pairs],
+        )
+
+        for single, batched in pairs:
+            expected = manager.get_needs(single.id)
+            assert result.needs_for(batched.id) == {
+                name: getattr(expected, name) for name in NEED_COLUMNS
+            }
+
+
+class TestBatchTimeDecay:
+    """Tests for writing batch results back."""
+
+    def test_loaded_needs_see_new_values(self, db_session, game_session):
+        entity = create_entity(db_session, game_session)
+        needs = create_character_needs(db_session, game_session, entity, hunger=80)
+        version = needs.row_version
+        manager = NeedsManager(db_session, game_session)
+
+        manager.apply_batch_time_decay(2)
+
+        assert needs.hunger == 68
+        assert needs.row_version == version + 1
+        # The ORM's version check still passes after the bulk update
+        needs.hunger = 50
+        db_session.flush()
+
+    def test_unchanged_rows_are_not_written(self, db_session, game_session):
+        entity = create_entity(db_session, game_session)
+        # Morale already at its baseline, so zero hours changes nothing
+        needs = create_character_needs(db_session, game_session, entity, morale=50)
+        version = needs.row_version
+        manager = NeedsManager(db_session, game_session)
+
+        result = manager.apply_batch_time_decay(0)
+
+        assert not result.changed.any()
+        assert needs.row_version == version
+
+    def test_entities_without_needs_are_skipped(self, db_session, game_session):
+        with_needs = create_entity(db_session, game_session)
+        without_needs = create_entity(db_session, game_session)
+        create_character_needs(db_session, game_session, with_needs)
+        manager = NeedsManager(db_session, game_session)
+
+        result = manager.apply_batch_time_decay(1, entity_ids=[with_needs.id, without_needs.id])
+
+        assert len(result) == 1
+        assert result.needs_for(without_needs.id) is None
+        assert manager.get_needs(without_needs.id) is None
+
+    def test_other_sessions_are_untouched(self, db_session, game_session, game_session_2):
+        ours = create_entity(db_session, game_session)
+        theirs = create_entity(db_session, game_session_2)
+        create_character_needs(db_session, game_session, ours, hunger=80)
+        other_needs = create_character_needs(db_session, game_session_2, theirs, hunger=80)
+
+        NeedsManager(db_session, game_session).apply_batch_time_decay(2)
+
+        assert other_needs.hunger == 80
+
+    def test_query_count_does_not_grow_with_entities(self, db_session, game_session):
+        create_twins(db_session, game_session, 20)
+        manager = NeedsManager(db_session, game_session)
+        statements = []
+        bind = db_session.connection()
+
+        def listener(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(bind, "before_cursor_execute", listener)
+        try:
+            manager.apply_batch_time_decay(3)
+        finally:
+            event.remove(bind, "before_cursor_execute", listener)
+
+        # Needs, modifiers, preferences and one executemany update
+        assert len(statements) == 4
+
+
+class TestCompanionTimeDecay:
+    """Tests for apply_companion_time_decay on top of the batch engine."""
+
+    def test_decays_companions_with_needs(self, db_session, game_session):
+        friend = create_entity(db_session, game_session, entity_key="friend")
+        create_npc_extension(db_session, friend, is_companion=True)
+        create_character_needs(db_session, game_session, friend, hunger=80, social_connection=50)
+        drifter = create_entity(db_session, game_session, entity_key="drifter")
+        create_npc_extension(db_session, drifter, is_companion=True)
+        stranger = create_entity(db_session, game_session, entity_key="stranger")
+        stranger_needs = create_character_needs(db_session, game_session, stranger, hunger=80)
+        manager = NeedsManager(db_session, game_session)
+
+        results = manager.apply_companion_time_decay(2)
+
+        assert set(results) == {"friend", "drifter"}
+        assert results["drifter"] is None
+        assert results["friend"].hunger == 68
+        assert results["friend"].social_connection == 60  # Companions are not alone
+        assert stranger_needs.hunger == 80
@@ -1,9 +1,11 @@
 """Tests for RumorManager."""
 
+import numpy as np
 import pytest
 
 from src.database.models.rumors import Rumor, RumorKnowledge, RumorSentiment
 from src.managers.rumor_manager import RumorManager, RumorInfo, RumorSpreadResult
+from tests.factories import create_entity, create_npc_extension, create_relationship
 
 
 class TestCreateRumor:
@@ -577,3 +579,117 @@ class TestRumorContext:
 
         assert "heroic" in context.lower() or "Player did something" in context
         assert len(context) > 0
+
+
+class TestRumorDiffusion:
+    """Tests for advancing all rumors over the social graph at once."""
+
+    def _rumor(self, manager, rumor_key="gossip", **overrides):
+        defaults = {
+            "subject_entity_key": "player",
+            "content": "The stranger cheated at cards",
+            "origin_location_key": "tavern",
+            "origin_turn": 1,
+            "spread_rate": 1.0,
+            "intensity": 1.0,
+            "decay_rate": 0.05,
+        }
+        defaults.update(overrides)
+        return manager.create_rumor(rumor_key=rumor_key, **defaults)
+
+    def test_spreads_along_relationships(self, db_session, game_session):
+        """Test that certain spread reaches known contacts only, one hop per step."""
+        teller = create_entity(db_session, game_session, entity_key="teller")
+        friend = create_entity(db_session, game_session, entity_key="friend")
+        friend_of_friend = create_entity(db_session, game_session, entity_key="friend_of_friend")
+        create_entity(db_session, game_session, entity_key="hermit")
+        create_relationship(db_session, game_session, teller, friend)
+        create_relationship(db_session, game_session, friend, friend_of_friend)
+        manager = RumorManager(db_session, game_session)
+        self._rumor(manager, decay_rate=0.0)  # Always told
+        manager.add_knowledge("gossip", "teller", 1)
+
+        result = manager.diffuse_rumors(current_turn=3, rng=np.random.default_rng(1))
+
+        assert [(r.from_entity_key, r.to_entity_key) for r in result.spread] == [
+            ("teller", "friend")
+        ]
+        assert manager.entity_knows_rumor("friend", "gossip")
+        assert not manager.entity_knows_rumor("friend_of_friend", "gossip")
+
+        manager.diffuse_rumors(current_turn=4, rng=np.random.default_rng(1))
+
+        assert manager.entity_knows_rumor("friend_of_friend", "gossip")
+        assert not manager.entity_knows_rumor("hermit", "gossip")
+
+    def test_spreads_between_co_located_npcs(self, db_session, game_session):
+        """Test that NPCs at the same location can hear a rumor."""
+        teller = create_entity(db_session, game_session, entity_key="teller")
+        neighbour = create_entity(db_session, game_session, entity_key="neighbour")
+        faraway = create_entity(db_session, game_session, entity_key="faraway")
+        create_npc_extension(db_session, teller, current_location="tavern")
+        create_npc_extension(db_session, neighbour, current_location="tavern")
+        create_npc_extension(db_session, faraway, current_location="farm")
+        manager = RumorManager(db_session, game_session)
+        self._rumor(manager)
+        manager.add_knowledge("gossip", "teller", 1)
+
+        # Co-location halves the chance, so a long step makes it certain enough
+        manager.diffuse_rumors(current_turn=3, days=20, rng=np.random.default_rng(2))
+
+        assert manager.entity_knows_rumor("neighbour", "gossip")
+        assert not manager.entity_knows_rumor("faraway", "gossip")
+
+    def test_silent_knowers_do_not_spread(self, db_session, game_session):
+        """Test that entities who won't spread a rumor keep it to themselves."""
+        keeper = create_entity(db_session, game_session, entity_key="keeper")
+        friend = create_entity(db_session, game_session, entity_key="friend")
+        create_relationship(db_session, game_session, keeper, friend)
+        manager = RumorManager(db_session, game_session)
+        self._rumor(manager)
+        manager.add_knowledge("gossip", "keeper", 1, will_spread=False)
+
+        result = manager.diffuse_rumors(current_turn=3, rng=np.random.default_rng(3))
+
+        assert result.spread == []
+
+    def test_distortion_and_decay(self, db_session, game_session):
+        """Test that distorted retellings erode truth and the step decays rumors."""
+        teller = create_entity(db_session, game_session, entity_key="teller")
+        for key in ("a", "b", "c"):
+            listener = create_entity(db_session, game_session, entity_key=key)
+            create_relationship(db_session, game_session, teller, listener)
+        manager = RumorManager(db_session, game_session)
+        rumor = self._rumor(manager, decay_rate=0.1)
+        fading = self._rumor(manager, rumor_key="fading", intensity=0.15, decay_rate=0.1)
+        manager.add_knowledge("gossip", "teller", 1)
+
+        result = manager.diffuse_rumors(
+            current_turn=3, distortion_chance=1.0, rng=np.random.default_rng(4)
+        )
+
+        assert len(result.spread) == 3
+        assert all(r.distortion_applied for r in result.spread)
+        assert rumor.truth_value == pytest.approx(0.7)
+        assert rumor.intensity == pytest.approx(0.9)
+        assert result.deactivated == [fading]
+        assert fading.is_active is False
+
+    def test_spread_probability_scales_with_intensity(self, db_session, game_session):
+        """Test that weak rumors reach fewer contacts than strong ones."""
+        manager = RumorManager(db_session, game_session)
+        teller = create_entity(db_session, game_session, entity_key="teller")
+        for index in range(200):
+            listener = create_entity(db_session, game_session, entity_key=f"listener_{index}")
+            create_relationship(db_session, game_session, teller, listener)
+        self._rumor(manager, "strong", spread_rate=0.8, intensity=1.0)
+        self._rumor(manager, "weak", spread_rate=0.8, intensity=0.25)
+        manager.add_knowledge("strong", "teller", 1)
+        manager.add_knowledge("weak", "teller", 1)
+
+        result = manager.diffuse_rumors(current_turn=3, rng=np.random.default_rng(5))
+
+        strong = sum(r.rumor_key == "strong" for r in result.spread)
+        weak = sum(r.rumor_key == "weak" for r in result.spread)
+        assert 140 < strong < 180  # ~80%
+        assert 25 < weak < 55  # ~20%
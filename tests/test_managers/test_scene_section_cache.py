@@ -0,0 +1,284 @@
+"""Tests for dependency-tracked scene section caching."""
+
+from dataclasses import asdict
+from datetime import datetime
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.util import find_tables
+
+from src.database.models.context_summary import (
+    ContextSummary,
+    Milestone,
+    MilestoneType,
+    SummaryType,
+)
+from src.database.models.entities import Entity
+from src.database.models.enums import EntityType, GoalPriority, QuestStatus, StorageLocationType
+from src.database.models.session import GameSession
+from src.database.models.world import Fact
+from src.managers.context_compiler import ContextCompiler
+from src.managers.narrative_mention_manager import NarrativeMentionManager
+from src.managers.needs_communication_manager import NeedsCommunicationManager
+from src.managers.scene_section_cache import SECTION_MODELS, SceneSectionCache
+from tests.factories import (
+    create_appointment,
+    create_body_injury,
+    create_character_needs,
+    create_entity,
+    create_entity_attribute,
+    create_entity_skill,
+    create_fact,
+    create_item,
+    create_location,
+    create_location_discovery,
+    create_location_zone_placement,
+    create_map_item,
+    create_npc_extension,
+    create_npc_goal,
+    create_quest,
+    create_quest_stage,
+    create_relationship,
+    create_storage_location,
+    create_task,
+    create_terrain_zone,
+    create_time_state,
+    create_turn,
+    create_world_event,
+    create_zone_connection,
+    create_zone_discovery,
+)
+
+
+def build_scene(db: Session, game_session: GameSession) -> dict:
+    """A scene in which every section has something to show."""
+    time_state = create_time_state(db, game_session, current_day=2, current_time="10:00")
+    player = create_entity(
+        db, game_session, EntityType.PLAYER, entity_key="hero", display_name="Hero"
+    )
+    create_entity_attribute(db, player, attribute_key="strength", value=14)
+    create_entity_skill(db, player, skill_key="swimming", proficiency_level=45)
+    create_character_needs(db, game_session, player, hunger=20)
+    create_body_injury(db, game_session, player)
+    create_item(
+        db, game_session, holder_id=player.id, body_slot="main_hand", display_name="Dagger"
+    )
+    map_item = create_item(db, game_session, holder_id=player.id, display_name="Old Map")
+    create_map_item(db, game_session, map_item)
+
+    location = create_location(db, game_session, location_key="tavern", display_name="Tavern")
+    shelf = create_storage_location(
+        db,
+        game_session,
+        location_type=StorageLocationType.PLACE,
+        world_location_id=location.id,
+        container_type="shelf",
+    )
+    create_item(db, game_session, storage_location_id=shelf.id, display_name="Tankard")
+
+    npc = create_entity(db, game_session, entity_key="tom", display_name="Tom")
+    create_npc_extension(db, npc, current_location="tavern", personality_traits=["shy"])
+    create_npc_goal(db, game_session, npc, priority=GoalPriority.HIGH)
+    create_character_needs(db, game_session, npc, hunger=10)
+    create_body_injury(db, game_session, npc)
+    create_relationship(db, game_session, npc, player, knows=True)
+
+    zone = create_terrain_zone(db, game_session, zone_key="meadow")
+    forest = create_terrain_zone(db, game_session, zone_key="forest")
+    create_zone_connection(db, game_session, zone, forest)
+    create_zone_discovery(db, game_session, forest)
+    create_location_zone_placement(db, game_session, location, zone)
+    create_location_discovery(db, game_session, location)
+
+    create_task(db, game_session)
+    create_appointment(db, game_session, game_day=2, game_time="14:00")
+    quest = create_quest(db, game_session, status=QuestStatus.ACTIVE)
+    create_quest_stage(db, quest)
+    create_world_event(db, game_session, game_day=2, is_processed=True)
+    create_fact(db, game_session, subject_key="tavern", is_secret=False)
+    create_fact(db, game_session, subject_key="tom", is_secret=True, is_foreshadowing=True)
+    for number in (1, 2):
+        create_turn(db, game_session, turn_number=number, game_day_at_turn=2)
+
+    milestone = Milestone(
+        session_id=game_session.id,
+        milestone_type=MilestoneType.QUEST_COMPLETE,
+        description="Cleared the cellar",
+        turn_number=1,
+        game_day=1,
+    )
+    db.add(milestone)
+    db.flush()
+    for summary_type in (SummaryType.STORY, SummaryType.RECENT):
+        db.add(
+            ContextSummary(
+                session_id=game_session.id,
+                summary_type=summary_type,
+                summary_text=f"{summary_type.value} summary",
+                generated_at_turn=1,
+                generated_at_day=1,
+                covers_through_turn=1,
+                covers_through_day=1,
+                milestone_id=milestone.id,
+            )
+        )
+    game_time = datetime(2000, 1, 2, 9, 0)
+    NarrativeMentionManager(db, game_session).record_mention(
+        "equipment", "dagger", "sharp", 1, game_time
+    )
+    NeedsCommunicationManager(db, game_session).record_communication(
+        player.id, "hunger", 60, "normal", game_time, 1
+    )
+    db.flush()
+    return {"player": player, "npc": npc, "time_state": time_state}
+
+
+def compile_scene(compiler: ContextCompiler, player: Entity, turn_number: int = 3) -> dict:
+    scene = compiler.compile_scene(
+        player.id, "tavern", turn_number=turn_number, current_zone_key="meadow"
+    )
+    return asdict(scene)
+
+
+def rebuilt(compiler: ContextCompiler, before: dict) -> set[str]:
+    """Sections whose miss count grew since a get_stats() snapshot."""
+    after = compiler.section_cache.get_stats()["sections"]
+    return {
+        name
+        for name, counts in after.items()
+        if counts["misses"] > before["sections"][name]["misses"]
+    }
+
+
+class TestSceneSectionCache:
+    """Tests for section reuse in ContextCompiler.compile_scene()."""
+
+    def test_unchanged_state_reuses_every_section(
+        self, db_session: Session, game_session: GameSession
+    ):
+        scene = build_scene(db_session, game_session)
+        compiler = ContextCompiler(db_session, game_session)
+        first = compile_scene(compiler, scene["player"])
+        stats = compiler.section_cache.get_stats()
+
+        second = compile_scene(compiler, scene["player"])
+
+        assert second == first
+        assert rebuilt(compiler, stats) == set()
+        assert compiler.section_cache.get_stats()["hits"] == stats["hits"] + len(SECTION_MODELS)
+
+    def test_compilers_share_one_cache_per_game_session(
+        self, db_session: Session, game_session: GameSession, game_session_2: GameSession
+    ):
+        scene = build_scene(db_session, game_session)
+        compile_scene(ContextCompiler(db_session, game_session), scene["player"])
+        listeners = len(db_session.dispatch.after_flush)
+
+        compiler = ContextCompiler(db_session, game_session)
+        stats = compiler.section_cache.get_stats()
+        compile_scene(compiler, scene["player"])
+
+        assert rebuilt(compiler, stats) == set()
+        assert ContextCompiler(db_session, game_session_2).section_cache is not (
+            compiler.section_cache
+        )
+        assert len(db_session.dispatch.after_flush) == listeners + 1
+
+    def test_writes_rebuild_only_dependent_sections(
+        self, db_session: Session, game_session: GameSession
+    ):
+        scene = build_scene(db_session, game_session)
+        compiler = ContextCompiler(db_session, game_session)
+        compile_scene(compiler, scene["player"])
+        stats = compiler.section_cache.get_stats()
+
+        create_fact(db_session, game_session, subject_key="well", value="dry")
+        result = compile_scene(compiler, scene["player"])
+
+        assert rebuilt(compiler, stats) == {"secrets_context", "world_facts_context"}
+        assert "dry" in result["world_facts_context"]
+
+    def test_unflushed_changes_are_seen(self, db_session: Session, game_session: GameSession):
+        scene = build_scene(db_session, game_session)
+        compiler = ContextCompiler(db_session, game_session)
+        compile_scene(compiler, scene["player"])
+
+        scene["player"].display_name = "Renamed Hero"
+        result = compile_scene(compiler, scene["player"])
+
+        assert "Renamed Hero" in result["player_context"]
+
+    def test_bulk_delete_rebuilds_sections(self, db_session: Session, game_session: GameSession):
+        scene = build_scene(db_session, game_session)
+        compiler = ContextCompiler(db_session, game_session)
+        assert compile_scene(compiler, scene["player"])["world_facts_context"]
+
+        db_session.query(Fact).filter(Fact.session_id == game_session.id).delete()
+
+        assert compile_scene(compiler, scene["player"])["world_facts_context"] == ""
+
+    def test_clock_rebuilds_only_time_scoped_sections(
+        self, db_session: Session, game_session: GameSession
+    ):
+        scene = build_scene(db_session, game_session)
+        compiler = ContextCompiler(db_session, game_session)
+        compile_scene(compiler, scene["player"])
+        stats = compiler.section_cache.get_stats()
+
+        scene["time_state"].current_time = "10:30"
+        db_session.flush()
+        compile_scene(compiler, scene["player"])
+
+        assert rebuilt(compiler, stats) == {
+            "time_context",
+            "tasks_context",
+            "needs_alerts_context",
+            "stable_conditions",
+        }
+
+    def test_rollback_drops_sections(self, db_session: Session, game_session: GameSession):
+        scene = build_scene(db_session, game_session)
+        compiler = ContextCompiler(db_session, game_session)
+        compile_scene(compiler, scene["player"])
+        stats = compiler.section_cache.get_stats()
+        nested = db_session.begin_nested()
+        create_fact(db_session, game_session, subject_key="ghost", value="boo")
+        nested.rollback()
+
+        compile_scene(compiler, scene["player"])
+
+        assert rebuilt(compiler, stats) == set(SECTION_MODELS)
+
+    def test_sections_declare_every_table_they_read(
+        self, db_session: Session, game_session: GameSession
+    ):
+        scene = build_scene(db_session, game_session)
+        db_session.expire_all()  # Reads that could hit the identity map go to the database
+        compiler = ContextCompiler(db_session, game_session, section_cache=SceneSectionCache())
+        read: dict[str, set[str]] = {}
+        building: list[str] = []
+
+        def record(state) -> None:
+            if building and state.is_select:
+                tables = find_tables(state.statement, include_joins=True, include_aliases=True)
+                read.setdefault(building[-1], set()).update(table.name for table in tables)
+
+        def get_section(name, scope, build):
+            building.append(name)
+            try:
+                return build()
+            finally:
+                building.pop()
+
+        compiler.section_cache.get_section = get_section
+        event.listen(db_session, "do_orm_execute", record)
+        try:
+            compile_scene(compiler, scene["player"])
+        finally:
+            event.remove(db_session, "do_orm_execute", record)
+
+        for name, tables in read.items():
+            declared = {table.name for model in SECTION_MODELS[name] for table in inspect(model).tables}
+            # The clock is part of each section's scope, not a table dependency
+            assert tables - {"time_states"} <= declared, name
+        assert set(read) == set(SECTION_MODELS)
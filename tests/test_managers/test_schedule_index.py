@@ -0,0 +1,191 @@
+"""Tests for the in-memory schedule index used by presence queries."""
+
+from src.database.models.enums import DayOfWeek
+from src.managers.schedule_index import (
+    ScheduledPresence,
+    ScheduleIndex,
+    get_schedule_index,
+    minute_of_week,
+)
+from src.managers.schedule_manager import ScheduleManager
+from src.world.world_mechanics import WorldMechanics
+from tests.factories import create_entity, create_schedule, create_time_state
+
+
+def make_index(*rows: tuple[str, str, DayOfWeek, str | None, int]) -> ScheduleIndex:
+    """Build an index from (start, end, pattern, location, priority) rows, one NPC per row."""
+    entries = []
+    ranges = []
+    for schedule_id, (start, end, pattern, location_key, priority) in enumerate(rows, 1):
+        entries.append(
+            ScheduledPresence(
+                schedule_id=schedule_id,
+                entity_id=schedule_id,
+                entity_key=f"npc_{schedule_id}",
+                activity=f"activity_{schedule_id}",
+                location_key=location_key,
+                priority=priority,
+            )
+        )
+        ranges.append((start, end, pattern))
+    return ScheduleIndex(entries, ranges)
+
+
+class TestScheduleIndexLookup:
+    """Tests for time matching in the index itself."""
+
+    def test_minute_of_week_starts_monday(self):
+        assert minute_of_week(DayOfWeek.MONDAY, "00:00") == 0
+        assert minute_of_week(DayOfWeek.TUESDAY, "01:30") == 24 * 60 + 90
+        assert minute_of_week(DayOfWeek.SUNDAY, "23:59") == 7 * 24 * 60 - 1
+
+    def test_range_spanning_hour_buckets(self):
+        index = make_index(("09:45", "11:15", DayOfWeek.DAILY, "market", 1))
+
+        assert index.matching(DayOfWeek.MONDAY, "09:44") == []
+        assert len(index.matching(DayOfWeek.MONDAY, "09:45")) == 1
+        assert len(index.matching(DayOfWeek.MONDAY, "10:30")) == 1
+        assert len(index.matching(DayOfWeek.MONDAY, "11:14")) == 1
+        assert index.matching(DayOfWeek.MONDAY, "11:15") == []
+
+    def test_range_crossing_midnight_covers_both_ends_of_day(self):
+        index = make_index(("22:00", "06:00", DayOfWeek.FRIDAY, "tavern", 1))
+
+        assert len(index.matching(DayOfWeek.FRIDAY, "23:00")) == 1
+        assert len(index.matching(DayOfWeek.FRIDAY, "02:00")) == 1
+        assert index.matching(DayOfWeek.FRIDAY, "07:00") == []
+        assert index.matching(DayOfWeek.SATURDAY, "02:00") == []
+
+    def test_day_patterns(self):
+        index = make_index(
+            ("09:00", "17:00", DayOfWeek.WEEKDAY, "forge", 1),
+            ("09:00", "17:00", DayOfWeek.WEEKEND, "river", 1),
+            ("09:00", "17:00", DayOfWeek.WEDNESDAY, "temple", 1),
+        )
+
+        assert {e.location_key for e in index.matching(DayOfWeek.WEDNESDAY, "12:00")} == {
+            "forge",
+            "temple",
+        }
+        assert {e.location_key for e in index.matching(DayOfWeek.SUNDAY, "12:00")} == {"river"}
+
+    def test_bad_time_range_is_skipped(self):
+        index = make_index(
+            ("nine", "17:00", DayOfWeek.DAILY, "forge", 1),
+            ("09:00", "17:00", DayOfWeek.DAILY, "market", 1),
+        )
+
+        assert [e.location_key for e in index.matching(DayOfWeek.MONDAY, "12:00")] == ["market"]
+
+    def test_presence_at_groups_every_location(self):
+        index = make_index(
+            ("09:00", "17:00", DayOfWeek.DAILY, "market", 1),
+            ("09:00", "17:00", DayOfWeek.DAILY, "market", 1),
+            ("09:00", "17:00", DayOfWeek.DAILY, "forge", 1),
+            ("09:00", "17:00", DayOfWeek.DAILY, None, 1),
+        )
+
+        presence = index.presence_at(DayOfWeek.MONDAY, "10:00")
+
+        assert {key: [e.entity_key for e in entries] for key, entries in presence.items()} == {
+            "market": ["npc_1", "npc_2"],
+            "forge": ["npc_3"],
+        }
+
+
+class TestScheduleIndexDatabase:
+    """Tests for the per-session index built from the database."""
+
+    def test_higher_priority_entry_wins(self, db_session, game_session):
+        npc = create_entity(db_session, game_session)
+        create_schedule(db_session, npc, location_key="market", priority=1)
+        create_schedule(
+            db_session, npc, location_key="temple", start_time="12:00", end_time="13:00", priority=9
+        )
+        manager = ScheduleManager(db_session, game_session)
+
+        assert manager.get_npcs_at_location_time("temple", DayOfWeek.MONDAY, "12:30") == [npc.id]
+        assert manager.get_npcs_at_location_time("market", DayOfWeek.MONDAY, "12:30") == []
+        assert manager.get_npcs_at_location_time("market", DayOfWeek.MONDAY, "10:00") == [npc.id]
+
+    def test_npc_locations_at_time(self, db_session, game_session):
+        smith = create_entity(db_session, game_session)
+        baker = create_entity(db_session, game_session)
+        create_schedule(db_session, smith, location_key="forge")
+        create_schedule(db_session, baker, location_key="bakery", start_time="05:00")
+        manager = ScheduleManager(db_session, game_session)
+
+        assert manager.get_npc_locations_at_time(DayOfWeek.MONDAY, "06:00") == {
+            "bakery": [baker.id]
+        }
+        assert manager.get_npc_locations_at_time(DayOfWeek.MONDAY, "10:00") == {
+            "forge": [smith.id],
+            "bakery": [baker.id],
+        }
+
+    def test_index_is_scoped_to_game_session(self, db_session, game_session, game_session_2):
+        ours = create_entity(db_session, game_session)
+        theirs = create_entity(db_session, game_session_2)
+        create_schedule(db_session, ours, location_key="market")
+        create_schedule(db_session, theirs, location_key="market")
+
+        index = get_schedule_index(db_session, game_session.id)
+
+        assert [e.entity_id for e in index.at_location("market", DayOfWeek.MONDAY, "10:00")] == [
+            ours.id
+        ]
+
+    def test_index_is_reused_until_schedules_change(self, db_session, game_session):
+        npc = create_entity(db_session, game_session)
+        create_schedule(db_session, npc, location_key="market")
+        index = get_schedule_index(db_session, game_session.id)
+
+        assert get_schedule_index(db_session, game_session.id) is index
+
+        create_schedule(
+            db_session, npc, location_key="tavern", start_time="18:00", end_time="23:00"
+        )
+
+        rebuilt = get_schedule_index(db_session, game_session.id)
+        assert rebuilt is not index
+        assert rebuilt.at_location("tavern", DayOfWeek.MONDAY, "19:00")[0].entity_id == npc.id
+
+    def test_manager_writes_rebuild_index(self, db_session, game_session):
+        npc = create_entity(db_session, game_session)
+        manager = ScheduleManager(db_session, game_session)
+        entry = manager.set_schedule_entry(
+            npc.id, DayOfWeek.DAILY, "09:00", "17:00", "Selling", location_key="market"
+        )
+        assert manager.get_npcs_at_location_time("market", DayOfWeek.MONDAY, "10:00") == [npc.id]
+
+        manager.delete_schedule_entry(entry.id)
+        assert manager.get_npcs_at_location_time("market", DayOfWeek.MONDAY, "10:00") == []
+
+    def test_clear_schedule_rebuilds_index(self, db_session, game_session):
+        npc = create_entity(db_session, game_session)
+        create_schedule(db_session, npc, location_key="market")
+        manager = ScheduleManager(db_session, game_session)
+        assert manager.get_npcs_at_location_time("market", DayOfWeek.MONDAY, "10:00") == [npc.id]
+
+        manager.clear_schedule(npc.id)
+
+        assert manager.get_npcs_at_location_time("market", DayOfWeek.MONDAY, "10:00") == []
+
+    def test_renamed_entity_rebuilds_index(self, db_session, game_session):
+        npc = create_entity(db_session, game_session, entity_key="old_name")
+        create_schedule(db_session, npc, location_key="market")
+        assert get_schedule_index(db_session, game_session.id).entries[0].entity_key == "old_name"
+
+        npc.entity_key = "new_name"
+
+        assert get_schedule_index(db_session, game_session.id).entries[0].entity_key == "new_name"
+
+    def test_world_mechanics_uses_index(self, db_session, game_session):
+        create_time_state(db_session, game_session, current_time="10:00", day_of_week="monday")
+        smith = create_entity(db_session, game_session, entity_key="smith")
+        create_schedule(db_session, smith, location_key="forge", activity="Hammering")
+        wm = WorldMechanics(db_session, game_session)
+
+        placements = wm.get_scheduled_npcs("forge")
+
+        assert [(p.entity_key, p.activity) for p in placements] == [("smith", "Hammering")]
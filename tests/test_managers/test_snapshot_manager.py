@@ -0,0 +1,228 @@
+"""Tests for SnapshotManager keyframe/delta snapshots."""
+
+import json
+import zlib
+
+import pytest
+
+from src.database.models.context_summary import (
+    Milestone,
+    MilestoneType,
+    SummaryJob,
+    SummaryJobType,
+    TurnChunkSummary,
+)
+from src.database.models.entities import Entity
+from src.database.models.items import Item
+from src.database.models.snapshots import SessionSnapshot
+from src.managers.snapshot_manager import SnapshotManager
+from tests.factories import create_entity, create_item, create_npc_extension, create_turn
+
+
+def decode(snapshot: SessionSnapshot) -> dict:
+    """Decode a snapshot's compressed payload."""
+    return json.loads(zlib.decompress(snapshot.compressed_data))
+
+
+class TestCaptureSnapshot:
+    """Tests for capture_snapshot."""
+
+    def test_first_snapshot_is_keyframe(self, db_session, game_session):
+        create_entity(db_session, game_session, entity_key="hero")
+        manager = SnapshotManager(db_session, game_session)
+
+        snapshot = manager.capture_snapshot(1)
+
+        assert snapshot.is_keyframe
+        assert [row["entity_key"] for row in decode(snapshot)["entities"]] == ["hero"]
+
+    def test_delta_stores_only_changed_rows(self, db_session, game_session):
+        hero = create_entity(db_session, game_session, entity_key="hero")
+        create_entity(db_session, game_session, entity_key="guard")
+        manager = SnapshotManager(db_session, game_session)
+        manager.capture_snapshot(1)
+
+        hero.display_name = "Finn the Bold"
+        db_session.flush()
+        snapshot = manager.capture_snapshot(2)
+
+        assert snapshot.base_turn_number == 1
+        delta = decode(snapshot)
+        assert list(delta) == ["entities"]
+        assert [row["entity_key"] for row in delta["entities"]["upserts"]] == ["hero"]
+        assert delta["entities"]["deletes"] == []
+
+    def test_duplicate_turn_is_skipped(self, db_session, game_session):
+        manager = SnapshotManager(db_session, game_session)
+        manager.capture_snapshot(1)
+
+        assert manager.capture_snapshot(1) is None
+
+    def test_keyframe_written_after_interval(self, db_session, game_session):
+        hero = create_entity(db_session, game_session, entity_key="hero")
+        manager = SnapshotManager(db_session, game_session)
+        manager.keyframe_interval = 2
+
+        snapshots = []
+        for turn in range(1, 5):
+            hero.display_name = f"Hero {turn}"
+            db_session.flush()
+            snapshots.append(manager.capture_snapshot(turn))
+
+        assert [s.is_keyframe for s in snapshots] == [True, False, False, True]
+
+
+class TestRestoreSnapshot:
+    """Tests for restore_snapshot."""
+
+    def test_restore_reverts_updates_inserts_and_deletes(self, db_session, game_session):
+        hero = create_entity(db_session, game_session, entity_key="hero", display_name="Finn")
+        guard = create_entity(db_session, game_session, entity_key="guard")
+        create_npc_extension(db_session, guard, current_location="gate")
+        create_item(db_session, game_session, item_key="sword", holder_id=hero.id)
+        manager = SnapshotManager(db_session, game_session)
+        manager.capture_snapshot(1)
+        game_session.total_turns = 1
+
+        # Turn 1 happens
+        hero.display_name = "Finn the Bold"
+        db_session.delete(db_session.query(Item).filter_by(item_key="sword").one())
+        create_item(db_session, game_session, item_key="shield")
+        guard.npc_extension.current_location = "tavern"
+        db_session.flush()
+        manager.capture_snapshot(2)
+        game_session.total_turns = 2
+
+        manager.restore_snapshot(1)
+
+        entities = {e.entity_key: e for e in db_session.query(Entity).all()}
+        assert entities["hero"].display_name == "Finn"
+        assert entities["guard"].npc_extension.current_location == "gate"
+        items = {i.item_key: i for i in db_session.query(Item).all()}
+        assert set(items) == {"sword"}
+        assert items["sword"].holder_id == entities["hero"].id
+        assert manager.get_available_snapshots() == [1]
+        assert game_session.total_turns == 1
+
+    def test_restore_drops_summaries_of_deleted_turns(self, db_session, game_session):
+        manager = SnapshotManager(db_session, game_session)
+        manager.capture_snapshot(12)
+        for from_turn in (1, 11):
+            create_turn(db_session, game_session, turn_number=from_turn + 9)
+            db_session.add(
+                TurnChunkSummary(
+                    session_id=game_session.id,
+                    from_turn=from_turn,
+                    to_turn=from_turn + 9,
+                    summary_text="chunk",
+                )
+            )
+            db_session.add(
+                SummaryJob(
+                    session_id=game_session.id,
+                    job_type=SummaryJobType.CHUNK,
+                    from_turn=from_turn,
+                    to_turn=from_turn + 9,
+                )
+            )
+        db_session.flush()
+
+        manager.restore_snapshot(12)
+
+        assert [c.to_turn for c in db_session.query(TurnChunkSummary).all()] == [10]
+        assert [j.to_turn for j in db_session.query(SummaryJob).all()] == [10]
+
+    def test_restore_through_delta_chain(self, db_session, game_session):
+        hero = create_entity(db_session, game_session, entity_key="hero")
+        manager = SnapshotManager(db_session, game_session)
+        for turn in range(1, 5):
+            hero.display_name = f"Hero {turn}"
+            db_session.flush()
+            manager.capture_snapshot(turn)
+
+        # A fresh manager has no cached state and must decode the chain
+        db_session.info.clear()
+        SnapshotManager(db_session, game_session).restore_snapshot(3)
+
+        assert db_session.query(Entity).filter_by(entity_key="hero").one().display_name == "Hero 3"
+
+    def test_restore_legacy_full_snapshot(self, db_session, game_session):
+        hero = create_entity(db_session, game_session, entity_key="hero", display_name="Finn")
+        guard = create_entity(db_session, game_session, entity_key="guard")
+        create_item(db_session, game_session, item_key="sword", holder_id=hero.id)
+        db_session.flush()
+        # Saved before row_version existed: one JSON list of rows per table
+        legacy = {
+            table: [{k: v for k, v in row.items() if k != "row_version"} for row in rows.values()]
+            for table, rows in SnapshotManager(db_session, game_session)._read_state().items()
+        }
+        assert all("row_version" not in row for row in legacy["entities"])
+        db_session.add(
+            SessionSnapshot(session_id=game_session.id, turn_number=1, snapshot_data=legacy)
+        )
+
+        hero.display_name = "Changed"
+        db_session.delete(db_session.query(Item).filter_by(item_key="sword").one())
+        db_session.delete(guard)
+        db_session.flush()
+        versions = {hero.id: hero.row_version}
+        SnapshotManager(db_session, game_session).restore_snapshot(1)
+
+        entities = {e.entity_key: e for e in db_session.query(Entity).all()}
+        assert entities["hero"].display_name == "Finn"
+        assert entities["hero"].row_version == versions[hero.id] + 1
+        assert entities["guard"].row_version == 2
+        assert db_session.query(Item).filter_by(item_key="sword").one().row_version == 2
+
+    def test_restore_moves_versions_forward(self, db_session, game_session):
+        hero = create_entity(db_session, game_session, entity_key="hero", display_name="Finn")
+        guard = create_entity(db_session, game_session, entity_key="guard")
+        db_session.flush()
+        manager = SnapshotManager(db_session, game_session)
+        manager.capture_snapshot(1)
+        saved = {"hero": hero.row_version, "guard": guard.row_version}
+
+        hero.display_name = "Changed"
+        db_session.delete(guard)
+        db_session.flush()
+        changed = hero.row_version
+        manager.restore_snapshot(1)
+
+        entities = {e.entity_key: e for e in db_session.query(Entity).all()}
+        assert entities["hero"].display_name == "Finn"
+        assert entities["hero"].row_version == changed + 1
+        assert entities["guard"].row_version == saved["guard"] + 1
+
+    def test_restore_missing_snapshot_raises(self, db_session, game_session):
+        with pytest.raises(ValueError, match="No snapshot found"):
+            SnapshotManager(db_session, game_session).restore_snapshot(7)
+
+
+class TestPruneSnapshots:
+    """Tests for prune_snapshots with delta chains."""
+
+    def test_prune_promotes_oldest_kept_delta(self, db_session, game_session):
+        hero = create_entity(db_session, game_session, entity_key="hero")
+        db_session.add(
+            Milestone(
+                session_id=game_session.id,
+                milestone_type=MilestoneType.QUEST_COMPLETE,
+                description="Quest done",
+                turn_number=4,
+                game_day=1,
+            )
+        )
+        manager = SnapshotManager(db_session, game_session)
+        for turn in range(1, 6):
+            hero.display_name = f"Hero {turn}"
+            db_session.flush()
+            manager.capture_snapshot(turn)
+
+        assert manager.prune_snapshots(min_keep=2) == 3
+        db_session.flush()
+
+        assert manager.get_available_snapshots() == [4, 5]
+        assert manager.get_snapshot(4).is_keyframe
+        db_session.info.clear()
+        manager.restore_snapshot(4)
+        assert db_session.query(Entity).filter_by(entity_key="hero").one().display_name == "Hero 4"
@@ -0,0 +1,300 @@
+"""Tests for background summary generation."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import event, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.cli.commands.game import _save_turn_immediately
+from src.database.models.context_summary import (
+    Milestone,
+    MilestoneType,
+    SummaryJob,
+    SummaryJobStatus,
+    SummaryJobType,
+    TurnChunkSummary,
+)
+from src.database.models.session import GameSession, Turn
+from src.llm.response_types import LLMResponse
+from src.managers.summary_manager import SummaryManager
+from src.managers.summary_worker import SummaryWorker
+from tests.factories import create_time_state, create_turn
+
+
+class FakeProvider:
+    """Records prompts and answers with a numbered summary."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.prompts: list[str] = []
+        self.fail = fail
+
+    async def complete(self, messages, system_prompt=None, **kwargs) -> LLMResponse:
+        if self.fail:
+            raise RuntimeError("provider down")
+        self.prompts.append(messages[0].content)
+        return LLMResponse(content=f"summary {len(self.prompts)}")
+
+
+def add_turns(db: Session, game_session: GameSession, last: int, first: int = 1) -> None:
+    for number in range(first, last + 1):
+        create_turn(
+            db,
+            game_session,
+            turn_number=number,
+            player_input=f"action {number}",
+            game_day_at_turn=1 + number // 20,
+        )
+
+
+def add_milestone(db: Session, game_session: GameSession, turn_number: int) -> Milestone:
+    milestone = Milestone(
+        session_id=game_session.id,
+        milestone_type=MilestoneType.QUEST_COMPLETE,
+        description=f"Quest done at {turn_number}",
+        turn_number=turn_number,
+        game_day=1,
+    )
+    db.add(milestone)
+    db.flush()
+    return milestone
+
+
+def jobs(db: Session, job_type: SummaryJobType) -> list[SummaryJob]:
+    return db.query(SummaryJob).filter(SummaryJob.job_type == job_type).all()
+
+
+def make_worker(db: Session, game_session: GameSession, provider: FakeProvider) -> SummaryWorker:
+    """A worker whose sessions run in savepoints of the test transaction."""
+    factory = sessionmaker(bind=db.connection(), join_transaction_mode="create_savepoint")
+    return SummaryWorker(factory, game_session.id, llm_provider=provider, poll_interval=0.01)
+
+
+class TestEnqueueDueJobs:
+    """Tests for SummaryManager.enqueue_due_jobs()."""
+
+    def test_chunks_queued_once_complete(self, db_session: Session, game_session: GameSession):
+        manager = SummaryManager(db_session, game_session)
+        add_turns(db_session, game_session, 25)
+
+        manager.enqueue_due_jobs()
+        assert manager.enqueue_due_jobs() == []
+        add_turns(db_session, game_session, 30, first=26)
+        manager.enqueue_due_jobs()
+
+        chunks = jobs(db_session, SummaryJobType.CHUNK)
+        assert [(job.from_turn, job.to_turn) for job in chunks] == [(1, 10), (11, 20), (21, 30)]
+
+    def test_pending_story_job_is_retargeted(
+        self, db_session: Session, game_session: GameSession
+    ):
+        manager = SummaryManager(db_session, game_session)
+        create_time_state(db_session, game_session, current_day=2)
+        add_turns(db_session, game_session, 5)
+        add_milestone(db_session, game_session, 3)
+        manager.enqueue_due_jobs()
+
+        newer = add_milestone(db_session, game_session, 5)
+        manager.enqueue_due_jobs()
+        manager.enqueue_due_jobs()
+
+        [story] = jobs(db_session, SummaryJobType.STORY)
+        assert (story.milestone_id, story.to_turn) == (newer.id, 5)
+        [recent] = jobs(db_session, SummaryJobType.RECENT)
+        assert recent.target_day == 2
+
+    def test_running_job_is_not_retargeted(self, db_session: Session, game_session: GameSession):
+        manager = SummaryManager(db_session, game_session)
+        add_turns(db_session, game_session, 5)
+        add_milestone(db_session, game_session, 3)
+        [started] = [j for j in manager.enqueue_due_jobs() if j.job_type == SummaryJobType.STORY]
+        started.status = SummaryJobStatus.RUNNING
+
+        add_milestone(db_session, game_session, 5)
+        manager.enqueue_due_jobs()
+
+        assert [job.to_turn for job in jobs(db_session, SummaryJobType.STORY)] == [3, 5]
+
+    def test_job_claimed_while_retargeting_is_kept(
+        self, db_session: Session, game_session: GameSession
+    ):
+        manager = SummaryManager(db_session, game_session)
+        add_turns(db_session, game_session, 5)
+        add_milestone(db_session, game_session, 3)
+        manager.enqueue_due_jobs()
+
+        def claim_first(state):
+            # The worker claims the job between the lookup and the retarget
+            if state.is_update:
+                state.session.connection().execute(
+                    update(SummaryJob.__table__).values(status=SummaryJobStatus.RUNNING)
+                )
+
+        event.listen(db_session, "do_orm_execute", claim_first)
+        add_milestone(db_session, game_session, 5)
+        manager.enqueue_due_jobs()
+        event.remove(db_session, "do_orm_execute", claim_first)
+
+        db_session.expire_all()
+        story = jobs(db_session, SummaryJobType.STORY)
+        assert [(job.to_turn, job.status) for job in story] == [
+            (3, SummaryJobStatus.RUNNING),
+            (5, SummaryJobStatus.PENDING),
+        ]
+
+
+class TestChunkFormatting:
+    """Tests for building summary input from chunk summaries."""
+
+    def test_only_complete_chunks_replace_turns(
+        self, db_session: Session, game_session: GameSession
+    ):
+        add_turns(db_session, game_session, 15)
+        db_session.add(
+            TurnChunkSummary(
+                session_id=game_session.id, from_turn=1, to_turn=10, summary_text="The opening."
+            )
+        )
+        db_session.flush()
+        manager = SummaryManager(db_session, game_session)
+        turns = db_session.query(Turn).order_by(Turn.turn_number).all()
+
+        full = manager._format_turns_with_chunks(turns)
+        partial = manager._format_turns_with_chunks(turns[4:])
+
+        assert full.startswith("Turns 1-10: The opening.\nTurn 11: Player: action 11")
+        assert "action 10" not in full
+        assert "The opening." not in partial
+        assert partial == manager._format_turns_brief(turns[4:])
+
+
+class TestSummaryWorker:
+    """Tests for SummaryWorker."""
+
+    async def test_runs_chunks_before_story(self, db_session: Session, game_session: GameSession):
+        add_turns(db_session, game_session, 12)
+        add_milestone(db_session, game_session, 12)
+        SummaryManager(db_session, game_session).enqueue_due_jobs()
+        provider = FakeProvider()
+        worker = make_worker(db_session, game_session, provider)
+
+        # Chunk 1-10, story, and a recent summary with nothing before today yet
+        assert await worker.run_pending() == 3
+
+        db_session.expire_all()
+        assert len(provider.prompts) == 2
+        assert "action 10" in provider.prompts[0]
+        assert "Turns 1-10: summary 1" in provider.prompts[1]
+        assert SummaryManager(db_session, game_session).get_story_summary() == "summary 2"
+        statuses = {job.status for job in db_session.query(SummaryJob)}
+        assert statuses == {SummaryJobStatus.DONE}
+
+    async def test_redundant_job_skips_llm(self, db_session: Session, game_session: GameSession):
+        add_turns(db_session, game_session, 10)
+        SummaryManager(db_session, game_session).enqueue_due_jobs()
+        provider = FakeProvider()
+        worker = make_worker(db_session, game_session, provider)
+        await worker.run_pending()
+
+        db_session.add(
+            SummaryJob(
+                session_id=game_session.id,
+                job_type=SummaryJobType.CHUNK,
+                from_turn=1,
+                to_turn=10,
+            )
+        )
+        db_session.flush()
+        await worker.run_pending()
+
+        assert len(provider.prompts) == 1
+        assert worker.get_stats() == {"generated": 1, "skipped": 1, "failed": 0}
+
+    async def test_failed_job_is_retried_then_failed(
+        self, db_session: Session, game_session: GameSession
+    ):
+        add_turns(db_session, game_session, 10)
+        SummaryManager(db_session, game_session).enqueue_due_jobs()
+        worker = make_worker(db_session, game_session, FakeProvider(fail=True))
+
+        assert await worker.run_pending() == 0
+        db_session.expire_all()
+        [job] = db_session.query(SummaryJob).all()
+        assert (job.status, job.attempts, job.last_error) == (
+            SummaryJobStatus.PENDING,
+            1,
+            "provider down",
+        )
+
+        await worker.run_pending()
+        await worker.run_pending()
+        db_session.expire_all()
+        assert (job.status, job.attempts) == (SummaryJobStatus.FAILED, 3)
+        assert db_session.query(TurnChunkSummary).count() == 0
+
+    async def test_start_requeues_interrupted_jobs(
+        self, db_session: Session, game_session: GameSession
+    ):
+        add_turns(db_session, game_session, 10)
+        [job] = SummaryManager(db_session, game_session).enqueue_due_jobs()
+        job.status = SummaryJobStatus.RUNNING
+        db_session.flush()
+        worker = make_worker(db_session, game_session, FakeProvider())
+
+        await worker.start()
+        try:
+            for _ in range(100):
+                if worker.get_stats()["generated"]:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await worker.stop()
+
+        db_session.expire_all()
+        assert job.status == SummaryJobStatus.DONE
+        assert db_session.query(TurnChunkSummary).one().summary_text == "summary 1"
+
+
+@pytest.mark.parametrize("status", [SummaryJobStatus.DONE, SummaryJobStatus.FAILED])
+def test_finished_target_is_not_queued_again(
+    db_session: Session, game_session: GameSession, status: SummaryJobStatus
+):
+    manager = SummaryManager(db_session, game_session)
+    add_turns(db_session, game_session, 5)
+    add_milestone(db_session, game_session, 3)
+    for job in manager.enqueue_due_jobs():
+        job.status = status
+
+    assert manager.enqueue_due_jobs() == []
+
+
+class TestSaveTurnImmediately:
+    """Summary jobs are only queued when a worker will run them."""
+
+    class RecordingWorker:
+        def __init__(self) -> None:
+            self.notified = 0
+
+        def notify(self) -> None:
+            self.notified += 1
+
+    def test_no_jobs_without_worker(self, db_session: Session, game_session: GameSession):
+        add_turns(db_session, game_session, 9)
+
+        _save_turn_immediately(db_session, game_session, 10, "look", "You look.", "tavern")
+
+        assert db_session.query(SummaryJob).count() == 0
+
+    def test_jobs_queued_for_running_worker(
+        self, db_session: Session, game_session: GameSession
+    ):
+        add_turns(db_session, game_session, 9)
+        worker = self.RecordingWorker()
+
+        _save_turn_immediately(
+            db_session, game_session, 10, "look", "You look.", "tavern", summary_worker=worker
+        )
+
+        chunks = jobs(db_session, SummaryJobType.CHUNK)
+        assert [(job.from_turn, job.to_turn) for job in chunks] == [(1, 10)]
+        assert worker.notified == 1
@@ -0,0 +1,99 @@
+"""Tests for the in-memory zone graph used by pathfinding."""
+
+import random
+
+from src.managers.pathfinding_manager import PathfindingManager
+from src.managers.zone_graph import ZoneGraph, get_zone_graph
+from src.managers.zone_manager import ZoneManager
+from tests.factories import create_terrain_zone, create_zone_connection
+
+
+def create_grid(db_session, game_session, width: int, height: int, seed: int = 7):
+    """Create a width x height grid of zones with random travel costs."""
+    rng = random.Random(seed)
+    zones = {}
+    for x in range(width):
+        for y in range(height):
+            zones[x, y] = create_terrain_zone(
+                db_session,
+                game_session,
+                zone_key=f"zone_{x}_{y}",
+                base_travel_cost=rng.randint(5, 30),
+            )
+    db_session.flush()
+    for (x, y), zone in zones.items():
+        if x + 1 < width:
+            create_zone_connection(db_session, game_session, zone, zones[x + 1, y])
+        if y + 1 < height:
+            create_zone_connection(
+                db_session, game_session, zone, zones[x, y + 1], crossing_minutes=rng.randint(1, 9)
+            )
+    db_session.flush()
+    return zones
+
+
+class TestZoneGraphCache:
+    """Tests for sharing and invalidating the per-session graph."""
+
+    def test_graph_is_reused_across_searches(self, db_session, game_session):
+        create_grid(db_session, game_session, 3, 3)
+        manager = PathfindingManager(db_session, game_session)
+
+        manager.find_optimal_path("zone_0_0", "zone_2_2", "walking")
+        graph = get_zone_graph(db_session, game_session.id)
+        manager.find_optimal_path("zone_2_2", "zone_0_0", "walking")
+
+        assert get_zone_graph(db_session, game_session.id) is graph
+
+    def test_closing_connection_rebuilds_graph(self, db_session, game_session):
+        create_grid(db_session, game_session, 2, 1)
+        zone_manager = ZoneManager(db_session, game_session)
+        manager = PathfindingManager(db_session, game_session)
+        assert manager.find_optimal_path("zone_0_0", "zone_1_0", "walking")["found"] is True
+
+        zone_manager.set_connection_passable("zone_1_0", "zone_0_0", False)
+
+        assert manager.find_optimal_path("zone_0_0", "zone_1_0", "walking")["found"] is False
+
+    def test_new_connection_rebuilds_graph(self, db_session, game_session):
+        create_terrain_zone(db_session, game_session, zone_key="island")
+        create_terrain_zone(db_session, game_session, zone_key="shore")
+        db_session.flush()
+        manager = PathfindingManager(db_session, game_session)
+        assert manager.find_optimal_path("shore", "island", "walking")["found"] is False
+
+        ZoneManager(db_session, game_session).connect_zones("shore", "island")
+
+        assert manager.find_optimal_path("shore", "island", "walking")["found"] is True
+
+    def test_adjacent_zones_match_zone_manager(self, db_session, game_session):
+        create_grid(db_session, game_session, 3, 3)
+        graph = get_zone_graph(db_session, game_session.id)
+        zone_manager = ZoneManager(db_session, game_session)
+
+        for key in ("zone_0_0", "zone_1_1", "zone_2_1"):
+            expected = {z.zone_key for z in zone_manager.get_adjacent_zones(key)}
+            assert {z.zone_key for z in graph.adjacent_zones(key)} == expected
+
+
+class TestLandmarkHeuristic:
+    """Tests for ALT landmark bounds on larger regions."""
+
+    def test_landmark_search_matches_dijkstra(self, db_session, game_session, monkeypatch):
+        create_grid(db_session, game_session, 8, 6)
+        manager = PathfindingManager(db_session, game_session)
+        pairs = [("zone_0_0", "zone_7_5"), ("zone_7_0", "zone_0_5"), ("zone_3_2", "zone_6_4")]
+
+        with_landmarks = [manager.find_optimal_path(a, b, "walking")["total_cost"] for a, b in pairs]
+        assert get_zone_graph(db_session, game_session.id)._landmarks
+
+        monkeypatch.setattr(ZoneGraph, "LANDMARK_MIN_ZONES", 10_000)
+        without = [manager.find_optimal_path(a, b, "walking")["total_cost"] for a, b in pairs]
+
+        assert with_landmarks == without
+
+    def test_small_graph_skips_landmarks(self, db_session, game_session):
+        create_grid(db_session, game_session, 2, 2)
+        graph = get_zone_graph(db_session, game_session.id)
+
+        assert graph.landmark_heuristic("walking", lambda zone: zone.base_travel_cost) is None
@@ -0,0 +1 @@
+"""Tests for observability hooks and tracing."""
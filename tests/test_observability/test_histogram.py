@@ -0,0 +1,81 @@
+"""Tests for latency histograms."""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.observability.events import PhaseEndEvent
+from src.observability.histogram import LatencyHistogram, LatencyHistogramHook
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_empty(self):
+        """Test an empty histogram reports zeros."""
+        histogram = LatencyHistogram()
+
+        assert histogram.percentile(99) == 0.0
+        assert histogram.summary()["count"] == 0
+
+    def test_small_values_are_exact(self):
+        """Test values below the linear range are recorded exactly."""
+        histogram = LatencyHistogram()
+        for value_ms in (0.001, 0.05, 0.1):
+            histogram.record(value_ms)
+
+        assert histogram.percentile(0) == 0.001
+        assert histogram.percentile(50) == 0.05
+        assert histogram.percentile(100) == 0.1
+
+    def test_percentiles_within_relative_error(self):
+        """Test percentiles over a wide range stay within the bucket precision."""
+        rng = random.Random(7)
+        values = [rng.lognormvariate(3, 1.5) for _ in range(5000)]
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        for percent in (50, 90, 95, 99):
+            exact = float(np.percentile(values, percent, method="inverted_cdf"))
+            assert histogram.percentile(percent) == pytest.approx(exact, rel=1 / 64)
+        assert histogram.percentile(100) == pytest.approx(max(values), abs=0.001)
+        assert histogram.mean == pytest.approx(np.mean(values), rel=1e-4)
+
+    def test_merge(self):
+        """Test merging adds counts and extremes."""
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.record(1.0)
+        second.record(500.0)
+        second.record(2.0)
+
+        first.merge(second)
+
+        assert first.count == 3
+        assert first.percentile(100) == 500.0
+        assert first.min_us == 1000
+
+    def test_merge_rejects_other_precision(self):
+        """Test histograms of different precision cannot be merged."""
+        with pytest.raises(ValueError):
+            LatencyHistogram(7).merge(LatencyHistogram(5))
+
+
+class TestLatencyHistogramHook:
+    """Tests for LatencyHistogramHook."""
+
+    def test_records_per_phase(self):
+        """Test phase durations go into one histogram per phase."""
+        hook = LatencyHistogramHook()
+        hook.on_phase_end(PhaseEndEvent(phase="manifest", duration_ms=4.0))
+        hook.on_phase_end(PhaseEndEvent(phase="manifest", duration_ms=6.0))
+        hook.on_phase_end(PhaseEndEvent(phase="turn", duration_ms=40.0))
+
+        summary = hook.summary()
+
+        assert list(summary) == ["manifest", "turn"]
+        assert summary["manifest"]["count"] == 2
+        assert summary["manifest"]["max"] == 6.0
+        hook.reset()
+        assert hook.summary() == {}
@@ -0,0 +1,41 @@
+"""Tests for the JSONL trace exporter."""
+
+import json
+
+from src.observability.events import PhaseEndEvent
+from src.observability.jsonl_exporter import JSONLTraceExporter
+from src.observability.tracing import Tracer
+
+
+class TestJSONLTraceExporter:
+    """Tests for JSONLTraceExporter."""
+
+    def test_writes_one_line_per_span(self, tmp_path):
+        """Test spans are written with their links and attributes."""
+        path = tmp_path / "traces" / "quantum.jsonl"
+        exporter = JSONLTraceExporter(path)
+        tracer = Tracer(exporter)
+
+        with tracer.span("turn", location="market_square"):
+            with tracer.span("manifest"):
+                pass
+
+        # Flushed when the root span ended, before close()
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        exporter.close()
+
+        assert [record["name"] for record in records] == ["manifest", "turn"]
+        assert records[0]["parent_id"] == records[1]["span_id"]
+        assert records[0]["attributes"] == {"location": "market_square"}
+        assert records[1]["success"] is True
+        assert records[1]["duration_ms"] >= records[0]["duration_ms"]
+
+    def test_ignores_untraced_events(self, tmp_path):
+        """Test phase events without span IDs are not exported."""
+        path = tmp_path / "quantum.jsonl"
+        exporter = JSONLTraceExporter(path)
+
+        exporter.on_phase_end(PhaseEndEvent(phase="context_building", duration_ms=1.0))
+        exporter.close()
+
+        assert not path.exists()
@@ -0,0 +1,116 @@
+"""Tests for nested tracing spans."""
+
+import asyncio
+
+import pytest
+
+from src.observability.hooks import NullHook
+from src.observability.tracing import Tracer, current_span
+
+
+class RecordingHook(NullHook):
+    """Hook collecting span events."""
+
+    def __init__(self):
+        self.started = []
+        self.ended = []
+
+    def on_phase_start(self, event):
+        self.started.append(event)
+
+    def on_phase_end(self, event):
+        self.ended.append(event)
+
+    def by_name(self):
+        return {event.phase: event for event in self.ended}
+
+
+class TestTracer:
+    """Tests for Tracer.span()."""
+
+    def test_nested_spans_link_and_inherit(self):
+        """Test children share the trace, link to the parent and inherit attributes."""
+        hook = RecordingHook()
+        tracer = Tracer(hook)
+
+        with tracer.span("turn", session_id=1, turn=3) as turn:
+            with tracer.span("manifest", npcs=2):
+                pass
+            turn.set(cache_hit=True)
+
+        spans = hook.by_name()
+        assert [event.phase for event in hook.ended] == ["manifest", "turn"]
+        assert spans["manifest"].parent_id == spans["turn"].span_id
+        assert spans["manifest"].trace_id == spans["turn"].trace_id
+        assert spans["turn"].parent_id is None
+        assert spans["manifest"].details == {"session_id": 1, "turn": 3, "npcs": 2}
+        assert spans["turn"].details["cache_hit"] is True
+        assert hook.started[0].details == {"session_id": 1, "turn": 3}
+
+    def test_separate_roots_get_separate_traces(self):
+        """Test each root span starts a new trace."""
+        hook = RecordingHook()
+        tracer = Tracer(hook)
+
+        with tracer.span("turn"):
+            pass
+        with tracer.span("turn"):
+            pass
+
+        assert hook.ended[0].trace_id != hook.ended[1].trace_id
+
+    def test_exception_marks_span_failed(self):
+        """Test a raising block ends its span as failed and re-raises."""
+        hook = RecordingHook()
+        tracer = Tracer(hook)
+
+        with pytest.raises(ValueError):
+            with tracer.span("collapse"):
+                raise ValueError("stale")
+
+        assert hook.ended[0].success is False
+        assert hook.ended[0].details["error"] == "ValueError"
+        assert current_span() is None
+
+    def test_fail_without_raising(self):
+        """Test fail() records a handled error."""
+        hook = RecordingHook()
+        tracer = Tracer(hook)
+
+        with tracer.span("turn") as span:
+            span.fail("Turn processing failed")
+
+        assert hook.ended[0].success is False
+        assert hook.ended[0].details["error"] == "Turn processing failed"
+
+    def test_disabled_tracer_emits_nothing(self):
+        """Test a tracer without a hook yields a no-op span."""
+        tracer = Tracer()
+
+        with tracer.span("turn", turn=1) as span:
+            span.set(cache_hit=True)
+            span.fail("ignored")
+            assert current_span() is None
+
+        assert tracer.enabled is False
+
+    @pytest.mark.asyncio
+    async def test_spans_nest_across_tasks(self):
+        """Test spans opened in tasks started inside a span nest under it."""
+        hook = RecordingHook()
+        tracer = Tracer(hook)
+
+        async def job(name):
+            await asyncio.sleep(0)
+            with tracer.span(name):
+                await asyncio.sleep(0)
+
+        with tracer.span("anticipation.cycle"):
+            await asyncio.gather(
+                asyncio.create_task(job("a")), asyncio.create_task(job("b"))
+            )
+
+        spans = hook.by_name()
+        cycle_id = spans["anticipation.cycle"].span_id
+        assert spans["a"].parent_id == cycle_id
+        assert spans["b"].parent_id == cycle_id
@@ -1,5 +1,7 @@
 """Tests for ActionMatcher."""
 
+import random
+
 import pytest
 
 from src.gm.grounding import GroundingManifest, GroundedEntity
@@ -10,9 +12,24 @@ from src.world_server.quantum.action_matcher import (
     MatchResult,
     ACTION_VERBS,
     STOPWORDS,
+    index_keys,
 )
 
 
+def brute_force_matches(matcher, text, predictions, manifest, min_confidence):
+    """Score every prediction without the index, sorted like match_all()."""
+    normalized = matcher._normalize(text)
+    verb, target_text = matcher._extract_verb_and_target(normalized)
+    text_words = set(normalized.split()) - STOPWORDS
+    results = []
+    for entry in matcher.compile(predictions, manifest).entries:
+        score, reason = matcher._score_entry(normalized, text_words, verb, target_text, entry)
+        if score >= min_confidence:
+            results.append(MatchResult(entry.prediction, score, reason))
+    results.sort(reverse=True)
+    return results
+
+
 @pytest.fixture
 def sample_manifest():
     """Create a sample grounding manifest for testing."""
@@ -503,6 +520,123 @@ class TestEdgeCases:
         assert result is not None or result is None  # May or may not match
 
 
+class TestPredictionIndex:
+    """Tests for the compiled prediction index."""
+
+    def test_compile_is_cached(self, sample_manifest, sample_predictions):
+        """Test the same predictions and manifest reuse one index."""
+        matcher = ActionMatcher()
+
+        first = matcher.compile(sample_predictions, sample_manifest)
+        second = matcher.compile(sample_predictions, sample_manifest)
+
+        assert first is second
+
+    def test_changed_predictions_recompile(self, sample_manifest, sample_predictions):
+        """Test a different prediction list gets its own index."""
+        matcher = ActionMatcher()
+
+        first = matcher.compile(sample_predictions, sample_manifest)
+        second = matcher.compile(sample_predictions[:3], sample_manifest)
+
+        assert first is not second
+        assert len(second.entries) == 3
+
+    def test_compile_resolves_target_names(self, sample_manifest, sample_predictions):
+        """Test targets are resolved to lowercase display names once."""
+        index = ActionMatcher().compile(sample_predictions, sample_manifest)
+
+        assert index.entries[0].target_name == "old tom"
+        assert index.entries[5].target_name is None  # Look around
+
+    def test_candidates_share_words_or_trigrams(self, sample_manifest, sample_predictions):
+        """Test unrelated predictions are not candidates."""
+        index = ActionMatcher().compile(sample_predictions, sample_manifest)
+
+        candidates = index.candidates("take the sword", "take", "sword", False)
+        keys = {index.entries[i].prediction.target_key for i in candidates}
+
+        assert "iron_sword" in keys
+        assert "village_square" not in keys
+        assert "guard_marcus" not in keys
+
+    def test_verb_candidates_for_low_thresholds(self, sample_manifest, sample_predictions):
+        """Test verb matches become candidates when the verb alone can qualify."""
+        index = ActionMatcher().compile(sample_predictions, sample_manifest)
+
+        candidates = index.candidates("go", "go", None, True)
+        keys = {index.entries[i].prediction.target_key for i in candidates}
+
+        assert "village_square" in keys
+
+    def test_alternation_patterns_always_candidates(self, sample_manifest):
+        """Test patterns that can't be indexed by their words are always scored."""
+        prediction = ActionPrediction(
+            action_type=ActionType.OBSERVE,
+            target_key=None,
+            input_patterns=[r"(peer|gaze)\s+about"],
+            probability=0.1,
+            reason=PredictionReason.ADJACENT,
+        )
+        index = ActionMatcher().compile([prediction], sample_manifest)
+
+        assert index.candidates("xyz", None, "xyz", False) == [0]
+
+    def test_large_prediction_set(self, sample_manifest, sample_predictions):
+        """Test the best match is found among many unrelated predictions."""
+        filler = [
+            ActionPrediction(
+                action_type=ActionType.MANIPULATE_ITEM,
+                target_key=f"crate_{i}",
+                input_patterns=[rf"open\s+crate {i}"],
+                probability=0.01,
+                reason=PredictionReason.ADJACENT,
+            )
+            for i in range(300)
+        ]
+        matcher = ActionMatcher()
+
+        result = matcher.match("talk to old tom", filler + sample_predictions, sample_manifest)
+
+        assert result is not None
+        assert result.prediction.target_key == "innkeeper_tom"
+
+    def test_parity_with_full_scan(self, sample_manifest):
+        """Test indexed matching returns what scoring every prediction returns."""
+        rng = random.Random(7)
+        names = [e.display_name.lower() for e in sample_manifest.npcs.values()]
+        names += [e.display_name.lower() for e in sample_manifest.items_at_location.values()]
+        keys = [*sample_manifest.npcs, *sample_manifest.items_at_location, None]
+        vocab = [*ACTION_VERBS, *" ".join(names).split(), "rag", "mol", "tomb", "aler", "to"]
+        predictions = [
+            ActionPrediction(
+                action_type=rng.choice(list(ActionType)),
+                target_key=rng.choice(keys),
+                input_patterns=[" ".join(rng.sample(vocab, 2)) for _ in range(2)],
+                probability=0.1,
+                reason=PredictionReason.ADJACENT,
+            )
+            for _ in range(60)
+        ]
+        matcher = ActionMatcher()
+
+        for _ in range(200):
+            text = " ".join(rng.choice(vocab) for _ in range(rng.randint(1, 4)))
+            for threshold in (0.1, 0.3, 0.5):
+                expected = brute_force_matches(
+                    matcher, text, predictions, sample_manifest, threshold
+                )
+                actual = matcher.match_all(
+                    text, predictions, sample_manifest, threshold, max_results=len(predictions)
+                )
+                assert actual == expected, (text, threshold)
+
+    def test_index_keys(self):
+        """Test keys cover whole words and their trigrams."""
+        assert index_keys("old tom") == {"w:old", "w:tom", "g:old", "g:tom"}
+        assert "g:wor" in index_keys("sword")
+
+
 class TestActionVerbsMapping:
     """Tests for ACTION_VERBS mapping."""
 
@@ -0,0 +1,291 @@
+"""Tests for the anticipation scheduler."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.database.models.enums import EntityType
+from src.gm.context_builder import GMContextBuilder
+from src.world_server.quantum.anticipation import AnticipationJob, AnticipationScheduler
+from src.world_server.quantum.cache import QuantumBranchCache
+from src.world_server.quantum.pipeline import QuantumPipeline
+from src.world_server.quantum.schemas import (
+    ActionPrediction,
+    ActionType,
+    GMDecision,
+    QuantumBranch,
+)
+from src.world_server.schemas import PredictionReason
+from tests.factories import create_entity, create_location, create_npc_extension
+
+
+def create_job(
+    target_key: str,
+    probability: float = 0.5,
+    location: str = "village_square",
+    provider: str = "default",
+) -> AnticipationJob:
+    """Helper to create scheduler jobs."""
+    action = ActionPrediction(
+        action_type=ActionType.INTERACT_NPC,
+        target_key=target_key,
+        input_patterns=[],
+        probability=probability,
+        reason=PredictionReason.ADJACENT,
+    )
+    decision = GMDecision(decision_type="no_twist", probability=1.0)
+    return AnticipationJob(
+        location_key=location,
+        action=action,
+        gm_decision=decision,
+        branch_key=QuantumBranch.create_key(
+            location, ActionType.INTERACT_NPC, target_key, "no_twist"
+        ),
+        provider=provider,
+    )
+
+
+def branch_for(job: AnticipationJob, tokens: int = 100) -> QuantumBranch:
+    """Helper to build the branch a job would produce."""
+    return QuantumBranch(
+        branch_key=job.branch_key,
+        action=job.action,
+        gm_decision=job.gm_decision,
+        variants={},
+        tokens_used=tokens,
+    )
+
+
+class FakeGenerator:
+    """Records call order and peak concurrency."""
+
+    def __init__(self, delay: float = 0.01, tokens: int = 100):
+        self.delay = delay
+        self.tokens = tokens
+        self.calls: list[str] = []
+        self.running = 0
+        self.peak = 0
+
+    async def __call__(self, job: AnticipationJob) -> QuantumBranch:
+        self.calls.append(job.action.target_key)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        return branch_for(job, self.tokens)
+
+
+class TestAnticipationJob:
+    """Tests for AnticipationJob."""
+
+    def test_priority_is_joint_probability(self):
+        job = create_job("guard", probability=0.5)
+        job.gm_decision.probability = 0.4
+        assert job.priority == pytest.approx(0.2)
+
+
+class TestAnticipationScheduler:
+    """Tests for AnticipationScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_runs_in_priority_order(self):
+        generate = FakeGenerator()
+        scheduler = AnticipationScheduler(generate, max_concurrency=1)
+        scheduler.submit(
+            [
+                create_job("low", 0.1),
+                create_job("high", 0.9),
+                create_job("mid", 0.5),
+            ]
+        )
+
+        branches = await scheduler.run_cycle()
+
+        assert generate.calls == ["high", "mid", "low"]
+        assert len(branches) == 3
+        assert scheduler.stats.jobs_completed == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        generate = FakeGenerator(delay=0.02)
+        scheduler = AnticipationScheduler(generate, max_concurrency=2)
+        scheduler.submit([create_job(f"npc_{i}") for i in range(6)])
+
+        await scheduler.run_cycle()
+
+        assert generate.peak == 2
+        assert len(generate.calls) == 6
+
+    @pytest.mark.asyncio
+    async def test_provider_limits(self):
+        generate = FakeGenerator(delay=0.02)
+        scheduler = AnticipationScheduler(
+            generate, max_concurrency=4, provider_limits={"ollama": 1}
+        )
+        scheduler.submit([create_job(f"npc_{i}", provider="ollama") for i in range(3)])
+
+        await scheduler.run_cycle()
+
+        assert generate.peak == 1
+
+    def test_submit_deduplicates(self):
+        scheduler = AnticipationScheduler(FakeGenerator())
+
+        queued = scheduler.submit([create_job("guard"), create_job("guard")])
+
+        assert queued == 1
+        assert scheduler.queue_depth == 1
+
+    @pytest.mark.asyncio
+    async def test_token_budget_defers_remaining_jobs(self):
+        generate = FakeGenerator(tokens=100)
+        scheduler = AnticipationScheduler(
+            generate, max_concurrency=1, cycle_token_budget=150
+        )
+        scheduler.submit([create_job(f"npc_{i}") for i in range(4)])
+
+        await scheduler.run_cycle()
+
+        assert len(generate.calls) == 2
+        assert scheduler.queue_depth == 2
+        assert scheduler.stats.budget_exhausted_cycles == 1
+
+    @pytest.mark.asyncio
+    async def test_time_budget_cancels_in_flight(self):
+        generate = FakeGenerator(delay=1.0)
+        scheduler = AnticipationScheduler(
+            generate, max_concurrency=2, cycle_time_budget_seconds=0.02
+        )
+        scheduler.submit([create_job("a"), create_job("b")])
+
+        branches = await scheduler.run_cycle()
+
+        assert branches == []
+        assert scheduler.in_flight == 0
+        assert scheduler.stats.jobs_cancelled == 2
+
+    @pytest.mark.asyncio
+    async def test_cancel_except_drops_other_locations(self):
+        scheduler = AnticipationScheduler(FakeGenerator())
+        scheduler.submit([create_job("guard", location="village_square")])
+        scheduler.submit([create_job("barkeep", location="tavern")])
+
+        removed = scheduler.cancel_except("tavern")
+
+        assert removed == 1
+        assert scheduler.queue_depth == 1
+        assert scheduler.stats.jobs_dropped == 1
+
+    @pytest.mark.asyncio
+    async def test_cancel_except_cancels_in_flight(self):
+        generate = FakeGenerator(delay=1.0)
+        scheduler = AnticipationScheduler(generate)
+        scheduler.submit([create_job("guard", location="village_square")])
+
+        cycle = asyncio.create_task(scheduler.run_cycle())
+        await asyncio.sleep(0.01)
+        scheduler.cancel_except("tavern")
+        branches = await asyncio.wait_for(cycle, timeout=1.0)
+
+        assert branches == []
+        assert scheduler.stats.jobs_cancelled == 1
+        assert scheduler.stats.wasted_generations == 1
+
+    @pytest.mark.asyncio
+    async def test_cancel_all(self):
+        scheduler = AnticipationScheduler(FakeGenerator())
+        scheduler.submit([create_job("a"), create_job("b")])
+
+        assert scheduler.cancel_all() == 2
+        assert scheduler.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_job_does_not_stop_cycle(self):
+        async def generate(job: AnticipationJob) -> QuantumBranch:
+            if job.action.target_key == "bad":
+                raise RuntimeError("LLM error")
+            return branch_for(job)
+
+        scheduler = AnticipationScheduler(generate)
+        scheduler.submit([create_job("bad", 0.9), create_job("good", 0.1)])
+
+        branches = await scheduler.run_cycle()
+
+        assert [b.action.target_key for b in branches] == ["good"]
+        assert scheduler.stats.jobs_failed == 1
+
+    @pytest.mark.asyncio
+    async def test_get_stats(self):
+        scheduler = AnticipationScheduler(FakeGenerator(tokens=50))
+        scheduler.submit([create_job("guard")])
+        await scheduler.run_cycle()
+
+        stats = scheduler.get_stats()
+
+        assert stats["queue_depth"] == 0
+        assert stats["in_flight"] == 0
+        assert stats["tokens_used"] == 50
+        assert stats["cycles_run"] == 1
+
+
+class TestCacheContains:
+    """Tests for the metric-free cache probe used by anticipation."""
+
+    @pytest.mark.asyncio
+    async def test_contains_does_not_record_metrics(self):
+        cache = QuantumBranchCache()
+        job = create_job("guard")
+        await cache.put_branch(branch_for(job), fingerprint="fp1")
+
+        assert await cache.contains(job.branch_key, "fp1") is True
+        assert await cache.contains(job.branch_key, "fp2") is False
+        assert await cache.contains("missing") is False
+        assert cache.metrics.cache_hits == 0
+        assert cache.metrics.cache_misses == 0
+
+
+class TestAnticipationSessions:
+    """Tests for planning anticipation on a separate session."""
+
+    @pytest.mark.asyncio
+    async def test_plans_through_session_factory(self, db_session, game_session):
+        create_location(db_session, game_session, location_key="village_square")
+        create_entity(
+            db_session, game_session, entity_type=EntityType.PLAYER, entity_key="hero"
+        )
+        guard = create_entity(db_session, game_session, entity_key="guard_001")
+        create_npc_extension(db_session, guard, current_location="village_square")
+        opened = []
+
+        @asynccontextmanager
+        async def session_factory():
+            opened.append(1)
+            yield SimpleNamespace(sync_session=db_session)
+
+        foreground_db = MagicMock()
+        with patch("src.world_server.quantum.pipeline.GMContextBuilder") as MockBuilder:
+            pipeline = QuantumPipeline(
+                db=foreground_db,
+                game_session=game_session,
+                llm_provider=MagicMock(),
+                anticipation_sessions=session_factory,
+            )
+            # Anticipation builds its own (real) context builder
+            MockBuilder.side_effect = GMContextBuilder
+
+            jobs = await pipeline._plan_anticipation_jobs("village_square")
+
+        assert opened == [1]
+        assert jobs
+        assert all(job.manifest.location_key == "village_square" for job in jobs)
+        assert "guard_001" in jobs[0].manifest.npcs
+        assert jobs[0].context.player_key == "hero"
+        # Versions are pinned at planning time, through the planning session
+        assert jobs[0].versions["entity:guard_001"] == 2
+        foreground_db.query.assert_not_called()
+        foreground_db.execute.assert_not_called()
@@ -0,0 +1,216 @@
+"""Tests for the quantum pipeline turn benchmark."""
+
+import json
+
+import pytest
+
+from src.llm.message_types import Message
+from src.llm.scripted_provider import ScriptedRequest
+from src.observability import CompositeHook, LatencyHistogramHook, NullHook
+from src.world_server.quantum.benchmark import (
+    PHASES,
+    BenchmarkConfig,
+    BenchmarkReport,
+    PhaseRecorder,
+    PhaseStats,
+    classify_intent,
+    compare_to_baseline,
+    generate_branch,
+    run_benchmark,
+)
+
+
+def _request(prompt: str) -> ScriptedRequest:
+    return ScriptedRequest("complete_structured", (Message.user(prompt),))
+
+
+def _report(hit_rate: float = 0.5, p95: float = 10.0) -> BenchmarkReport:
+    return BenchmarkReport(
+        turns=10,
+        cache_hits=int(hit_rate * 10),
+        wall_time_s=1.0,
+        phases={"db_commit": PhaseStats(count=10, p50=p95 / 2, p95=p95, p99=p95)},
+        config={"latency_ms": 0.0},
+    )
+
+
+class TestScriptedResponders:
+    """Tests for the deterministic intent and branch responders."""
+
+    def test_classify_npc_interaction(self):
+        """Test talk inputs target the NPC named in the scene."""
+        prompt = (
+            '## Player Input\n"ask old aldric about the well"\n\n'
+            "## Scene: Market Square\n\nNPCs present: Master Corin, Old Aldric\n"
+        )
+
+        result = classify_intent(_request(prompt))
+
+        assert result["action_type"] == "interact_npc"
+        assert result["target"] == "Old Aldric"
+        assert result["confidence"] >= 0.7
+
+    def test_classify_question(self):
+        """Test questions are informational."""
+        result = classify_intent(_request('## Player Input\n"is the well locked?"\n'))
+
+        assert result["intent_type"] == "question"
+
+    def test_unknown_input_is_low_confidence(self):
+        """Test unmatched inputs fall back to the fuzzy matcher."""
+        result = classify_intent(_request('## Player Input\n"juggle three apples"\n'))
+
+        assert result["confidence"] < 0.7
+
+    def test_generate_branch_uses_player_key(self):
+        """Test generated variants reference the player and need a roll."""
+        prompt = "PLAYER ENTITY KEY: hero\nPLAYER ACTION: Look around\n"
+
+        result = generate_branch(_request(prompt))
+
+        assert [v["variant_type"] for v in result["variants"]] == ["success", "failure"]
+        assert result["variants"][0]["narrative"].startswith("[hero:You] look around.")
+        assert all(v["dc"] for v in result["variants"])
+
+
+class TestPhaseRecorder:
+    """Tests for PhaseRecorder."""
+
+    @pytest.mark.asyncio
+    async def test_wraps_sync_and_async_methods(self):
+        """Test wrapped calls add to their phase and take() resets."""
+
+        class Component:
+            def build(self):
+                return "built"
+
+            async def fetch(self):
+                return "fetched"
+
+        component = Component()
+        recorder = PhaseRecorder()
+        recorder.wrap(component, "build", "manifest")
+        recorder.wrap(component, "fetch", "cache_lookup")
+
+        assert component.build() == "built"
+        assert await component.fetch() == "fetched"
+        component.build()
+
+        phases = recorder.take()
+        assert set(phases) == {"manifest", "cache_lookup"}
+        assert recorder.take() == {}
+
+
+class TestBaselineComparison:
+    """Tests for BenchmarkReport baselines and compare_to_baseline."""
+
+    def test_round_trip(self):
+        """Test a report survives to_dict/from_dict via JSON."""
+        report = _report()
+
+        restored = BenchmarkReport.from_dict(json.loads(json.dumps(report.to_dict())))
+
+        assert restored.cache_hit_rate == report.cache_hit_rate
+        assert restored.phases["db_commit"] == report.phases["db_commit"]
+
+    def test_rejects_other_versions(self):
+        """Test baselines from another format version are refused."""
+        data = _report().to_dict()
+        data["version"] = 0
+
+        with pytest.raises(ValueError, match="version"):
+            BenchmarkReport.from_dict(data)
+
+    def test_no_regression_within_tolerance(self):
+        """Test small changes pass."""
+        assert compare_to_baseline(_report(p95=11.0), _report()) == []
+
+    def test_hit_rate_drop(self):
+        """Test a lower cache hit rate is a regression."""
+        regressions = compare_to_baseline(_report(hit_rate=0.2), _report())
+
+        assert len(regressions) == 1
+        assert "cache hit rate" in regressions[0]
+
+    def test_db_time_growth(self):
+        """Test slower DB commits are a regression."""
+        regressions = compare_to_baseline(_report(p95=20.0), _report())
+
+        assert len(regressions) == 1
+        assert regressions[0].startswith("db_commit p95")
+
+    def test_ignores_sub_millisecond_noise(self):
+        """Test large relative growth of tiny phases is ignored."""
+        assert compare_to_baseline(_report(p95=0.5), _report(p95=0.1)) == []
+
+    def test_different_settings_reported(self):
+        """Test runs with other settings are flagged as not comparable."""
+        other = _report()
+        other.config = {"latency_ms": 200.0}
+
+        regressions = compare_to_baseline(other, _report())
+
+        assert regressions == ["run settings differ from baseline: latency_ms"]
+
+
+class TestRunBenchmark:
+    """Tests for run_benchmark on the Millbrook world."""
+
+    @pytest.mark.asyncio
+    async def test_millbrook_run(self):
+        """Test the default script runs cleanly, hits the cache and times each phase."""
+        turns = []
+
+        report = await run_benchmark(
+            BenchmarkConfig(), on_turn=lambda n, text, result: turns.append(result)
+        )
+
+        assert report.turns == len(turns) == len(BenchmarkConfig().inputs)
+        assert report.errors == 0
+        assert 0 < report.cache_hit_rate < 1
+        assert set(report.phases) == set(PHASES)
+        for name in ("manifest", "prediction", "intent", "collapse", "db_commit", "total"):
+            assert report.phases[name].count == report.turns
+        assert report.phases["generation"].count == report.turns - report.cache_hits
+        assert any(
+            result.matched_action and result.matched_action.target_key == "old_aldric"
+            for result in turns
+        )
+
+    @pytest.mark.asyncio
+    async def test_simulated_latency_reaches_llm_phases(self):
+        """Test LLM latency shows up in intent classification and generation."""
+        config = BenchmarkConfig(inputs=("look around", "talk to master corin"), latency_ms=20)
+
+        report = await run_benchmark(config)
+
+        assert report.phases["intent"].p50 >= 15
+        assert report.phases["generation"].p50 >= 15
+        assert report.config["latency_ms"] == 20
+
+    @pytest.mark.asyncio
+    async def test_observability_hook_receives_turn_spans(self):
+        """Test the pipeline emits nested phase, collapse and LLM spans per turn."""
+        histograms = LatencyHistogramHook()
+        spans = []
+
+        class Recorder(NullHook):
+            def on_phase_end(self, event):
+                spans.append(event)
+
+        config = BenchmarkConfig(inputs=("look around", "look around"))
+        await run_benchmark(config, observability_hook=CompositeHook([histograms, Recorder()]))
+
+        summary = histograms.summary()
+        for name in ("turn", "manifest", "prediction", "intent", "cache_lookup", "collapse"):
+            assert summary[name]["count"] == 2
+        assert summary["llm.complete_structured"]["count"] >= 2
+
+        turns = [event for event in spans if event.phase == "turn"]
+        assert [event.details["turn"] for event in turns] == [1, 2]
+        assert turns[1].details["cache_hit"] is True
+        intent = next(event for event in spans if event.phase == "intent")
+        llm = next(e for e in spans if e.parent_id == intent.span_id)
+        assert llm.phase == "llm.complete_structured"
+        assert llm.details["location"] == "market_square"
+        assert intent.parent_id == turns[0].span_id
@@ -213,6 +213,35 @@ class TestGenerateBranch:
         expected_key = "tavern_main::interact_npc::innkeeper_tom::no_twist"
         assert branch.branch_key == expected_key
 
+    @pytest.mark.asyncio
+    async def test_generate_branch_keys_dialogue_by_topic(
+        self,
+        mock_db,
+        mock_game_session,
+        mock_llm,
+        sample_manifest,
+        sample_context,
+        sample_action,
+        sample_gm_decision,
+        sample_llm_response,
+    ):
+        """Test that NPC dialogue branches record the player's topic."""
+        mock_llm.complete_structured.return_value = LLMResponse(
+            content="",
+            parsed_content=sample_llm_response,
+        )
+        sample_context.player_input = "Ask Old Tom about any rumors he's heard"
+
+        generator = BranchGenerator(mock_db, mock_game_session, mock_llm)
+
+        branch = await generator.generate_branch(
+            sample_action, sample_gm_decision, sample_manifest, sample_context
+        )
+
+        assert branch.topic == "rumor"
+        assert branch.base_key == "tavern_main::interact_npc::innkeeper_tom::no_twist"
+        assert branch.branch_key != branch.base_key
+
     @pytest.mark.asyncio
     async def test_generate_branch_fallback_on_llm_error(
         self,
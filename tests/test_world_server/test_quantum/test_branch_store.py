@@ -0,0 +1,331 @@
+"""Tests for the persistent branch store and its integration with the cache."""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from src.gm.grounding import GroundedEntity, GroundingManifest
+from src.world_server.quantum.branch_store import (
+    SQLiteBranchStore,
+    compute_world_fingerprint,
+    deserialize_branch,
+    serialize_branch,
+)
+from src.world_server.quantum.cache import QuantumBranchCache
+from src.world_server.quantum.schemas import (
+    ActionPrediction,
+    ActionType,
+    DeltaType,
+    GMDecision,
+    OutcomeVariant,
+    QuantumBranch,
+    StateDelta,
+    VariantType,
+)
+from src.world_server.schemas import PredictionReason
+
+
+def create_branch(
+    location: str = "village_square",
+    target_key: str = "guard_001",
+    gm_decision: str = "no_twist",
+    generated_at: datetime | None = None,
+) -> QuantumBranch:
+    """Helper to create test branches."""
+    action = ActionPrediction(
+        action_type=ActionType.INTERACT_NPC,
+        target_key=target_key,
+        input_patterns=[f".*{target_key}.*"],
+        probability=0.25,
+        reason=PredictionReason.ADJACENT,
+        display_name="Town Guard",
+    )
+    return QuantumBranch(
+        branch_key=QuantumBranch.create_key(
+            location_key=location,
+            action_type=ActionType.INTERACT_NPC,
+            target_key=target_key,
+            gm_decision_type=gm_decision,
+        ),
+        action=action,
+        gm_decision=GMDecision(decision_type=gm_decision, probability=0.7),
+        variants={
+            "success": OutcomeVariant(
+                variant_type=VariantType.SUCCESS,
+                requires_dice=True,
+                skill="persuasion",
+                dc=12,
+                narrative="[guard_001:The guard] nods.",
+                state_deltas=[
+                    StateDelta(
+                        delta_type=DeltaType.UPDATE_RELATIONSHIP,
+                        target_key="guard_001",
+                        changes={"from_key": "guard_001", "to_key": "player", "delta": 5},
+                        expected_state={"is_active": True},
+                    )
+                ],
+                time_passed_minutes=3,
+            ),
+        },
+        generated_at=generated_at or datetime.now(),
+        generation_time_ms=4200.0,
+    )
+
+
+def create_manifest(guard_description: str = "a vigilant guard") -> GroundingManifest:
+    """Helper to create a scene manifest."""
+    return GroundingManifest(
+        location_key="village_square",
+        location_display="Village Square",
+        player_key="player_001",
+        npcs={
+            "guard_001": GroundedEntity(
+                key="guard_001",
+                display_name="Town Guard",
+                entity_type="npc",
+                short_description=guard_description,
+            ),
+        },
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a file-backed store in a temp directory."""
+    store = SQLiteBranchStore(tmp_path / "branches.sqlite")
+    yield store
+    store.close()
+
+
+class TestWorldFingerprint:
+    """Tests for compute_world_fingerprint."""
+
+    def test_same_scene_same_fingerprint(self):
+        assert compute_world_fingerprint(create_manifest()) == compute_world_fingerprint(
+            create_manifest()
+        )
+
+    def test_scene_change_changes_fingerprint(self):
+        before = compute_world_fingerprint(create_manifest())
+        after = compute_world_fingerprint(create_manifest("a sleeping guard"))
+        assert before != after
+
+    def test_ignores_session_id(self):
+        first = create_manifest()
+        second = create_manifest()
+        first.session_id = 1
+        second.session_id = 2
+        assert compute_world_fingerprint(first) == compute_world_fingerprint(second)
+
+
+class TestSerialization:
+    """Tests for branch serialization round-trips."""
+
+    def test_round_trip(self):
+        branch = create_branch()
+        branch.version_vector = {"entity:guard_001": 3}
+        restored = deserialize_branch(serialize_branch(branch))
+
+        assert restored.branch_key == branch.branch_key
+        assert restored.action.action_type == ActionType.INTERACT_NPC
+        assert restored.action.reason == PredictionReason.ADJACENT
+        assert restored.gm_decision.decision_type == "no_twist"
+        variant = restored.variants["success"]
+        assert variant.dc == 12
+        assert variant.state_deltas[0].delta_type == DeltaType.UPDATE_RELATIONSHIP
+        assert variant.state_deltas[0].expected_state == {"is_active": True}
+        assert restored.generated_at == branch.generated_at
+        assert restored.is_collapsed is False
+        assert restored.version_vector == {"entity:guard_001": 3}
+
+
+class TestSQLiteBranchStore:
+    """Tests for SQLiteBranchStore."""
+
+    def test_put_and_get(self, store):
+        branch = create_branch()
+        store.put(branch, "fp1")
+
+        restored = store.get(branch.branch_key, "fp1")
+
+        assert restored is not None
+        assert restored.branch_key == branch.branch_key
+        assert store.count() == 1
+
+    def test_fingerprint_mismatch_is_miss(self, store):
+        branch = create_branch()
+        store.put(branch, "fp1")
+
+        assert store.get(branch.branch_key, "fp2") is None
+
+    def test_survives_reopen(self, tmp_path):
+        path = tmp_path / "branches.sqlite"
+        first = SQLiteBranchStore(path)
+        first.put(create_branch(), "fp1")
+        first.close()
+
+        second = SQLiteBranchStore(path)
+        try:
+            assert second.get(create_branch().branch_key, "fp1") is not None
+        finally:
+            second.close()
+
+    def test_invalidate_location(self, store):
+        store.put(create_branch(location="village_square"), "fp1")
+        store.put(create_branch(location="tavern"), "fp1")
+
+        removed = store.invalidate_location("village_square")
+
+        assert removed == 1
+        assert store.count() == 1
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        store = SQLiteBranchStore(tmp_path / "small.sqlite", max_entries=2)
+        try:
+            store.put(create_branch(target_key="a"), "fp")
+            store.put(create_branch(target_key="b"), "fp")
+            store.put(create_branch(target_key="c"), "fp")
+
+            assert store.count() == 2
+            assert store.get(create_branch(target_key="a").branch_key, "fp") is None
+        finally:
+            store.close()
+
+    def test_ttl_expiry(self, tmp_path):
+        store = SQLiteBranchStore(tmp_path / "ttl.sqlite", ttl_seconds=0.0)
+        try:
+            branch = create_branch()
+            store.put(branch, "fp")
+            assert store.get(branch.branch_key, "fp") is None
+        finally:
+            store.close()
+
+
+class TestCacheWithStore:
+    """Tests for QuantumBranchCache backed by a store."""
+
+    @pytest.mark.asyncio
+    async def test_put_writes_through_with_fingerprint(self, store):
+        cache = QuantumBranchCache(store=store)
+
+        await cache.put_branch(create_branch(), fingerprint="fp1")
+
+        assert store.count() == 1
+        assert cache.metrics.store_writes == 1
+
+    @pytest.mark.asyncio
+    async def test_put_without_fingerprint_skips_store(self, store):
+        cache = QuantumBranchCache(store=store)
+
+        await cache.put_branch(create_branch())
+
+        assert store.count() == 0
+
+    @pytest.mark.asyncio
+    async def test_l1_miss_promotes_from_store(self, store):
+        branch = create_branch()
+        store.put(branch, "fp1")
+        cache = QuantumBranchCache(store=store)
+
+        result = await cache.get_branch(
+            location_key="village_square",
+            action=branch.action,
+            gm_decision_type="no_twist",
+            fingerprint="fp1",
+        )
+
+        assert result is not None
+        assert cache.size == 1
+        assert cache.metrics.store_hits == 1
+        assert cache.metrics.cache_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_old_branch_served_when_fingerprint_matches(self, store):
+        """Wall-clock branch expiry is replaced by the fingerprint check."""
+        branch = create_branch(generated_at=datetime.now() - timedelta(hours=1))
+        store.put(branch, "fp1")
+        cache = QuantumBranchCache(store=store)
+
+        result = await cache.get_branch_by_key(branch.branch_key, fingerprint="fp1")
+
+        assert result is not None
+
+    @pytest.mark.asyncio
+    async def test_stale_fingerprint_never_served(self, store):
+        cache = QuantumBranchCache(store=store)
+        branch = create_branch()
+        await cache.put_branch(branch, fingerprint="fp1")
+
+        result = await cache.get_branch_by_key(branch.branch_key, fingerprint="fp2")
+
+        assert result is None
+        assert cache.metrics.cache_misses == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_location_clears_store(self, store):
+        cache = QuantumBranchCache(store=store)
+        await cache.put_branch(create_branch(), fingerprint="fp1")
+
+        removed = await cache.invalidate_location("village_square")
+
+        assert removed == 2  # one in memory, one on disk
+        assert store.count() == 0
+
+    @staticmethod
+    def blocking_get(store):
+        """Wrap store.get so reads wait until the returned event is set."""
+        release = threading.Event()
+        get = store.get
+
+        def slow_get(key, fingerprint):
+            release.wait(timeout=5)
+            return get(key, fingerprint)
+
+        return patch.object(store, "get", side_effect=slow_get), release
+
+    @pytest.mark.asyncio
+    async def test_store_read_does_not_block_memory_hits(self, store):
+        stored = create_branch(target_key="guard_002")
+        store.put(stored, "fp1")
+        cache = QuantumBranchCache(store=store)
+        cached = create_branch()
+        await cache.put_branch(cached, fingerprint="fp1")
+        patcher, release = self.blocking_get(store)
+
+        with patcher:
+            pending = asyncio.create_task(
+                cache.get_branch_by_key(stored.branch_key, fingerprint="fp1")
+            )
+            await asyncio.sleep(0.05)
+            hit = await asyncio.wait_for(
+                cache.get_branch_by_key(cached.branch_key, fingerprint="fp1"), timeout=1
+            )
+            release.set()
+            promoted = await pending
+
+        assert hit is not None
+        assert promoted is not None
+        assert cache.metrics.store_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_read_racing_clear_is_not_promoted(self, store):
+        branch = create_branch()
+        store.put(branch, "fp1")
+        cache = QuantumBranchCache(store=store)
+        patcher, release = self.blocking_get(store)
+
+        with patcher:
+            pending = asyncio.create_task(
+                cache.get_branch_by_key(branch.branch_key, fingerprint="fp1")
+            )
+            await asyncio.sleep(0.05)
+            await cache.clear()
+            release.set()
+            result = await pending
+
+        assert result is None
+        assert cache.size == 0
+        assert cache.metrics.cache_misses == 1
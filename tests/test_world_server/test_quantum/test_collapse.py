@@ -11,6 +11,8 @@ from src.dice.types import (
     RollResult,
     SkillCheckResult,
 )
+from src.observability.histogram import LatencyHistogramHook
+from src.observability.tracing import Tracer
 from src.world_server.schemas import PredictionReason
 from src.world_server.quantum.schemas import (
     ActionPrediction,
@@ -491,6 +493,45 @@ class TestVariantSelection:
         assert result.selected_variant == VariantType.FAILURE
 
 
+class TestVariantProbabilities:
+    """Tests for variant odds without rolling."""
+
+    def test_no_dice_is_certain_success(
+        self, mock_db, mock_game_session, sample_branch_no_dice
+    ):
+        """Test branches without dice always select success."""
+        manager = BranchCollapseManager(mock_db, mock_game_session)
+
+        assert manager.variant_probabilities(sample_branch_no_dice) == {"success": 1.0}
+
+    def test_probabilities_match_2d10_odds(
+        self, mock_db, mock_game_session, sample_branch_with_dice
+    ):
+        """Test DC 15 with +3 splits odds across all four variants."""
+        manager = BranchCollapseManager(mock_db, mock_game_session)
+
+        odds = manager.variant_probabilities(
+            sample_branch_with_dice, attribute_modifier=1, skill_modifier=2
+        )
+
+        # Need 12+ on 2d10 (45%), double-10 and double-1 are 1% each
+        assert odds["critical_success"] == pytest.approx(0.01)
+        assert odds["success"] == pytest.approx(0.44)
+        assert odds["critical_failure"] == pytest.approx(0.01)
+        assert odds["failure"] == pytest.approx(0.54)
+        assert sum(odds.values()) == pytest.approx(1.0)
+
+    def test_auto_success_is_certain(
+        self, mock_db, mock_game_session, sample_branch_with_dice
+    ):
+        """Test routine checks (DC <= 10 + modifier) always succeed."""
+        manager = BranchCollapseManager(mock_db, mock_game_session)
+
+        odds = manager.variant_probabilities(sample_branch_with_dice, skill_modifier=5)
+
+        assert odds == {"success": 1.0}
+
+
 class TestDeltaValidation:
     """Tests for state delta validation."""
 
@@ -577,6 +618,56 @@ class TestDeltaValidation:
             )
 
 
+class TestCollapseTracing:
+    """Tests for collapse tracing spans."""
+
+    @pytest.mark.asyncio
+    async def test_collapse_span_with_validation(
+        self, mock_db, mock_game_session, sample_action, sample_gm_decision
+    ):
+        """Test collapse emits its span, a validation child and a failure on stale state."""
+        branch = QuantumBranch(
+            branch_key="test::interact_npc::npc::no_twist",
+            action=sample_action,
+            gm_decision=sample_gm_decision,
+            variants={
+                "success": OutcomeVariant(
+                    variant_type=VariantType.SUCCESS,
+                    requires_dice=False,
+                    narrative="You get the item.",
+                    state_deltas=[
+                        StateDelta(
+                            delta_type=DeltaType.TRANSFER_ITEM,
+                            target_key="sword_001",
+                            changes={"from": "chest", "to": "player"},
+                            expected_state={"location": "chest"},
+                        ),
+                    ],
+                ),
+            },
+            generated_at=datetime.now(),
+        )
+        hook = LatencyHistogramHook()
+        manager = BranchCollapseManager(mock_db, mock_game_session, tracer=Tracer(hook))
+
+        async def mock_get_state(key, delta_type):
+            return {"location": "ground"}
+
+        manager._get_current_state = mock_get_state
+
+        with pytest.raises(StaleStateError):
+            await manager.collapse_branch(
+                branch=branch,
+                player_input="take sword",
+                turn_number=1,
+            )
+
+        summary = hook.summary()
+        assert summary["collapse"]["count"] == 1
+        assert summary["collapse.validate"]["count"] == 1
+        assert "collapse.apply_deltas" not in summary
+
+
 class TestMetricsTracking:
     """Tests for metrics tracking during collapse."""
 
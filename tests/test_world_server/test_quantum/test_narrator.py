@@ -663,3 +663,91 @@ class TestNarratorValidation:
         assert not is_valid
         assert len(errors) > 0
         assert any("Old Tom" in e for e in errors)
+
+
+class TestNarratorStreaming:
+    """Tests for streamed narration via on_text."""
+
+    @pytest.fixture
+    def sample_context(self):
+        """Create sample narration context with NPCs."""
+        return NarrationContext(
+            what_happens="Old Tom gives the player a mug of honeyed ale",
+            outcome_type="success",
+            key_mapping={"a mug of honeyed ale": "item_ale_001"},
+            player_key="hero_001",
+            npcs_in_scene={"Old Tom": "npc_tom_001"},
+        )
+
+    def streaming_llm(self, *texts: str) -> MagicMock:
+        """Create a mock LLM that streams each text in small tokens."""
+        llm = MagicMock()
+        llm.complete_structured = AsyncMock()
+        responses = iter(texts)
+
+        async def stream(*, on_token, **kwargs):
+            text = next(responses)
+            for i in range(0, len(text), 5):
+                on_token(text[i : i + 5])
+            return MagicMock(content=text)
+
+        llm.complete_with_tools_streaming = AsyncMock(side_effect=stream)
+        return llm
+
+    @pytest.mark.asyncio
+    async def test_streams_cleaned_sentences(self, sample_context):
+        """Test valid narration is streamed as cleaned prose."""
+        llm = self.streaming_llm(
+            "[npc_tom_001:Old Tom] slides [item_ale_001:a mug of honeyed ale] "
+            "toward [hero_001:you]. The foam spills over."
+        )
+        narrator = NarratorEngine(llm=llm)
+        chunks: list[str] = []
+
+        result = await narrator.narrate(sample_context, on_text=chunks.append)
+
+        assert chunks == [
+            "Old Tom slides a mug of honeyed ale toward you.",
+            " The foam spills over.",
+        ]
+        assert "[npc_tom_001:Old Tom]" in result.narrative
+        llm.complete_structured.assert_not_called()
+        kwargs = llm.complete_with_tools_streaming.call_args.kwargs
+        assert kwargs["tool_choice"] == "none"
+        assert "prose only" in kwargs["messages"][0].content
+
+    @pytest.mark.asyncio
+    async def test_invalid_stream_falls_back_to_retry(self, sample_context):
+        """Test an invalid stream stops output and retries non-streamed."""
+        llm = self.streaming_llm("The bar is quiet. Old Tom slides over a mug.")
+        llm.complete_structured.return_value = MagicMock(
+            parsed_content=NarrationResponse(
+                narrative="[npc_tom_001:Old Tom] slides over [item_ale_001:a mug of honeyed ale]."
+            )
+        )
+        narrator = NarratorEngine(llm=llm, max_retries=3)
+        chunks: list[str] = []
+
+        result = await narrator.narrate(sample_context, on_text=chunks.append)
+
+        assert chunks == ["The bar is quiet."]
+        assert result.narrative.startswith("[npc_tom_001:Old Tom]")
+        retry_prompt = llm.complete_structured.call_args.kwargs["messages"][0].content
+        assert "Old Tom" in retry_prompt and "Previous Attempt Had Errors" in retry_prompt
+
+    @pytest.mark.asyncio
+    async def test_provider_without_streaming(self, sample_context):
+        """Test providers without streaming emit the whole narrative once."""
+        llm = MagicMock(spec=["complete_structured"])
+        llm.complete_structured = AsyncMock(
+            return_value=MagicMock(
+                parsed_content=NarrationResponse(narrative="[hero_001:you] drink deeply.")
+            )
+        )
+        narrator = NarratorEngine(llm=llm)
+        chunks: list[str] = []
+
+        await narrator.narrate(sample_context, on_text=chunks.append)
+
+        assert not narrator.can_stream
+        assert chunks == ["You drink deeply."]
@@ -19,6 +19,7 @@ from src.world_server.quantum.schemas import (
     VariantType,
 )
 from src.world_server.quantum.collapse import CollapseResult
+from src.world_server.quantum.narrator import NarrationContext, NarrationResponse
 from src.world_server.quantum.pipeline import (
     AnticipationConfig,
     QuantumPipeline,
@@ -333,6 +334,47 @@ class TestProcessTurn:
             assert result.was_cache_hit is False
             assert result.generation_time_ms > 0
 
+    @pytest.mark.asyncio
+    async def test_streamed_narration_records_time_to_first_token(
+        self, mock_db, mock_game_session, mock_llm_provider, sample_manifest
+    ):
+        """Test on_text is threaded to generation and first text is timed."""
+        with patch("src.world_server.quantum.pipeline.GMContextBuilder") as MockBuilder:
+            mock_builder = MagicMock()
+            mock_builder.build_grounding_manifest.return_value = sample_manifest
+            MockBuilder.return_value = mock_builder
+
+            pipeline = QuantumPipeline(
+                db=mock_db,
+                game_session=mock_game_session,
+                llm_provider=mock_llm_provider,
+            )
+            pipeline.branch_cache.get_branch = AsyncMock(return_value=None)
+            pipeline.action_predictor.predict_actions = MagicMock(return_value=[])
+
+            async def generate(**kwargs):
+                kwargs["on_text"]("You talk")
+                kwargs["on_text"](" to the guard.")
+                return TurnResult(narrative="You talk to the guard.")
+
+            pipeline._generate_sync = AsyncMock(side_effect=generate)
+            chunks: list[str] = []
+
+            result = await pipeline.process_turn(
+                player_input="talk to the guard",
+                location_key="village_square",
+                turn_number=1,
+                on_text=chunks.append,
+            )
+
+            assert chunks == ["You talk", " to the guard."]
+            assert result.time_to_first_token_ms is not None
+            assert result.time_to_first_token_ms <= result.total_time_ms
+            assert pipeline.metrics.streamed_narrations == 1
+            assert pipeline.metrics.avg_time_to_first_token_ms == pytest.approx(
+                result.time_to_first_token_ms
+            )
+
     @pytest.mark.asyncio
     async def test_error_handling(
         self, mock_db, mock_game_session, mock_llm_provider, sample_manifest
@@ -471,6 +513,7 @@ class TestCacheManagement:
             assert "metrics" in stats
             assert "anticipation" in stats
             assert stats["anticipation"]["running"] is False
+            assert stats["anticipation"]["scheduler"]["queue_depth"] == 0
 
 
 class TestBackgroundAnticipation:
@@ -1079,3 +1122,133 @@ class TestCreateEntityKeyInjection:
         # Should have grounding errors for the patron keys
         grounding_errors = [e for e in result.errors if "grounding" in e.category]
         assert len(grounding_errors) > 0, "Expected grounding errors without key injection"
+
+
+class TestRollAndNarrate:
+    """Tests for rolling the skill check and (speculatively) narrating."""
+
+    @pytest.fixture
+    def reasoning_response(self):
+        from src.world_server.quantum.reasoning import ReasoningResponse, SemanticOutcome
+
+        return ReasoningResponse(
+            requires_skill_check=True,
+            skill_name="lockpicking",
+            difficulty="medium",
+            success=SemanticOutcome(what_happens="The lock clicks open", outcome_type="success"),
+            failure=SemanticOutcome(what_happens="The pick snaps", outcome_type="failure"),
+        )
+
+    def make_pipeline(self, mock_db, mock_game_session, mock_llm_provider, policy):
+        from src.world_server.quantum.speculation import SpeculationPolicy
+
+        with patch("src.world_server.quantum.pipeline.GMContextBuilder"):
+            pipeline = QuantumPipeline(
+                db=mock_db,
+                game_session=mock_game_session,
+                llm_provider=mock_llm_provider,
+                speculation_policy=SpeculationPolicy.from_setting(policy),
+            )
+
+        async def narrate(context, on_text=None):
+            await asyncio.sleep(0.01)
+            return NarrationResponse(narrative=f"[player_001:you] see: {context.what_happens}.")
+
+        pipeline.narrator_engine.narrate = AsyncMock(side_effect=narrate)
+        return pipeline
+
+    @staticmethod
+    def prepare(outcome):
+        translation = MagicMock(key_mapping={})
+        return translation, NarrationContext(
+            what_happens=outcome.what_happens,
+            outcome_type=outcome.outcome_type,
+            key_mapping={},
+            player_key="player_001",
+        )
+
+    @staticmethod
+    def failed_check():
+        from src.dice.types import SkillCheckResult
+
+        return SkillCheckResult(
+            roll_result=None,
+            dc=15,
+            success=False,
+            margin=-4,
+            is_critical_success=False,
+            is_critical_failure=False,
+            advantage_type=AdvantageType.NORMAL,
+        )
+
+    @pytest.mark.asyncio
+    async def test_serial_narrates_rolled_outcome_only(
+        self, mock_db, mock_game_session, mock_llm_provider, reasoning_response
+    ):
+        pipeline = self.make_pipeline(mock_db, mock_game_session, mock_llm_provider, "off")
+        on_roll = AsyncMock()
+
+        with patch(
+            "src.world_server.quantum.pipeline.make_skill_check",
+            return_value=self.failed_check(),
+        ):
+            outcome, _, narration = await pipeline._roll_and_narrate(
+                reasoning_response, self.prepare, on_roll=on_roll
+            )
+
+        assert outcome.outcome_type == "failure"
+        assert "The pick snaps" in narration.narrative
+        assert pipeline.narrator_engine.narrate.await_count == 1
+        on_roll.assert_awaited_once()
+        assert pipeline.metrics.speculative_turns == 0
+
+    @pytest.mark.asyncio
+    async def test_speculation_narrates_during_roll(
+        self, mock_db, mock_game_session, mock_llm_provider, reasoning_response
+    ):
+        """Test every plausible outcome is narrated while on_roll runs."""
+        pipeline = self.make_pipeline(mock_db, mock_game_session, mock_llm_provider, "all")
+        chunks: list[str] = []
+
+        async def slow_roll(check):
+            await asyncio.sleep(0.05)
+
+        with patch(
+            "src.world_server.quantum.pipeline.make_skill_check",
+            return_value=self.failed_check(),
+        ):
+            outcome, _, narration = await pipeline._roll_and_narrate(
+                reasoning_response, self.prepare, on_text=chunks.append, on_roll=slow_roll
+            )
+
+        assert outcome.outcome_type == "failure"
+        assert "The pick snaps" in narration.narrative
+        narrated = {
+            call.args[0].outcome_type for call in pipeline.narrator_engine.narrate.await_args_list
+        }
+        assert narrated == {"success", "failure"}
+        assert chunks == ["You see: The pick snaps."]
+        assert pipeline.metrics.speculative_turns == 1
+        assert pipeline.metrics.speculation_hits == 1
+        assert pipeline.metrics.wasted_speculative_tokens > 0
+        assert pipeline.metrics.total_speculation_saved_ms > 0
+
+    @pytest.mark.asyncio
+    async def test_no_speculation_without_roll_callback(
+        self, mock_db, mock_game_session, mock_llm_provider, reasoning_response
+    ):
+        """Test an instant roll narrates only the rolled outcome."""
+        pipeline = self.make_pipeline(mock_db, mock_game_session, mock_llm_provider, "all")
+
+        with patch(
+            "src.world_server.quantum.pipeline.make_skill_check",
+            return_value=self.failed_check(),
+        ):
+            outcome, _, narration = await pipeline._roll_and_narrate(
+                reasoning_response, self.prepare
+            )
+
+        assert outcome.outcome_type == "failure"
+        assert "The pick snaps" in narration.narrative
+        assert pipeline.narrator_engine.narrate.await_count == 1
+        assert pipeline.metrics.speculative_turns == 0
@@ -412,6 +412,18 @@ class TestQuantumMetrics:
         assert metrics.critical_failures == 1
         assert metrics.no_twists == 1
 
+    def test_record_first_token(self):
+        """Test time-to-first-token averaging."""
+        metrics = QuantumMetrics()
+        assert metrics.avg_time_to_first_token_ms == 0.0
+
+        metrics.record_first_token(300.0)
+        metrics.record_first_token(500.0)
+
+        assert metrics.streamed_narrations == 2
+        assert metrics.avg_time_to_first_token_ms == 400.0
+        assert metrics.to_dict()["avg_time_to_first_token_ms"] == "400"
+
     def test_to_dict(self):
         """Test conversion to dict."""
         metrics = QuantumMetrics()
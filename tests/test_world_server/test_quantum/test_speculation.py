@@ -0,0 +1,228 @@
+"""Tests for speculative multi-outcome narration."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.dice.probability import success_probability
+from src.dice.types import AdvantageType, SkillCheckResult
+from src.world_server.quantum.narrator import (
+    NarrationContext,
+    NarrationResponse,
+    NarratorEngine,
+)
+from src.world_server.quantum.reasoning import ReasoningResponse, SemanticOutcome
+from src.world_server.quantum.schemas import QuantumMetrics
+from src.world_server.quantum.speculation import (
+    SpeculationPolicy,
+    SpeculativeNarration,
+    outcome_key_for_check,
+    outcome_probabilities,
+    provider_cost_class,
+)
+
+
+def semantic(outcome_type: str) -> SemanticOutcome:
+    return SemanticOutcome(what_happens=f"The lock {outcome_type}", outcome_type=outcome_type)
+
+
+@pytest.fixture
+def reasoning_response():
+    """Reasoning response with all four outcomes."""
+    return ReasoningResponse(
+        requires_skill_check=True,
+        skill_name="lockpicking",
+        difficulty="medium",
+        success=semantic("success"),
+        failure=semantic("failure"),
+        critical_success=semantic("critical_success"),
+        critical_failure=semantic("critical_failure"),
+    )
+
+
+def check(success: bool, crit_success: bool = False, crit_failure: bool = False):
+    return SkillCheckResult(
+        roll_result=None,
+        dc=15,
+        success=success,
+        margin=0 if success else -3,
+        is_critical_success=crit_success,
+        is_critical_failure=crit_failure,
+        advantage_type=AdvantageType.NORMAL,
+    )
+
+
+def provider(name: str) -> MagicMock:
+    llm = MagicMock()
+    llm.provider_name = name
+    return llm
+
+
+class TestOutcomeSelection:
+    """Tests for outcome_key_for_check and outcome_probabilities."""
+
+    def test_no_check_is_success(self, reasoning_response):
+        assert outcome_key_for_check(reasoning_response, None) == "success"
+
+    def test_criticals_preferred(self, reasoning_response):
+        assert outcome_key_for_check(reasoning_response, check(True, crit_success=True)) == (
+            "critical_success"
+        )
+        assert outcome_key_for_check(reasoning_response, check(False, crit_failure=True)) == (
+            "critical_failure"
+        )
+
+    def test_missing_outcomes_fall_back(self):
+        """Test criticals fall back to success/failure and failure to success."""
+        response = ReasoningResponse(requires_skill_check=True, success=semantic("success"))
+
+        assert outcome_key_for_check(response, check(True, crit_success=True)) == "success"
+        assert outcome_key_for_check(response, check(False, crit_failure=True)) == "success"
+
+    def test_probabilities_match_exact_odds(self, reasoning_response):
+        """Test outcome odds add up and agree with the success chance."""
+        odds = outcome_probabilities(reasoning_response, dc=15, modifier=3)
+
+        assert sum(odds.values()) == pytest.approx(1.0)
+        assert odds["critical_success"] == pytest.approx(0.01)
+        assert odds["success"] + odds["critical_success"] == pytest.approx(
+            success_probability(15, 3)
+        )
+
+    def test_probabilities_without_failure(self):
+        """Test a response without failure routes every roll to success."""
+        response = ReasoningResponse(requires_skill_check=True, success=semantic("success"))
+
+        assert outcome_probabilities(response, dc=18, modifier=0) == {
+            "success": pytest.approx(1.0)
+        }
+
+
+class TestSpeculationPolicy:
+    """Tests for SpeculationPolicy."""
+
+    def test_from_setting(self):
+        assert not SpeculationPolicy.from_setting("off").enabled
+        assert SpeculationPolicy.from_setting("local").cost_classes == {"local"}
+        assert SpeculationPolicy.from_setting("all").cost_classes == {"local", "metered"}
+        assert SpeculationPolicy.from_setting("Local, metered").cost_classes == {
+            "local",
+            "metered",
+        }
+
+    def test_from_setting_rejects_unknown_class(self):
+        with pytest.raises(ValueError, match="cheap"):
+            SpeculationPolicy.from_setting("cheap")
+
+    def test_allows_by_cost_class(self):
+        """Test only providers in an enabled cost class may speculate."""
+        policy = SpeculationPolicy.from_setting("local")
+
+        assert policy.allows(provider("ollama"))
+        assert policy.allows(provider("qwen-agent"))
+        assert not policy.allows(provider("anthropic"))
+        assert provider_cost_class(provider("someone-else")) == "metered"
+
+    def test_plausible_outcomes_prunes_unlikely(self):
+        """Test rare outcomes are skipped, most likely first."""
+        policy = SpeculationPolicy(cost_classes=frozenset({"local"}), min_probability=0.05)
+        odds = {"success": 0.44, "failure": 0.54, "critical_success": 0.01, "critical_failure": 0.01}
+
+        assert policy.plausible_outcomes(odds) == ["failure", "success"]
+
+    def test_single_outcome_is_not_raced(self):
+        policy = SpeculationPolicy(cost_classes=frozenset({"local"}))
+
+        assert policy.plausible_outcomes({"success": 0.97, "failure": 0.03}) == []
+
+
+class TestSpeculativeNarration:
+    """Tests for SpeculativeNarration."""
+
+    @pytest.fixture
+    def narrator(self):
+        """Narrator whose narration takes 20ms per outcome."""
+        narrator = NarratorEngine(llm=MagicMock())
+
+        async def narrate(context, on_text=None):
+            await asyncio.sleep(0.02)
+            return NarrationResponse(narrative=context.what_happens)
+
+        narrator.narrate = AsyncMock(side_effect=narrate)
+        return narrator
+
+    def contexts(self, *keys: str) -> dict[str, NarrationContext]:
+        return {
+            key: NarrationContext(what_happens=f"The lock {key}", outcome_type=key, key_mapping={})
+            for key in keys
+        }
+
+    @pytest.mark.asyncio
+    async def test_keeps_selected_and_reports_waste(self, narrator):
+        speculation = SpeculativeNarration(narrator)
+        speculation.start(self.contexts("success", "failure"))
+
+        await asyncio.sleep(0.05)  # Slow roll: both narrations finish first
+        speculation.mark_rolled()
+        response, report = await speculation.resolve("failure")
+
+        assert response.narrative == "The lock failure"
+        assert report.hit
+        assert report.branches == 2
+        assert report.wasted_branches == 1
+        assert report.wasted_tokens > 0
+        assert report.latency_saved_ms >= 15  # The 20ms narration ran during the roll
+
+    @pytest.mark.asyncio
+    async def test_fast_roll_cancels_losers(self, narrator):
+        """Test unfinished narrations are cancelled and little time is saved."""
+        speculation = SpeculativeNarration(narrator)
+        speculation.start(self.contexts("success", "failure"))
+        tasks = dict(speculation._tasks)
+
+        speculation.mark_rolled()
+        response, report = await speculation.resolve("success")
+
+        assert response.narrative == "The lock success"
+        assert tasks["failure"].cancelled()
+        assert report.latency_saved_ms < 15
+
+    @pytest.mark.asyncio
+    async def test_miss_returns_none(self, narrator):
+        speculation = SpeculativeNarration(narrator)
+        speculation.start(self.contexts("success", "failure"))
+
+        response, report = await speculation.resolve("critical_success")
+
+        assert response is None
+        assert not report.hit
+        assert report.wasted_branches == 2
+
+
+class TestSpeculationMetrics:
+    """Tests for speculation metrics."""
+
+    def test_wasted_tokens_against_time_saved(self):
+        metrics = QuantumMetrics()
+        metrics.record_speculation(
+            hit=True, wasted_branches=1, wasted_tokens=600, latency_saved_ms=1500.0
+        )
+        metrics.record_speculation(
+            hit=False, wasted_branches=2, wasted_tokens=600, latency_saved_ms=0.0
+        )
+
+        assert metrics.speculative_turns == 2
+        assert metrics.speculation_hits == 1
+        assert metrics.avg_speculation_saved_ms == 750.0
+        assert metrics.wasted_tokens_per_second_saved == 800.0
+        assert metrics.to_dict()["wasted_tokens_per_second_saved"] == "800"
+
+    def test_no_savings(self):
+        metrics = QuantumMetrics()
+        assert metrics.wasted_tokens_per_second_saved == 0.0
+
+        metrics.record_speculation(
+            hit=False, wasted_branches=1, wasted_tokens=100, latency_saved_ms=0.0
+        )
+        assert metrics.wasted_tokens_per_second_saved == float("inf")
@@ -0,0 +1,89 @@
+"""Tests for streamed narration (StreamingNarrative)."""
+
+from src.world_server.quantum.cleanup import cleanup_narrative
+from src.world_server.quantum.streaming import StreamingNarrative
+
+
+def unkeyed_tom(text: str) -> list[str]:
+    """Validator that rejects 'Old Tom' without a [key:text] reference."""
+    if "Old Tom" in text and "[npc_tom:Old Tom]" not in text:
+        return ["Unkeyed mention: 'Old Tom'"]
+    return []
+
+
+class TestStreamingNarrative:
+    """Tests for StreamingNarrative."""
+
+    def test_releases_complete_sentences(self):
+        """Test text is only released at sentence ends."""
+        chunks: list[str] = []
+        stream = StreamingNarrative(chunks.append, player_key="hero")
+
+        stream.feed("[hero:You] push the door")
+        assert chunks == []
+
+        stream.feed(". It swings ")
+        assert chunks == ["You push the door."]
+
+    def test_holds_open_entity_ref(self):
+        """Test a sentence end inside [key:display] is not a boundary."""
+        chunks: list[str] = []
+        stream = StreamingNarrative(chunks.append)
+
+        stream.feed("You greet [npc_smith:Mr. ")
+        assert chunks == []
+
+        stream.feed("Smith] warmly. ")
+        assert chunks == ["You greet Mr. Smith warmly."]
+
+    def test_emitted_matches_full_cleanup(self):
+        """Test the concatenated stream equals cleanup of the whole text."""
+        raw = (
+            "[hero:you] step inside.  the fire crackles! [npc_tom:Old Tom] "
+            "nods at [hero:you]. 'Welcome,' he says."
+        )
+        chunks: list[str] = []
+        stream = StreamingNarrative(chunks.append, player_key="hero")
+
+        for i in range(0, len(raw), 7):
+            stream.feed(raw[i : i + 7])
+        assert stream.finish() == []
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == cleanup_narrative(raw, player_key="hero").text
+        assert stream.complete
+
+    def test_invalid_prefix_holds_output(self):
+        """Test nothing after an invalid sentence is released."""
+        chunks: list[str] = []
+        stream = StreamingNarrative(chunks.append, validate=unkeyed_tom)
+
+        stream.feed("Old Tom waves. ")
+        stream.feed("The door opens. ")
+
+        assert chunks == []
+        assert stream.held
+        assert stream.finish()
+        assert not stream.complete
+
+    def test_valid_sentences_before_error_are_shown(self):
+        """Test only the prefix up to the first invalid sentence is released."""
+        chunks: list[str] = []
+        stream = StreamingNarrative(chunks.append, validate=unkeyed_tom)
+
+        stream.feed("The fire crackles. Old Tom waves. The door opens.")
+
+        assert chunks == ["The fire crackles."]
+
+    def test_finish_flushes_when_full_text_validates(self):
+        """Test held text is released if the full narrative is valid."""
+        chunks: list[str] = []
+        stream = StreamingNarrative(chunks.append, validate=unkeyed_tom)
+
+        stream.feed("Old Tom looks up. ")
+        stream.feed("[npc_tom:Old Tom] smiles.")
+        assert chunks == []
+
+        assert stream.finish() == []
+        assert "".join(chunks) == "Old Tom looks up. Old Tom smiles."
+        assert stream.complete
@@ -0,0 +1,214 @@
+"""Tests for topic-aware caching of NPC dialogue branches."""
+
+import pytest
+
+from src.world_server.quantum.branch_store import deserialize_branch, serialize_branch
+from src.world_server.quantum.cache import QuantumBranchCache
+from src.world_server.quantum.schemas import (
+    ActionPrediction,
+    ActionType,
+    GMDecision,
+    OutcomeVariant,
+    QuantumBranch,
+    VariantType,
+)
+from src.world_server.quantum.topic_index import (
+    DEFAULT_TOPIC_THRESHOLD,
+    TopicIndex,
+    TopicVectorizer,
+    calibrate_threshold,
+    dialogue_topic,
+    target_names,
+)
+from src.world_server.schemas import PredictionReason
+
+NPC_NAMES = ["innkeeper tom", "Old Tom"]
+
+# Inputs one cached reply would fit
+SAME_TOPIC = [
+    ("Ask Tom about any rumors he's heard", "Heard any rumors lately?"),
+    ("Do you have a room for the night?", "I'd like to rent a room for the night"),
+    ("How much for a room?", "What are your room prices?"),
+    ("Tell me about the mine", "What do you know about the old mine?"),
+    ("Where is the blacksmith?", "Can you point me to the blacksmith's shop?"),
+    ("I want to buy some ale", "An ale, please"),
+    ("Any news from the capital?", "What news from the capital?"),
+    ("Have you seen any bandits on the road?", "Are there bandits on the road?"),
+    ("Who runs this town?", "Who is in charge of the town?"),
+]
+
+# Inputs that need different replies
+DIFFERENT_TOPIC = [
+    ("Ask Tom about any rumors he's heard", "Do you have a room for the night?"),
+    ("How much for a room?", "Where is the blacksmith?"),
+    ("Tell me about the mine", "I want to buy some ale"),
+    ("Any news from the capital?", "How much does a room cost?"),
+    ("Have you seen any bandits on the road?", "What's good to eat here?"),
+    ("Heard any rumors lately?", "Where is the road to the capital?"),
+    ("I'd like to rent a room", "I'd like to buy a horse"),
+    ("Where can I find work?", "Where can I find the blacksmith?"),
+    ("Tell me about your family", "Tell me about the mine"),
+    ("Is the road north safe?", "Is the road south safe?"),
+]
+
+
+def topics(pairs):
+    return [
+        (dialogue_topic(first, NPC_NAMES), dialogue_topic(second, NPC_NAMES))
+        for first, second in pairs
+    ]
+
+
+def make_action(target_key: str = "innkeeper_tom") -> ActionPrediction:
+    return ActionPrediction(
+        action_type=ActionType.INTERACT_NPC,
+        target_key=target_key,
+        input_patterns=["talk.*tom"],
+        probability=0.5,
+        reason=PredictionReason.ADJACENT,
+        display_name="Old Tom",
+    )
+
+
+def make_branch(player_input: str | None, narrative: str) -> QuantumBranch:
+    action = make_action()
+    topic = dialogue_topic(player_input, target_names(action))
+    return QuantumBranch(
+        branch_key=QuantumBranch.create_key(
+            "tavern", ActionType.INTERACT_NPC, "innkeeper_tom", "no_twist", topic=topic
+        ),
+        action=action,
+        gm_decision=GMDecision(decision_type="no_twist", probability=1.0),
+        variants={
+            "success": OutcomeVariant(
+                variant_type=VariantType.SUCCESS, requires_dice=False, narrative=narrative
+            )
+        },
+        topic=topic,
+    )
+
+
+class TestDialogueTopic:
+    """Tests for topic descriptors."""
+
+    def test_filler_and_npc_name_are_dropped(self):
+        assert dialogue_topic("Ask Old Tom about any rumors he's heard", NPC_NAMES) == "rumor"
+
+    def test_input_without_topic(self):
+        assert dialogue_topic("Talk to the innkeeper", NPC_NAMES) is None
+        assert dialogue_topic(None) is None
+
+    def test_topic_changes_branch_key(self):
+        base = QuantumBranch.create_key("tavern", ActionType.INTERACT_NPC, "tom", "no_twist")
+        keyed = QuantumBranch.create_key(
+            "tavern", ActionType.INTERACT_NPC, "tom", "no_twist", topic="rumor"
+        )
+
+        assert keyed.startswith(f"{base}::topic-")
+        assert make_branch("rumors?", "").base_key == (
+            "tavern::interact_npc::innkeeper_tom::no_twist"
+        )
+
+
+class TestCalibration:
+    """Tests for the acceptance threshold."""
+
+    def test_default_threshold_rejects_every_wrong_topic(self):
+        calibrated = calibrate_threshold(topics(SAME_TOPIC), topics(DIFFERENT_TOPIC))
+
+        assert calibrated <= DEFAULT_TOPIC_THRESHOLD
+
+    def test_default_threshold_accepts_most_paraphrases(self):
+        vectorizer = TopicVectorizer()
+        accepted = [
+            vectorizer.similarity(first, second) >= DEFAULT_TOPIC_THRESHOLD
+            for first, second in topics(SAME_TOPIC)
+        ]
+
+        assert sum(accepted) >= len(accepted) - 1
+
+    def test_separable_pairs_get_midpoint(self):
+        threshold = calibrate_threshold([("ale", "ale")], [("ale", "mine")])
+
+        assert threshold == pytest.approx(0.5)
+
+    def test_empty_pairs_are_rejected(self):
+        with pytest.raises(ValueError):
+            calibrate_threshold([], [("ale", "mine")])
+
+
+class TestTopicIndex:
+    """Tests for nearest-topic lookup."""
+
+    def test_nearest_within_group(self):
+        vectorizer = TopicVectorizer()
+        index = TopicIndex()
+        index.add("tom", "tom::rooms", vectorizer.vectorize("room night"))
+        index.add("tom", "tom::rumors", vectorizer.vectorize("rumor"))
+        index.add("mary", "mary::rooms", vectorizer.vectorize("room price"))
+
+        key, score = index.nearest("tom", vectorizer.vectorize("room price"), 0.3)
+
+        assert key == "tom::rooms"
+        assert 0.3 <= score < 1.0
+        assert index.nearest("tom", vectorizer.vectorize("bandit"), 0.3) is None
+        index.remove("tom::rooms")
+        assert index.nearest("tom", vectorizer.vectorize("room price"), 0.3) is None
+        assert len(index) == 2
+
+
+class TestTopicAwareCache:
+    """Tests for INTERACT_NPC lookups with player input."""
+
+    @pytest.mark.asyncio
+    async def test_similar_topic_is_served(self):
+        cache = QuantumBranchCache()
+        await cache.put_branch(make_branch("Ask Tom about any rumors he's heard", "Rumors!"))
+        await cache.put_branch(make_branch("Do you have a room for the night?", "Rooms!"))
+
+        branch = await cache.get_branch(
+            "tavern", make_action(), "no_twist", player_input="Heard any rumors lately, Tom?"
+        )
+
+        assert branch.variants["success"].narrative == "Rumors!"
+        assert cache.get_stats()["topics_cached"] == 2
+
+    @pytest.mark.asyncio
+    async def test_wrong_topic_is_a_miss(self):
+        cache = QuantumBranchCache()
+        await cache.put_branch(make_branch("Do you have a room for the night?", "Rooms!"))
+        await cache.put_branch(make_branch(None, "Greetings!"))
+
+        branch = await cache.get_branch(
+            "tavern", make_action(), "no_twist", player_input="Ask Tom about the old mine"
+        )
+
+        assert branch is None
+        assert cache.metrics.cache_misses == 1
+
+    @pytest.mark.asyncio
+    async def test_input_without_topic_uses_generic_branch(self):
+        cache = QuantumBranchCache()
+        await cache.put_branch(make_branch(None, "Greetings!"))
+
+        branch = await cache.get_branch(
+            "tavern", make_action(), "no_twist", player_input="Talk to the innkeeper"
+        )
+
+        assert branch.variants["success"].narrative == "Greetings!"
+
+    @pytest.mark.asyncio
+    async def test_evicted_topics_are_forgotten(self):
+        cache = QuantumBranchCache(max_branches=1)
+        await cache.put_branch(make_branch("Any rumors?", "Rumors!"))
+        await cache.put_branch(make_branch("A room, please", "Rooms!"))
+
+        assert cache.get_stats()["topics_cached"] == 1
+        assert await cache.get_branch(
+            "tavern", make_action(), "no_twist", player_input="rumors?"
+        ) is None
+
+    def test_topic_survives_serialization(self):
+        branch = make_branch("Any rumors?", "Rumors!")
+
+        assert deserialize_branch(serialize_branch(branch)).topic == "rumor"
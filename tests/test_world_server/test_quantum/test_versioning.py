@@ -0,0 +1,252 @@
+"""Tests for world-state version vectors."""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import update
+
+from src.database.models.entities import Entity
+from src.gm.grounding import GroundedEntity, GroundingManifest
+from src.managers.needs import NeedsManager
+from src.world_server.quantum.cache import QuantumBranchCache
+from src.world_server.quantum.collapse import BranchCollapseManager, StaleStateError
+from src.world_server.quantum.pipeline import QuantumPipeline
+from src.world_server.quantum.schemas import (
+    ActionPrediction,
+    ActionType,
+    DeltaType,
+    GMDecision,
+    OutcomeVariant,
+    QuantumBranch,
+    StateDelta,
+    VariantType,
+)
+from src.world_server.quantum.versioning import (
+    WorldVersionIndex,
+    branch_refs,
+    delta_refs,
+    manifest_refs,
+)
+from src.world_server.schemas import PredictionReason
+from tests.factories import create_character_needs, create_entity, create_item
+
+
+def create_branch(deltas: list[StateDelta], generated_at: datetime | None = None) -> QuantumBranch:
+    """Helper to create a branch with a single success variant."""
+    action = ActionPrediction(
+        action_type=ActionType.MANIPULATE_ITEM,
+        target_key="sword_001",
+        input_patterns=[],
+        probability=0.5,
+        reason=PredictionReason.ADJACENT,
+    )
+    return QuantumBranch(
+        branch_key=QuantumBranch.create_key(
+            "village_square", ActionType.MANIPULATE_ITEM, "sword_001", "no_twist"
+        ),
+        action=action,
+        gm_decision=GMDecision(decision_type="no_twist", probability=1.0),
+        variants={
+            "success": OutcomeVariant(
+                variant_type=VariantType.SUCCESS,
+                requires_dice=False,
+                narrative="You take the sword.",
+                state_deltas=deltas,
+            ),
+        },
+        generated_at=generated_at or datetime.now(),
+    )
+
+
+class TestDeltaRefs:
+    """Tests for mapping deltas to version refs."""
+
+    def test_entity_item_and_need_refs(self):
+        assert delta_refs(StateDelta(DeltaType.UPDATE_ENTITY, "guard_001", {})) == [
+            "entity:guard_001"
+        ]
+        assert delta_refs(StateDelta(DeltaType.TRANSFER_ITEM, "sword_001", {})) == [
+            "item:sword_001"
+        ]
+        assert delta_refs(
+            StateDelta(DeltaType.UPDATE_NEED, "player", {"entity_key": "hero"})
+        ) == ["needs:hero"]
+
+    def test_additive_deltas_have_no_refs(self):
+        assert delta_refs(StateDelta(DeltaType.RECORD_FACT, "guard_001", {})) == []
+        assert delta_refs(StateDelta(DeltaType.ADVANCE_TIME, "world", {})) == []
+
+    def test_branch_refs_cover_all_variants(self):
+        branch = create_branch([StateDelta(DeltaType.TRANSFER_ITEM, "sword_001", {})])
+        branch.variants["failure"] = OutcomeVariant(
+            variant_type=VariantType.FAILURE,
+            requires_dice=False,
+            state_deltas=[StateDelta(DeltaType.UPDATE_ENTITY, "guard_001", {})],
+        )
+        assert branch_refs(branch) == {"item:sword_001", "entity:guard_001"}
+
+
+class TestWorldVersionIndex:
+    """Tests for WorldVersionIndex against a real database."""
+
+    def test_snapshot_reads_row_versions(self, db_session, game_session):
+        create_item(db_session, game_session, item_key="sword_001")
+        index = WorldVersionIndex(db_session, game_session)
+
+        vector = index.snapshot(["item:sword_001", "item:missing"])
+
+        assert vector == {"item:sword_001": 1, "item:missing": 0}
+
+    def test_update_invalidates_vector(self, db_session, game_session):
+        item = create_item(db_session, game_session, item_key="sword_001")
+        index = WorldVersionIndex(db_session, game_session)
+        vector = index.snapshot(["item:sword_001"])
+
+        item.display_name = "Rusty Sword"
+        db_session.flush()
+
+        assert index.is_current(vector) is False
+        assert index.snapshot(["item:sword_001"]) == {"item:sword_001": 2}
+
+    def test_unchanged_check_needs_no_reload(self, db_session, game_session):
+        create_item(db_session, game_session, item_key="sword_001")
+        index = WorldVersionIndex(db_session, game_session)
+        vector = index.snapshot(["item:sword_001"])
+        loads = index.loads
+
+        for _ in range(10):
+            assert index.is_current(vector) is True
+
+        assert index.loads == loads
+
+    def test_creating_missing_row_invalidates(self, db_session, game_session):
+        index = WorldVersionIndex(db_session, game_session)
+        vector = index.snapshot(["item:sword_001"])
+
+        create_item(db_session, game_session, item_key="sword_001")
+
+        assert index.is_current(vector) is False
+
+    def test_needs_change_invalidates(self, db_session, game_session):
+        entity = create_entity(db_session, game_session, entity_key="hero")
+        needs = create_character_needs(db_session, game_session, entity)
+        index = WorldVersionIndex(db_session, game_session)
+        vector = index.snapshot(["needs:hero", "entity:hero"])
+
+        needs.hunger = 10
+        db_session.flush()
+
+        assert index.is_current({"entity:hero": vector["entity:hero"]}) is True
+        assert index.is_current(vector) is False
+
+    def test_batch_need_decay_invalidates(self, db_session, game_session):
+        entity = create_entity(db_session, game_session, entity_key="hero")
+        create_character_needs(db_session, game_session, entity, hunger=50)
+        index = WorldVersionIndex(db_session, game_session)
+        vector = index.snapshot(["needs:hero", "item:sword_001"])
+
+        NeedsManager(db_session, game_session).apply_batch_time_decay(3)
+
+        assert index.is_current({"item:sword_001": 0}) is True
+        assert index.is_current(vector) is False
+        assert index.snapshot(["needs:hero"]) == {"needs:hero": 2}
+
+    def test_update_after_bulk_bump_is_not_a_conflict(self, db_session, game_session):
+        entity = create_entity(db_session, game_session, entity_key="hero")
+        needs = create_character_needs(db_session, game_session, entity, hunger=50)
+        db_session.flush()
+
+        # Batch decay bumps the row with an executemany the loaded object never sees
+        NeedsManager(db_session, game_session).apply_batch_time_decay(3)
+        db_session.connection().execute(
+            update(Entity.__table__).values(row_version=Entity.__table__.c.row_version + 1)
+        )
+        needs.hunger = 10
+        entity.display_name = "Finn"
+        db_session.flush()
+
+        index = WorldVersionIndex(db_session, game_session)
+        assert index.snapshot(["needs:hero", "entity:hero"]) == {
+            "needs:hero": 3,
+            "entity:hero": 3,
+        }
+
+
+class TestVersionedFreshness:
+    """Tests for version vectors in the cache and collapse manager."""
+
+    @pytest.mark.asyncio
+    async def test_cache_ignores_age_when_versions_current(self, db_session, game_session):
+        create_item(db_session, game_session, item_key="sword_001")
+        index = WorldVersionIndex(db_session, game_session)
+        cache = QuantumBranchCache(ttl_seconds=1.0, version_check=index.is_current)
+        branch = create_branch(
+            [StateDelta(DeltaType.TRANSFER_ITEM, "sword_001", {"to_entity_key": "hero"})],
+            generated_at=datetime.now() - timedelta(hours=1),
+        )
+        branch.version_vector = index.snapshot(branch_refs(branch))
+        await cache.put_branch(branch)
+        cache._entries[branch.branch_key].inserted_at -= timedelta(hours=1)
+
+        assert await cache.get_branch_by_key(branch.branch_key) is branch
+
+    @pytest.mark.asyncio
+    async def test_cache_drops_branch_when_input_changes(self, db_session, game_session):
+        item = create_item(db_session, game_session, item_key="sword_001")
+        index = WorldVersionIndex(db_session, game_session)
+        cache = QuantumBranchCache(version_check=index.is_current)
+        branch = create_branch([StateDelta(DeltaType.TRANSFER_ITEM, "sword_001", {})])
+        branch.version_vector = index.snapshot(branch_refs(branch))
+        await cache.put_branch(branch)
+
+        item.holder_id = None
+        item.description = "Someone else picked it up"
+        db_session.flush()
+
+        assert await cache.get_branch_by_key(branch.branch_key) is None
+
+    def test_write_during_generation_leaves_branch_stale(self, db_session, game_session):
+        item = create_item(db_session, game_session, item_key="sword_001")
+        index = WorldVersionIndex(db_session, game_session)
+        manifest = GroundingManifest(
+            location_key="village_square",
+            location_display="Village Square",
+            player_key="hero",
+            items_at_location={
+                "sword_001": GroundedEntity(
+                    key="sword_001", display_name="Sword", entity_type="item"
+                )
+            },
+        )
+        planned = index.snapshot(manifest_refs(manifest))
+
+        # The row changes while the LLM is generating the branch
+        item.description = "changed"
+        db_session.flush()
+        branch = create_branch(
+            [
+                StateDelta(DeltaType.TRANSFER_ITEM, "sword_001", {}),
+                StateDelta(DeltaType.UPDATE_ENTITY, "new_npc", {}),
+            ]
+        )
+        QuantumPipeline._record_versions(SimpleNamespace(version_index=index), branch, planned)
+
+        assert branch.version_vector == {"item:sword_001": 1, "entity:new_npc": 0}
+        assert index.is_current(branch.version_vector) is False
+
+    @pytest.mark.asyncio
+    async def test_collapse_rejects_stale_versions(self, db_session, game_session):
+        item = create_item(db_session, game_session, item_key="sword_001")
+        index = WorldVersionIndex(db_session, game_session)
+        manager = BranchCollapseManager(db_session, game_session, version_index=index)
+        branch = create_branch([StateDelta(DeltaType.TRANSFER_ITEM, "sword_001", {})])
+        branch.version_vector = index.snapshot(branch_refs(branch))
+
+        item.description = "changed"
+        db_session.flush()
+
+        with pytest.raises(StaleStateError, match="item:sword_001"):
+            await manager.collapse_branch(
+                branch, "take sword", turn_number=1, apply_deltas=False
+            )